@@ -7,14 +7,16 @@ This module provides comprehensive usage tracking and reporting:
 - Aggregation and analysis
 - Report generation
 - Data lifecycle management
+- Live sliding-window metrics
 """
 
 from .writer import JSONLWriter, MetricEntry
 from .parser import MetricsParser, ParsedMetric
 from .aggregator import MetricsAggregator, AggregationResult, AggregationType
-from .reporter import ReportGenerator, ReportFormat, UsageReport
+from .reporter import ReportGenerator, ReportFormat, UsageReport, ReportCache
 from .cleaner import DataCleaner, CleanupPolicy
 from .exporter import MetricsExporter, ExportFormat
+from .live import LiveMetricsMonitor
 
 __all__ = [
     # Writer
@@ -34,6 +36,7 @@ __all__ = [
     'ReportGenerator',
     'ReportFormat',
     'UsageReport',
+    'ReportCache',
     
     # Cleaner
     'DataCleaner',
@@ -41,5 +44,8 @@ __all__ = [
     
     # Exporter
     'MetricsExporter',
-    'ExportFormat'
+    'ExportFormat',
+    
+    # Live
+    'LiveMetricsMonitor'
 ]
\ No newline at end of file
@@ -15,6 +15,7 @@ import statistics
 from ..utils.logging import get_logger
 from .parser import ParsedMetric, MetricsParser
 from .writer import MetricType
+from . import vectorized
 
 logger = get_logger(__name__)
 
@@ -110,17 +111,29 @@ class AggregationResult:
         }
 
 
+# Aggregations with a vectorized implementation
+VECTORIZED_AGGREGATIONS = {
+    AggregationType.HOURLY: vectorized.aggregate_hourly,
+    AggregationType.DAILY: vectorized.aggregate_daily,
+    AggregationType.BY_SESSION: vectorized.aggregate_by_session,
+}
+
+
 class MetricsAggregator:
     """Aggregates metrics data for analysis and reporting."""
     
-    def __init__(self, parser: MetricsParser):
+    def __init__(self, parser: MetricsParser, use_vectorized: Optional[bool] = None):
         """
         Initialize aggregator.
         
         Args:
             parser: Metrics parser instance
+            use_vectorized: Use the NumPy backend (defaults to on when
+                NumPy is installed)
         """
         self.parser = parser
+        self.use_vectorized = vectorized.HAS_NUMPY if use_vectorized is None \
+            else use_vectorized and vectorized.HAS_NUMPY
         
     async def aggregate(
         self,
@@ -154,11 +167,21 @@ class MetricsAggregator:
         if not metrics:
             return result
         
+        # Load typed arrays for the vectorized backend when possible
+        arrays = None
+        if self.use_vectorized:
+            arrays = vectorized.MetricArrays.from_metrics(metrics)
+        
         # Perform base aggregations
-        await self._aggregate_base_stats(metrics, result)
+        if arrays is not None:
+            vectorized.aggregate_base_stats(arrays, result)
+        else:
+            await self._aggregate_base_stats(metrics, result)
         
         # Perform type-specific aggregations
-        if aggregation_type == AggregationType.HOURLY:
+        if arrays is not None and aggregation_type in VECTORIZED_AGGREGATIONS:
+            VECTORIZED_AGGREGATIONS[aggregation_type](arrays, result)
+        elif aggregation_type == AggregationType.HOURLY:
             await self._aggregate_hourly(metrics, result)
         elif aggregation_type == AggregationType.DAILY:
             await self._aggregate_daily(metrics, result)
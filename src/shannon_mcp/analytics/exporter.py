@@ -2,6 +2,9 @@
 Metrics Exporter for Analytics Engine.
 
 Exports analytics data to various formats and destinations.
+
+Every exporter streams: metrics are written as they are parsed through
+buffered sinks, so peak memory does not grow with the size of the range.
 """
 
 import json
@@ -10,11 +13,12 @@ import asyncio
 import aiofiles
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional, AsyncIterator
+from typing import List, Dict, Any, Optional, AsyncIterator, Awaitable, Callable, Tuple
 from dataclasses import dataclass
+from contextlib import asynccontextmanager
 from enum import Enum
+import gzip
 import zipfile
-import tempfile
 import shutil
 
 from ..utils.logging import get_logger
@@ -25,6 +29,27 @@ from .reporter import ReportGenerator, ReportFormat
 
 logger = get_logger(__name__)
 
+# Bytes of text buffered before each write to the destination
+DEFAULT_BUFFER_BYTES = 1024 * 1024
+
+# Records per Parquet row group
+DEFAULT_ROW_GROUP_SIZE = 10_000
+
+# Metrics sheet columns and fixed widths (write-only sheets cannot be
+# auto-sized after the rows are written)
+EXCEL_METRIC_COLUMNS = [
+    ("ID", 38),
+    ("Timestamp", 34),
+    ("Type", 20),
+    ("Session ID", 38),
+    ("User ID", 20),
+    ("Tool Name", 20),
+    ("Duration (ms)", 15),
+    ("Success", 9),
+    ("Tokens", 10),
+    ("Data", 50)
+]
+
 
 class ExportFormat(str, Enum):
     """Supported export formats."""
@@ -63,6 +88,105 @@ class ExportOptions:
             ]
 
 
+class _BufferedSink:
+    """Collects text and hands it to the destination in large chunks."""
+    
+    def __init__(
+        self,
+        write_chunk: Callable[[str], Awaitable[Any]],
+        buffer_bytes: int = DEFAULT_BUFFER_BYTES
+    ):
+        self._write_chunk = write_chunk
+        self._buffer_bytes = buffer_bytes
+        self._parts: List[str] = []
+        self._size = 0
+    
+    async def write(self, text: str) -> None:
+        """Buffer text, flushing once the buffer is full."""
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self._buffer_bytes:
+            await self.flush()
+    
+    async def flush(self) -> None:
+        """Write buffered text to the destination."""
+        if not self._parts:
+            return
+        data = "".join(self._parts)
+        self._parts.clear()
+        self._size = 0
+        await self._write_chunk(data)
+
+
+@asynccontextmanager
+async def _open_file_sink(path: Path, buffer_bytes: int) -> AsyncIterator[_BufferedSink]:
+    """Open a buffered text sink on a file."""
+    async with aiofiles.open(path, 'w') as f:
+        sink = _BufferedSink(f.write, buffer_bytes)
+        yield sink
+        await sink.flush()
+
+
+@asynccontextmanager
+async def _open_zip_sink(
+    zf: zipfile.ZipFile,
+    arcname: str,
+    buffer_bytes: int
+) -> AsyncIterator[_BufferedSink]:
+    """Open a buffered text sink that writes straight into a ZIP member."""
+    member = zf.open(arcname, 'w', force_zip64=True)
+    
+    async def write_chunk(data: str) -> None:
+        await asyncio.to_thread(member.write, data.encode('utf-8'))
+    
+    try:
+        sink = _BufferedSink(write_chunk, buffer_bytes)
+        yield sink
+        await sink.flush()
+    finally:
+        member.close()
+
+
+def _indent_json(value: Any, level: int) -> str:
+    """Serialize value as json.dumps(indent=2) would at the given depth."""
+    return json.dumps(value, indent=2).replace("\n", "\n" + "  " * level)
+
+
+def _json_key(key: str, first: bool, level: int) -> str:
+    """Separator, indentation and key for an object member."""
+    return ("\n" if first else ",\n") + "  " * level + json.dumps(key) + ": "
+
+
+async def _write_json_array(
+    sink: _BufferedSink,
+    items: AsyncIterator[Any],
+    level: int
+) -> None:
+    """Write an async sequence as an indented JSON array."""
+    await sink.write("[")
+    first = True
+    async for item in items:
+        await sink.write(("\n" if first else ",\n") + "  " * (level + 1))
+        await sink.write(_indent_json(item, level + 1))
+        first = False
+    await sink.write("]" if first else "\n" + "  " * level + "]")
+
+
+async def _write_json_object(
+    sink: _BufferedSink,
+    items: AsyncIterator[Tuple[str, Any]],
+    level: int
+) -> None:
+    """Write async (key, value) pairs as an indented JSON object."""
+    await sink.write("{")
+    first = True
+    async for key, value in items:
+        await sink.write(_json_key(key, first, level + 1))
+        await sink.write(_indent_json(value, level + 1))
+        first = False
+    await sink.write("}" if first else "\n" + "  " * level + "}")
+
+
 class MetricsExporter:
     """Exports metrics data to various formats."""
     
@@ -70,7 +194,9 @@ class MetricsExporter:
         self,
         parser: MetricsParser,
         aggregator: MetricsAggregator,
-        reporter: ReportGenerator
+        reporter: ReportGenerator,
+        buffer_bytes: int = DEFAULT_BUFFER_BYTES,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE
     ):
         """
         Initialize exporter.
@@ -79,10 +205,14 @@ class MetricsExporter:
             parser: Metrics parser instance
             aggregator: Metrics aggregator instance
             reporter: Report generator instance
+            buffer_bytes: Text buffered before each write
+            row_group_size: Records per Parquet row group
         """
         self.parser = parser
         self.aggregator = aggregator
         self.reporter = reporter
+        self.buffer_bytes = buffer_bytes
+        self.row_group_size = row_group_size
         
     async def export(
         self,
@@ -144,59 +274,69 @@ class MetricsExporter:
         filters: Optional[Dict[str, Any]]
     ) -> Path:
         """Export as JSON."""
-        data = {}
+        async with _open_file_sink(output_path, self.buffer_bytes) as sink:
+            await self._write_json(sink, start_time, end_time, options, filters)
+        
+        # Compress if requested
+        if options.compress:
+            return await self._compress_file(output_path)
+        
+        return output_path
+    
+    async def _write_json(
+        self,
+        sink: "_BufferedSink",
+        start_time: datetime,
+        end_time: datetime,
+        options: ExportOptions,
+        filters: Optional[Dict[str, Any]]
+    ) -> None:
+        """
+        Write the JSON document incrementally.
+        
+        Output is formatted exactly like ``json.dumps(data, indent=2)``, but
+        metrics, aggregations and reports are written one at a time.
+        """
+        await sink.write("{")
         
         # Metadata
-        data["metadata"] = {
+        await sink.write(_json_key("metadata", first=True, level=1))
+        await sink.write(_indent_json({
             "exported_at": datetime.now(timezone.utc).isoformat(),
             "start_time": start_time.isoformat(),
             "end_time": end_time.isoformat(),
             "filters": filters or {}
-        }
+        }, 1))
         
         # Raw metrics
         if options.include_raw_metrics:
-            metrics = []
-            async for batch in self.parser.stream_metrics(start_time, end_time):
-                for metric in batch:
-                    if self._apply_filters(metric, filters):
-                        metrics.append(metric.entry.to_dict())
-            data["metrics"] = metrics
+            await sink.write(_json_key("metrics", first=False, level=1))
+            await _write_json_array(
+                sink,
+                (metric.entry.to_dict() async for metric in
+                 self._stream_filtered(start_time, end_time, filters)),
+                level=1
+            )
         
         # Aggregations
         if options.include_aggregations:
-            data["aggregations"] = {}
-            for agg_type in options.aggregation_types:
-                result = await self.aggregator.aggregate(
-                    agg_type, start_time, end_time, filters
-                )
-                data["aggregations"][agg_type.value] = result.to_dict()
+            await sink.write(_json_key("aggregations", first=False, level=1))
+            await _write_json_object(
+                sink,
+                self._iter_aggregations(start_time, end_time, options, filters),
+                level=1
+            )
         
         # Reports
         if options.include_reports:
-            data["reports"] = {}
-            for report_format in options.report_formats:
-                if report_format == ReportFormat.JSON:
-                    continue  # Skip JSON in JSON
-                    
-                report = await self.reporter.generate_report(
-                    AggregationType.DAILY,
-                    start_time,
-                    end_time,
-                    report_format,
-                    filters
-                )
-                data["reports"][report_format.value] = report.content
-        
-        # Write to file
-        async with aiofiles.open(output_path, 'w') as f:
-            await f.write(json.dumps(data, indent=2))
-        
-        # Compress if requested
-        if options.compress:
-            return await self._compress_file(output_path)
+            await sink.write(_json_key("reports", first=False, level=1))
+            await _write_json_object(
+                sink,
+                self._iter_reports(start_time, end_time, options, filters, skip_json=True),
+                level=1
+            )
         
-        return output_path
+        await sink.write("\n}")
     
     async def _export_csv(
         self,
@@ -214,85 +354,101 @@ class MetricsExporter:
         # Raw metrics CSV
         if options.include_raw_metrics:
             metrics_path = Path(f"{base_path}_metrics.csv")
+            headers = await self._collect_csv_headers(start_time, end_time, filters)
             
-            # Collect all metrics first to determine headers
-            all_metrics = []
-            headers = set(["id", "timestamp", "type", "session_id", "user_id"])
-            
-            async for batch in self.parser.stream_metrics(start_time, end_time):
-                for metric in batch:
-                    if self._apply_filters(metric, filters):
-                        all_metrics.append(metric)
-                        # Collect all possible data keys
-                        headers.update(metric.entry.data.keys())
-            
-            # Write CSV
-            headers = sorted(list(headers))
-            
-            async with aiofiles.open(metrics_path, 'w') as f:
-                writer = csv.DictWriter(f, fieldnames=headers)
-                await f.write(','.join(headers) + '\n')
-                
-                for metric in all_metrics:
-                    row = {
-                        "id": metric.entry.id,
-                        "timestamp": metric.entry.timestamp.isoformat(),
-                        "type": metric.entry.type.value,
-                        "session_id": metric.entry.session_id or "",
-                        "user_id": metric.entry.user_id or ""
-                    }
-                    # Add data fields
-                    for key in headers:
-                        if key in metric.entry.data:
-                            value = metric.entry.data[key]
-                            if isinstance(value, (list, dict)):
-                                value = json.dumps(value)
-                            row[key] = value
-                    
-                    # Write row
-                    line = ','.join(str(row.get(h, '')) for h in headers)
-                    await f.write(line + '\n')
+            async with _open_file_sink(metrics_path, self.buffer_bytes) as sink:
+                await self._write_csv_metrics(sink, headers, start_time, end_time, filters)
             
             files_created.append(metrics_path)
         
         # Aggregations CSV
         if options.include_aggregations:
-            for agg_type in options.aggregation_types:
-                agg_path = Path(f"{base_path}_{agg_type.value}.csv")
-                
-                result = await self.aggregator.aggregate(
-                    agg_type, start_time, end_time, filters
-                )
-                
+            async for agg_name, result in self._iter_aggregation_results(
+                start_time, end_time, options, filters
+            ):
                 # Write time series data as CSV
                 if result.time_series:
-                    headers = list(result.time_series[0].keys())
+                    agg_path = Path(f"{base_path}_{agg_name}.csv")
                     
-                    async with aiofiles.open(agg_path, 'w') as f:
-                        await f.write(','.join(headers) + '\n')
-                        
-                        for entry in result.time_series:
-                            values = []
-                            for h in headers:
-                                value = entry.get(h, '')
-                                if isinstance(value, (list, dict)):
-                                    value = json.dumps(value)
-                                values.append(str(value))
-                            await f.write(','.join(values) + '\n')
+                    async with _open_file_sink(agg_path, self.buffer_bytes) as sink:
+                        await self._write_csv_time_series(sink, result.time_series)
                     
                     files_created.append(agg_path)
         
         # If multiple files, create a ZIP
         if len(files_created) > 1:
             zip_path = output_path.with_suffix('.zip')
-            with zipfile.ZipFile(zip_path, 'w') as zf:
-                for file_path in files_created:
-                    zf.write(file_path, file_path.name)
-                    file_path.unlink()  # Remove individual file
+            
+            def archive() -> None:
+                with zipfile.ZipFile(zip_path, 'w') as zf:
+                    for file_path in files_created:
+                        zf.write(file_path, file_path.name)
+                        file_path.unlink()  # Remove individual file
+            
+            await asyncio.to_thread(archive)
             return zip_path
         
         return files_created[0] if files_created else output_path
     
+    async def _collect_csv_headers(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        filters: Optional[Dict[str, Any]]
+    ) -> List[str]:
+        """First pass over the range: collect the union of data keys."""
+        headers = set(["id", "timestamp", "type", "session_id", "user_id"])
+        
+        async for metric in self._stream_filtered(start_time, end_time, filters):
+            headers.update(metric.entry.data.keys())
+        
+        return sorted(headers)
+    
+    async def _write_csv_metrics(
+        self,
+        sink: "_BufferedSink",
+        headers: List[str],
+        start_time: datetime,
+        end_time: datetime,
+        filters: Optional[Dict[str, Any]]
+    ) -> None:
+        """Second pass over the range: write one row per metric."""
+        await sink.write(','.join(headers) + '\n')
+        
+        async for metric in self._stream_filtered(start_time, end_time, filters):
+            row = {
+                "id": metric.entry.id,
+                "timestamp": metric.entry.timestamp.isoformat(),
+                "type": metric.entry.type.value,
+                "session_id": metric.entry.session_id or "",
+                "user_id": metric.entry.user_id or ""
+            }
+            # Add data fields
+            for key, value in metric.entry.data.items():
+                if isinstance(value, (list, dict)):
+                    value = json.dumps(value)
+                row[key] = value
+            
+            await sink.write(','.join(str(row.get(h, '')) for h in headers) + '\n')
+    
+    async def _write_csv_time_series(
+        self,
+        sink: "_BufferedSink",
+        time_series: List[Dict[str, Any]]
+    ) -> None:
+        """Write aggregation time series rows as CSV."""
+        headers = list(time_series[0].keys())
+        await sink.write(','.join(headers) + '\n')
+        
+        for entry in time_series:
+            values = []
+            for h in headers:
+                value = entry.get(h, '')
+                if isinstance(value, (list, dict)):
+                    value = json.dumps(value)
+                values.append(str(value))
+            await sink.write(','.join(values) + '\n')
+    
     async def _export_jsonl(
         self,
         output_path: Path,
@@ -302,25 +458,8 @@ class MetricsExporter:
         filters: Optional[Dict[str, Any]]
     ) -> Path:
         """Export as JSONL."""
-        async with aiofiles.open(output_path, 'w') as f:
-            # Write metadata as first line
-            metadata = {
-                "_metadata": True,
-                "exported_at": datetime.now(timezone.utc).isoformat(),
-                "start_time": start_time.isoformat(),
-                "end_time": end_time.isoformat(),
-                "filters": filters or {}
-            }
-            await f.write(json.dumps(metadata) + '\n')
-            
-            # Stream metrics
-            if options.include_raw_metrics:
-                async for batch in self.parser.stream_metrics(start_time, end_time):
-                    for metric in batch:
-                        if self._apply_filters(metric, filters):
-                            await f.write(
-                                json.dumps(metric.entry.to_dict()) + '\n'
-                            )
+        async with _open_file_sink(output_path, self.buffer_bytes) as sink:
+            await self._write_jsonl(sink, start_time, end_time, options, filters)
         
         # Compress if requested
         if options.compress:
@@ -328,6 +467,30 @@ class MetricsExporter:
         
         return output_path
     
+    async def _write_jsonl(
+        self,
+        sink: "_BufferedSink",
+        start_time: datetime,
+        end_time: datetime,
+        options: ExportOptions,
+        filters: Optional[Dict[str, Any]]
+    ) -> None:
+        """Write metadata and metrics as JSON lines."""
+        # Write metadata as first line
+        metadata = {
+            "_metadata": True,
+            "exported_at": datetime.now(timezone.utc).isoformat(),
+            "start_time": start_time.isoformat(),
+            "end_time": end_time.isoformat(),
+            "filters": filters or {}
+        }
+        await sink.write(json.dumps(metadata) + '\n')
+        
+        # Stream metrics
+        if options.include_raw_metrics:
+            async for metric in self._stream_filtered(start_time, end_time, filters):
+                await sink.write(json.dumps(metric.entry.to_dict()) + '\n')
+    
     async def _export_parquet(
         self,
         output_path: Path,
@@ -346,51 +509,56 @@ class MetricsExporter:
                 "Install with: pip install pyarrow"
             )
         
-        # Collect metrics
-        records = []
+        # Fixed schema so row groups can be written as they fill; the
+        # flattened fields are nullable
+        schema = pa.schema([
+            pa.field("id", pa.string()),
+            pa.field("timestamp", pa.timestamp('us', tz='UTC')),
+            pa.field("type", pa.string()),
+            pa.field("session_id", pa.string()),
+            pa.field("user_id", pa.string()),
+            pa.field("data", pa.string()),
+            pa.field("metadata", pa.string()),
+            pa.field("tool_name", pa.string()),
+            pa.field("duration_ms", pa.float64()),
+            pa.field("success", pa.bool_()),
+            pa.field("token_count", pa.int64())
+        ])
+        
+        writer = pq.ParquetWriter(output_path, schema, compression='snappy')
+        columns: Dict[str, List[Any]] = {name: [] for name in schema.names}
+        rows = 0
+        
+        async def flush_row_group() -> None:
+            table = pa.Table.from_pydict(columns, schema=schema)
+            await asyncio.to_thread(writer.write_table, table)
+            for values in columns.values():
+                values.clear()
         
-        async for batch in self.parser.stream_metrics(start_time, end_time):
-            for metric in batch:
-                if self._apply_filters(metric, filters):
-                    record = {
-                        "id": metric.entry.id,
-                        "timestamp": metric.entry.timestamp,
-                        "type": metric.entry.type.value,
-                        "session_id": metric.entry.session_id,
-                        "user_id": metric.entry.user_id,
-                        "data": json.dumps(metric.entry.data),
-                        "metadata": json.dumps(metric.entry.metadata)
-                    }
-                    
-                    # Flatten common fields
-                    if metric.tool_name:
-                        record["tool_name"] = metric.tool_name
-                    if metric.duration_ms is not None:
-                        record["duration_ms"] = metric.duration_ms
-                    if metric.success is not None:
-                        record["success"] = metric.success
-                    if metric.token_count is not None:
-                        record["token_count"] = metric.token_count
-                    
-                    records.append(record)
-        
-        # Create table and write
-        if records:
-            table = pa.Table.from_pylist(records)
-            pq.write_table(table, output_path, compression='snappy')
-        else:
-            # Write empty table
-            schema = pa.schema([
-                pa.field("id", pa.string()),
-                pa.field("timestamp", pa.timestamp('us', tz='UTC')),
-                pa.field("type", pa.string()),
-                pa.field("session_id", pa.string()),
-                pa.field("user_id", pa.string()),
-                pa.field("data", pa.string()),
-                pa.field("metadata", pa.string())
-            ])
-            table = pa.Table.from_pylist([], schema=schema)
-            pq.write_table(table, output_path)
+        try:
+            async for metric in self._stream_filtered(start_time, end_time, filters):
+                columns["id"].append(metric.entry.id)
+                columns["timestamp"].append(metric.entry.timestamp)
+                columns["type"].append(metric.entry.type.value)
+                columns["session_id"].append(metric.entry.session_id)
+                columns["user_id"].append(metric.entry.user_id)
+                columns["data"].append(json.dumps(metric.entry.data))
+                columns["metadata"].append(json.dumps(metric.entry.metadata))
+                
+                # Flatten common fields
+                columns["tool_name"].append(metric.tool_name or None)
+                columns["duration_ms"].append(metric.duration_ms)
+                columns["success"].append(metric.success)
+                columns["token_count"].append(metric.token_count)
+                
+                rows += 1
+                if rows % self.row_group_size == 0:
+                    await flush_row_group()
+            
+            if rows % self.row_group_size:
+                await flush_row_group()
+        finally:
+            writer.close()
         
         return output_path
     
@@ -412,12 +580,11 @@ class MetricsExporter:
                 "Install with: pip install openpyxl"
             )
         
-        # Create workbook
-        wb = openpyxl.Workbook()
+        # Write-only workbooks stream rows to disk instead of holding cells
+        wb = openpyxl.Workbook(write_only=True)
         
         # Metadata sheet
-        ws_meta = wb.active
-        ws_meta.title = "Metadata"
+        ws_meta = wb.create_sheet("Metadata")
         ws_meta.append(["Field", "Value"])
         ws_meta.append(["Exported At", datetime.now(timezone.utc).isoformat()])
         ws_meta.append(["Start Time", start_time.isoformat()])
@@ -428,36 +595,27 @@ class MetricsExporter:
         if options.include_raw_metrics:
             ws_metrics = wb.create_sheet("Metrics")
             
+            # Column widths must be set before rows in write-only mode
+            for index, (_, width) in enumerate(EXCEL_METRIC_COLUMNS, 1):
+                ws_metrics.column_dimensions[get_column_letter(index)].width = width
+            
             # Headers
-            headers = [
-                "ID", "Timestamp", "Type", "Session ID", "User ID",
-                "Tool Name", "Duration (ms)", "Success", "Tokens", "Data"
-            ]
-            ws_metrics.append(headers)
+            ws_metrics.append([header for header, _ in EXCEL_METRIC_COLUMNS])
             
             # Data
-            row_num = 2
-            async for batch in self.parser.stream_metrics(start_time, end_time):
-                for metric in batch:
-                    if self._apply_filters(metric, filters):
-                        ws_metrics.append([
-                            metric.entry.id,
-                            metric.entry.timestamp.isoformat(),
-                            metric.entry.type.value,
-                            metric.entry.session_id or "",
-                            metric.entry.user_id or "",
-                            metric.tool_name or "",
-                            metric.duration_ms or "",
-                            str(metric.success) if metric.success is not None else "",
-                            metric.token_count or "",
-                            json.dumps(metric.entry.data)
-                        ])
-                        row_num += 1
-            
-            # Auto-adjust column widths
-            for column_cells in ws_metrics.columns:
-                length = max(len(str(cell.value or "")) for cell in column_cells)
-                ws_metrics.column_dimensions[get_column_letter(column_cells[0].column)].width = min(length + 2, 50)
+            async for metric in self._stream_filtered(start_time, end_time, filters):
+                ws_metrics.append([
+                    metric.entry.id,
+                    metric.entry.timestamp.isoformat(),
+                    metric.entry.type.value,
+                    metric.entry.session_id or "",
+                    metric.entry.user_id or "",
+                    metric.tool_name or "",
+                    metric.duration_ms or "",
+                    str(metric.success) if metric.success is not None else "",
+                    metric.token_count or "",
+                    json.dumps(metric.entry.data)
+                ])
         
         # Summary sheet
         if options.include_aggregations:
@@ -490,7 +648,7 @@ class MetricsExporter:
                 ws_summary.append([tool, stats["count"], f"{success_rate:.1%}"])
         
         # Save workbook
-        wb.save(output_path)
+        await asyncio.to_thread(wb.save, output_path)
         
         return output_path
     
@@ -502,56 +660,45 @@ class MetricsExporter:
         options: ExportOptions,
         filters: Optional[Dict[str, Any]]
     ) -> Path:
-        """Export as ZIP containing multiple formats."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            files_to_archive = []
-            
-            # Export different formats
-            formats_to_export = [
-                (ExportFormat.JSON, "data.json"),
-                (ExportFormat.CSV, "data.csv"),
-                (ExportFormat.JSONL, "data.jsonl")
+        """Export as ZIP, streaming each format straight into its member."""
+        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            members = [
+                ("data.json", lambda sink: self._write_json(
+                    sink, start_time, end_time, options, filters
+                )),
+                ("data.jsonl", lambda sink: self._write_jsonl(
+                    sink, start_time, end_time, options, filters
+                ))
             ]
             
-            for format_type, filename in formats_to_export:
+            for arcname, write_member in members:
                 try:
-                    format_options = ExportOptions(
-                        format=format_type,
-                        include_raw_metrics=options.include_raw_metrics,
-                        include_aggregations=options.include_aggregations,
-                        include_reports=options.include_reports,
-                        aggregation_types=options.aggregation_types,
-                        report_formats=options.report_formats,
-                        compress=False  # Don't compress individual files
-                    )
-                    
-                    file_path = await self.export(
-                        temp_path / filename,
-                        start_time,
-                        end_time,
-                        format_options,
-                        filters
-                    )
-                    
-                    # Handle multiple files (e.g., CSV might create several)
-                    if file_path.exists():
-                        files_to_archive.append(file_path)
-                    
-                    # Check for related files
-                    base_name = file_path.stem
-                    for related in temp_path.glob(f"{base_name}*"):
-                        if related not in files_to_archive:
-                            files_to_archive.append(related)
-                            
+                    async with _open_zip_sink(zf, arcname, self.buffer_bytes) as sink:
+                        await write_member(sink)
                 except Exception as e:
-                    logger.warning(f"Failed to export {format_type}: {e}")
+                    logger.warning(f"Failed to export {arcname}: {e}")
+            
+            # CSV members
+            try:
+                if options.include_raw_metrics:
+                    headers = await self._collect_csv_headers(start_time, end_time, filters)
+                    async with _open_zip_sink(zf, "data_metrics.csv", self.buffer_bytes) as sink:
+                        await self._write_csv_metrics(sink, headers, start_time, end_time, filters)
+                
+                if options.include_aggregations:
+                    async for agg_name, result in self._iter_aggregation_results(
+                        start_time, end_time, options, filters
+                    ):
+                        if result.time_series:
+                            async with _open_zip_sink(
+                                zf, f"data_{agg_name}.csv", self.buffer_bytes
+                            ) as sink:
+                                await self._write_csv_time_series(sink, result.time_series)
+            except Exception as e:
+                logger.warning(f"Failed to export {ExportFormat.CSV}: {e}")
             
             # Add reports
             if options.include_reports:
-                reports_dir = temp_path / "reports"
-                reports_dir.mkdir(exist_ok=True)
-                
                 for report_format in options.report_formats:
                     try:
                         report = await self.reporter.generate_report(
@@ -570,33 +717,91 @@ class MetricsExporter:
                             ReportFormat.TEXT: ".txt"
                         }.get(report_format, ".txt")
                         
-                        report_path = reports_dir / f"report_{report_format.value}{ext}"
-                        report.save(report_path)
-                        files_to_archive.append(report_path)
+                        content = report.content
+                        if report_format == ReportFormat.JSON:
+                            # Match UsageReport.save pretty-printing
+                            content = json.dumps(json.loads(content), indent=2)
                         
+                        arcname = f"reports/report_{report_format.value}{ext}"
+                        async with _open_zip_sink(zf, arcname, self.buffer_bytes) as sink:
+                            await sink.write(content)
+                    
                     except Exception as e:
                         logger.warning(f"Failed to generate {report_format} report: {e}")
+        
+        return output_path
+    
+    async def _stream_filtered(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        filters: Optional[Dict[str, Any]]
+    ) -> AsyncIterator[ParsedMetric]:
+        """Stream metrics in the range that pass the filters."""
+        async for batch in self.parser.stream_metrics(start_time, end_time):
+            for metric in batch:
+                if self._apply_filters(metric, filters):
+                    yield metric
+    
+    async def _iter_aggregation_results(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        options: ExportOptions,
+        filters: Optional[Dict[str, Any]]
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Compute configured aggregations one at a time."""
+        for agg_type in options.aggregation_types:
+            result = await self.aggregator.aggregate(
+                agg_type, start_time, end_time, filters
+            )
+            yield agg_type.value, result
+    
+    async def _iter_aggregations(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        options: ExportOptions,
+        filters: Optional[Dict[str, Any]]
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Yield (name, dict) pairs for configured aggregations."""
+        async for agg_name, result in self._iter_aggregation_results(
+            start_time, end_time, options, filters
+        ):
+            yield agg_name, result.to_dict()
+    
+    async def _iter_reports(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        options: ExportOptions,
+        filters: Optional[Dict[str, Any]],
+        skip_json: bool = False
+    ) -> AsyncIterator[Tuple[str, str]]:
+        """Yield (format, content) pairs for configured reports."""
+        for report_format in options.report_formats:
+            if skip_json and report_format == ReportFormat.JSON:
+                continue  # Skip JSON in JSON
             
-            # Create ZIP archive
-            with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-                for file_path in files_to_archive:
-                    arcname = file_path.relative_to(temp_path)
-                    zf.write(file_path, arcname)
-            
-            return output_path
+            report = await self.reporter.generate_report(
+                AggregationType.DAILY,
+                start_time,
+                end_time,
+                report_format,
+                filters
+            )
+            yield report_format.value, report.content
     
     async def _compress_file(self, file_path: Path) -> Path:
-        """Compress a file using gzip."""
-        import gzip
-        
+        """Compress a file using gzip, streaming in a worker thread."""
         compressed_path = file_path.with_suffix(file_path.suffix + '.gz')
         
-        async with aiofiles.open(file_path, 'rb') as f_in:
-            content = await f_in.read()
+        def compress() -> None:
+            with open(file_path, 'rb') as f_in, \
+                    gzip.open(compressed_path, 'wb', compresslevel=6) as f_out:
+                shutil.copyfileobj(f_in, f_out, self.buffer_bytes)
         
-        async with aiofiles.open(compressed_path, 'wb') as f_out:
-            compressed = gzip.compress(content, compresslevel=6)
-            await f_out.write(compressed)
+        await asyncio.to_thread(compress)
         
         # Remove original
         file_path.unlink()
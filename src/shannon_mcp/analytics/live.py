@@ -0,0 +1,231 @@
+"""
+Live Metrics Monitor for Analytics Engine.
+
+Maintains real-time sliding-window aggregates over metrics as they are
+written, without re-reading files:
+- Taps the JSONLWriter queue directly
+- 1/5/15 minute windows of rates, errors and latency quantiles
+- O(1) amortized work per metric
+- Throttled updates pushed through the EventBus
+"""
+
+import asyncio
+import time
+from typing import Optional, Dict, Any, Callable, Sequence
+
+from ..utils.logging import get_logger
+from ..utils.notifications import (
+    EventBus, EventCategory, EventPriority, Event, Subscription, get_event_bus
+)
+from ..utils.stats import SlidingWindow
+from .writer import JSONLWriter, MetricEntry, MetricType
+
+logger = get_logger(__name__)
+
+
+# Event name used for pushed window snapshots
+LIVE_METRICS_EVENT = "analytics.live_metrics"
+
+# Default window spans in seconds
+DEFAULT_WINDOWS: Sequence[float] = (60, 300, 900)
+
+
+def _window_label(span: float) -> str:
+    """Label a window span, e.g. 300 -> '5m'."""
+    if span % 60 == 0:
+        return f"{int(span // 60)}m"
+    return f"{span:g}s"
+
+
+class LiveMetricsMonitor:
+    """Tracks sliding-window metrics and pushes throttled snapshots."""
+    
+    def __init__(
+        self,
+        writer: JSONLWriter,
+        event_bus: Optional[EventBus] = None,
+        windows: Sequence[float] = DEFAULT_WINDOWS,
+        update_interval: float = 1.0,
+        slots: int = 60,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize live metrics monitor.
+        
+        Args:
+            writer: Writer whose queued entries are observed
+            event_bus: Bus to publish snapshots on (global bus by default)
+            windows: Window spans in seconds
+            update_interval: Minimum seconds between pushed updates
+            slots: Ring slots per window; resolution is span / slots
+            clock: Monotonic time source
+        """
+        self.writer = writer
+        self.event_bus = event_bus or get_event_bus()
+        self.update_interval = update_interval
+        self.clock = clock
+        
+        self.windows: Dict[str, SlidingWindow] = {
+            _window_label(span): SlidingWindow(span, slots) for span in windows
+        }
+        self.by_type: Dict[str, Dict[str, SlidingWindow]] = {}
+        self._slots = slots
+        self._spans = tuple(windows)
+        
+        # Statistics
+        self.events_observed = 0
+        self.updates_published = 0
+        
+        # Background publisher
+        self._publish_task: Optional[asyncio.Task] = None
+        self._stop_event = asyncio.Event()
+        self._dirty = False
+        self._active = False
+    
+    async def start(self) -> None:
+        """Start observing the writer and publishing updates."""
+        if self._publish_task and not self._publish_task.done():
+            logger.warning("Live metrics monitor already running")
+            return
+        
+        self.writer.add_listener(self.observe)
+        self._stop_event.clear()
+        self._publish_task = asyncio.create_task(self._publish_loop())
+        logger.info("Started live metrics monitor")
+    
+    async def stop(self) -> None:
+        """Stop observing and publishing."""
+        self.writer.remove_listener(self.observe)
+        
+        if not self._publish_task:
+            return
+        
+        self._stop_event.set()
+        
+        try:
+            await asyncio.wait_for(self._publish_task, timeout=5.0)
+        except asyncio.TimeoutError:
+            logger.warning("Live metrics publisher didn't stop gracefully, cancelling")
+            self._publish_task.cancel()
+        
+        self._publish_task = None
+        logger.info("Stopped live metrics monitor")
+    
+    def observe(self, entry: MetricEntry) -> None:
+        """
+        Fold a single metric into every window.
+        
+        Args:
+            entry: Metric entry as queued by the writer
+        """
+        now = self.clock()
+        data = entry.data
+        
+        error = entry.type == MetricType.ERROR_OCCURRED or data.get("success") is False
+        latency = data.get("duration_ms")
+        if isinstance(latency, bool) or not isinstance(latency, (int, float)):
+            latency = None
+        
+        for window in self.windows.values():
+            window.record(now, error, latency)
+        
+        type_windows = self.by_type.get(entry.type.value)
+        if type_windows is None:
+            type_windows = {
+                _window_label(span): SlidingWindow(span, self._slots) for span in self._spans
+            }
+            self.by_type[entry.type.value] = type_windows
+        for window in type_windows.values():
+            window.record(now, error, latency)
+        
+        self.events_observed += 1
+        self._dirty = True
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get current window aggregates.
+        
+        Returns:
+            Overall and per-metric-type summaries for each window
+        """
+        now = self.clock()
+        return {
+            "windows": {
+                label: window.snapshot(now) for label, window in self.windows.items()
+            },
+            "by_type": {
+                metric_type: {
+                    label: window.snapshot(now) for label, window in type_windows.items()
+                }
+                for metric_type, type_windows in self.by_type.items()
+            },
+            "events_observed": self.events_observed
+        }
+    
+    def subscribe(self, handler: Callable[[Event], Any], **kwargs) -> Subscription:
+        """
+        Subscribe to pushed snapshots.
+        
+        Args:
+            handler: Event handler receiving snapshot events
+            **kwargs: Extra EventBus.subscribe options
+        
+        Returns:
+            Subscription handle for EventBus.unsubscribe
+        """
+        return self.event_bus.subscribe(
+            handler,
+            event_names={LIVE_METRICS_EVENT},
+            **kwargs
+        )
+    
+    async def publish(self) -> None:
+        """Publish the current snapshot immediately."""
+        snapshot = self.snapshot()
+        
+        # Keep publishing while windows drain so subscribers see rates
+        # decay to zero, then go quiet until new metrics arrive
+        self._active = any(w["count"] for w in snapshot["windows"].values())
+        self._dirty = False
+        
+        await self.event_bus.emit(
+            LIVE_METRICS_EVENT,
+            EventCategory.ANALYTICS,
+            snapshot,
+            priority=EventPriority.LOW,
+            source="analytics.live"
+        )
+        self.updates_published += 1
+    
+    async def _publish_loop(self) -> None:
+        """Publish at most one update per interval."""
+        while not self._stop_event.is_set():
+            try:
+                await asyncio.wait_for(
+                    self._stop_event.wait(),
+                    timeout=self.update_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            
+            if self._stop_event.is_set():
+                break
+            
+            if not (self._dirty or self._active):
+                continue
+            
+            try:
+                await self.publish()
+            except Exception as e:
+                logger.error(f"Error publishing live metrics: {e}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get monitor statistics."""
+        return {
+            "running": bool(self._publish_task and not self._publish_task.done()),
+            "events_observed": self.events_observed,
+            "updates_published": self.updates_published,
+            "windows": list(self.windows),
+            "metric_types": len(self.by_type),
+            "update_interval": self.update_interval
+        }
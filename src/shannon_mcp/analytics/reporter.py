@@ -6,14 +6,16 @@ Generates formatted reports from aggregated metrics data.
 
 import json
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional, Union
-from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Union, Tuple
+from dataclasses import dataclass, field
+from collections import OrderedDict
 from enum import Enum
 from pathlib import Path
 import textwrap
 
 from ..utils.logging import get_logger
 from .aggregator import AggregationResult, AggregationType, MetricsAggregator
+from .writer import JSONLWriter
 
 logger = get_logger(__name__)
 
@@ -53,18 +55,173 @@ class UsageReport:
         logger.info(f"Saved {self.format.value} report to {path}")
 
 
+QueryKey = Tuple[str, datetime, datetime, str]
+
+
+def _normalize_time(timestamp: datetime) -> datetime:
+    """Normalize a query bound to aware UTC, treating naive values as UTC."""
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.astimezone(timezone.utc)
+
+
+def make_query_key(
+    aggregation_type: AggregationType,
+    start_time: datetime,
+    end_time: datetime,
+    filters: Optional[Dict[str, Any]] = None
+) -> QueryKey:
+    """
+    Build a normalized cache key for a report query.
+    
+    Equivalent queries map to the same key regardless of time zone or
+    filter ordering, and empty filters are the same as no filters.
+    
+    Args:
+        aggregation_type: Type of aggregation
+        start_time: Start of time range
+        end_time: End of time range
+        filters: Optional filters
+        
+    Returns:
+        Hashable query key
+    """
+    return (
+        aggregation_type.value,
+        _normalize_time(start_time),
+        _normalize_time(end_time),
+        json.dumps(filters or {}, sort_keys=True, default=str)
+    )
+
+
+@dataclass
+class CachedQuery:
+    """An aggregation result and the reports rendered from it."""
+    result: AggregationResult
+    generation: Optional[int]  # None once the time range is sealed
+    formatted: Dict[Tuple[ReportFormat, str], Tuple[str, datetime]] = field(default_factory=dict)
+
+
+class ReportCache:
+    """
+    LRU cache of aggregation results keyed by normalized query.
+    
+    Entries for sealed time ranges (ending before the writer's sealed_before
+    watermark) never expire; all other entries are tied to the writer's
+    flush generation and dropped as soon as another flush lands.
+    """
+    
+    def __init__(self, writer: JSONLWriter, max_entries: int = 256):
+        """
+        Initialize report cache.
+        
+        Args:
+            writer: Writer whose flushes invalidate live entries
+            max_entries: Maximum number of cached queries
+        """
+        self.writer = writer
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[QueryKey, CachedQuery]" = OrderedDict()
+        
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+    
+    def is_sealed(self, end_time: datetime) -> bool:
+        """Check whether no further metrics can land before end_time."""
+        sealed_before = self.writer.sealed_before
+        return sealed_before is not None and _normalize_time(end_time) < sealed_before
+    
+    def get(self, key: QueryKey) -> Optional[CachedQuery]:
+        """
+        Get a cached query if it is still valid.
+        
+        Args:
+            key: Normalized query key
+            
+        Returns:
+            Cached query or None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        if entry.generation is not None:
+            if entry.generation != self.writer.flush_generation:
+                # New data was flushed since this was computed
+                del self._entries[key]
+                self.invalidations += 1
+                self.misses += 1
+                return None
+            
+            if self.is_sealed(key[2]):
+                # Unchanged since it was computed and now immutable
+                entry.generation = None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+    
+    def put(self, key: QueryKey, entry: CachedQuery) -> None:
+        """
+        Cache a query result.
+        
+        Args:
+            key: Normalized query key
+            entry: Entry to cache
+        """
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def clear(self) -> None:
+        """Drop all cached entries, including sealed ones."""
+        self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "sealed_entries": sum(1 for e in self._entries.values() if e.generation is None),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "invalidations": self.invalidations,
+            "evictions": self.evictions
+        }
+
+
 class ReportGenerator:
     """Generates reports from aggregated metrics."""
     
-    def __init__(self, aggregator: MetricsAggregator):
+    def __init__(
+        self,
+        aggregator: MetricsAggregator,
+        writer: Optional[JSONLWriter] = None,
+        cache_size: int = 256
+    ):
         """
         Initialize report generator.
         
         Args:
             aggregator: Metrics aggregator instance
+            writer: Writer producing the metrics; enables result caching
+            cache_size: Maximum number of cached queries (0 disables caching)
         """
         self.aggregator = aggregator
         
+        # Caching needs the writer to know when results go stale
+        self.cache: Optional[ReportCache] = None
+        if writer is not None and cache_size > 0:
+            self.cache = ReportCache(writer, cache_size)
+        
     async def generate_report(
         self,
         aggregation_type: AggregationType,
@@ -89,34 +246,24 @@ class ReportGenerator:
             Generated usage report
         """
         # Get aggregated data
-        result = await self.aggregator.aggregate(
-            aggregation_type,
-            start_time,
-            end_time,
-            filters
-        )
+        cached = await self._get_cached_query(aggregation_type, start_time, end_time, filters)
+        result = cached.result
         
         # Generate title if not provided
         if not title:
             title = self._generate_title(aggregation_type, start_time, end_time)
         
-        # Generate content based on format
-        if format == ReportFormat.JSON:
-            content = self._format_json(result)
-        elif format == ReportFormat.MARKDOWN:
-            content = self._format_markdown(result, title)
-        elif format == ReportFormat.HTML:
-            content = self._format_html(result, title)
-        elif format == ReportFormat.CSV:
-            content = self._format_csv(result)
-        elif format == ReportFormat.TEXT:
-            content = self._format_text(result, title)
-        else:
-            raise ValueError(f"Unsupported format: {format}")
+        # Formatted output is memoized with the result, keeping the time it
+        # was rendered since that is embedded in the content
+        rendered = cached.formatted.get((format, title))
+        if rendered is None:
+            rendered = (self._format_content(result, format, title), datetime.now(timezone.utc))
+            cached.formatted[(format, title)] = rendered
+        content, generated_at = rendered
         
         return UsageReport(
             title=title,
-            generated_at=datetime.now(timezone.utc),
+            generated_at=generated_at,
             format=format,
             content=content,
             metadata={
@@ -128,6 +275,60 @@ class ReportGenerator:
             }
         )
     
+    async def _get_cached_query(
+        self,
+        aggregation_type: AggregationType,
+        start_time: datetime,
+        end_time: datetime,
+        filters: Optional[Dict[str, Any]]
+    ) -> CachedQuery:
+        """Return the aggregation for a query, from cache when valid."""
+        if self.cache is None:
+            result = await self.aggregator.aggregate(aggregation_type, start_time, end_time, filters)
+            return CachedQuery(result=result, generation=None)
+        
+        key = make_query_key(aggregation_type, start_time, end_time, filters)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        
+        # Capture validity before aggregating so a flush that lands while
+        # we read makes this entry stale rather than silently missing data
+        generation = None if self.cache.is_sealed(end_time) else self.cache.writer.flush_generation
+        
+        result = await self.aggregator.aggregate(aggregation_type, start_time, end_time, filters)
+        cached = CachedQuery(result=result, generation=generation)
+        self.cache.put(key, cached)
+        return cached
+    
+    def _format_content(
+        self,
+        result: AggregationResult,
+        format: ReportFormat,
+        title: str
+    ) -> str:
+        """Render an aggregation result in the requested format."""
+        if format == ReportFormat.JSON:
+            content = self._format_json(result)
+        elif format == ReportFormat.MARKDOWN:
+            content = self._format_markdown(result, title)
+        elif format == ReportFormat.HTML:
+            content = self._format_html(result, title)
+        elif format == ReportFormat.CSV:
+            content = self._format_csv(result)
+        elif format == ReportFormat.TEXT:
+            content = self._format_text(result, title)
+        else:
+            raise ValueError(f"Unsupported format: {format}")
+        
+        return content
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get result cache statistics."""
+        if self.cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.cache.get_stats()}
+    
     def _generate_title(
         self,
         aggregation_type: AggregationType,
@@ -0,0 +1,512 @@
+"""
+Vectorized aggregation backend for Analytics Engine.
+
+Loads a batch of parsed metrics into typed NumPy arrays (epoch timestamps,
+type codes, durations, tokens, success flags and factorized identifiers)
+and computes bucketed counts, sums and percentiles with array operations
+instead of one dict update per event.
+
+The results are identical to the pure-Python aggregation path:
+- Categorical breakdowns keep first-occurrence ordering
+- Float sums use ``np.add.at``, which accumulates in event order
+- Means are computed from an exact sum, as ``statistics.mean`` does
+- Integer-only inputs produce integer outputs
+
+NumPy is optional. When it is not installed, or a batch contains values the
+array layout cannot represent exactly (naive or non-UTC timestamps,
+non-numeric durations), callers fall back to the pure-Python path.
+"""
+
+from datetime import datetime, timezone, timedelta
+from fractions import Fraction
+from typing import Dict, List, Any, Optional, Sequence
+from dataclasses import dataclass
+
+from ..utils.logging import get_logger
+from .parser import ParsedMetric
+from .writer import MetricType
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+logger = get_logger(__name__)
+
+HAS_NUMPY = np is not None
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ZERO = timedelta(0)
+_ONE_US = timedelta(microseconds=1)
+_US_PER_HOUR = 3_600_000_000
+_US_PER_DAY = 86_400_000_000
+
+# Largest integer float64 represents exactly
+_MAX_EXACT_INT = 2 ** 53
+
+
+class _Factorizer:
+    """Assigns dense integer codes to values in first-occurrence order."""
+    
+    __slots__ = ("codes", "values")
+    
+    def __init__(self):
+        self.codes: Dict[Any, int] = {}
+        self.values: List[Any] = []
+    
+    def code(self, value: Any) -> int:
+        """Return the code for value, or -1 for falsy values."""
+        if not value:
+            return -1
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+
+@dataclass
+class MetricArrays:
+    """Column-oriented view of a batch of parsed metrics."""
+    timestamps_us: "np.ndarray"      # int64 microseconds since the epoch
+    type_codes: "np.ndarray"         # int64 index into types
+    durations: "np.ndarray"          # float64, NaN where duration_ms is None
+    duration_is_float: "np.ndarray"  # bool, True where duration_ms was a float
+    tokens: "np.ndarray"             # int64, 0 where token_count is falsy
+    success: "np.ndarray"            # int8: -1 unknown, 0 failure, 1 success
+    session_codes: "np.ndarray"      # int64, -1 where session_id is falsy
+    user_codes: "np.ndarray"
+    tool_codes: "np.ndarray"
+    agent_codes: "np.ndarray"
+    error_codes: "np.ndarray"        # only set for ERROR_OCCURRED metrics
+    
+    types: List[MetricType]
+    sessions: List[str]
+    users: List[str]
+    tools: List[str]
+    agents: List[str]
+    error_types: List[str]
+    
+    def __len__(self) -> int:
+        return len(self.timestamps_us)
+    
+    @property
+    def error_mask(self) -> "np.ndarray":
+        """Boolean mask of ERROR_OCCURRED metrics."""
+        try:
+            error_code = self.types.index(MetricType.ERROR_OCCURRED)
+        except ValueError:
+            return np.zeros(len(self), dtype=bool)
+        return self.type_codes == error_code
+    
+    @classmethod
+    def from_metrics(cls, metrics: Sequence[ParsedMetric]) -> Optional["MetricArrays"]:
+        """
+        Load parsed metrics into typed arrays.
+        
+        Args:
+            metrics: Parsed metrics to load
+        
+        Returns:
+            Metric arrays, or None if NumPy is unavailable or the batch
+            cannot be represented exactly
+        """
+        if not HAS_NUMPY:
+            return None
+        
+        n = len(metrics)
+        timestamps = [0] * n
+        type_codes = [0] * n
+        durations = [0.0] * n
+        duration_is_float = [False] * n
+        tokens = [0] * n
+        success = [-1] * n
+        session_codes = [-1] * n
+        user_codes = [-1] * n
+        tool_codes = [-1] * n
+        agent_codes = [-1] * n
+        error_codes = [-1] * n
+        
+        types = _Factorizer()
+        sessions = _Factorizer()
+        users = _Factorizer()
+        tools = _Factorizer()
+        agents = _Factorizer()
+        error_types = _Factorizer()
+        nan = float("nan")
+        
+        for i, metric in enumerate(metrics):
+            timestamp = metric.timestamp
+            if timestamp.utcoffset() != _ZERO:
+                return None
+            timestamps[i] = (timestamp - _EPOCH) // _ONE_US
+            
+            type_codes[i] = types.code(metric.type)
+            
+            duration = metric.duration_ms
+            if duration is None:
+                durations[i] = nan
+            elif type(duration) is float:
+                durations[i] = duration
+                duration_is_float[i] = True
+            elif type(duration) is int and abs(duration) < _MAX_EXACT_INT:
+                durations[i] = duration
+            else:
+                return None
+            
+            token_count = metric.token_count
+            if token_count:
+                if type(token_count) is not int:
+                    return None
+                tokens[i] = token_count
+            
+            if metric.success is not None:
+                success[i] = 1 if metric.success else 0
+            
+            session_codes[i] = sessions.code(metric.session_id)
+            user_codes[i] = users.code(metric.user_id)
+            tool_codes[i] = tools.code(metric.tool_name)
+            agent_codes[i] = agents.code(metric.agent_id)
+            if metric.type == MetricType.ERROR_OCCURRED:
+                error_codes[i] = error_types.code(metric.error_type)
+        
+        try:
+            return cls(
+                timestamps_us=np.array(timestamps, dtype=np.int64),
+                type_codes=np.array(type_codes, dtype=np.int64),
+                durations=np.array(durations, dtype=np.float64),
+                duration_is_float=np.array(duration_is_float, dtype=bool),
+                tokens=np.array(tokens, dtype=np.int64),
+                success=np.array(success, dtype=np.int8),
+                session_codes=np.array(session_codes, dtype=np.int64),
+                user_codes=np.array(user_codes, dtype=np.int64),
+                tool_codes=np.array(tool_codes, dtype=np.int64),
+                agent_codes=np.array(agent_codes, dtype=np.int64),
+                error_codes=np.array(error_codes, dtype=np.int64),
+                types=types.values,
+                sessions=sessions.values,
+                users=users.values,
+                tools=tools.values,
+                agents=agents.values,
+                error_types=error_types.values
+            )
+        except OverflowError:
+            # Token counts beyond int64
+            return None
+
+
+def _datetime_from_us(us: int) -> datetime:
+    """Convert epoch microseconds back to an aware UTC datetime."""
+    return _EPOCH + timedelta(microseconds=us)
+
+
+def _number(value: Any, is_int: bool) -> Any:
+    """Convert a NumPy scalar to the Python type the pure path produces."""
+    return int(value) if is_int else float(value)
+
+
+def _element(values: "np.ndarray", is_float: "np.ndarray", index: int) -> Any:
+    """Return values[index] as the int or float it was loaded from."""
+    return _number(values[index], not is_float[index])
+
+
+def _ranked_element(
+    values: "np.ndarray",
+    is_float: "np.ndarray",
+    value: float,
+    rank: int
+) -> Any:
+    """
+    Return the element a stable sort would place at rank.
+    
+    Among equal values a stable sort keeps event order, which decides
+    whether an int or a float ends up at that position.
+    """
+    ties = np.flatnonzero(values == value)
+    index = ties[rank - int((values < value).sum())]
+    return _element(values, is_float, int(index))
+
+
+def _exact_sum(values: "np.ndarray") -> Fraction:
+    """
+    Compute the exact (unrounded) sum of float64 values.
+    
+    Each value is split into an integer mantissa and a power-of-two
+    exponent; mantissas are summed exactly per exponent in int64 and the
+    partial sums are combined with Python integers.
+    """
+    if not len(values):
+        return Fraction(0)
+    
+    mantissas, exponents = np.frexp(values)
+    ints = (mantissas * float(1 << 53)).astype(np.int64)
+    exponents = exponents.astype(np.int64) - 53
+    
+    min_exp = int(exponents.min())
+    offsets = exponents - min_exp
+    width = int(offsets.max()) + 1
+    
+    # Split mantissas so per-exponent sums cannot overflow int64
+    high_sums = np.zeros(width, dtype=np.int64)
+    low_sums = np.zeros(width, dtype=np.int64)
+    np.add.at(high_sums, offsets, ints >> 26)
+    np.add.at(low_sums, offsets, ints & ((1 << 26) - 1))
+    
+    total = 0
+    for offset, (high, low) in enumerate(zip(high_sums.tolist(), low_sums.tolist())):
+        if high or low:
+            total += ((high << 26) + low) << offset
+    
+    if min_exp >= 0:
+        return Fraction(total << min_exp)
+    return Fraction(total, 1 << -min_exp)
+
+
+def _exact_mean(values: "np.ndarray", has_float: bool) -> Any:
+    """Mean with the same rounding and result type as statistics.mean."""
+    mean = _exact_sum(values) / len(values)
+    if not has_float and mean.denominator == 1:
+        return int(mean)
+    return float(mean)
+
+
+def _sequential_sum(values: "np.ndarray") -> float:
+    """Left-to-right float sum matching repeated ``+=``."""
+    return float(np.cumsum(values)[-1]) if len(values) else 0.0
+
+
+def _group_counts(codes: "np.ndarray", size: int) -> "np.ndarray":
+    """Count occurrences of each non-negative code."""
+    return np.bincount(codes[codes >= 0], minlength=size)
+
+
+def _group_duration_sums(
+    arrays: MetricArrays,
+    codes: "np.ndarray",
+    size: int
+) -> List[Any]:
+    """
+    Sum truthy durations per group in event order.
+    
+    Groups with no float contributions produce ints, matching the pure path
+    which starts each accumulator at integer zero.
+    """
+    durations = arrays.durations
+    mask = (codes >= 0) & ~np.isnan(durations) & (durations != 0)
+    group_codes = codes[mask]
+    
+    sums = np.zeros(size, dtype=np.float64)
+    np.add.at(sums, group_codes, durations[mask])
+    float_counts = np.bincount(
+        group_codes[arrays.duration_is_float[mask]], minlength=size
+    )
+    
+    return [
+        _number(total, not has_float)
+        for total, has_float in zip(sums.tolist(), float_counts.tolist())
+    ]
+
+
+def _group_token_sums(
+    arrays: MetricArrays,
+    codes: "np.ndarray",
+    size: int
+) -> List[int]:
+    """Sum token counts per group."""
+    mask = (codes >= 0) & (arrays.tokens != 0)
+    sums = np.zeros(size, dtype=np.int64)
+    np.add.at(sums, codes[mask], arrays.tokens[mask])
+    return sums.tolist()
+
+
+def _usage_breakdown(
+    arrays: MetricArrays,
+    codes: "np.ndarray",
+    names: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """Build tools_usage/agents_usage style breakdowns."""
+    size = len(names)
+    if not size:
+        return {}
+    
+    counts = _group_counts(codes, size).tolist()
+    successes = _group_counts(np.where(arrays.success == 1, codes, -1), size).tolist()
+    durations = _group_duration_sums(arrays, codes, size)
+    
+    usage = {}
+    for name, count, success, total_duration in zip(names, counts, successes, durations):
+        usage[name] = {
+            "count": count,
+            "success": success,
+            "failure": count - success,
+            "total_duration_ms": total_duration,
+            "avg_duration_ms": total_duration / count
+            if count > 0 and total_duration > 0 else 0
+        }
+    return usage
+
+
+def aggregate_base_stats(arrays: MetricArrays, result: Any) -> None:
+    """Vectorized equivalent of MetricsAggregator._aggregate_base_stats."""
+    # Count by type, in first-occurrence order
+    type_counts = np.bincount(arrays.type_codes, minlength=len(arrays.types))
+    for metric_type, count in zip(arrays.types, type_counts.tolist()):
+        result.metrics_by_type[metric_type.value] = count
+    
+    # Errors
+    error_mask = arrays.error_mask
+    result.total_errors = int(error_mask.sum())
+    error_counts = _group_counts(arrays.error_codes, len(arrays.error_types))
+    for error_type, count in zip(arrays.error_types, error_counts.tolist()):
+        result.errors_by_type[error_type] = count
+    
+    # Durations
+    present = ~np.isnan(arrays.durations)
+    durations = arrays.durations[present]
+    if len(durations):
+        is_float = arrays.duration_is_float[present]
+        has_float = bool(is_float.any())
+        
+        result.total_duration_ms = _number(_sequential_sum(durations), not has_float)
+        result.avg_duration_ms = _exact_mean(durations, has_float)
+        result.min_duration_ms = _element(durations, is_float, int(durations.argmin()))
+        result.max_duration_ms = _element(durations, is_float, int(durations.argmax()))
+        
+        # Calculate percentiles with the same indices as the sorted list
+        n = len(durations)
+        indices = [n // 2, int(n * 0.95), int(n * 0.99)]
+        partitioned = np.partition(durations, indices)
+        result.p50_duration_ms, result.p95_duration_ms, result.p99_duration_ms = [
+            _ranked_element(durations, is_float, partitioned[k], k) for k in indices
+        ]
+    
+    # Success/failure
+    result.success_count = int((arrays.success == 1).sum())
+    result.failure_count = int((arrays.success == 0).sum())
+    
+    # Tokens
+    result.total_tokens = int(arrays.tokens.sum())
+    
+    # Tool and agent usage
+    result.tools_usage.update(_usage_breakdown(arrays, arrays.tool_codes, arrays.tools))
+    result.agents_usage.update(_usage_breakdown(arrays, arrays.agent_codes, arrays.agents))
+    
+    # Set counts
+    result.total_sessions = len(arrays.sessions)
+    result.total_users = len(arrays.users)
+    
+    # Calculate success rate
+    total_outcomes = result.success_count + result.failure_count
+    if total_outcomes > 0:
+        result.success_rate = result.success_count / total_outcomes
+    
+    # Calculate average tokens per session
+    if result.total_sessions > 0:
+        result.avg_tokens_per_session = result.total_tokens / result.total_sessions
+
+
+def _time_buckets(arrays: MetricArrays, bucket_us: int):
+    """Group metrics into fixed-width UTC time buckets."""
+    bucket_index = arrays.timestamps_us // bucket_us
+    buckets, inverse = np.unique(bucket_index, return_inverse=True)
+    return buckets, inverse.ravel()
+
+
+def _bucketed_series(
+    arrays: MetricArrays,
+    bucket_us: int,
+    with_sessions: bool
+) -> List[Dict[str, Any]]:
+    """Build an hourly/daily time series."""
+    buckets, inverse = _time_buckets(arrays, bucket_us)
+    size = len(buckets)
+    
+    counts = np.bincount(inverse, minlength=size).tolist()
+    errors = np.bincount(inverse[arrays.error_mask], minlength=size).tolist()
+    durations = _group_duration_sums(arrays, inverse, size)
+    tokens = _group_token_sums(arrays, inverse, size)
+    
+    if with_sessions:
+        session_mask = arrays.session_codes >= 0
+        n_sessions = max(len(arrays.sessions), 1)
+        pairs = np.unique(
+            inverse[session_mask] * n_sessions + arrays.session_codes[session_mask]
+        )
+        sessions = np.bincount(pairs // n_sessions, minlength=size).tolist()
+    
+    series = []
+    for i, bucket in enumerate(buckets.tolist()):
+        entry = {
+            "timestamp": _datetime_from_us(bucket * bucket_us).isoformat(),
+            "metrics_count": counts[i]
+        }
+        if with_sessions:
+            entry["sessions"] = sessions[i]
+        entry["errors"] = errors[i]
+        entry["total_duration_ms"] = durations[i]
+        entry["tokens"] = tokens[i]
+        series.append(entry)
+    
+    return series
+
+
+def aggregate_hourly(arrays: MetricArrays, result: Any) -> None:
+    """Vectorized equivalent of MetricsAggregator._aggregate_hourly."""
+    result.time_series.extend(_bucketed_series(arrays, _US_PER_HOUR, with_sessions=False))
+
+
+def aggregate_daily(arrays: MetricArrays, result: Any) -> None:
+    """Vectorized equivalent of MetricsAggregator._aggregate_daily."""
+    result.time_series.extend(_bucketed_series(arrays, _US_PER_DAY, with_sessions=True))
+
+
+def aggregate_by_session(arrays: MetricArrays, result: Any) -> None:
+    """Vectorized equivalent of MetricsAggregator._aggregate_by_session."""
+    size = len(arrays.sessions)
+    if not size:
+        return
+    
+    codes = arrays.session_codes
+    mask = codes >= 0
+    session_codes = codes[mask]
+    timestamps = arrays.timestamps_us[mask]
+    
+    counts = np.bincount(session_codes, minlength=size).tolist()
+    errors = _group_counts(np.where(arrays.error_mask, codes, -1), size).tolist()
+    durations = _group_duration_sums(arrays, codes, size)
+    tokens = _group_token_sums(arrays, codes, size)
+    
+    starts = np.full(size, np.iinfo(np.int64).max, dtype=np.int64)
+    ends = np.full(size, np.iinfo(np.int64).min, dtype=np.int64)
+    np.minimum.at(starts, session_codes, timestamps)
+    np.maximum.at(ends, session_codes, timestamps)
+    
+    # Per-session tool counts, keeping first-occurrence order
+    tool_uses: List[Dict[str, int]] = [{} for _ in range(size)]
+    pair_mask = mask & (arrays.tool_codes >= 0)
+    if pair_mask.any():
+        n_tools = len(arrays.tools)
+        keys = codes[pair_mask] * n_tools + arrays.tool_codes[pair_mask]
+        unique_keys, first_index, pair_counts = np.unique(
+            keys, return_index=True, return_counts=True
+        )
+        order = np.argsort(first_index, kind="stable")
+        for key, count in zip(unique_keys[order].tolist(), pair_counts[order].tolist()):
+            session_code, tool_code = divmod(key, n_tools)
+            tool_uses[session_code][arrays.tools[tool_code]] = count
+    
+    for i, session_id in enumerate(arrays.sessions):
+        start_us = int(starts[i])
+        end_us = int(ends[i])
+        result.time_series.append({
+            "session_id": session_id,
+            "start_time": _datetime_from_us(start_us).isoformat(),
+            "end_time": _datetime_from_us(end_us).isoformat(),
+            "duration_seconds": (end_us - start_us) / 10**6,
+            "metrics_count": counts[i],
+            "tool_uses": tool_uses[i],
+            "errors": errors[i],
+            "total_duration_ms": durations[i],
+            "tokens": tokens[i]
+        })
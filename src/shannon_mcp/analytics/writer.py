@@ -6,6 +6,7 @@ Handles writing metrics to JSONL files with:
 - File rotation
 - Compression support
 - Thread-safe operations
+- Background group-commit flushing
 """
 
 import json
@@ -13,19 +14,30 @@ import asyncio
 import aiofiles
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Deque, Set, Callable
 from dataclasses import dataclass, asdict
 from contextlib import asynccontextmanager
+from collections import deque
 import gzip
+import shutil
+import time
 import uuid
 from enum import Enum
 
 from ..utils.logging import get_logger
 from ..utils.errors import ShannonError
+from ..utils.stats import Histogram, DEFAULT_COUNT_BUCKETS, DEFAULT_LATENCY_BUCKETS_MS
 
 logger = get_logger(__name__)
 
 
+def _as_utc(timestamp: datetime) -> datetime:
+    """Return an aware UTC timestamp, treating naive values as UTC."""
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.astimezone(timezone.utc)
+
+
 class MetricType(str, Enum):
     """Types of metrics we track."""
     SESSION_START = "session_start"
@@ -78,7 +90,14 @@ class MetricEntry:
 
 
 class JSONLWriter:
-    """Writes metrics to JSONL files with rotation and compression."""
+    """
+    Writes metrics to JSONL files with rotation and compression.
+    
+    Producers only append to an in-memory queue; a background flusher task
+    drains it on a time or size trigger and group-commits each batch as a
+    single write to a file handle that stays open between flushes. Rotated
+    files are compressed in a worker thread off the flush path.
+    """
     
     def __init__(
         self,
@@ -86,7 +105,8 @@ class JSONLWriter:
         max_file_size: int = 100 * 1024 * 1024,  # 100MB
         max_files: int = 10,
         compress_old: bool = True,
-        buffer_size: int = 100
+        buffer_size: int = 100,
+        flush_interval: float = 1.0
     ):
         """
         Initialize JSONL writer.
@@ -96,48 +116,100 @@ class JSONLWriter:
             max_file_size: Maximum size before rotation
             max_files: Maximum number of files to keep
             compress_old: Whether to compress rotated files
-            buffer_size: Number of entries to buffer before writing
+            buffer_size: Number of queued entries that triggers a flush
+            flush_interval: Maximum seconds between background flushes
         """
         self.base_path = Path(base_path)
         self.max_file_size = max_file_size
         self.max_files = max_files
         self.compress_old = compress_old
         self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
         
         # Create directory if needed
         self.base_path.mkdir(parents=True, exist_ok=True)
         
-        # Current file and buffer
+        # Current file and pending queue (deque appends are atomic, so
+        # producers never take a lock)
         self.current_file: Optional[Path] = None
-        self.buffer: List[MetricEntry] = []
+        self.buffer: Deque[MetricEntry] = deque()
+        
+        # Serializes flushes only; writers never wait on it
         self.write_lock = asyncio.Lock()
         
         # File handle cache
         self._file_handle = None
+        self._current_size = 0
+        
+        # Background flusher
+        self._flush_event: Optional[asyncio.Event] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._closing = False
+        
+        # Rotated files awaiting compression
+        self._compression_tasks: Set[asyncio.Task] = set()
+        self._rotating: Set[Path] = set()
         
+        # Incremented after every successful flush
+        self.flush_generation = 0
+        
+        # Oldest timestamp that may still be appended to the live file
+        self._live_since: Optional[datetime] = None
+        
+        # Callbacks invoked synchronously for every queued entry
+        self._listeners: List[Callable[[MetricEntry], None]] = []
+        
+        # Instrumentation
+        self.queue_depth_histogram = Histogram(DEFAULT_COUNT_BUCKETS)
+        self.flush_latency_histogram = Histogram(DEFAULT_LATENCY_BUCKETS_MS)
+        self._entries_written = 0
+        self._bytes_written = 0
+        self._flush_errors = 0
+        self._entries_dropped = 0
+        self._rotations = 0
+    
     @property
     def metrics_dir(self) -> Path:
         """Get metrics directory."""
         return self.base_path / "metrics"
     
+    @property
+    def sealed_before(self) -> Optional[datetime]:
+        """
+        Timestamp before which no further entries will be flushed.
+        
+        Metrics older than this are already on disk and will not change, so
+        readers can treat time ranges ending before it as immutable. Returns
+        None until a live file has been opened.
+        """
+        if self._live_since is None:
+            return None
+        
+        sealed = self._live_since
+        for entry in self.buffer:
+            sealed = min(sealed, _as_utc(entry.timestamp))
+        return sealed
+    
     async def initialize(self) -> None:
         """Initialize writer and ensure current file exists."""
         self.metrics_dir.mkdir(parents=True, exist_ok=True)
         await self._ensure_current_file()
-        
+        self._ensure_flusher()
+    
     async def write(self, entry: MetricEntry) -> None:
         """
         Write a metric entry.
         
+        The entry is queued and persisted by the background flusher; this
+        never waits on disk I/O.
+        
         Args:
             entry: Metric entry to write
         """
-        async with self.write_lock:
-            self.buffer.append(entry)
-            
-            # Flush if buffer is full
-            if len(self.buffer) >= self.buffer_size:
-                await self._flush_buffer()
+        self.buffer.append(entry)
+        if self._listeners:
+            self._notify_listeners([entry])
+        self._signal_if_full()
     
     async def write_batch(self, entries: List[MetricEntry]) -> None:
         """
@@ -146,45 +218,170 @@ class JSONLWriter:
         Args:
             entries: List of metric entries to write
         """
-        async with self.write_lock:
-            self.buffer.extend(entries)
-            
-            # Flush if buffer is full
-            if len(self.buffer) >= self.buffer_size:
-                await self._flush_buffer()
+        self.buffer.extend(entries)
+        if self._listeners:
+            self._notify_listeners(entries)
+        self._signal_if_full()
+    
+    def add_listener(self, listener: Callable[[MetricEntry], None]) -> None:
+        """
+        Register a callback for every entry as it is queued.
+        
+        Listeners run inline on the write path before the entry reaches
+        disk, so they must be cheap and must not block.
+        
+        Args:
+            listener: Callable receiving each metric entry
+        """
+        self._listeners.append(listener)
+    
+    def remove_listener(self, listener: Callable[[MetricEntry], None]) -> None:
+        """
+        Unregister a listener.
+        
+        Args:
+            listener: Previously registered callable
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    def _notify_listeners(self, entries: List[MetricEntry]) -> None:
+        """Pass queued entries to listeners, isolating their failures."""
+        for listener in self._listeners:
+            for entry in entries:
+                try:
+                    listener(entry)
+                except Exception as e:
+                    logger.warning(f"Metrics listener failed: {e}")
     
     async def flush(self) -> None:
-        """Force flush the buffer."""
+        """Force flush the queue and wait until it is on disk."""
         async with self.write_lock:
             await self._flush_buffer()
     
+    def _signal_if_full(self) -> None:
+        """Start the flusher if needed and wake it on the size trigger."""
+        self._ensure_flusher()
+        if len(self.buffer) >= self.buffer_size:
+            self._flush_event.set()
+    
+    def _ensure_flusher(self) -> None:
+        """Start the background flusher task if it is not running."""
+        if self._closing:
+            return
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flush_event = asyncio.Event()
+            self._flusher_task = asyncio.create_task(self._flush_loop())
+    
+    async def _flush_loop(self) -> None:
+        """Drain the queue on a size trigger or every flush_interval."""
+        while not self._closing:
+            try:
+                await asyncio.wait_for(
+                    self._flush_event.wait(),
+                    timeout=self.flush_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            
+            self._flush_event.clear()
+            
+            try:
+                async with self.write_lock:
+                    await self._flush_buffer()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._flush_errors += 1
+                logger.error(f"Background metrics flush failed: {e}")
+    
     async def _flush_buffer(self) -> None:
-        """Flush buffer to disk."""
+        """Flush queued entries to disk as one joined write."""
         if not self.buffer:
             return
-            
-        await self._ensure_current_file()
         
-        # Write entries
-        async with aiofiles.open(self.current_file, 'a') as f:
-            for entry in self.buffer:
-                line = json.dumps(entry.to_dict(), separators=(',', ':'))
-                await f.write(line + '\n')
+        start = time.perf_counter()
+        
+        # Take a snapshot of the current depth; entries queued while we
+        # write are picked up by the next flush
+        depth = len(self.buffer)
+        self.queue_depth_histogram.observe(depth)
+        
+        # Serialize entry by entry so one bad entry does not cost the batch
+        entries = []
+        lines = []
+        for _ in range(depth):
+            entry = self.buffer.popleft()
+            try:
+                lines.append(json.dumps(entry.to_dict(), separators=(',', ':')) + '\n')
+            except Exception as e:
+                self._entries_dropped += 1
+                logger.error(f"Dropping unserializable metric {entry.id}: {e}")
+                continue
+            entries.append(entry)
+        
+        if not entries:
+            return
+        
+        payload = "".join(lines)
+        
+        try:
+            handle = await self._get_file_handle()
+            await handle.write(payload)
+            await handle.flush()
+        except Exception:
+            # Put entries back in order so they are retried
+            self.buffer.extendleft(reversed(entries))
+            await self._close_file_handle()
+            raise
+        
+        oldest = min(_as_utc(entry.timestamp) for entry in entries)
+        if self._live_since is None or oldest < self._live_since:
+            self._live_since = oldest
+        
+        encoded_size = len(payload.encode('utf-8'))
+        self._current_size += encoded_size
+        self._bytes_written += encoded_size
+        self._entries_written += len(entries)
+        self.flush_generation += 1
+        self.flush_latency_histogram.observe((time.perf_counter() - start) * 1000)
         
-        logger.debug(f"Flushed {len(self.buffer)} metrics to {self.current_file}")
-        self.buffer.clear()
+        logger.debug(f"Flushed {len(entries)} metrics to {self.current_file}")
         
         # Check if rotation needed
         await self._check_rotation()
     
+    async def _get_file_handle(self):
+        """Return the cached append handle for the current file."""
+        if self._file_handle is not None and self.current_file and self.current_file.exists():
+            return self._file_handle
+        
+        await self._close_file_handle()
+        await self._ensure_current_file()
+        self._file_handle = await aiofiles.open(self.current_file, 'a')
+        self._current_size = self.current_file.stat().st_size
+        return self._file_handle
+    
+    async def _close_file_handle(self) -> None:
+        """Close the cached file handle if open."""
+        if self._file_handle is not None:
+            try:
+                await self._file_handle.close()
+            except Exception as e:
+                logger.warning(f"Error closing metrics file handle: {e}")
+            self._file_handle = None
+    
     async def _ensure_current_file(self) -> None:
         """Ensure we have a current file to write to."""
         if self.current_file and self.current_file.exists():
             return
-            
+        
+        # Only appends made from now on can change what readers see
+        self._live_since = datetime.now(timezone.utc)
+        
         # Find or create current file
         existing = sorted(
-            self.metrics_dir.glob("metrics_*.jsonl"),
+            (p for p in self.metrics_dir.glob("metrics_*.jsonl") if p not in self._rotating),
             key=lambda p: p.stat().st_mtime if p.exists() else 0,
             reverse=True
         )
@@ -192,71 +389,130 @@ class JSONLWriter:
         if existing and existing[0].stat().st_size < self.max_file_size:
             self.current_file = existing[0]
         else:
-            # Create new file
+            # Create new file, avoiding names still held by a rotated file
             timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-            self.current_file = self.metrics_dir / f"metrics_{timestamp}.jsonl"
+            candidate = self.metrics_dir / f"metrics_{timestamp}.jsonl"
+            suffix = 1
+            while candidate.exists() or candidate.with_suffix('.jsonl.gz').exists():
+                candidate = self.metrics_dir / f"metrics_{timestamp}_{suffix}.jsonl"
+                suffix += 1
+            self.current_file = candidate
             self.current_file.touch()
             logger.info(f"Created new metrics file: {self.current_file}")
     
     async def _check_rotation(self) -> None:
         """Check if file rotation is needed."""
-        if not self.current_file or not self.current_file.exists():
+        if not self.current_file:
             return
-            
-        size = self.current_file.stat().st_size
-        if size >= self.max_file_size:
+        
+        if self._current_size >= self.max_file_size:
             await self._rotate_files()
     
     async def _rotate_files(self) -> None:
-        """Rotate metrics files."""
+        """Rotate metrics files, compressing the old one in a worker thread."""
         logger.info(f"Rotating metrics file: {self.current_file}")
         
-        # Compress current file if needed
-        if self.compress_old and self.current_file:
-            compressed = self.current_file.with_suffix('.jsonl.gz')
-            
-            async with aiofiles.open(self.current_file, 'rb') as f_in:
-                content = await f_in.read()
-                
-            async with aiofiles.open(compressed, 'wb') as f_out:
-                compressed_content = gzip.compress(content)
-                await f_out.write(compressed_content)
-            
-            # Remove original
-            self.current_file.unlink()
-            logger.info(f"Compressed {self.current_file} to {compressed}")
+        rotated = self.current_file
+        await self._close_file_handle()
+        self.current_file = None
+        self._current_size = 0
+        self._rotations += 1
         
-        # Clean up old files
-        await self._cleanup_old_files()
+        if self.compress_old and rotated and rotated.exists():
+            self._rotating.add(rotated)
+            task = asyncio.create_task(self._compress_rotated(rotated))
+            self._compression_tasks.add(task)
+            task.add_done_callback(self._compression_tasks.discard)
+        else:
+            await self._cleanup_old_files()
         
-        # Reset current file
-        self.current_file = None
         await self._ensure_current_file()
     
+    async def _compress_rotated(self, path: Path) -> None:
+        """Compress a rotated file off the event loop, then prune old files."""
+        try:
+            compressed = await asyncio.to_thread(self._compress_file, path)
+            logger.info(f"Compressed {path} to {compressed}")
+        except Exception as e:
+            logger.error(f"Failed to compress rotated metrics file {path}: {e}")
+        finally:
+            self._rotating.discard(path)
+        
+        await self._cleanup_old_files()
+    
+    @staticmethod
+    def _compress_file(path: Path) -> Path:
+        """Stream-compress a file to .jsonl.gz and remove the original."""
+        compressed = path.with_suffix('.jsonl.gz')
+        tmp_path = compressed.with_name(compressed.name + '.tmp')
+        
+        with open(path, 'rb') as f_in, gzip.open(tmp_path, 'wb') as f_out:
+            shutil.copyfileobj(f_in, f_out, 1024 * 1024)
+        
+        tmp_path.replace(compressed)
+        path.unlink()
+        return compressed
+    
     async def _cleanup_old_files(self) -> None:
         """Remove old files exceeding max_files limit."""
         # Get all metrics files
         files = []
         for pattern in ["metrics_*.jsonl", "metrics_*.jsonl.gz"]:
-            files.extend(self.metrics_dir.glob(pattern))
+            files.extend(
+                p for p in self.metrics_dir.glob(pattern)
+                if p not in self._rotating and p != self.current_file
+            )
         
-        # Sort by modification time
+        # Sort by modification time (the live file always counts as newest)
         files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
         
         # Remove excess files
-        for f in files[self.max_files:]:
-            f.unlink()
+        keep = self.max_files - 1 if self.current_file else self.max_files
+        for f in files[max(keep, 0):]:
+            f.unlink(missing_ok=True)
             logger.info(f"Removed old metrics file: {f}")
     
+    def get_stats(self) -> Dict[str, Any]:
+        """Get writer statistics."""
+        return {
+            "queue_depth": len(self.buffer),
+            "flush_generation": self.flush_generation,
+            "sealed_before": self.sealed_before.isoformat() if self.sealed_before else None,
+            "entries_written": self._entries_written,
+            "bytes_written": self._bytes_written,
+            "flush_errors": self._flush_errors,
+            "entries_dropped": self._entries_dropped,
+            "rotations": self._rotations,
+            "pending_compressions": len(self._compression_tasks),
+            "current_file": str(self.current_file) if self.current_file else None,
+            "current_file_size": self._current_size,
+            "queue_depth_histogram": self.queue_depth_histogram.to_dict(),
+            "flush_latency_ms": self.flush_latency_histogram.to_dict()
+        }
+    
     async def close(self) -> None:
         """Close writer and flush remaining data."""
+        self._closing = True
+        
+        if self._flusher_task:
+            # Wake the loop and let it finish its current flush; cancelling
+            # could interrupt a write or rotation halfway
+            self._flush_event.set()
+            await self._flusher_task
+            self._flusher_task = None
+        
         await self.flush()
         
+        if self._compression_tasks:
+            await asyncio.gather(*self._compression_tasks, return_exceptions=True)
+        
+        await self._close_file_handle()
+    
     # Context manager support
     async def __aenter__(self):
         await self.initialize()
         return self
-        
+    
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
 
@@ -13,6 +13,9 @@ from .registry import HookRegistry
 from .engine import HookEngine
 from .templates import HookTemplate, TemplateManager
 from .sandbox import HookSandbox
+from .scheduler import HookScheduler
+from .webhook import WebhookClient
+from .workers import ScriptWorkerPool
 
 __all__ = [
     "HookConfig",
@@ -22,5 +25,8 @@ __all__ = [
     "HookEngine",
     "HookTemplate",
     "TemplateManager",
-    "HookSandbox"
+    "HookSandbox",
+    "HookScheduler",
+    "WebhookClient",
+    "ScriptWorkerPool"
 ]
\ No newline at end of file
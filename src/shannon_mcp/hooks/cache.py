@@ -0,0 +1,193 @@
+"""Memoized results for cacheable hooks"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+from .config import HookConfig, _field_getter
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def _digest(value: Any) -> str:
+    """Stable hash of a JSON-like value"""
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class HookResultCache:
+    """LRU cache of hook results for hooks marked cacheable
+    
+    Entries are keyed by hook name, a fingerprint of the hook's
+    configuration and a hash of the context fields it declares relevant
+    (the whole context by default), plus the content of any files named
+    in the context. Editing a hook or a keyed file therefore misses
+    instead of returning a stale result.
+    
+    Features:
+    - Per-hook TTL (HookConfig.cache_ttl)
+    - Bounded size with least recently used eviction
+    - File content hashes reused while size and mtime are unchanged
+    - Hit, miss, expiry and eviction counters
+    """
+    
+    def __init__(self, max_entries: int = 1024):
+        """Initialize cache
+        
+        Args:
+            max_entries: Results kept before the least recently used is evicted
+        """
+        self.max_entries = max_entries
+        
+        # key -> (expires_at, result)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        
+        # hook name -> (hook identity, updated_at, fingerprint)
+        self._fingerprints: Dict[str, Tuple[int, Any, str]] = {}
+        
+        # path -> (size, mtime_ns, sha256)
+        self._file_digests: Dict[str, Tuple[int, int, str]] = {}
+        
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+    
+    async def key_for(self, hook: HookConfig, context: Dict[str, Any]) -> str:
+        """Build the cache key for one invocation
+        
+        Args:
+            hook: Cacheable hook
+            context: Execution context
+        
+        Returns:
+            Cache key
+        """
+        if hook.cache_key_fields:
+            relevant = {
+                field: _field_getter(field)(context) for field in hook.cache_key_fields
+            }
+        else:
+            relevant = context
+        
+        files = {}
+        for field in hook.cache_key_files:
+            path = _field_getter(field)(context)
+            if path:
+                files[field] = await asyncio.to_thread(self._file_digest, str(path))
+        
+        return f"{hook.name}:{self._fingerprint(hook)}:{_digest([relevant, files])}"
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Look up a live result
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Cached result, or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            self.expired += 1
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return result
+    
+    def put(self, key: str, result: Any, ttl: float) -> None:
+        """Store a result
+        
+        Args:
+            key: Cache key
+            result: Result to store
+            ttl: Seconds the result stays valid
+        """
+        self._entries[key] = (time.monotonic() + ttl, result)
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def invalidate(self, hook_name: Optional[str] = None) -> int:
+        """Drop cached results
+        
+        Args:
+            hook_name: Only drop this hook's results (all when None)
+        
+        Returns:
+            Number of results dropped
+        """
+        if hook_name is None:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+        
+        prefix = f"{hook_name}:"
+        keys = [key for key in self._entries if key.startswith(prefix)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+    
+    def _fingerprint(self, hook: HookConfig) -> str:
+        """Config fingerprint, recomputed only when the hook changes"""
+        cached = self._fingerprints.get(hook.name)
+        if cached and cached[0] == id(hook) and cached[1] == hook.updated_at:
+            return cached[2]
+        
+        fingerprint = hook.fingerprint()
+        self._fingerprints[hook.name] = (id(hook), hook.updated_at, fingerprint)
+        return fingerprint
+    
+    def _file_digest(self, path: str) -> Optional[str]:
+        """Content hash of a file, reused while its size and mtime hold"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        
+        cached = self._file_digests.get(path)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            return cached[2]
+        
+        sha = hashlib.sha256()
+        try:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    sha.update(chunk)
+        except OSError:
+            return None
+        
+        digest = sha.hexdigest()
+        if len(self._file_digests) >= self.max_entries:
+            self._file_digests.clear()
+        self._file_digests[path] = (st.st_size, st.st_mtime_ns, digest)
+        return digest
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "expired": self.expired,
+            "evictions": self.evictions
+        }
@@ -0,0 +1,141 @@
+"""Compiled templates and transform expressions for hook actions"""
+
+from functools import lru_cache
+from string import Template
+from typing import Dict, Any, Optional, Tuple
+
+from ..utils.errors import HookExecutionError
+
+# Marks an identifier the context cannot supply; safe_substitute keeps it as-is
+_MISSING = object()
+
+
+def resolve(context: Dict[str, Any], key: str) -> Any:
+    """Look up a top-level context key"""
+    return context.get(key, _MISSING)
+
+
+def resolve_flat(context: Dict[str, Any], key: str, sep: str = "_") -> Any:
+    """Look up a key of the flattened context without flattening it
+    
+    Nested dictionaries are addressed by joining their keys with sep, so
+    "file_path" finds context["file"]["path"]. Only leaf values resolve.
+    """
+    value = context.get(key, _MISSING)
+    if value is not _MISSING and not isinstance(value, dict):
+        return value
+    
+    start = key.find(sep)
+    while start != -1:
+        child = context.get(key[:start])
+        if isinstance(child, dict):
+            value = resolve_flat(child, key[start + len(sep):], sep)
+            if value is not _MISSING:
+                return value
+        start = key.find(sep, start + 1)
+    
+    return _MISSING
+
+
+class CompiledTemplate:
+    """A string.Template parsed once, with the identifiers it references"""
+    
+    __slots__ = ("template", "identifiers")
+    
+    def __init__(self, source: str):
+        self.template = Template(source)
+        
+        identifiers = []
+        for match in self.template.pattern.finditer(source):
+            name = match.group("named") or match.group("braced")
+            if name and name not in identifiers:
+                identifiers.append(name)
+        self.identifiers: Tuple[str, ...] = tuple(identifiers)
+    
+    def render(self, context: Dict[str, Any], flat: bool = False) -> str:
+        """Substitute the referenced context values
+        
+        Args:
+            context: Execution context
+            flat: Resolve identifiers against the flattened context
+        
+        Returns:
+            Rendered string; unknown placeholders are left in place
+        """
+        lookup = resolve_flat if flat else resolve
+        
+        mapping = {}
+        for name in self.identifiers:
+            value = lookup(context, name)
+            if value is not _MISSING:
+                mapping[name] = value
+        
+        return self.template.safe_substitute(mapping)
+
+
+class CompiledAction:
+    """Templates of one HookAction, parsed once
+    
+    When an action has a template, string values in its config are
+    templates too, rendered against the flattened context. The action's
+    own config is never modified; render_config returns a new dict.
+    """
+    
+    __slots__ = ("template", "config_templates")
+    
+    def __init__(self, template: Optional[str], config: Dict[str, Any]):
+        self.template = CompiledTemplate(template) if template else None
+        
+        self.config_templates: Dict[str, CompiledTemplate] = {}
+        if template:
+            self.config_templates = {
+                key: CompiledTemplate(value)
+                for key, value in config.items()
+                if isinstance(value, str) and "$" in value
+            }
+    
+    def render_template(self, context: Dict[str, Any], default: str) -> str:
+        """Render the action template, or return default when there is none"""
+        if self.template is None:
+            return default
+        return self.template.render(context)
+    
+    def render_config(self, config: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+        """Substitute context values into config
+        
+        Args:
+            config: The action's config
+            context: Execution context
+        
+        Returns:
+            config itself when nothing needs substituting, else a new dict
+        """
+        if not self.config_templates:
+            return config
+        
+        rendered = dict(config)
+        for key, template in self.config_templates.items():
+            rendered[key] = template.render(context, flat=True)
+        return rendered
+
+
+@lru_cache(maxsize=256)
+def compile_expression(transform_type: str, expression: str) -> Any:
+    """Parse a transform expression once
+    
+    Args:
+        transform_type: "json" (JSONPath) or "jmespath"
+        expression: Expression source
+    
+    Returns:
+        Compiled expression (jsonpath_ng or jmespath object)
+    """
+    if transform_type == "json":
+        import jsonpath_ng
+        return jsonpath_ng.parse(expression)
+    
+    if transform_type == "jmespath":
+        import jmespath
+        return jmespath.compile(expression)
+    
+    raise HookExecutionError(f"Unknown transform type: {transform_type}")
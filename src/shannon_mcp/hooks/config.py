@@ -1,17 +1,31 @@
 """Hook configuration schema and definitions"""
 
+import hashlib
 import json
+import operator
+import re
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Union, Set
+from typing import Optional, Dict, Any, List, Union, Set, Callable, Tuple
 from datetime import datetime
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 
+from .compiled import CompiledAction
 from ..utils.logging import get_logger
 from ..utils.errors import ValidationError
 
 logger = get_logger(__name__)
 
+# Compiled condition: context -> whether the hook should run
+ConditionPredicate = Callable[[Dict[str, Any]], bool]
+
+_COMPARISONS = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "lt": operator.lt,
+}
+
 
 class HookTrigger(str, Enum):
     """Hook trigger types"""
@@ -65,36 +79,55 @@ class HookCondition:
     
     def evaluate(self, context: Dict[str, Any]) -> bool:
         """Evaluate condition against context"""
-        field_value = self._get_field_value(context, self.field)
+        return self.compile()(context)
         
-        if self.operator == "eq":
-            return field_value == self.value
-        elif self.operator == "ne":
-            return field_value != self.value
-        elif self.operator == "gt":
-            return field_value > self.value
-        elif self.operator == "lt":
-            return field_value < self.value
-        elif self.operator == "contains":
-            return self.value in str(field_value)
-        elif self.operator == "regex":
-            import re
-            return bool(re.match(self.value, str(field_value)))
-        else:
-            raise ValidationError("operator", self.operator, "Invalid operator")
+    def compile(self) -> ConditionPredicate:
+        """Compile condition into a predicate
             
-    def _get_field_value(self, context: Dict[str, Any], field: str) -> Any:
-        """Get nested field value from context"""
-        parts = field.split(".")
-        value = context
+        The field path is split and any regex compiled here, once, so the
+        returned predicate only walks the context and compares.
+        
+        Returns:
+            Predicate taking the execution context
+        """
+        get_value = _field_getter(self.field)
+        expected = self.value
         
+        if self.operator in _COMPARISONS:
+            compare = _COMPARISONS[self.operator]
+            return lambda context: compare(get_value(context), expected)
+            
+        if self.operator == "contains":
+            return lambda context: expected in str(get_value(context))
+            
+        if self.operator == "regex":
+            try:
+                pattern = re.compile(expected)
+            except (re.error, TypeError) as e:
+                raise ValidationError("value", expected, f"Invalid regex: {e}")
+            return lambda context: pattern.match(str(get_value(context))) is not None
+            
+        raise ValidationError("operator", self.operator, "Invalid operator")
+
+
+def _field_getter(field: str) -> Callable[[Dict[str, Any]], Any]:
+    """Build an accessor for a dotted field path"""
+    parts = tuple(field.split("."))
+    
+    if len(parts) == 1:
+        key = parts[0]
+        return lambda context: context.get(key)
+        
+    def get_value(context: Dict[str, Any]) -> Any:
+        value = context
         for part in parts:
             if isinstance(value, dict):
                 value = value.get(part)
             else:
                 return None
-                
         return value
+        
+    return get_value
 
 
 @dataclass
@@ -110,6 +143,25 @@ class HookAction:
     function_name: Optional[str] = None  # For FUNCTION type
     template: Optional[str] = None  # Template string
     
+    # Compiled templates, built on first use
+    _compiled: Optional[CompiledAction] = field(default=None, init=False, repr=False, compare=False)
+    
+    def compile(self) -> CompiledAction:
+        """Compile the action's templates
+        
+        Compiled once and cached; an action is treated as immutable after
+        its first execution.
+        """
+        if self._compiled is None:
+            self._compiled = CompiledAction(self.template, self.config)
+        return self._compiled
+        
+    def with_config(self, config: Dict[str, Any]) -> 'HookAction':
+        """Copy of this action with a different config, sharing compiled templates"""
+        action = replace(self, config=config)
+        action._compiled = self._compiled
+        return action
+        
     def validate(self) -> None:
         """Validate action configuration"""
         if self.type == HookActionType.COMMAND:
@@ -147,6 +199,13 @@ class HookConfig:
     timeout: Optional[float] = None  # Seconds
     retry_count: int = 0
     retry_delay: float = 1.0  # Seconds
+    max_concurrency: int = 1  # Invocations of this hook running at once
+    
+    # Result memoization
+    cacheable: bool = False  # Results depend only on config and key fields
+    cache_ttl: float = 300.0  # Seconds
+    cache_key_fields: List[str] = field(default_factory=list)  # Dotted paths; empty keys on the whole context
+    cache_key_files: List[str] = field(default_factory=list)  # Dotted paths naming files keyed by content
     
     # Security settings
     sandbox: bool = True  # Execute in sandbox
@@ -173,6 +232,12 @@ class HookConfig:
         if not self.actions:
             raise ValidationError("actions", self.actions, "At least one action required")
             
+        if self.max_concurrency < 1:
+            raise ValidationError("max_concurrency", self.max_concurrency, "Must be at least 1")
+            
+        if self.cacheable and self.cache_ttl <= 0:
+            raise ValidationError("cache_ttl", self.cache_ttl, "Must be positive")
+            
         # Validate actions
         for action in self.actions:
             action.validate()
@@ -186,10 +251,32 @@ class HookConfig:
         
     def evaluate_conditions(self, context: Dict[str, Any]) -> bool:
         """Evaluate all conditions"""
+        predicate = self.compile_conditions()
+        return predicate is None or predicate(context)
+        
+    def compile_conditions(self) -> Optional[ConditionPredicate]:
+        """Compile all conditions into one predicate
+        
+        Returns:
+            Predicate requiring every condition, or None if there are none
+        """
         if not self.conditions:
-            return True
+            return None
             
-        return all(condition.evaluate(context) for condition in self.conditions)
+        predicates: Tuple[ConditionPredicate, ...] = tuple(
+            condition.compile() for condition in self.conditions
+        )
+        if len(predicates) == 1:
+            return predicates[0]
+            
+        return lambda context: all(predicate(context) for predicate in predicates)
+        
+    def fingerprint(self) -> str:
+        """Stable hash of everything that affects the hook's behaviour"""
+        data = self.to_dict()
+        del data["created_at"], data["updated_at"]
+        encoded = json.dumps(data, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
         
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -223,6 +310,11 @@ class HookConfig:
             "timeout": self.timeout,
             "retry_count": self.retry_count,
             "retry_delay": self.retry_delay,
+            "max_concurrency": self.max_concurrency,
+            "cacheable": self.cacheable,
+            "cache_ttl": self.cache_ttl,
+            "cache_key_fields": self.cache_key_fields,
+            "cache_key_files": self.cache_key_files,
             "sandbox": self.sandbox,
             "allowed_paths": [str(p) for p in self.allowed_paths],
             "environment": self.environment,
@@ -275,6 +367,11 @@ class HookConfig:
             timeout=data.get("timeout"),
             retry_count=data.get("retry_count", 0),
             retry_delay=data.get("retry_delay", 1.0),
+            max_concurrency=data.get("max_concurrency", 1),
+            cacheable=data.get("cacheable", False),
+            cache_ttl=data.get("cache_ttl", 300.0),
+            cache_key_fields=data.get("cache_key_fields", []),
+            cache_key_files=data.get("cache_key_files", []),
             sandbox=data.get("sandbox", True),
             allowed_paths=[Path(p) for p in data.get("allowed_paths", [])],
             environment=data.get("environment", {}),
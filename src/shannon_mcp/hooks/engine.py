@@ -1,22 +1,29 @@
 """Hook execution engine"""
 
 import asyncio
+import functools
 import subprocess
-import aiohttp
 import json
 import os
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Callable, Union
+from typing import Dict, Any, List, Optional, Callable, Union, Deque
 from datetime import datetime
-from string import Template
 import traceback
 
+from .cache import HookResultCache
+from .compiled import compile_expression
 from .config import HookConfig, HookAction, HookActionType, HookTrigger
 from .registry import HookRegistry
 from .sandbox import HookSandbox
+from .scheduler import HookScheduler
+from .webhook import WebhookClient
+from .workers import ScriptWorkerPool
 from ..utils.logging import get_logger
 from ..utils.errors import HookExecutionError
-from ..utils.notifications import NotificationCenter, NotificationType
+from ..utils.notifications import NotificationCenter, EventCategory
+from ..utils.stats import Histogram
 
 logger = get_logger(__name__)
 
@@ -30,13 +37,15 @@ class HookExecutionResult:
         success: bool,
         output: Optional[Any] = None,
         error: Optional[str] = None,
-        duration: float = 0.0
+        duration: float = 0.0,
+        cached: bool = False
     ):
         self.hook_name = hook_name
         self.success = success
         self.output = output
         self.error = error
         self.duration = duration
+        self.cached = cached
         self.timestamp = datetime.utcnow()
         
     def to_dict(self) -> Dict[str, Any]:
@@ -47,27 +56,78 @@ class HookExecutionResult:
             "output": self.output,
             "error": self.error,
             "duration": self.duration,
+            "cached": self.cached,
             "timestamp": self.timestamp.isoformat()
         }
 
 
+class HookExecutionStats:
+    """Running execution totals for one hook (or all hooks)"""
+    
+    __slots__ = ("executions", "failures", "cached", "duration_ms", "last_run", "last_error")
+    
+    def __init__(self):
+        self.executions = 0
+        self.failures = 0
+        self.cached = 0
+        self.duration_ms = Histogram()
+        self.last_run: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+        
+    def record(self, result: HookExecutionResult) -> None:
+        """Fold one result into the totals"""
+        self.executions += 1
+        if not result.success:
+            self.failures += 1
+            self.last_error = result.error
+        if result.cached:
+            self.cached += 1
+        self.duration_ms.observe(result.duration * 1000)
+        self.last_run = result.timestamp
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            "executions": self.executions,
+            "failures": self.failures,
+            "cached": self.cached,
+            "success_rate": (self.executions - self.failures) / max(1, self.executions),
+            "duration_ms": {
+                "mean": self.duration_ms.mean,
+                "max": self.duration_ms.max,
+                "p50": self.duration_ms.quantile(0.50),
+                "p95": self.duration_ms.quantile(0.95),
+                "p99": self.duration_ms.quantile(0.99)
+            },
+            "last_run": self.last_run.isoformat() if self.last_run else None,
+            "last_error": self.last_error
+        }
+
+
 class HookEngine:
     """Engine for executing hooks
     
     Features:
     - Multiple action type support
-    - Async and sync execution
+    - Async and sync execution on a bounded, priority-ordered pool
     - Retry logic
     - Timeout handling
     - Sandboxed execution
-    - Template variable substitution
+    - Template variable substitution with templates compiled once per action
+    - Pooled, optionally batched webhook delivery
+    - Memoized results for hooks marked cacheable
+    - Fixed-size execution history with per-hook aggregated stats
     """
     
     def __init__(
         self,
         registry: HookRegistry,
         notification_center: Optional[NotificationCenter] = None,
-        custom_functions: Optional[Dict[str, Callable]] = None
+        custom_functions: Optional[Dict[str, Callable]] = None,
+        webhook_client: Optional[WebhookClient] = None,
+        max_workers: int = 16,
+        max_history: int = 1000,
+        max_hook_history: int = 100
     ):
         """Initialize hook engine
         
@@ -75,19 +135,42 @@ class HookEngine:
             registry: Hook registry
             notification_center: Optional notification center
             custom_functions: Custom functions for FUNCTION action type
+            webhook_client: HTTP client for WEBHOOK actions (a pooled
+                client owned by the engine by default)
+            max_workers: Maximum hook executions running at once
+            max_history: Results kept in the execution history
+            max_hook_history: Results kept per hook
         """
         self.registry = registry
         self.notification_center = notification_center or NotificationCenter()
+        self._owns_notification_center = notification_center is None
         self.custom_functions = custom_functions or {}
         
         # Execution tracking
-        self._running_hooks: Set[str] = set()
-        self._execution_history: List[HookExecutionResult] = []
-        self._max_history = 1000
+        self.scheduler = HookScheduler(max_workers=max_workers)
+        
+        # Execution history: fixed-size rings, overall and per hook
+        self._max_history = max_history
+        self._max_hook_history = max_hook_history
+        self._execution_history: Deque[HookExecutionResult] = deque(maxlen=self._max_history)
+        self._hook_history: Dict[str, Deque[HookExecutionResult]] = {}
+        
+        # Aggregates kept up to date as results arrive
+        self._totals = HookExecutionStats()
+        self._hook_stats: Dict[str, HookExecutionStats] = {}
         
         # Sandbox for secure execution
         self.sandbox = HookSandbox()
         
+        # Connection pool shared by all webhook actions
+        self.webhook_client = webhook_client or WebhookClient()
+        
+        # Long-lived interpreters for script actions with "persistent" set
+        self.script_workers = ScriptWorkerPool()
+        
+        # Results of cacheable hooks
+        self.result_cache = HookResultCache()
+        
     async def initialize(self) -> None:
         """Initialize engine"""
         await self.sandbox.initialize()
@@ -97,16 +180,33 @@ class HookEngine:
             custom_functions=list(self.custom_functions.keys())
         )
         
+    async def cleanup(self) -> None:
+        """Release engine resources"""
+        await self.webhook_client.close()
+        await self.script_workers.close()
+        await self.sandbox.cleanup()
+        
+        # A center of our own has a processor task once anything was emitted
+        if self._owns_notification_center:
+            await self.notification_center.shutdown()
+        
     async def trigger(
         self,
         trigger: Union[HookTrigger, str],
-        context: Dict[str, Any]
+        context: Dict[str, Any],
+        wait: bool = True
     ) -> List[HookExecutionResult]:
         """Trigger hooks for an event
         
+        Synchronous hooks run one after another in priority order; async
+        hooks are queued alongside them. All of them share the engine's
+        bounded worker pool.
+        
         Args:
             trigger: Trigger type
             context: Execution context
+            wait: Wait for async hooks; when False they are dispatched
+                fire-and-forget and left out of the results
             
         Returns:
             List of execution results
@@ -127,7 +227,7 @@ class HookEngine:
         
         # Execute hooks
         results = []
-        tasks = []
+        futures = []
         
         for hook in hooks:
             # Check rate limits
@@ -143,18 +243,20 @@ class HookEngine:
             self.registry.record_execution(hook)
             
             # Execute hook
+            run = functools.partial(self._execute_hook, hook, context)
             if hook.async_execution:
                 # Execute asynchronously
-                task = asyncio.create_task(self._execute_hook(hook, context))
-                tasks.append(task)
+                future = self.scheduler.submit(hook, run, detached=not wait)
+                if wait:
+                    futures.append(future)
             else:
                 # Execute synchronously
-                result = await self._execute_hook(hook, context)
+                result = await self.scheduler.submit(hook, run)
                 results.append(result)
                 
-        # Wait for async tasks
-        if tasks:
-            async_results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Wait for async hooks
+        if futures:
+            async_results = await asyncio.gather(*futures, return_exceptions=True)
             for result in async_results:
                 if isinstance(result, Exception):
                     logger.error(f"Async hook execution failed: {result}")
@@ -185,7 +287,10 @@ class HookEngine:
                 error=f"Hook not found: {hook_name}"
             )
             
-        return await self._execute_hook(hook, context or {})
+        return await self.scheduler.submit(
+            hook,
+            functools.partial(self._execute_hook, hook, context or {})
+        )
         
     async def _execute_hook(
         self,
@@ -201,94 +306,100 @@ class HookEngine:
         Returns:
             Execution result
         """
-        # Check if already running
-        if hook.name in self._running_hooks:
-            return HookExecutionResult(
-                hook_name=hook.name,
-                success=False,
-                error="Hook already running"
-            )
-            
-        self._running_hooks.add(hook.name)
         start_time = asyncio.get_event_loop().time()
         
-        try:
-            # Execute with retries
-            last_error = None
-            for attempt in range(hook.retry_count + 1):
-                if attempt > 0:
-                    await asyncio.sleep(hook.retry_delay)
-                    logger.info(f"Retrying hook {hook.name} (attempt {attempt + 1})")
-                    
-                try:
-                    # Execute all actions
-                    outputs = []
-                    for action in hook.actions:
-                        output = await self._execute_action(
-                            action,
-                            hook,
-                            context
-                        )
-                        outputs.append(output)
-                        
-                    # Success
-                    duration = asyncio.get_event_loop().time() - start_time
-                    result = HookExecutionResult(
-                        hook_name=hook.name,
-                        success=True,
-                        output=outputs,
-                        duration=duration
-                    )
-                    
-                    self._add_to_history(result)
-                    
-                    # Send notification
-                    await self.notification_center.notify(
-                        NotificationType.HOOK,
-                        f"Hook executed: {hook.name}",
-                        {
-                            "hook_name": hook.name,
-                            "success": True,
-                            "duration": duration
-                        }
-                    )
-                    
-                    return result
-                    
-                except Exception as e:
-                    last_error = str(e)
-                    logger.error(
-                        f"Hook execution failed: {hook.name}",
-                        exc_info=True
+        # Reuse a memoized result for cacheable hooks
+        cache_key = None
+        if hook.cacheable:
+            cache_key = await self.result_cache.key_for(hook, context)
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                result = HookExecutionResult(
+                    hook_name=hook.name,
+                    success=True,
+                    output=cached.output,
+                    duration=asyncio.get_event_loop().time() - start_time,
+                    cached=True
+                )
+                self._add_to_history(result)
+                return result
+        
+        # Execute with retries
+        last_error = None
+        for attempt in range(hook.retry_count + 1):
+            if attempt > 0:
+                await asyncio.sleep(hook.retry_delay)
+                logger.info(f"Retrying hook {hook.name} (attempt {attempt + 1})")
+                
+            try:
+                # Execute all actions
+                outputs = []
+                for action in hook.actions:
+                    output = await self._execute_action(
+                        action,
+                        hook,
+                        context
                     )
+                    outputs.append(output)
                     
-            # All retries failed
-            duration = asyncio.get_event_loop().time() - start_time
-            result = HookExecutionResult(
-                hook_name=hook.name,
-                success=False,
-                error=last_error,
-                duration=duration
-            )
-            
-            self._add_to_history(result)
-            
-            # Send notification
-            await self.notification_center.notify(
-                NotificationType.ERROR,
-                f"Hook failed: {hook.name}",
-                {
-                    "hook_name": hook.name,
-                    "error": last_error,
-                    "duration": duration
-                }
-            )
-            
-            return result
-            
-        finally:
-            self._running_hooks.discard(hook.name)
-            
+                # Success
+                duration = asyncio.get_event_loop().time() - start_time
+                result = HookExecutionResult(
+                    hook_name=hook.name,
+                    success=True,
+                    output=outputs,
+                    duration=duration
+                )
+                
+                self._add_to_history(result)
+                
+                if cache_key is not None:
+                    self.result_cache.put(cache_key, result, hook.cache_ttl)
+                
+                # Send notification
+                await self.notification_center.emit(
+                    "hook_executed",
+                    EventCategory.HOOKS,
+                    {
+                        "hook_name": hook.name,
+                        "success": True,
+                        "duration": duration
+                    }
+                )
+                
+                return result
+                
+            except Exception as e:
+                last_error = str(e)
+                logger.error(
+                    f"Hook execution failed: {hook.name}",
+                    exc_info=True
+                )
+                
+        # All retries failed
+        duration = asyncio.get_event_loop().time() - start_time
+        result = HookExecutionResult(
+            hook_name=hook.name,
+            success=False,
+            error=last_error,
+            duration=duration
+        )
+        
+        self._add_to_history(result)
+        
+        # Send notification
+        await self.notification_center.emit(
+            "hook_failed",
+            EventCategory.ERROR,
+            {
+                "hook_name": hook.name,
+                "error": last_error,
+                "duration": duration
+            }
+        )
+        
+        return result
+        
     async def _execute_action(
         self,
         action: HookAction,
@@ -305,30 +416,33 @@ class HookEngine:
         Returns:
             Action output
         """
-        # Substitute template variables
-        substituted_context = self._substitute_templates(action, context)
-        
+        # Substitute template variables into a copy of the action's config
+        compiled = action.compile()
+        config = compiled.render_config(action.config, context)
+        if config is not action.config:
+            action = action.with_config(config)
+            
         # Execute based on type
         if action.type == HookActionType.COMMAND:
-            return await self._execute_command(action, hook, substituted_context)
+            return await self._execute_command(action, hook, context)
             
         elif action.type == HookActionType.SCRIPT:
-            return await self._execute_script(action, hook, substituted_context)
+            return await self._execute_script(action, hook, context)
             
         elif action.type == HookActionType.WEBHOOK:
-            return await self._execute_webhook(action, hook, substituted_context)
+            return await self._execute_webhook(action, hook, context)
             
         elif action.type == HookActionType.FUNCTION:
-            return await self._execute_function(action, hook, substituted_context)
+            return await self._execute_function(action, hook, context)
             
         elif action.type == HookActionType.NOTIFICATION:
-            return await self._execute_notification(action, hook, substituted_context)
+            return await self._execute_notification(action, hook, context)
             
         elif action.type == HookActionType.LOG:
-            return await self._execute_log(action, hook, substituted_context)
+            return await self._execute_log(action, hook, context)
             
         elif action.type == HookActionType.TRANSFORM:
-            return await self._execute_transform(action, hook, substituted_context)
+            return await self._execute_transform(action, hook, context)
             
         else:
             raise HookExecutionError(f"Unknown action type: {action.type}")
@@ -345,9 +459,7 @@ class HookEngine:
             raise HookExecutionError("No command specified")
             
         # Apply template substitution
-        if action.template:
-            template = Template(action.template)
-            command = template.safe_substitute(**context)
+        command = action.compile().render_template(context, command)
             
         # Build environment
         env = os.environ.copy()
@@ -403,6 +515,18 @@ class HookEngine:
         if not action.script_path or not action.script_path.exists():
             raise HookExecutionError("Script file not found")
             
+        # Persistent mode: the script's handler runs in a long-lived worker
+        if action.config.get("persistent") and self.script_workers.supports(action.script_path):
+            env = os.environ.copy()
+            env.update(hook.environment)
+            return await self.script_workers.call(
+                action.script_path,
+                context,
+                env=env,
+                sandbox=self.sandbox if hook.sandbox else None,
+                timeout=hook.timeout
+            )
+            
         # Determine interpreter
         extension = action.script_path.suffix.lower()
         if extension == ".py":
@@ -475,10 +599,7 @@ class HookEngine:
             raise HookExecutionError("No webhook URL specified")
             
         # Apply template substitution
-        url = action.url
-        if action.template:
-            template = Template(action.template)
-            url = template.safe_substitute(**context)
+        url = action.compile().render_template(context, action.url)
             
         # Build request
         headers = action.config.get("headers", {})
@@ -491,56 +612,31 @@ class HookEngine:
             "context": context
         }
         
-        # Execute request
-        timeout = aiohttp.ClientTimeout(total=hook.timeout)
+        # Execute request over the shared connection pool
+        try:
+            if method == "GET":
+                return await self.webhook_client.get(
+                    url,
+                    headers=headers,
+                    timeout=hook.timeout
+                )
         
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            try:
-                if method == "GET":
-                    async with session.get(url, headers=headers) as response:
-                        return await self._process_webhook_response(response)
+            elif method == "POST":
+                return await self.webhook_client.post(
+                    url,
+                    payload,
+                    headers=headers,
+                    timeout=hook.timeout,
+                    batch_window=action.config.get("batch_window", 0.0)
+                )
                         
-                elif method == "POST":
-                    async with session.post(
-                        url,
-                        json=payload,
-                        headers=headers
-                    ) as response:
-                        return await self._process_webhook_response(response)
+            else:
+                raise HookExecutionError(f"Unsupported HTTP method: {method}")
                         
-                else:
-                    raise HookExecutionError(f"Unsupported HTTP method: {method}")
-                    
-            except asyncio.TimeoutError:
-                raise HookExecutionError(f"Webhook timed out: {url}")
-            except Exception as e:
-                raise HookExecutionError(f"Webhook failed: {url} - {e}")
-                
-    async def _process_webhook_response(
-        self,
-        response: aiohttp.ClientResponse
-    ) -> Dict[str, Any]:
-        """Process webhook response"""
-        text = await response.text()
-        
-        result = {
-            "status_code": response.status,
-            "headers": dict(response.headers),
-            "body": text
-        }
-        
-        # Try to parse JSON
-        try:
-            result["json"] = json.loads(text)
-        except:
-            pass
-            
-        if response.status >= 400:
-            raise HookExecutionError(
-                f"Webhook returned error: {response.status} - {text}"
-            )
-            
-        return result
+        except asyncio.TimeoutError:
+            raise HookExecutionError(f"Webhook timed out: {url}")
+        except Exception as e:
+            raise HookExecutionError(f"Webhook failed: {url} - {e}")
         
     async def _execute_function(
         self,
@@ -582,18 +678,18 @@ class HookEngine:
         # Get notification config
         title = action.config.get("title", f"Hook: {hook.name}")
         message = action.config.get("message", "Hook triggered")
-        notification_type = action.config.get("type", NotificationType.INFO)
+        notification_type = action.config.get("type", "info")
         
         # Apply template substitution
-        if action.template:
-            template = Template(action.template)
-            message = template.safe_substitute(**context)
+        message = action.compile().render_template(context, message)
             
         # Send notification
-        await self.notification_center.notify(
-            notification_type,
-            title,
+        await self.notification_center.emit(
+            "hook_notification",
+            EventCategory.HOOKS,
             {
+                "title": title,
+                "type": notification_type,
                 "message": message,
                 "hook_name": hook.name,
                 "context": context
@@ -618,9 +714,7 @@ class HookEngine:
         message = action.config.get("message", f"Hook {hook.name} triggered")
         
         # Apply template substitution
-        if action.template:
-            template = Template(action.template)
-            message = template.safe_substitute(**context)
+        message = action.compile().render_template(context, message)
             
         # Log message
         log_func = getattr(logger, level, logger.info)
@@ -651,75 +745,36 @@ class HookEngine:
             raise HookExecutionError("No transform expression specified")
             
         # Apply template substitution
-        if action.template:
-            template = Template(action.template)
-            expression = template.safe_substitute(**context)
+        expression = action.compile().render_template(context, expression)
             
+        # Parsed once per distinct expression
+        compiled_expression = compile_expression(transform_type, expression)
+        
         # Execute transform
         if transform_type == "json":
             # JSONPath-like transformation
-            import jsonpath_ng
-            jsonpath_expr = jsonpath_ng.parse(expression)
-            matches = jsonpath_expr.find(context)
+            matches = compiled_expression.find(context)
             return [match.value for match in matches]
             
-        elif transform_type == "jmespath":
-            # JMESPath transformation
-            import jmespath
-            return jmespath.search(expression, context)
+        # JMESPath transformation
+        return compiled_expression.search(context)
             
-        else:
-            raise HookExecutionError(f"Unknown transform type: {transform_type}")
-            
-    def _substitute_templates(
-        self,
-        action: HookAction,
-        context: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Substitute template variables in context"""
-        if not action.template:
-            return context
-            
-        # Create flat context for template substitution
-        flat_context = self._flatten_dict(context)
-        
-        # Apply substitution to string values in config
-        substituted_config = {}
-        for key, value in action.config.items():
-            if isinstance(value, str):
-                template = Template(value)
-                substituted_config[key] = template.safe_substitute(**flat_context)
-            else:
-                substituted_config[key] = value
-                
-        # Update action config
-        action.config = substituted_config
-        
-        return context
-        
-    def _flatten_dict(
-        self,
-        d: Dict[str, Any],
-        parent_key: str = "",
-        sep: str = "_"
-    ) -> Dict[str, Any]:
-        """Flatten nested dictionary for template substitution"""
-        items = []
-        for k, v in d.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            if isinstance(v, dict):
-                items.extend(self._flatten_dict(v, new_key, sep=sep).items())
-            else:
-                items.append((new_key, v))
-        return dict(items)
-        
     def _add_to_history(self, result: HookExecutionResult) -> None:
-        """Add execution result to history"""
+        """Add execution result to history and aggregated stats"""
+        # Rings drop their oldest entry when full
         self._execution_history.append(result)
         
-        # Limit history size
-        if len(self._execution_history) > self._max_history:
-            self._execution_history = self._execution_history[-self._max_history:]
+        history = self._hook_history.get(result.hook_name)
+        if history is None:
+            history = self._hook_history[result.hook_name] = deque(maxlen=self._max_hook_history)
+        history.append(result)
+        
+        self._totals.record(result)
+        
+        stats = self._hook_stats.get(result.hook_name)
+        if stats is None:
+            stats = self._hook_stats[result.hook_name] = HookExecutionStats()
+        stats.record(result)
             
     def get_execution_history(
         self,
@@ -729,37 +784,53 @@ class HookEngine:
         """Get execution history
         
         Args:
-            hook_name: Filter by hook name
+            hook_name: Filter by hook name (its most recent results)
             limit: Maximum results
             
         Returns:
-            List of execution results
+            List of execution results, oldest first
         """
-        results = self._execution_history
-        
         if hook_name:
-            results = [r for r in results if r.hook_name == hook_name]
+            results = self._hook_history.get(hook_name, ())
+        else:
+            results = self._execution_history
             
         if limit:
-            results = results[-limit:]
+            return list(islice(reversed(results), limit))[::-1]
             
-        return results
+        return list(results)
+        
+    def get_hook_stats(self, hook_name: str) -> Optional[Dict[str, Any]]:
+        """Get aggregated execution stats for one hook
+        
+        Args:
+            hook_name: Hook name
+            
+        Returns:
+            Execution counts, failures and latency quantiles, or None if
+            the hook has not run
+        """
+        stats = self._hook_stats.get(hook_name)
+        return stats.to_dict() if stats else None
         
     def get_stats(self) -> Dict[str, Any]:
         """Get engine statistics"""
-        success_count = sum(1 for r in self._execution_history if r.success)
-        failure_count = len(self._execution_history) - success_count
+        totals = self._totals
         
-        avg_duration = 0.0
-        if self._execution_history:
-            avg_duration = sum(r.duration for r in self._execution_history) / len(self._execution_history)
-            
         return {
-            "total_executions": len(self._execution_history),
-            "success_count": success_count,
-            "failure_count": failure_count,
-            "success_rate": success_count / max(1, len(self._execution_history)),
-            "average_duration": avg_duration,
-            "running_hooks": list(self._running_hooks),
-            "custom_functions": list(self.custom_functions.keys())
+            "total_executions": totals.executions,
+            "success_count": totals.executions - totals.failures,
+            "failure_count": totals.failures,
+            "success_rate": (totals.executions - totals.failures) / max(1, totals.executions),
+            "average_duration": totals.duration_ms.mean / 1000,
+            "duration_ms": totals.to_dict()["duration_ms"],
+            "hooks": {
+                name: stats.to_dict() for name, stats in self._hook_stats.items()
+            },
+            "running_hooks": self.scheduler.running_hooks(),
+            "scheduler": self.scheduler.get_stats(),
+            "custom_functions": list(self.custom_functions.keys()),
+            "webhooks": self.webhook_client.get_stats(),
+            "script_workers": self.script_workers.get_stats(),
+            "result_cache": self.result_cache.get_stats()
         }
\ No newline at end of file
@@ -1,17 +1,57 @@
 """Hook registry for managing hooks"""
 
 import asyncio
+import time
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Union
+from typing import Dict, Any, List, Optional, Set, Tuple, Union
 from datetime import datetime
 from collections import defaultdict
 
-from .config import HookConfig, HookTrigger
+from watchdog.observers import Observer
+from watchdog.events import FileSystemEventHandler, FileSystemEvent
+
+from .config import HookConfig, HookTrigger, ConditionPredicate
 from ..utils.logging import get_logger
 from ..utils.errors import ValidationError, StorageError
 
 logger = get_logger(__name__)
 
+# Dispatch entry: hook plus its compiled conditions (None when unconditional)
+DispatchEntry = Tuple[HookConfig, Optional[ConditionPredicate]]
+
+
+class _TokenBucket:
+    """Per-minute rate limit as a token bucket on the monotonic clock
+    
+    Holds up to `limit` tokens and refills `limit` per minute, so checks
+    and executions are O(1) regardless of how often a hook runs.
+    """
+    
+    __slots__ = ("limit", "rate", "tokens", "updated")
+    
+    def __init__(self, limit: int, now: float):
+        self.limit = limit
+        self.rate = limit / 60.0
+        self.tokens = float(limit)
+        self.updated = now
+        
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last update"""
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.limit, self.tokens + elapsed * self.rate)
+            self.updated = now
+            
+    def available(self, now: float) -> bool:
+        """Whether an execution is allowed now"""
+        self._refill(now)
+        return self.tokens >= 1.0
+        
+    def take(self, now: float) -> None:
+        """Consume a token for an execution"""
+        self._refill(now)
+        self.tokens = max(0.0, self.tokens - 1.0)
+
 
 class HookRegistry:
     """Registry for managing hooks
@@ -20,8 +60,12 @@ class HookRegistry:
     - Hook registration and discovery
     - Priority-based ordering
     - Trigger indexing for fast lookup
-    - Rate limiting tracking
-    - Hot reload support
+    - Conditions compiled once at registration
+    - Per-trigger dispatch lists, rebuilt only when hooks change
+    - O(1) rate limiting (token bucket) and cooldowns on a monotonic clock
+    - Hot reload from a watched hooks directory: file events are debounced
+      and only the hooks whose files changed are replaced, in one
+      dispatch table swap
     """
     
     def __init__(self, hooks_dir: Optional[Path] = None):
@@ -39,18 +83,41 @@ class HookRegistry:
         # Trigger index for fast lookup
         self._trigger_index: Dict[HookTrigger, Set[str]] = defaultdict(set)
         
-        # Rate limiting tracking
-        self._execution_counts: Dict[str, List[datetime]] = defaultdict(list)
-        self._last_execution: Dict[str, datetime] = {}
+        # Compiled conditions by hook name
+        self._predicates: Dict[str, Optional[ConditionPredicate]] = {}
+        
+        # Enabled hooks per trigger, priority-ordered (CUSTOM hooks merged in).
+        # Replaced whole on every rebuild, so readers never see a partial table.
+        self._dispatch: Dict[HookTrigger, Tuple[DispatchEntry, ...]] = {}
+        
+        # Rate limiting tracking (monotonic seconds)
+        self._rate_buckets: Dict[str, _TokenBucket] = {}
+        self._last_execution: Dict[str, float] = {}
         
         # File watching
         self._file_mtimes: Dict[Path, float] = {}
+        self._file_hooks: Dict[Path, str] = {}
+        self._observer: Optional[Observer] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._debounce = 0.25
+        self._pending_paths: Set[Path] = set()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._reload_tasks: Set[asyncio.Task] = set()
+        self.hot_reloads = 0
+        self.hot_reload_changes = 0
+        
+    async def initialize(self, watch: bool = False) -> None:
+        """Initialize registry
         
-    async def initialize(self) -> None:
-        """Initialize registry"""
+        Args:
+            watch: Reload hooks when files in hooks_dir change
+        """
         if self.hooks_dir:
             await self.scan_directory(self.hooks_dir)
             
+            if watch:
+                self.start_watching()
+            
         logger.info(
             "hook_registry_initialized",
             hooks_count=len(self._hooks),
@@ -65,18 +132,15 @@ class HookRegistry:
         """
         # Validate hook
         hook.validate()
+        predicate = hook.compile_conditions()
         
         async with self._hooks_lock:
             # Check for duplicate name
             if hook.name in self._hooks:
                 raise ValidationError("name", hook.name, "Hook name already registered")
                 
-            # Add to registry
-            self._hooks[hook.name] = hook
-            
-            # Update trigger index
-            for trigger in hook.triggers:
-                self._trigger_index[trigger].add(hook.name)
+            self._add_locked(hook, predicate)
+            self._rebuild_dispatch()
                 
         logger.info(
             "hook_registered",
@@ -95,19 +159,45 @@ class HookRegistry:
             True if unregistered, False if not found
         """
         async with self._hooks_lock:
-            hook = self._hooks.pop(name, None)
-            if not hook:
+            if not self._remove_locked(name):
                 return False
                 
-            # Remove from trigger index
-            for trigger in hook.triggers:
-                self._trigger_index[trigger].discard(name)
-                if not self._trigger_index[trigger]:
-                    del self._trigger_index[trigger]
+            # The file stays loaded but no longer owns the name
+            for path in [p for p, hook_name in self._file_hooks.items() if hook_name == name]:
+                del self._file_hooks[path]
+                
+            self._rebuild_dispatch()
+            self._rate_buckets.pop(name, None)
+            self._last_execution.pop(name, None)
                     
         logger.info("hook_unregistered", name=name)
         return True
         
+    def _add_locked(self, hook: HookConfig, predicate: Optional[ConditionPredicate]) -> None:
+        """Add a validated hook; caller holds the lock and rebuilds dispatch"""
+        self._hooks[hook.name] = hook
+        self._predicates[hook.name] = predicate
+        
+        # Update trigger index
+        for trigger in hook.triggers:
+            self._trigger_index[trigger].add(hook.name)
+            
+    def _remove_locked(self, name: str) -> bool:
+        """Remove a hook; caller holds the lock and rebuilds dispatch"""
+        hook = self._hooks.pop(name, None)
+        if not hook:
+            return False
+            
+        self._predicates.pop(name, None)
+        
+        # Remove from trigger index
+        for trigger in hook.triggers:
+            self._trigger_index[trigger].discard(name)
+            if not self._trigger_index[trigger]:
+                del self._trigger_index[trigger]
+                
+        return True
+        
     async def get_hook(self, name: str) -> Optional[HookConfig]:
         """Get hook by name"""
         async with self._hooks_lock:
@@ -165,27 +255,40 @@ class HookRegistry:
         if isinstance(trigger, str):
             trigger = HookTrigger(trigger)
             
-        # Get hook names from trigger index
-        async with self._hooks_lock:
-            hook_names = self._trigger_index.get(trigger, set()).copy()
+        entries = self._dispatch.get(trigger, ())
             
-            # Add hooks with CUSTOM trigger
-            if trigger != HookTrigger.CUSTOM:
-                hook_names.update(self._trigger_index.get(HookTrigger.CUSTOM, set()))
+        if context is None:
+            return [hook for hook, _ in entries]
                 
-        # Get enabled hooks
-        hooks = []
-        for name in hook_names:
-            hook = await self.get_hook(name)
-            if hook and hook.enabled:
-                # Evaluate conditions if context provided
-                if context is None or hook.evaluate_conditions(context):
-                    hooks.append(hook)
+        return [
+            hook for hook, predicate in entries
+            if predicate is None or predicate(context)
+        ]
                     
-        # Sort by priority (higher first)
-        hooks.sort(key=lambda h: h.priority, reverse=True)
+    def _rebuild_dispatch(self) -> None:
+        """Rebuild the per-trigger dispatch lists
         
-        return hooks
+        Called with the hooks lock held whenever a hook is added, removed,
+        enabled, disabled or updated.
+        """
+        # Registration order breaks priority ties
+        ordered = sorted(
+            (hook for hook in self._hooks.values() if hook.enabled),
+            key=lambda h: h.priority,
+            reverse=True
+        )
+        
+        dispatch: Dict[HookTrigger, Tuple[DispatchEntry, ...]] = {}
+        for trigger in HookTrigger:
+            entries = tuple(
+                (hook, self._predicates.get(hook.name))
+                for hook in ordered
+                if hook.matches_trigger(trigger)
+            )
+            if entries:
+                dispatch[trigger] = entries
+                
+        self._dispatch = dispatch
         
     async def enable_hook(self, name: str) -> bool:
         """Enable a hook"""
@@ -196,6 +299,7 @@ class HookRegistry:
                 
             hook.enabled = True
             hook.updated_at = datetime.utcnow()
+            self._rebuild_dispatch()
             
         logger.info("hook_enabled", name=name)
         return True
@@ -209,6 +313,7 @@ class HookRegistry:
                 
             hook.enabled = False
             hook.updated_at = datetime.utcnow()
+            self._rebuild_dispatch()
             
         logger.info("hook_disabled", name=name)
         return True
@@ -231,7 +336,9 @@ class HookRegistry:
             # Update allowed fields
             allowed_fields = {
                 "description", "enabled", "priority", "timeout",
-                "retry_count", "retry_delay", "rate_limit", "cooldown",
+                "retry_count", "retry_delay", "max_concurrency",
+                "cacheable", "cache_ttl", "cache_key_fields", "cache_key_files",
+                "rate_limit", "cooldown",
                 "tags", "environment"
             }
             
@@ -240,6 +347,7 @@ class HookRegistry:
                     setattr(hook, field, value)
                     
             hook.updated_at = datetime.utcnow()
+            self._rebuild_dispatch()
             
         logger.info("hook_updated", name=name, updates=list(updates.keys()))
         return True
@@ -253,35 +361,34 @@ class HookRegistry:
         Returns:
             True if within limits
         """
+        now = time.monotonic()
+        
         # Check cooldown
         if hook.cooldown:
             last_exec = self._last_execution.get(hook.name)
-            if last_exec:
-                elapsed = (datetime.utcnow() - last_exec).total_seconds()
-                if elapsed < hook.cooldown:
-                    return False
-                    
+            if last_exec is not None and now - last_exec < hook.cooldown:
+                return False
+                
         # Check rate limit
         if hook.rate_limit:
-            # Clean old executions
-            now = datetime.utcnow()
-            executions = self._execution_counts[hook.name]
-            executions = [
-                e for e in executions
-                if (now - e).total_seconds() < 60  # Within last minute
-            ]
-            self._execution_counts[hook.name] = executions
-            
-            if len(executions) >= hook.rate_limit:
-                return False
+            return self._rate_bucket(hook, now).available(now)
                 
         return True
         
     def record_execution(self, hook: HookConfig) -> None:
         """Record hook execution for rate limiting"""
-        now = datetime.utcnow()
+        now = time.monotonic()
         self._last_execution[hook.name] = now
-        self._execution_counts[hook.name].append(now)
+        
+        if hook.rate_limit:
+            self._rate_bucket(hook, now).take(now)
+            
+    def _rate_bucket(self, hook: HookConfig, now: float) -> _TokenBucket:
+        """Get a hook's token bucket, resized if its rate limit changed"""
+        bucket = self._rate_buckets.get(hook.name)
+        if bucket is None or bucket.limit != hook.rate_limit:
+            bucket = self._rate_buckets[hook.name] = _TokenBucket(hook.rate_limit, now)
+        return bucket
         
     async def scan_directory(self, directory: Path) -> int:
         """Scan directory for hook configurations
@@ -295,30 +402,23 @@ class HookRegistry:
         if not directory.exists():
             return 0
             
-        loaded = 0
-        
+        # New or modified files, plus tracked files that have disappeared
+        changed = []
         for hook_file in directory.glob("*.json"):
             try:
-                # Check if file has been modified
                 mtime = hook_file.stat().st_mtime
-                if hook_file in self._file_mtimes and self._file_mtimes[hook_file] == mtime:
-                    continue  # Skip unchanged files
-                    
-                # Load hook configuration
-                hook = HookConfig.from_file(hook_file)
-                
-                # Register or update
-                existing = await self.get_hook(hook.name)
-                if existing:
-                    await self.unregister(hook.name)
-                    
-                await self.register(hook)
-                self._file_mtimes[hook_file] = mtime
-                loaded += 1
-                
-            except Exception as e:
-                logger.error(f"Failed to load hook from {hook_file}: {e}")
+            except OSError:
+                continue
+            if self._file_mtimes.get(hook_file) != mtime:
+                changed.append(hook_file)
                 
+        changed.extend(
+            path for path in self._file_mtimes
+            if path.parent == directory and not path.exists()
+        )
+        
+        loaded = await self._apply_file_changes(changed)
+        
         logger.info(
             "hooks_loaded_from_directory",
             directory=str(directory),
@@ -338,6 +438,181 @@ class HookRegistry:
             
         return await self.scan_directory(self.hooks_dir)
         
+    async def _apply_file_changes(self, paths: List[Path]) -> int:
+        """Apply changed hook files as one registry update
+        
+        Files are parsed and validated outside the lock. The resulting
+        adds, replacements and removals are then applied together and the
+        dispatch table is swapped once, so a trigger sees either the old
+        hooks or the new ones. A file that fails to load, or that names a
+        hook owned by another file or registered directly, leaves its
+        previous hook in place.
+        
+        Args:
+            paths: Hook files that were created, modified or deleted
+            
+        Returns:
+            Number of hooks added, replaced or removed
+        """
+        loaded: Dict[Path, Optional[Tuple[HookConfig, Optional[ConditionPredicate], float]]] = {}
+        for path in paths:
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                loaded[path] = None
+                continue
+                
+            try:
+                hook = await asyncio.to_thread(HookConfig.from_file, path)
+                hook.validate()
+                loaded[path] = (hook, hook.compile_conditions(), mtime)
+            except Exception as e:
+                logger.error(f"Failed to load hook from {path}: {e}")
+                
+        changes = 0
+        async with self._hooks_lock:
+            # Deletions, then renames and new files, then edits in place,
+            # so names freed in this batch can be taken by another file
+            def order(item):
+                path, entry = item
+                if entry is None:
+                    return 0
+                return 2 if entry[0].name == self._file_hooks.get(path) else 1
+                
+            ordered = sorted(loaded.items(), key=order)
+            
+            for path, entry in ordered:
+                previous = self._file_hooks.get(path)
+                
+                if entry is None:
+                    # File deleted
+                    self._file_mtimes.pop(path, None)
+                    self._file_hooks.pop(path, None)
+                    if previous and self._remove_locked(previous):
+                        changes += 1
+                    continue
+                    
+                hook, predicate, mtime = entry
+                
+                current = self._hooks.get(hook.name)
+                if current is not None and previous != hook.name:
+                    owner = next(
+                        (p for p, name in self._file_hooks.items() if name == hook.name),
+                        None
+                    )
+                    # Left unrecorded, so the file is retried on its next change or scan
+                    logger.error(
+                        "hook_file_duplicate_name",
+                        path=str(path),
+                        name=hook.name,
+                        owner=str(owner) if owner else "registered"
+                    )
+                    continue
+                    
+                self._file_mtimes[path] = mtime
+                
+                if current is not None and current.fingerprint() == hook.fingerprint():
+                    # Touched or rewritten without changes
+                    continue
+                    
+                if previous and previous != hook.name:
+                    self._remove_locked(previous)
+                self._remove_locked(hook.name)
+                self._add_locked(hook, predicate)
+                self._file_hooks[path] = hook.name
+                changes += 1
+                
+            if changes:
+                self._rebuild_dispatch()
+                
+        return changes
+        
+    def start_watching(self, debounce: float = 0.25) -> None:
+        """Watch hooks_dir and apply file changes as they happen
+        
+        Args:
+            debounce: Seconds without further events before changes are
+                applied, so an editor's burst of writes is one reload
+        """
+        if not self.hooks_dir:
+            raise StorageError("No hooks directory to watch")
+            
+        if self._observer:
+            return
+            
+        self.hooks_dir.mkdir(parents=True, exist_ok=True)
+        self._loop = asyncio.get_running_loop()
+        self._debounce = debounce
+        
+        self._observer = Observer()
+        self._observer.schedule(HookFileHandler(self), str(self.hooks_dir), recursive=False)
+        self._observer.start()
+        
+        logger.info("hook_hot_reload_enabled", hooks_dir=str(self.hooks_dir))
+        
+    async def stop_watching(self) -> None:
+        """Stop watching hooks_dir"""
+        if not self._observer:
+            return
+            
+        observer, self._observer = self._observer, None
+        observer.stop()
+        await asyncio.to_thread(observer.join)
+        
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending_paths.clear()
+        
+        if self._reload_tasks:
+            await asyncio.gather(*self._reload_tasks, return_exceptions=True)
+            
+    async def shutdown(self) -> None:
+        """Release registry resources"""
+        await self.stop_watching()
+        
+    def _file_event(self, path: Path) -> None:
+        """Record a changed hook file (called from the watcher thread)"""
+        if self._loop and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._queue_change, path)
+            
+    def _queue_change(self, path: Path) -> None:
+        """Queue a changed file and restart the debounce timer"""
+        if not self._observer:
+            return
+            
+        self._pending_paths.add(path)
+        
+        if self._flush_handle:
+            self._flush_handle.cancel()
+        self._flush_handle = self._loop.call_later(self._debounce, self._flush_changes)
+        
+    def _flush_changes(self) -> None:
+        """Apply the files queued since the last flush"""
+        self._flush_handle = None
+        paths, self._pending_paths = list(self._pending_paths), set()
+        
+        task = asyncio.create_task(self._hot_reload(paths))
+        self._reload_tasks.add(task)
+        task.add_done_callback(self._reload_tasks.discard)
+        
+    async def _hot_reload(self, paths: List[Path]) -> None:
+        """Apply a debounced batch of file changes"""
+        try:
+            changes = await self._apply_file_changes(paths)
+        except Exception as e:
+            logger.error(f"Hook hot reload failed: {e}")
+            return
+            
+        self.hot_reloads += 1
+        self.hot_reload_changes += changes
+        
+        logger.info(
+            "hooks_hot_reloaded",
+            files=[path.name for path in paths],
+            changes=changes
+        )
+        
     async def save_hook(self, hook: HookConfig, directory: Optional[Path] = None) -> Path:
         """Save hook to file
         
@@ -361,8 +636,9 @@ class HookRegistry:
         # Save hook
         hook.save_to_file(filepath)
         
-        # Update file mtime tracking
+        # Update file tracking
         self._file_mtimes[filepath] = filepath.stat().st_mtime
+        self._file_hooks[filepath] = hook.name
         
         logger.info("hook_saved", name=hook.name, path=str(filepath))
         return filepath
@@ -380,5 +656,29 @@ class HookRegistry:
             "hooks_with_rate_limits": sum(
                 1 for h in self._hooks.values()
                 if h.rate_limit or h.cooldown
-            )
-        }
\ No newline at end of file
+            ),
+            "watching": self._observer is not None,
+            "hot_reloads": self.hot_reloads,
+            "hot_reload_changes": self.hot_reload_changes
+        }
+
+
+class HookFileHandler(FileSystemEventHandler):
+    """File system event handler for hook configuration files"""
+    
+    def __init__(self, registry: HookRegistry):
+        self.registry = registry
+        
+    def on_any_event(self, event: FileSystemEvent) -> None:
+        """Forward changes to *.json files to the registry"""
+        if event.is_directory or event.event_type not in {"created", "modified", "deleted", "moved"}:
+            return
+            
+        paths = [event.src_path]
+        if event.event_type == "moved":
+            paths.append(event.dest_path)
+            
+        for path in paths:
+            path = Path(path)
+            if path.suffix == ".json":
+                self.registry._file_event(path)
\ No newline at end of file
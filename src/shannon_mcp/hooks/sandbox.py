@@ -10,6 +10,7 @@ import subprocess
 import resource
 import signal
 
+from .workspace import WorkspaceCache
 from ..utils.logging import get_logger
 from ..utils.errors import SecurityError, HookExecutionError
 
@@ -21,7 +22,7 @@ class HookSandbox:
     
     Features:
     - Resource limits (CPU, memory, file handles)
-    - Filesystem isolation
+    - Filesystem isolation, with workspaces cloned from cached templates
     - Environment variable filtering
     - Command whitelisting
     - Network isolation (optional)
@@ -31,6 +32,7 @@ class HookSandbox:
     def __init__(self):
         """Initialize sandbox"""
         self.temp_dir: Optional[Path] = None
+        self.workspaces: Optional[WorkspaceCache] = None
         
         # Security settings
         self.max_memory = 512 * 1024 * 1024  # 512MB
@@ -64,7 +66,8 @@ class HookSandbox:
     async def initialize(self) -> None:
         """Initialize sandbox environment"""
         # Create temporary directory
-        self.temp_dir = Path(tempfile.mkdtemp(prefix="hook_sandbox_"))
+        self.temp_dir = Path(await asyncio.to_thread(tempfile.mkdtemp, prefix="hook_sandbox_"))
+        self.workspaces = WorkspaceCache(self.temp_dir)
         
         logger.info(
             "sandbox_initialized",
@@ -74,7 +77,7 @@ class HookSandbox:
     async def cleanup(self) -> None:
         """Cleanup sandbox environment"""
         if self.temp_dir and self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+            await asyncio.to_thread(shutil.rmtree, self.temp_dir)
             
         logger.info("sandbox_cleaned_up")
         
@@ -102,13 +105,8 @@ class HookSandbox:
         # Create sandbox environment
         sandbox_env = self._create_sandbox_env(env)
         
-        # Create sandbox directory
-        sandbox_dir = self.temp_dir / f"cmd_{os.getpid()}"
-        sandbox_dir.mkdir(exist_ok=True)
-        
-        # Copy allowed files if needed
-        if allowed_paths:
-            await self._setup_sandbox_files(sandbox_dir, allowed_paths)
+        # Create sandbox directory with the allowed files
+        sandbox_dir = await self.workspaces.create("cmd_", allowed_paths)
             
         # Execute command with resource limits
         try:
@@ -143,8 +141,7 @@ class HookSandbox:
                 
         finally:
             # Cleanup sandbox directory
-            if sandbox_dir.exists():
-                shutil.rmtree(sandbox_dir)
+            await self.workspaces.remove(sandbox_dir)
                 
     async def execute_script(
         self,
@@ -169,8 +166,7 @@ class HookSandbox:
             raise HookExecutionError(f"Script not found: {script_path}")
             
         # Read script content
-        with open(script_path, 'r') as f:
-            script_content = f.read()
+        script_content = await asyncio.to_thread(script_path.read_text)
             
         # Validate script content
         self._validate_script(script_content)
@@ -178,18 +174,17 @@ class HookSandbox:
         # Create sandbox environment
         sandbox_env = self._create_sandbox_env(env)
         
-        # Create sandbox directory
-        sandbox_dir = self.temp_dir / f"script_{os.getpid()}"
-        sandbox_dir.mkdir(exist_ok=True)
+        # Create sandbox directory with the allowed files
+        sandbox_dir = await self.workspaces.create("script_", allowed_paths)
         
         # Copy script to sandbox
-        sandbox_script = sandbox_dir / script_path.name
-        shutil.copy2(script_path, sandbox_script)
-        sandbox_script.chmod(0o755)
-        
-        # Copy allowed files if needed
-        if allowed_paths:
-            await self._setup_sandbox_files(sandbox_dir, allowed_paths)
+        try:
+            sandbox_script = await asyncio.to_thread(
+                self._install_script, script_path, sandbox_dir
+            )
+        except Exception:
+            await self.workspaces.remove(sandbox_dir)
+            raise
             
         # Determine interpreter
         extension = script_path.suffix.lower()
@@ -238,9 +233,41 @@ class HookSandbox:
                 
         finally:
             # Cleanup sandbox directory
-            if sandbox_dir.exists():
-                shutil.rmtree(sandbox_dir)
+            await self.workspaces.remove(sandbox_dir)
                 
+    def prepare_worker(
+        self,
+        script_path: Path,
+        env: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Prepare subprocess options for a long-lived script worker
+        
+        The script is validated once here rather than per invocation. The
+        CPU time limit covers the worker's whole life, so a worker that
+        uses it up is killed and replaced.
+        
+        Args:
+            script_path: Script the worker will load
+            env: Environment variables
+            
+        Returns:
+            Keyword arguments for asyncio.create_subprocess_exec
+        """
+        if not script_path.exists():
+            raise HookExecutionError(f"Script not found: {script_path}")
+            
+        with open(script_path, 'r') as f:
+            self._validate_script(f.read())
+            
+        worker_dir = self.temp_dir / f"worker_{script_path.stem}"
+        worker_dir.mkdir(exist_ok=True)
+        
+        return {
+            "cwd": worker_dir,
+            "env": self._create_sandbox_env(env),
+            "preexec_fn": self._set_resource_limits
+        }
+        
     def _validate_command(self, command: str) -> None:
         """Validate command for security issues"""
         # Check for dangerous patterns
@@ -294,32 +321,18 @@ class HookSandbox:
         
         return sandbox_env
         
-    async def _setup_sandbox_files(
-        self,
-        sandbox_dir: Path,
-        allowed_paths: List[Path]
-    ) -> None:
-        """Set up allowed files in sandbox"""
-        for path in allowed_paths:
-            if not path.exists():
-                continue
-                
-            # Create relative path in sandbox
-            if path.is_absolute():
-                # Use last component of path
-                sandbox_path = sandbox_dir / path.name
-            else:
-                sandbox_path = sandbox_dir / path
-                
-            # Create parent directories
-            sandbox_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Copy file or directory
-            if path.is_file():
-                shutil.copy2(path, sandbox_path)
-            elif path.is_dir():
-                shutil.copytree(path, sandbox_path, dirs_exist_ok=True)
-                
+    def _install_script(self, script_path: Path, sandbox_dir: Path) -> Path:
+        """Copy a script into a sandbox directory"""
+        sandbox_script = sandbox_dir / script_path.name
+        
+        # An allowed path may have put a file of the same name here, copied
+        # with its source's mode; if that is read-only, copying over it fails
+        sandbox_script.unlink(missing_ok=True)
+        shutil.copy2(script_path, sandbox_script)
+        sandbox_script.chmod(0o755)
+        
+        return sandbox_script
+        
     def _set_resource_limits(self) -> None:
         """Set resource limits for subprocess
         
@@ -419,5 +432,6 @@ class HookSandbox:
             },
             "allowed_commands": list(self.allowed_commands),
             "allowed_env_vars": list(self.allowed_env_vars),
-            "dangerous_patterns": len(self.dangerous_patterns)
+            "dangerous_patterns": len(self.dangerous_patterns),
+            "workspaces": self.workspaces.get_stats() if self.workspaces else None
         }
\ No newline at end of file
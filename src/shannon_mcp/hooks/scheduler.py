@@ -0,0 +1,238 @@
+"""Bounded, priority-ordered hook execution"""
+
+import asyncio
+import time
+from bisect import insort
+from collections import deque, defaultdict
+from typing import Dict, Any, List, Callable, Awaitable, Deque
+
+from .config import HookConfig
+from ..utils.logging import get_logger
+from ..utils.stats import Histogram, DEFAULT_COUNT_BUCKETS
+
+logger = get_logger(__name__)
+
+
+class _Job:
+    """One queued hook invocation"""
+    
+    __slots__ = ("hook", "run", "future", "enqueued")
+    
+    def __init__(
+        self,
+        hook: HookConfig,
+        run: Callable[[], Awaitable[Any]],
+        future: asyncio.Future
+    ):
+        self.hook = hook
+        self.run = run
+        self.future = future
+        self.enqueued = time.monotonic()
+
+
+class HookScheduler:
+    """Runs hook invocations on a bounded pool
+    
+    Features:
+    - At most max_workers invocations run at once
+    - One FIFO queue per HookConfig.priority, highest priority first
+    - Per-hook concurrency limits (HookConfig.max_concurrency): extra
+      invocations wait for a running one to finish instead of failing
+    - Fire-and-forget submission for results nobody awaits
+    - Queue depth and wait time statistics
+    """
+    
+    def __init__(self, max_workers: int = 16):
+        """Initialize scheduler
+        
+        Args:
+            max_workers: Maximum hook invocations running at once
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        
+        self.max_workers = max_workers
+        
+        # priority -> waiting jobs; _order holds the negated priorities present
+        self._queues: Dict[int, Deque[_Job]] = {}
+        self._order: List[int] = []
+        
+        # Jobs whose hook was at its concurrency limit when they came up
+        self._parked: Dict[str, Deque[_Job]] = defaultdict(deque)
+        
+        self._active: Dict[str, int] = {}
+        self._running = 0
+        self._queued = 0
+        self._tasks: set = set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        
+        # Statistics
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.detached = 0
+        self.max_queue_depth = 0
+        self.wait_ms = Histogram()
+        self.queue_depth = Histogram(DEFAULT_COUNT_BUCKETS)
+    
+    @property
+    def queued(self) -> int:
+        """Invocations waiting to start"""
+        return self._queued
+    
+    @property
+    def running(self) -> int:
+        """Invocations in progress"""
+        return self._running
+    
+    def running_hooks(self) -> List[str]:
+        """Names of hooks with an invocation in progress"""
+        return list(self._active)
+    
+    def submit(
+        self,
+        hook: HookConfig,
+        run: Callable[[], Awaitable[Any]],
+        detached: bool = False
+    ) -> asyncio.Future:
+        """Queue a hook invocation
+        
+        Args:
+            hook: Hook being run (supplies priority and concurrency limit)
+            run: Coroutine function performing the invocation
+            detached: Nobody will await the result; failures are logged
+        
+        Returns:
+            Future resolving to the invocation's result
+        """
+        future = asyncio.get_running_loop().create_future()
+        job = _Job(hook, run, future)
+        
+        if detached:
+            self.detached += 1
+            future.add_done_callback(self._log_detached_failure)
+        
+        self.submitted += 1
+        self._enqueue(job)
+        self.queue_depth.observe(self._queued)
+        self.max_queue_depth = max(self.max_queue_depth, self._queued)
+        
+        self._dispatch()
+        return future
+    
+    async def drain(self) -> None:
+        """Wait until every submitted invocation has finished"""
+        await self._idle.wait()
+    
+    def _enqueue(self, job: _Job, front: bool = False) -> None:
+        """Add a job to its priority queue"""
+        priority = job.hook.priority
+        queue = self._queues.get(priority)
+        if queue is None:
+            queue = self._queues[priority] = deque()
+            insort(self._order, -priority)
+        
+        if front:
+            queue.appendleft(job)
+        else:
+            queue.append(job)
+        
+        self._queued += 1
+        self._idle.clear()
+    
+    def _dispatch(self) -> None:
+        """Start waiting jobs while workers are free"""
+        while self._running < self.max_workers and self._order:
+            priority = -self._order[0]
+            queue = self._queues[priority]
+            job = queue.popleft()
+            if not queue:
+                del self._queues[priority]
+                self._order.pop(0)
+            
+            name = job.hook.name
+            if self._active.get(name, 0) >= max(1, job.hook.max_concurrency):
+                # Still counted as queued until a slot for this hook frees up
+                self._parked[name].append(job)
+                continue
+            
+            self._queued -= 1
+            self._start(job)
+    
+    def _start(self, job: _Job) -> None:
+        """Run a job on a free worker"""
+        name = job.hook.name
+        self._active[name] = self._active.get(name, 0) + 1
+        self._running += 1
+        self.wait_ms.observe((time.monotonic() - job.enqueued) * 1000)
+        
+        task = asyncio.create_task(self._run(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _run(self, job: _Job) -> None:
+        """Run a job and release its slots"""
+        name = job.hook.name
+        try:
+            result = await job.run()
+        except asyncio.CancelledError:
+            if not job.future.done():
+                job.future.cancel()
+            raise
+        except Exception as e:
+            self.failed += 1
+            if not job.future.done():
+                job.future.set_exception(e)
+        else:
+            self.completed += 1
+            if not job.future.done():
+                job.future.set_result(result)
+        finally:
+            self._running -= 1
+            self._active[name] -= 1
+            if not self._active[name]:
+                del self._active[name]
+            
+            # A parked invocation of this hook goes back to the head of its queue
+            parked = self._parked.get(name)
+            if parked:
+                self._queued -= 1
+                self._enqueue(parked.popleft(), front=True)
+                if not parked:
+                    del self._parked[name]
+            
+            self._dispatch()
+            
+            if not self._running and not self._queued:
+                self._idle.set()
+    
+    def _log_detached_failure(self, future: asyncio.Future) -> None:
+        """Log the failure of an invocation nobody awaits"""
+        if future.cancelled():
+            return
+        
+        error = future.exception()
+        if error is not None:
+            logger.error(f"Detached hook execution failed: {error}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler statistics"""
+        return {
+            "max_workers": self.max_workers,
+            "running": self._running,
+            "queued": self._queued,
+            "queued_by_priority": {
+                priority: len(queue) for priority, queue in self._queues.items()
+            },
+            "parked_by_hook": {
+                name: len(jobs) for name, jobs in self._parked.items()
+            },
+            "max_queue_depth": self.max_queue_depth,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "detached": self.detached,
+            "wait_ms": self.wait_ms.to_dict(),
+            "queue_depth": self.queue_depth.to_dict()
+        }
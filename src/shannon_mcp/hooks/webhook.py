@@ -0,0 +1,251 @@
+"""Pooled HTTP client for webhook hook actions"""
+
+import asyncio
+import json
+from typing import Dict, Any, List, Optional, Tuple
+
+import aiohttp
+
+from ..utils.logging import get_logger
+from ..utils.errors import HookExecutionError
+
+logger = get_logger(__name__)
+
+# Batches are keyed by URL and headers
+BatchKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class _Batch:
+    """Payloads waiting to be sent to one URL in a single POST"""
+    
+    __slots__ = ("payloads", "futures", "timeout", "handle")
+    
+    def __init__(self, timeout: Optional[float]):
+        self.payloads: List[Dict[str, Any]] = []
+        self.futures: List[asyncio.Future] = []
+        self.timeout = timeout
+        self.handle: Optional[asyncio.TimerHandle] = None
+
+
+class WebhookClient:
+    """Long-lived HTTP client shared by all webhook actions
+    
+    Features:
+    - One connection pool with per-host limits and keep-alive
+    - Cached DNS lookups
+    - Optional batching: POSTs to the same URL within a short window are
+      sent as one request with body {"batch": [payload, ...]}
+    """
+    
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: int = 300,
+        max_batch_size: int = 100
+    ):
+        """Initialize webhook client
+        
+        Args:
+            limit: Maximum open connections in total
+            limit_per_host: Maximum open connections to one host
+            keepalive_timeout: Seconds an idle connection is kept open
+            dns_cache_ttl: Seconds a DNS lookup is cached
+            max_batch_size: Payloads that flush a batch before its window ends
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.max_batch_size = max_batch_size
+        
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._batches: Dict[BatchKey, _Batch] = {}
+        self._flushes: set = set()
+        
+        # Statistics
+        self.requests = 0
+        self.batches_sent = 0
+        self.batched_payloads = 0
+    
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """HTTP session, created on first use"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                use_dns_cache=True,
+                ttl_dns_cache=self.dns_cache_ttl
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+    
+    async def close(self) -> None:
+        """Send pending batches and close the connection pool"""
+        for key in list(self._batches):
+            self._flush(key)
+        
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+        
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Send a GET request
+        
+        Args:
+            url: Webhook URL
+            headers: Request headers
+            timeout: Total request timeout in seconds
+        
+        Returns:
+            Processed response
+        """
+        return await self._request("GET", url, None, headers, timeout)
+    
+    async def post(
+        self,
+        url: str,
+        payload: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        batch_window: float = 0.0
+    ) -> Dict[str, Any]:
+        """Send a JSON POST, optionally batched with others to the same URL
+        
+        Args:
+            url: Webhook URL
+            payload: JSON body
+            headers: Request headers
+            timeout: Total request timeout in seconds
+            batch_window: Seconds to wait for more payloads to the same URL
+                (0 sends immediately)
+        
+        Returns:
+            Processed response; batched callers share the batch's response
+        """
+        if batch_window <= 0:
+            return await self._request("POST", url, payload, headers, timeout)
+        
+        key: BatchKey = (url, tuple(sorted((headers or {}).items())))
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = _Batch(timeout)
+            self._batches[key] = batch
+            batch.handle = asyncio.get_running_loop().call_later(
+                batch_window, self._flush, key
+            )
+        
+        future = asyncio.get_running_loop().create_future()
+        batch.payloads.append(payload)
+        batch.futures.append(future)
+        
+        if len(batch.payloads) >= self.max_batch_size:
+            self._flush(key)
+        
+        return await future
+    
+    def _flush(self, key: BatchKey) -> None:
+        """Start sending a batch"""
+        batch = self._batches.pop(key, None)
+        if batch is None:
+            return
+        
+        if batch.handle:
+            batch.handle.cancel()
+        
+        task = asyncio.ensure_future(self._send_batch(key, batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+    
+    async def _send_batch(self, key: BatchKey, batch: _Batch) -> None:
+        """Send a batch and resolve its callers"""
+        url, headers = key
+        
+        try:
+            result = await self._request(
+                "POST", url, {"batch": batch.payloads}, dict(headers), batch.timeout
+            )
+            result["batched"] = len(batch.payloads)
+        except Exception as e:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        self.batches_sent += 1
+        self.batched_payloads += len(batch.payloads)
+        logger.debug("webhook_batch_sent", url=url, payloads=len(batch.payloads))
+        
+        for future in batch.futures:
+            if not future.done():
+                future.set_result(dict(result))
+    
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        payload: Optional[Any],
+        headers: Optional[Dict[str, str]],
+        timeout: Optional[float]
+    ) -> Dict[str, Any]:
+        """Send one request over the pool"""
+        self.requests += 1
+        
+        async with self.session.request(
+            method,
+            url,
+            json=payload,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            return await self._process_response(response)
+    
+    async def _process_response(
+        self,
+        response: aiohttp.ClientResponse
+    ) -> Dict[str, Any]:
+        """Process webhook response"""
+        text = await response.text()
+        
+        result = {
+            "status_code": response.status,
+            "headers": dict(response.headers),
+            "body": text
+        }
+        
+        # Try to parse JSON
+        try:
+            result["json"] = json.loads(text)
+        except ValueError:
+            pass
+        
+        if response.status >= 400:
+            raise HookExecutionError(
+                f"Webhook returned error: {response.status} - {text}"
+            )
+        
+        return result
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get client statistics"""
+        connector = self._session.connector if self._session else None
+        return {
+            "requests": self.requests,
+            "batches_sent": self.batches_sent,
+            "batched_payloads": self.batched_payloads,
+            "pending_batches": len(self._batches),
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "pool_open": bool(connector and not connector.closed)
+        }
@@ -0,0 +1,409 @@
+"""Persistent interpreter workers for script hooks
+
+A worker loads a hook script once and then serves invocations over a
+JSON-lines protocol on stdin/stdout:
+
+    -> {"id": 1, "context": {...}}
+    <- {"id": 1, "ok": true, "result": ..., "stdout": "..."}
+
+Python scripts define ``handle(context)``; Node scripts export a function
+(or an object with a ``handle`` function), which may return a promise.
+Anything the script prints goes to ``stdout`` in the response rather
+than onto the protocol channel.
+"""
+
+import asyncio
+import itertools
+import json
+from collections import deque
+from pathlib import Path
+from typing import Dict, Any, Optional, Set, Tuple, Deque
+
+from .sandbox import HookSandbox
+from ..utils.logging import get_logger
+from ..utils.errors import HookExecutionError
+
+logger = get_logger(__name__)
+
+# Largest response line accepted from a worker
+MAX_LINE_BYTES = 16 * 1024 * 1024
+
+PYTHON_RUNNER = r"""
+import contextlib, importlib.util, io, json, sys
+out = sys.stdout
+sys.stdout = sys.stderr
+try:
+    spec = importlib.util.spec_from_file_location("hook_script", sys.argv[1])
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    handler = module.handle
+except Exception as e:
+    out.write(json.dumps({"ready": False, "error": repr(e)}) + "\n")
+    out.flush()
+    sys.exit(1)
+out.write(json.dumps({"ready": True}) + "\n")
+out.flush()
+for line in sys.stdin:
+    request = json.loads(line)
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            result = handler(request["context"])
+        response = {"id": request["id"], "ok": True, "result": result}
+    except Exception as e:
+        response = {"id": request["id"], "ok": False, "error": repr(e)}
+    response["stdout"] = buffer.getvalue()
+    out.write(json.dumps(response, default=str) + "\n")
+    out.flush()
+"""
+
+NODE_RUNNER = r"""
+const readline = require('readline');
+const write = process.stdout.write.bind(process.stdout);
+let captured = '';
+process.stdout.write = (chunk) => { captured += chunk; return true; };
+let handler;
+try {
+  const loaded = require(require('path').resolve(process.argv[1]));
+  handler = typeof loaded === 'function' ? loaded : loaded.handle;
+  if (typeof handler !== 'function') throw new Error('script exports no handler');
+} catch (e) {
+  write(JSON.stringify({ready: false, error: String(e)}) + '\n');
+  process.exit(1);
+}
+write(JSON.stringify({ready: true}) + '\n');
+const queue = [];
+let busy = false;
+async function drain() {
+  if (busy) return;
+  busy = true;
+  while (queue.length) {
+    const request = JSON.parse(queue.shift());
+    captured = '';
+    let response;
+    try {
+      response = {id: request.id, ok: true, result: await handler(request.context)};
+    } catch (e) {
+      response = {id: request.id, ok: false, error: String(e)};
+    }
+    response.stdout = captured;
+    write(JSON.stringify(response) + '\n');
+  }
+  busy = false;
+}
+readline.createInterface({input: process.stdin}).on('line', (line) => { queue.push(line); drain(); });
+"""
+
+# Script suffix -> (interpreter, runner source)
+RUNNERS: Dict[str, Tuple[str, str]] = {
+    ".py": ("python3", PYTHON_RUNNER),
+    ".js": ("node", NODE_RUNNER),
+}
+
+
+class ScriptWorker:
+    """One long-lived interpreter serving a single script"""
+    
+    def __init__(
+        self,
+        script_path: Path,
+        env: Dict[str, str],
+        sandbox: Optional[HookSandbox] = None
+    ):
+        """Initialize worker
+        
+        Args:
+            script_path: Script to load
+            env: Environment for the interpreter
+            sandbox: Sandbox whose validation, environment filtering and
+                resource limits apply to the worker process
+        """
+        self.script_path = script_path
+        self.env = env
+        self.sandbox = sandbox
+        
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.mtime: Optional[float] = None
+        self.calls = 0
+        
+        # Callers that got this worker from the pool and have not finished
+        self.holders = 0
+        self.retired = False
+        
+        self._ids = itertools.count(1)
+        self._lock = asyncio.Lock()
+        self._stderr: Deque[str] = deque(maxlen=50)
+        self._stderr_task: Optional[asyncio.Task] = None
+    
+    @property
+    def alive(self) -> bool:
+        """Whether the interpreter is running"""
+        return self.process is not None and self.process.returncode is None
+    
+    @property
+    def pid(self) -> Optional[int]:
+        """Interpreter process ID"""
+        return self.process.pid if self.process else None
+    
+    def is_stale(self) -> bool:
+        """Whether the script changed since it was loaded"""
+        try:
+            return self.script_path.stat().st_mtime != self.mtime
+        except OSError:
+            return True
+    
+    async def start(self, timeout: float = 10.0) -> None:
+        """Start the interpreter and wait until the script is loaded
+        
+        Args:
+            timeout: Seconds to wait for the script to load
+        """
+        interpreter, runner = RUNNERS[self.script_path.suffix.lower()]
+        self.mtime = self.script_path.stat().st_mtime
+        
+        options: Dict[str, Any] = {"env": self.env}
+        if self.sandbox:
+            options = self.sandbox.prepare_worker(self.script_path, self.env)
+        
+        self.process = await asyncio.create_subprocess_exec(
+            interpreter,
+            "-c" if interpreter == "python3" else "-e",
+            runner,
+            str(self.script_path.resolve()),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=MAX_LINE_BYTES,
+            **options
+        )
+        self._stderr_task = asyncio.create_task(self._collect_stderr())
+        
+        try:
+            ready = await self._read_message(timeout)
+        except HookExecutionError:
+            await self.stop()
+            raise
+        
+        if not ready.get("ready"):
+            await self.stop()
+            raise HookExecutionError(
+                f"Script worker failed to load {self.script_path}: {ready.get('error')}"
+            )
+        
+        logger.debug("script_worker_started", script=str(self.script_path), pid=self.pid)
+    
+    async def call(
+        self,
+        context: Dict[str, Any],
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Run the script's handler once
+        
+        Args:
+            context: Hook context passed to the handler
+            timeout: Seconds to wait for the response
+        
+        Returns:
+            Handler result with captured stdout
+        """
+        async with self._lock:
+            request_id = next(self._ids)
+            self.calls += 1
+            
+            line = json.dumps({"id": request_id, "context": context}, default=str)
+            
+            try:
+                self.process.stdin.write(line.encode() + b"\n")
+                await self.process.stdin.drain()
+                response = await self._read_message(timeout)
+            except (HookExecutionError, ConnectionError) as e:
+                # The worker's state is unknown after a timeout or crash
+                await self.stop()
+                raise HookExecutionError(f"{e}\n{self.stderr}".rstrip())
+            
+            if response.get("id") != request_id:
+                await self.stop()
+                raise HookExecutionError(f"Script worker out of sync: {self.script_path}")
+        
+        if not response.get("ok"):
+            raise HookExecutionError(
+                f"Script failed: {self.script_path}\n{response.get('error')}"
+            )
+        
+        return {
+            "returncode": 0,
+            "stdout": response.get("stdout", ""),
+            "stderr": "",
+            "result": response.get("result"),
+            "worker_pid": self.pid
+        }
+    
+    async def stop(self) -> None:
+        """Stop the interpreter"""
+        if self.alive:
+            self.process.stdin.close()
+            try:
+                await asyncio.wait_for(self.process.wait(), timeout=2.0)
+            except asyncio.TimeoutError:
+                self.process.kill()
+                await self.process.wait()
+        
+        if self._stderr_task:
+            self._stderr_task.cancel()
+            self._stderr_task = None
+    
+    @property
+    def stderr(self) -> str:
+        """Recent stderr output"""
+        return "".join(self._stderr)
+    
+    async def _read_message(self, timeout: Optional[float]) -> Dict[str, Any]:
+        """Read one protocol line"""
+        try:
+            line = await asyncio.wait_for(self.process.stdout.readline(), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise HookExecutionError(f"Script timed out: {self.script_path}")
+        
+        if not line:
+            raise HookExecutionError(f"Script worker exited: {self.script_path}")
+        
+        return json.loads(line)
+    
+    async def _collect_stderr(self) -> None:
+        """Keep the tail of stderr so the pipe never fills"""
+        async for line in self.process.stderr:
+            self._stderr.append(line.decode(errors="replace"))
+
+
+class ScriptWorkerPool:
+    """Long-lived workers for script hooks, one per script and environment
+    
+    Features:
+    - Interpreter startup paid once per worker instead of once per call
+    - Workers recycled after max_calls invocations or when the script's
+      mtime changes
+    - Crashed or timed-out workers replaced on the next call
+    - Sandbox validation, environment filtering and resource limits
+    
+    Calls to one worker are serialized.
+    """
+    
+    def __init__(self, max_calls: int = 1000):
+        """Initialize pool
+        
+        Args:
+            max_calls: Invocations served before a worker is recycled
+        """
+        self.max_calls = max_calls
+        
+        self._workers: Dict[Tuple[Any, ...], ScriptWorker] = {}
+        self._lock = asyncio.Lock()
+        self._retired: Set[ScriptWorker] = set()
+        self._stopping: set = set()
+        
+        # Statistics
+        self.spawned = 0
+        self.recycled = 0
+        self.calls = 0
+    
+    @staticmethod
+    def supports(script_path: Path) -> bool:
+        """Whether scripts of this type can run in a worker"""
+        return script_path.suffix.lower() in RUNNERS
+    
+    async def call(
+        self,
+        script_path: Path,
+        context: Dict[str, Any],
+        env: Dict[str, str],
+        sandbox: Optional[HookSandbox] = None,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Run a script's handler in its worker
+        
+        Args:
+            script_path: Script to run
+            context: Hook context
+            env: Environment for the worker
+            sandbox: Sandbox to apply (None runs the worker directly)
+            timeout: Seconds to wait for the response
+        
+        Returns:
+            Handler result
+        """
+        worker = await self._get_worker(script_path, env, sandbox, timeout)
+        self.calls += 1
+        try:
+            return await worker.call(context, timeout)
+        finally:
+            worker.holders -= 1
+            if worker.retired and worker.holders == 0:
+                self._stop_retired(worker)
+    
+    async def close(self) -> None:
+        """Stop all workers"""
+        async with self._lock:
+            workers = list(self._workers.values()) + list(self._retired)
+            self._workers.clear()
+            self._retired.clear()
+        
+        await asyncio.gather(
+            *(worker.stop() for worker in workers),
+            *self._stopping,
+            return_exceptions=True
+        )
+    
+    async def _get_worker(
+        self,
+        script_path: Path,
+        env: Dict[str, str],
+        sandbox: Optional[HookSandbox],
+        timeout: Optional[float]
+    ) -> ScriptWorker:
+        """Get a live, current worker for a script"""
+        key = (
+            str(script_path.resolve()),
+            sandbox is not None,
+            tuple(sorted(env.items()))
+        )
+        
+        async with self._lock:
+            worker = self._workers.get(key)
+            if worker is not None:
+                if worker.alive and worker.calls < self.max_calls and not worker.is_stale():
+                    worker.holders += 1
+                    return worker
+                
+                # Callers already holding the old worker finish on it; the
+                # last of them stops it
+                self.recycled += 1
+                del self._workers[key]
+                worker.retired = True
+                if worker.holders:
+                    self._retired.add(worker)
+                else:
+                    self._stop_retired(worker)
+            
+            worker = ScriptWorker(script_path, env, sandbox)
+            await worker.start(timeout or 10.0)
+            self._workers[key] = worker
+            self.spawned += 1
+            worker.holders += 1
+            return worker
+    
+    def _stop_retired(self, worker: ScriptWorker) -> None:
+        """Stop a retired worker in the background"""
+        self._retired.discard(worker)
+        task = asyncio.create_task(worker.stop())
+        self._stopping.add(task)
+        task.add_done_callback(self._stopping.discard)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics"""
+        return {
+            "workers": len(self._workers),
+            "spawned": self.spawned,
+            "recycled": self.recycled,
+            "calls": self.calls,
+            "max_calls": self.max_calls
+        }
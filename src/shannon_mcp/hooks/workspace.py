@@ -0,0 +1,335 @@
+"""Cached sandbox workspaces
+
+Each distinct set of allowed paths is copied once into a template
+directory. Sandbox workspaces are then built from the template, using
+reflink (copy-on-write) clones where the filesystem supports them, so
+preparing a workspace costs one clone per file instead of a copy of
+every byte. Elsewhere each workspace gets plain copies. Workspaces never
+share an inode with the template or with each other, so a hook writing
+a file in place cannot change what another hook sees.
+
+Before a template is reused, its sources and its own files are compared
+against the (size, mtime, mode) signatures recorded when it was built,
+and the template is rebuilt if either side changed.
+
+All filesystem work runs in worker threads.
+"""
+
+import asyncio
+import errno
+import fcntl
+import hashlib
+import itertools
+import os
+import shutil
+import stat
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# ioctl request cloning one file's extents into another (Linux, btrfs/XFS)
+FICLONE = 0x40049409
+
+# Relative path -> (size, mtime_ns, mode); directories have size -1
+Manifest = Dict[str, Tuple[int, int, int]]
+
+# (source path, name inside the workspace)
+Sources = Tuple[Tuple[Path, str], ...]
+
+
+def _reflink(source: str, target: str) -> None:
+    """Clone a file's contents without copying its data"""
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            os.unlink(target)
+            raise
+    shutil.copystat(source, target)
+
+
+def _copy(source: str, target: str) -> str:
+    """Copy a file, cloning it when the filesystem allows"""
+    try:
+        _reflink(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+    return target
+
+
+def _scan(root: Path) -> Manifest:
+    """Record the signature of every file and directory under root"""
+    st = root.stat()
+    if not stat.S_ISDIR(st.st_mode):
+        return {"": (st.st_size, st.st_mtime_ns, st.st_mode)}
+    
+    manifest: Manifest = {}
+    for dirpath, dirnames, filenames in os.walk(root, followlinks=True):
+        rel_dir = os.path.relpath(dirpath, root)
+        for name in dirnames:
+            manifest[os.path.normpath(os.path.join(rel_dir, name))] = (-1, 0, 0)
+        for name in filenames:
+            try:
+                st = os.stat(os.path.join(dirpath, name))
+            except OSError:
+                # Dangling symlink
+                continue
+            if stat.S_ISREG(st.st_mode):
+                manifest[os.path.normpath(os.path.join(rel_dir, name))] = (
+                    st.st_size, st.st_mtime_ns, st.st_mode
+                )
+    return manifest
+
+
+def _scan_sources(sources: Sources) -> Manifest:
+    """Record the signatures of a template's sources"""
+    manifest: Manifest = {}
+    for path, name in sources:
+        if not path.exists():
+            continue
+        for rel, signature in _scan(path).items():
+            manifest[os.path.join(name, rel) if rel else name] = signature
+    return manifest
+
+
+class _Template:
+    """A built template and the signatures it was verified against"""
+    
+    __slots__ = ("path", "sources", "source_manifest", "manifest", "users", "retired")
+    
+    def __init__(self, path: Path, sources: Sources):
+        self.path = path
+        self.sources = sources
+        self.source_manifest: Manifest = {}
+        self.manifest: Manifest = {}
+        self.users = 0
+        self.retired = False
+
+
+class WorkspaceCache:
+    """Builds sandbox workspaces from cached, verified templates
+    
+    Features:
+    - One template per distinct set of allowed paths, copied once
+    - Workspaces as reflink clones of the template, falling back to
+      plain copies
+    - Templates rebuilt when a source or a template file changes
+    - Least recently used templates evicted beyond max_templates
+    - All filesystem work off the event loop
+    """
+    
+    def __init__(self, root: Path, max_templates: int = 32):
+        """Initialize cache
+        
+        Args:
+            root: Directory holding templates and workspaces
+            max_templates: Templates kept before the least recently used
+                is removed
+        """
+        self.root = root
+        self.max_templates = max_templates
+        
+        # "reflink" or "copy", probed on first use
+        self.mode: Optional[str] = None
+        
+        self._templates: "OrderedDict[str, _Template]" = OrderedDict()
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._generation = itertools.count()
+        
+        # Statistics
+        self.workspaces_created = 0
+        self.template_hits = 0
+        self.template_builds = 0
+        self.template_invalidations = 0
+        self.files_populated = 0
+    
+    async def create(
+        self,
+        prefix: str,
+        allowed_paths: Optional[List[Path]] = None
+    ) -> Path:
+        """Create a fresh workspace
+        
+        Args:
+            prefix: Workspace directory name prefix
+            allowed_paths: Paths to expose in the workspace; absolute paths
+                appear under their last component, relative paths as given
+        
+        Returns:
+            Workspace directory
+        """
+        if self.mode is None:
+            self.mode = await asyncio.to_thread(self._probe_mode)
+            logger.info("sandbox_workspace_mode", mode=self.mode)
+        
+        workspace = Path(await asyncio.to_thread(
+            tempfile.mkdtemp, prefix=prefix, dir=self.root
+        ))
+        self.workspaces_created += 1
+        
+        if not allowed_paths:
+            return workspace
+        
+        template = await self._acquire(allowed_paths)
+        try:
+            self.files_populated += await asyncio.to_thread(
+                self._populate, template.path, workspace
+            )
+        except Exception:
+            await self.remove(workspace)
+            raise
+        finally:
+            await self._release(template)
+        
+        return workspace
+    
+    async def remove(self, workspace: Path) -> None:
+        """Remove a workspace"""
+        await asyncio.to_thread(shutil.rmtree, workspace, True)
+    
+    async def clear(self) -> None:
+        """Remove all templates"""
+        templates = list(self._templates.values())
+        self._templates.clear()
+        for template in templates:
+            await asyncio.to_thread(shutil.rmtree, template.path, True)
+    
+    async def _acquire(self, allowed_paths: List[Path]) -> _Template:
+        """Get a verified template for a set of allowed paths"""
+        sources: Sources = tuple(
+            (path, path.name if path.is_absolute() else str(path))
+            for path in allowed_paths
+        )
+        key = hashlib.sha1(
+            "\0".join(f"{path}\0{name}" for path, name in sources).encode()
+        ).hexdigest()[:16]
+        
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            template = self._templates.get(key)
+            if template is not None:
+                if await asyncio.to_thread(self._is_current, template):
+                    self.template_hits += 1
+                    self._templates.move_to_end(key)
+                    template.users += 1
+                    return template
+                
+                self.template_invalidations += 1
+                self._retire(self._templates.pop(key))
+            
+            template = _Template(self.root / f"template_{key}.{next(self._generation)}", sources)
+            await asyncio.to_thread(self._build, template)
+            self.template_builds += 1
+            
+            self._templates[key] = template
+            template.users += 1
+            
+            while len(self._templates) > self.max_templates:
+                _, evicted = self._templates.popitem(last=False)
+                self._retire(evicted)
+            
+            return template
+    
+    async def _release(self, template: _Template) -> None:
+        """Drop a workspace's hold on a template"""
+        template.users -= 1
+        if template.retired and not template.users:
+            await asyncio.to_thread(shutil.rmtree, template.path, True)
+    
+    def _retire(self, template: _Template) -> None:
+        """Remove a template once no workspace is being built from it"""
+        template.retired = True
+        if not template.users:
+            task = asyncio.create_task(
+                asyncio.to_thread(shutil.rmtree, template.path, True)
+            )
+            task.add_done_callback(lambda t: t.exception())
+    
+    def _probe_mode(self) -> str:
+        """Find the cheapest way to populate workspaces on this filesystem"""
+        self.root.mkdir(parents=True, exist_ok=True)
+        probe = tempfile.mkdtemp(prefix="probe_", dir=self.root)
+        try:
+            source = os.path.join(probe, "source")
+            with open(source, "wb") as f:
+                f.write(b"probe")
+            
+            try:
+                _reflink(source, os.path.join(probe, "clone"))
+                return "reflink"
+            except OSError:
+                # Hardlinks would share inodes between workspaces
+                return "copy"
+        finally:
+            shutil.rmtree(probe, ignore_errors=True)
+    
+    def _build(self, template: _Template) -> None:
+        """Copy a template's sources and record its signatures"""
+        # Signatures first, so a source changing mid-copy fails verification
+        template.source_manifest = _scan_sources(template.sources)
+        template.path.mkdir(parents=True)
+        
+        for path, name in template.sources:
+            if not path.exists():
+                continue
+            
+            target = template.path / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if path.is_file():
+                _copy(str(path), str(target))
+            elif path.is_dir():
+                shutil.copytree(path, target, copy_function=_copy, dirs_exist_ok=True)
+        
+        template.manifest = _scan(template.path)
+    
+    def _is_current(self, template: _Template) -> bool:
+        """Whether neither the sources nor the template changed"""
+        try:
+            return (
+                _scan_sources(template.sources) == template.source_manifest
+                and _scan(template.path) == template.manifest
+            )
+        except OSError:
+            return False
+    
+    def _populate(self, template_path: Path, workspace: Path) -> int:
+        """Fill a workspace from a template, returning the file count"""
+        count = 0
+        for dirpath, _, filenames in os.walk(template_path):
+            rel_dir = os.path.relpath(dirpath, template_path)
+            target_dir = workspace if rel_dir == "." else workspace / rel_dir
+            target_dir.mkdir(exist_ok=True)
+            
+            for name in filenames:
+                self._clone(os.path.join(dirpath, name), str(target_dir / name))
+                count += 1
+        return count
+    
+    def _clone(self, source: str, target: str) -> None:
+        """Add one template file to a workspace"""
+        if self.mode == "reflink":
+            try:
+                _reflink(source, target)
+                return
+            except OSError as e:
+                if e.errno not in (errno.EOPNOTSUPP, errno.EXDEV, errno.EINVAL):
+                    raise
+        
+        shutil.copy2(source, target)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get workspace statistics"""
+        return {
+            "mode": self.mode,
+            "templates": len(self._templates),
+            "workspaces_created": self.workspaces_created,
+            "template_hits": self.template_hits,
+            "template_builds": self.template_builds,
+            "template_invalidations": self.template_invalidations,
+            "files_populated": self.files_populated
+        }
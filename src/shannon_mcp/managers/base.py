@@ -22,6 +22,7 @@ import structlog
 from contextlib import asynccontextmanager
 
 from ..utils.logging import get_logger, log_function_call
+from ..utils.scheduler import AdaptiveScheduler, Activity, JobFunc, get_scheduler
 
 
 T = TypeVar('T')
@@ -97,10 +98,13 @@ class BaseManager(ABC, Generic[T]):
         self.db: Optional[aiosqlite.Connection] = None
         self._event_handlers: Dict[str, List[Callable]] = {}
         self._health_status = HealthStatus(healthy=True, last_check=datetime.utcnow())
-        self._health_task: Optional[asyncio.Task] = None
         self._recovery_attempts = 0
         self._tasks: List[asyncio.Task] = []
         
+        # Periodic passes run on the shared adaptive scheduler
+        self._scheduler: Optional[AdaptiveScheduler] = None
+        self._scheduled_jobs: List[str] = []
+        
     @property
     def is_ready(self) -> bool:
         """Check if manager is ready for operations."""
@@ -161,14 +165,19 @@ class BaseManager(ABC, Generic[T]):
             
             # Start health monitoring
             if self.config.health_check_interval > 0:
-                self._health_task = asyncio.create_task(self._health_monitor())
-                self._tasks.append(self._health_task)
+                self._schedule_job(
+                    "health",
+                    self._health_monitor,
+                    interval=self.config.health_check_interval
+                )
             
             self.state = ManagerState.RUNNING
             self.logger.info("manager_started")
             await self._notify_event("started", {"manager": self.config.name})
             
         except Exception as e:
+            # stop() skips a manager that never ran, so drop its jobs here
+            await self._remove_jobs()
             self.state = ManagerState.ERROR
             self.logger.error("start_failed", error=str(e), exc_info=True)
             raise ManagerError(f"Failed to start {self.config.name}: {e}") from e
@@ -187,13 +196,8 @@ class BaseManager(ABC, Generic[T]):
         self.logger.info("stopping_manager")
         
         try:
-            # Cancel health monitoring
-            if self._health_task:
-                self._health_task.cancel()
-                try:
-                    await self._health_task
-                except asyncio.CancelledError:
-                    pass
+            # Stop periodic passes, letting running ones finish
+            await self._remove_jobs()
             
             # Cancel all managed tasks
             for task in self._tasks:
@@ -304,20 +308,49 @@ class BaseManager(ABC, Generic[T]):
         await self._create_schema()
         await self.db.commit()
     
-    async def _health_monitor(self) -> None:
-        """Background task for health monitoring."""
-        while self.is_running:
-            try:
-                await asyncio.sleep(self.config.health_check_interval)
-                status = await self.health_check()
+    def _schedule_job(
+        self,
+        name: str,
+        func: JobFunc,
+        interval: float,
+        **options: Any
+    ) -> None:
+        """
+        Run a periodic pass on the shared scheduler until the manager stops.
                 
-                if not status.healthy and self.config.auto_recovery:
-                    await self._attempt_recovery()
+        Args:
+            name: Job name, unique within this manager
+            func: Coroutine function running one pass
+            interval: Interval while activity is normal
+            **options: Further AdaptiveScheduler.add_job() options
+        """
+        if self._scheduler is None:
+            self._scheduler = get_scheduler()
                     
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                self.logger.error("health_monitor_error", error=str(e))
+        # The scheduler is shared per event loop, and managers of one class
+        # share a config name
+        job_name = f"{self.config.name}.{id(self):x}.{name}"
+        self._scheduler.add_job(job_name, func, interval, **options)
+        self._scheduled_jobs.append(job_name)
+    
+    async def _remove_jobs(self) -> None:
+        """Remove this manager's jobs from the shared scheduler."""
+        for name in self._scheduled_jobs:
+            await self._scheduler.remove_job(name)
+        self._scheduled_jobs.clear()
+    
+    async def _health_monitor(self) -> Activity:
+        """Scheduled health check; runs more often while unhealthy."""
+        was_healthy = self._health_status.healthy
+        status = await self.health_check()
+        
+        if not status.healthy and self.config.auto_recovery:
+            await self._attempt_recovery()
+        
+        return Activity(
+            changed=status.healthy != was_healthy,
+            pressure=0.0 if status.healthy else 1.0
+        )
     
     async def _attempt_recovery(self) -> None:
         """Attempt automatic recovery."""
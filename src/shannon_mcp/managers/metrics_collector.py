@@ -0,0 +1,229 @@
+"""
+Process metrics collector for Shannon MCP Server.
+
+This module gathers per-process resource usage in bulk with:
+- One pass over all tracked PIDs in a worker thread
+- Batched /proc reads through psutil's oneshot()
+- Cached psutil handles so CPU percent is a real delta
+- Expensive probes (smaps, connections, open files) on a slower cadence
+"""
+
+import threading
+import time
+import psutil
+from datetime import datetime
+from typing import Optional, Dict, Any, Iterable, Set
+from dataclasses import dataclass
+
+from ..utils.logging import get_logger
+
+
+logger = get_logger("shannon-mcp.metrics-collector")
+
+MB = 1024 * 1024
+
+
+@dataclass
+class ProcessSample:
+    """Raw resource readings for one process from one collection pass."""
+    pid: int
+    timestamp: datetime
+    
+    # Cheap probes (one batched /proc read under oneshot)
+    cpu_percent: float = 0.0
+    memory_rss_mb: float = 0.0
+    memory_vms_mb: float = 0.0
+    memory_shared_mb: float = 0.0
+    num_fds: int = 0
+    num_threads: int = 0
+    read_bytes: Optional[int] = None
+    write_bytes: Optional[int] = None
+    ctx_switches_voluntary: Optional[int] = None
+    ctx_switches_involuntary: Optional[int] = None
+    
+    # Expensive probes; None when not collected in this pass
+    memory_uss_mb: Optional[float] = None
+    network_connections: Optional[int] = None
+    open_files: Optional[int] = None
+    
+    @property
+    def has_expensive(self) -> bool:
+        """Whether this sample includes the slow-cadence probes."""
+        return (
+            self.memory_uss_mb is not None
+            or self.network_connections is not None
+            or self.open_files is not None
+        )
+
+
+def sample_process(proc: psutil.Process, expensive: bool = True) -> ProcessSample:
+    """
+    Take a single sample of a process.
+    
+    Args:
+        proc: psutil process handle (reuse it across calls for CPU deltas)
+        expensive: Whether to include smaps, connections and open files
+    
+    Returns:
+        Process sample
+    
+    Raises:
+        psutil.NoSuchProcess: If the process has exited
+        psutil.AccessDenied: If the basic probes are not permitted
+    """
+    sample = ProcessSample(pid=proc.pid, timestamp=datetime.utcnow())
+    
+    with proc.oneshot():
+        sample.cpu_percent = proc.cpu_percent()
+        memory_info = proc.memory_info()
+        sample.memory_rss_mb = memory_info.rss / MB
+        sample.memory_vms_mb = memory_info.vms / MB
+        sample.memory_shared_mb = getattr(memory_info, 'shared', 0) / MB
+        sample.num_fds = proc.num_fds() if hasattr(proc, 'num_fds') else 0
+        sample.num_threads = proc.num_threads()
+        
+        try:
+            io_counters = proc.io_counters()
+            sample.read_bytes = io_counters.read_bytes
+            sample.write_bytes = io_counters.write_bytes
+        except (psutil.AccessDenied, AttributeError):
+            pass
+        
+        try:
+            ctx_switches = proc.num_ctx_switches()
+            sample.ctx_switches_voluntary = ctx_switches.voluntary
+            sample.ctx_switches_involuntary = ctx_switches.involuntary
+        except (psutil.AccessDenied, AttributeError):
+            pass
+    
+    if expensive:
+        try:
+            sample.memory_uss_mb = proc.memory_full_info().uss / MB
+        except (psutil.AccessDenied, AttributeError):
+            pass
+        
+        try:
+            sample.network_connections = len(proc.net_connections())
+        except (psutil.AccessDenied, AttributeError):
+            try:
+                sample.network_connections = len(proc.connections())
+            except (psutil.AccessDenied, AttributeError):
+                pass
+        
+        try:
+            sample.open_files = len(proc.open_files())
+        except (psutil.AccessDenied, AttributeError):
+            pass
+    
+    return sample
+
+
+class CollectedSamples(Dict[int, ProcessSample]):
+    """Samples keyed by PID, plus the PIDs a pass found to have exited."""
+    
+    def __init__(self):
+        super().__init__()
+        self.exited: Set[int] = set()
+
+
+class ProcessMetricsCollector:
+    """Collects metrics for many processes in a single worker-thread pass."""
+    
+    def __init__(self, expensive_interval: float = 300.0):
+        """
+        Initialize collector.
+        
+        Args:
+            expensive_interval: Minimum seconds between expensive probes of
+                the same process (0 probes every pass)
+        """
+        self.expensive_interval = expensive_interval
+        
+        # Cached handles keep the CPU-time baseline between passes
+        self._handles: Dict[int, psutil.Process] = {}
+        self._last_expensive: Dict[int, float] = {}
+        
+        # One pass at a time
+        self._lock = threading.Lock()
+        
+        # Statistics
+        self.passes = 0
+        self.last_pass_ms = 0.0
+        self.last_pass_size = 0
+        self.expensive_probes = 0
+    
+    def _get_handle(self, pid: int) -> psutil.Process:
+        """Return a cached handle, replacing it if the PID was reused."""
+        proc = self._handles.get(pid)
+        if proc is not None:
+            # is_running() compares creation times, catching PID reuse
+            if proc.is_running():
+                return proc
+            self._last_expensive.pop(pid, None)
+        
+        proc = psutil.Process(pid)
+        self._handles[pid] = proc
+        return proc
+    
+    def collect(self, pids: Iterable[int]) -> CollectedSamples:
+        """
+        Sample every PID in one pass.
+        
+        Blocking; call through asyncio.to_thread from async code. PIDs
+        that have exited or cannot be read are omitted from the result;
+        only the exited ones are listed in its exited set.
+        
+        Args:
+            pids: Process IDs to sample
+        
+        Returns:
+            Samples keyed by PID
+        """
+        with self._lock:
+            start = time.perf_counter()
+            now = time.monotonic()
+            wanted = set(pids)
+            samples = CollectedSamples()
+            
+            for pid in wanted:
+                try:
+                    proc = self._get_handle(pid)
+                    last = self._last_expensive.get(pid)
+                    expensive = last is None or now - last >= self.expensive_interval
+                    
+                    samples[pid] = sample_process(proc, expensive)
+                    
+                    if expensive:
+                        self._last_expensive[pid] = now
+                        self.expensive_probes += 1
+                except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                    samples.exited.add(pid)
+                    self._handles.pop(pid, None)
+                    self._last_expensive.pop(pid, None)
+                except psutil.AccessDenied as e:
+                    self._handles.pop(pid, None)
+                    self._last_expensive.pop(pid, None)
+                    logger.debug("process_sample_denied", pid=pid, error=str(e))
+                except Exception as e:
+                    logger.debug("process_sample_failed", pid=pid, error=str(e))
+            
+            # Forget processes no longer tracked
+            for pid in set(self._handles) - wanted:
+                del self._handles[pid]
+                self._last_expensive.pop(pid, None)
+            
+            self.passes += 1
+            self.last_pass_size = len(wanted)
+            self.last_pass_ms = (time.perf_counter() - start) * 1000
+            return samples
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get collector statistics."""
+        return {
+            "passes": self.passes,
+            "last_pass_ms": self.last_pass_ms,
+            "last_pass_size": self.last_pass_size,
+            "cached_handles": len(self._handles),
+            "expensive_probes": self.expensive_probes,
+            "expensive_interval": self.expensive_interval
+        }
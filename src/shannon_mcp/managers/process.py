@@ -15,6 +15,7 @@ import signal
 import psutil
 import json
 import uuid
+import time
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Set
 from dataclasses import dataclass, field
@@ -31,6 +32,15 @@ from ..utils.errors import (
 from ..utils.notifications import emit, EventCategory, EventPriority, event_handler
 from ..utils.shutdown import track_request_lifetime, register_shutdown_handler, ShutdownPhase
 from ..utils.logging import get_logger
+from ..utils.stats import RingBuffer
+from ..utils.table import IndexedTable
+from ..utils.process_watcher import ProcessExitWatcher, get_exit_watcher
+from ..utils.scheduler import Activity
+from ..utils.retention import (
+    DailyPartitionedTable, PartitionSummary,
+    enable_incremental_vacuum, incremental_vacuum
+)
+from .metrics_collector import ProcessMetricsCollector, ProcessSample, sample_process
 
 
 logger = get_logger("shannon-mcp.process")
@@ -278,37 +288,61 @@ class ResourceLimits:
     def should_alert_memory(self, memory_mb: float) -> bool:
         """Check if memory usage should trigger alert."""
         return memory_mb > (self.max_memory_mb * self.memory_alert_threshold)
+    
+    def alert_pressure(
+        self,
+        cpu_percent: float,
+        memory_mb: float,
+        fd_count: int = 0
+    ) -> float:
+        """Usage as a fraction of the nearest alert threshold (above 1.0 alerts)."""
+        return max(
+            cpu_percent / (self.max_cpu_percent * self.cpu_alert_threshold),
+            memory_mb / (self.max_memory_mb * self.memory_alert_threshold),
+            fd_count / (self.max_file_descriptors * self.fd_alert_threshold)
+        )
 
 
 @dataclass
 class ProcessResourceHistory:
     """Historical resource usage tracking."""
-    cpu_history: List[float] = field(default_factory=list)
-    memory_history: List[float] = field(default_factory=list)
-    timestamp_history: List[datetime] = field(default_factory=list)
     max_history_size: int = 100  # Keep last 100 measurements
+    cpu: RingBuffer = field(init=False, repr=False)
+    memory: RingBuffer = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        """Allocate fixed-capacity sample buffers."""
+        self.cpu = RingBuffer(self.max_history_size)
+        self.memory = RingBuffer(self.max_history_size)
+    
+    @property
+    def cpu_history(self) -> List[float]:
+        """CPU measurements, oldest first."""
+        return self.cpu.values()
+    
+    @property
+    def memory_history(self) -> List[float]:
+        """Memory measurements, oldest first."""
+        return self.memory.values()
+    
+    @property
+    def timestamp_history(self) -> List[datetime]:
+        """Measurement times, oldest first."""
+        return [datetime.utcfromtimestamp(ts) for ts in self.cpu.timestamps()]
     
     def add_measurement(self, cpu_percent: float, memory_mb: float) -> None:
         """Add a resource measurement."""
-        now = datetime.utcnow()
-        
-        self.cpu_history.append(cpu_percent)
-        self.memory_history.append(memory_mb)
-        self.timestamp_history.append(now)
-        
-        # Trim history if too large
-        if len(self.cpu_history) > self.max_history_size:
-            self.cpu_history.pop(0)
-            self.memory_history.pop(0)
-            self.timestamp_history.pop(0)
+        now = time.time()
+        self.cpu.append(cpu_percent, now)
+        self.memory.append(memory_mb, now)
     
     def get_cpu_trend(self) -> str:
         """Get CPU usage trend."""
-        if len(self.cpu_history) < 3:
+        if len(self.cpu) < 3:
             return "insufficient_data"
         
-        recent = sum(self.cpu_history[-3:]) / 3
-        older = sum(self.cpu_history[-6:-3]) / 3 if len(self.cpu_history) >= 6 else recent
+        recent = self.cpu.mean_last(3)
+        older = self.cpu.mean_last(3, skip=3) if len(self.cpu) >= 6 else recent
         
         if recent > older * 1.1:
             return "increasing"
@@ -319,14 +353,13 @@ class ProcessResourceHistory:
     
     def get_average_cpu(self, last_n: int = 10) -> float:
         """Get average CPU usage over last N measurements."""
-        if not self.cpu_history:
-            return 0.0
-        recent_measurements = self.cpu_history[-last_n:]
-        return sum(recent_measurements) / len(recent_measurements)
+        average = self.cpu.mean_last(last_n)
+        return average if average is not None else 0.0
     
     def get_peak_memory(self) -> float:
         """Get peak memory usage."""
-        return max(self.memory_history) if self.memory_history else 0.0
+        peak = self.memory.peak()
+        return peak[0] if peak else 0.0
 
 
 @dataclass
@@ -341,6 +374,7 @@ class ProcessMetrics:
     # Extended metrics
     memory_vms_mb: float = 0.0  # Virtual memory size
     memory_shared_mb: float = 0.0  # Shared memory
+    memory_uss_mb: float = 0.0  # Unique set size (slow-cadence probe)
     network_connections: int = 0
     disk_read_mb: float = 0.0
     disk_write_mb: float = 0.0
@@ -369,76 +403,64 @@ class ProcessMetrics:
     def update_from_psutil(self, proc: psutil.Process) -> None:
         """Update metrics from psutil process with comprehensive data collection."""
         try:
-            now = datetime.utcnow()
-            
-            # Basic metrics
-            self.cpu_percent = proc.cpu_percent()
-            memory_info = proc.memory_info()
-            self.memory_mb = memory_info.rss / 1024 / 1024
-            self.memory_vms_mb = memory_info.vms / 1024 / 1024
-            
-            # Memory details (platform-dependent)
-            try:
-                memory_full_info = proc.memory_full_info()
-                if hasattr(memory_full_info, 'shared'):
-                    self.memory_shared_mb = memory_full_info.shared / 1024 / 1024
-            except (AttributeError, psutil.AccessDenied):
-                pass
-            
-            # File descriptors and threads
-            self.file_descriptors = proc.num_fds() if hasattr(proc, 'num_fds') else 0
-            self.threads = proc.num_threads()
-            
-            # Network connections
-            try:
-                connections = proc.connections()
-                self.network_connections = len(connections)
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                pass
-            
-            # Disk I/O
-            try:
-                io_counters = proc.io_counters()
-                if io_counters:
-                    # Calculate I/O rate if we have previous measurement
-                    if self.last_disk_io_time:
-                        time_delta = (now - self.last_disk_io_time).total_seconds()
-                        if time_delta > 0:
-                            read_delta = (io_counters.read_bytes / 1024 / 1024) - self.disk_read_mb
-                            write_delta = (io_counters.write_bytes / 1024 / 1024) - self.disk_write_mb
-                            self.disk_io_mb_per_sec = (read_delta + write_delta) / time_delta
-                    
-                    self.disk_read_mb = io_counters.read_bytes / 1024 / 1024
-                    self.disk_write_mb = io_counters.write_bytes / 1024 / 1024
-                    self.last_disk_io_time = now
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                pass
-            
-            # Open files
-            try:
-                open_files = proc.open_files()
-                self.open_files = len(open_files)
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                pass
-            
-            # Context switches
-            try:
-                ctx_switches = proc.num_ctx_switches()
-                if ctx_switches:
-                    self.ctx_switches_voluntary = ctx_switches.voluntary
-                    self.ctx_switches_involuntary = ctx_switches.involuntary
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                pass
-            
-            # Update history
-            self.history.add_measurement(self.cpu_percent, self.memory_mb)
-            
-            # Update timestamp
-            self.last_updated = now
-            
+            self.apply_sample(sample_process(proc, expensive=True))
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             pass
     
+    def apply_sample(self, sample: ProcessSample) -> None:
+        """Update metrics from a collector sample.
+        
+        Expensive readings missing from the sample keep their previous
+        values until the next slow-cadence probe.
+        """
+        now = sample.timestamp
+        
+        # Basic metrics
+        self.cpu_percent = sample.cpu_percent
+        self.memory_mb = sample.memory_rss_mb
+        self.memory_vms_mb = sample.memory_vms_mb
+        self.memory_shared_mb = sample.memory_shared_mb
+        
+        # File descriptors and threads
+        self.file_descriptors = sample.num_fds
+        self.threads = sample.num_threads
+        
+        # Disk I/O
+        if sample.read_bytes is not None and sample.write_bytes is not None:
+            read_mb = sample.read_bytes / 1024 / 1024
+            write_mb = sample.write_bytes / 1024 / 1024
+            
+            # Calculate I/O rate if we have previous measurement
+            if self.last_disk_io_time:
+                time_delta = (now - self.last_disk_io_time).total_seconds()
+                if time_delta > 0:
+                    read_delta = read_mb - self.disk_read_mb
+                    write_delta = write_mb - self.disk_write_mb
+                    self.disk_io_mb_per_sec = (read_delta + write_delta) / time_delta
+            
+            self.disk_read_mb = read_mb
+            self.disk_write_mb = write_mb
+            self.last_disk_io_time = now
+        
+        # Context switches
+        if sample.ctx_switches_voluntary is not None:
+            self.ctx_switches_voluntary = sample.ctx_switches_voluntary
+            self.ctx_switches_involuntary = sample.ctx_switches_involuntary
+        
+        # Slow-cadence probes
+        if sample.memory_uss_mb is not None:
+            self.memory_uss_mb = sample.memory_uss_mb
+        if sample.network_connections is not None:
+            self.network_connections = sample.network_connections
+        if sample.open_files is not None:
+            self.open_files = sample.open_files
+        
+        # Update history
+        self.history.add_measurement(self.cpu_percent, self.memory_mb)
+        
+        # Update timestamp
+        self.last_updated = now
+    
     def check_resource_limits(self) -> List[str]:
         """Check if any resource limits are exceeded.
         
@@ -486,6 +508,12 @@ class ProcessMetrics:
         
         return alerts
     
+    def alert_pressure(self) -> float:
+        """Current usage as a fraction of the nearest alert threshold."""
+        return self.limits.alert_pressure(
+            self.cpu_percent, self.memory_mb, self.file_descriptors
+        )
+    
     def get_resource_summary(self) -> Dict[str, Any]:
         """Get comprehensive resource usage summary."""
         return {
@@ -499,6 +527,7 @@ class ProcessMetrics:
                 "rss_mb": self.memory_mb,
                 "vms_mb": self.memory_vms_mb,
                 "shared_mb": self.memory_shared_mb,
+                "uss_mb": self.memory_uss_mb,
                 "peak_mb": self.history.get_peak_memory(),
                 "limit_mb": self.limits.max_memory_mb
             },
@@ -528,6 +557,7 @@ class ProcessMetrics:
             "memory_mb": self.memory_mb,
             "memory_vms_mb": self.memory_vms_mb,
             "memory_shared_mb": self.memory_shared_mb,
+            "memory_uss_mb": self.memory_uss_mb,
             "file_descriptors": self.file_descriptors,
             "threads": self.threads,
             "network_connections": self.network_connections,
@@ -660,15 +690,111 @@ class ProcessManager(BaseManager[ProcessRecord]):
         )
         super().__init__(manager_config)
         
-        # In-memory process registry
-        self._processes: Dict[str, ProcessRecord] = {}
-        self._pid_to_process_id: Dict[int, str] = {}
+        # In-memory process registry, indexed for O(1) lookups
+        self._processes: IndexedTable[ProcessRecord] = IndexedTable(
+            key=lambda record: record.process_id,
+            indexes={
+                "pid": lambda record: record.pid,
+                "session_id": lambda record: record.session_id,
+                "status": lambda record: record.status,
+                "process_type": lambda record: record.process_type
+            },
+            unique=("pid",)
+        )
         self._registry_lock = asyncio.Lock()
         
         # Enhanced PID tracking
         self._pid_events: List[PIDEvent] = []  # In-memory PID event buffer
         self._pid_audit_lock = asyncio.Lock()
         
+        # Audit history is partitioned per day; expired days are rolled up
+        self._audit_trail = DailyPartitionedTable(
+            "pid_audit_trail",
+            columns="""
+                id TEXT PRIMARY KEY,
+                pid INTEGER NOT NULL,
+                event_type TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                process_id TEXT,
+                details TEXT
+            """,
+            indexes=("pid", "event_type", "process_id"),
+            summary=PartitionSummary(
+                table="pid_audit_summary",
+                columns="""
+                    day TEXT NOT NULL,
+                    event_type TEXT NOT NULL,
+                    events INTEGER NOT NULL,
+                    distinct_pids INTEGER NOT NULL,
+                    first_event TEXT,
+                    last_event TEXT
+                """,
+                rollup="""
+                    INSERT INTO pid_audit_summary
+                    (day, event_type, events, distinct_pids, first_event, last_event)
+                    SELECT ?, event_type, COUNT(*), COUNT(DISTINCT pid),
+                           MIN(timestamp), MAX(timestamp)
+                    FROM {partition}
+                    GROUP BY event_type
+                """
+            ),
+            time_column="timestamp"
+        )
+        self._validation_results = DailyPartitionedTable(
+            "validation_results",
+            columns="""
+                id TEXT PRIMARY KEY,
+                process_id TEXT NOT NULL,
+                pid INTEGER NOT NULL,
+                is_valid BOOLEAN NOT NULL,
+                validation_time TEXT NOT NULL,
+                integrity_valid BOOLEAN NOT NULL,
+                resource_valid BOOLEAN NOT NULL,
+                security_valid BOOLEAN NOT NULL,
+                lifecycle_valid BOOLEAN NOT NULL,
+                warnings TEXT,
+                errors TEXT,
+                metrics TEXT,
+                created_at TEXT NOT NULL,
+                FOREIGN KEY (process_id) REFERENCES process_registry(process_id)
+            """,
+            indexes=("process_id", "pid", "is_valid"),
+            summary=PartitionSummary(
+                table="validation_summary",
+                columns="""
+                    day TEXT NOT NULL,
+                    process_id TEXT NOT NULL,
+                    checks INTEGER NOT NULL,
+                    valid INTEGER NOT NULL,
+                    integrity_failures INTEGER NOT NULL,
+                    resource_failures INTEGER NOT NULL,
+                    security_failures INTEGER NOT NULL,
+                    lifecycle_failures INTEGER NOT NULL,
+                    first_check TEXT,
+                    last_check TEXT
+                """,
+                rollup="""
+                    INSERT INTO validation_summary
+                    (day, process_id, checks, valid, integrity_failures,
+                     resource_failures, security_failures, lifecycle_failures,
+                     first_check, last_check)
+                    SELECT ?, process_id, COUNT(*), SUM(is_valid),
+                           SUM(NOT integrity_valid), SUM(NOT resource_valid),
+                           SUM(NOT security_valid), SUM(NOT lifecycle_valid),
+                           MIN(validation_time), MAX(validation_time)
+                    FROM {partition}
+                    GROUP BY process_id
+                """
+            ),
+            time_column="validation_time"
+        )
+        
+        # Days of roll-up rows kept once raw partitions are dropped
+        self._summary_retention_days = 365
+        
+        # Longest single incremental-vacuum slice, in milliseconds
+        self._vacuum_slice_ms = 5.0
+        
         # PID file directory
         self._pid_dir = Path.home() / ".shannon-mcp" / "pids"
         self._pid_dir.mkdir(parents=True, exist_ok=True)
@@ -677,11 +803,19 @@ class ProcessManager(BaseManager[ProcessRecord]):
         self._last_cleanup = datetime.utcnow()
         self._cleanup_interval = 3600   # 1 hour between comprehensive cleanups
         
-        # Monitoring settings
+        # Monitoring settings (passes run on the adaptive scheduler)
         self._monitoring_interval = 30.0  # seconds
+        self._resource_validation_interval = 300.0
+        self._last_resource_validation = datetime.utcnow()
         self._heartbeat_timeout = 300.0   # 5 minutes
         self._cleanup_age = 3600.0        # 1 hour for stopped processes
         
+        # Bulk metrics collection (runs in a worker thread)
+        self._metrics_collector = ProcessMetricsCollector()
+        
+        # Exit events are pushed by the watcher (set up in _start)
+        self._exit_watcher: Optional[ProcessExitWatcher] = None
+        
         # Register shutdown handler
         register_shutdown_handler(
             "process_manager",
@@ -705,32 +839,56 @@ class ProcessManager(BaseManager[ProcessRecord]):
     
     async def _start(self) -> None:
         """Start process manager operations."""
+        # Watch loaded processes for exit
+        self._exit_watcher = get_exit_watcher()
+        for process_record in list(self._processes.values()):
+            self._watch_exit(process_record)
+        
         # Start process monitoring
-        self._tasks.append(
-            asyncio.create_task(self._monitor_processes())
+        self._schedule_job(
+            "monitor_processes",
+            self._monitor_processes,
+            interval=self._monitoring_interval
         )
         
         # Start resource monitoring
-        self._tasks.append(
-            asyncio.create_task(self._monitor_resources())
+        config = get_config()
+        self._resource_validation_interval = getattr(
+            config, 'resource_validation_interval', 300.0
+        )  # Default 5 minutes
+        self._metrics_collector.expensive_interval = getattr(
+            config, 'process_expensive_metrics_interval', 300.0
+        )  # smaps, connections and open files; default 5 minutes
+        monitoring_interval = getattr(config, 'process_monitoring_interval', 60.0)  # Default 60 seconds
+        
+        self._schedule_job(
+            "monitor_resources",
+            self._monitor_resources,
+            interval=monitoring_interval,
+            min_interval=min(monitoring_interval, 5.0)
+        )
+        
+        logger.info(
+            "resource_monitoring_started",
+            monitoring_interval=monitoring_interval,
+            validation_interval=self._resource_validation_interval,
+            expensive_metrics_interval=self._metrics_collector.expensive_interval
         )
     
     async def _stop(self) -> None:
         """Stop process manager operations."""
         # Gracefully terminate tracked processes
         await self._shutdown_processes()
+        
+        if self._exit_watcher:
+            for process_record in list(self._processes.values()):
+                self._exit_watcher.unwatch(process_record.pid, self._on_process_exit)
     
     async def _health_check(self) -> Dict[str, Any]:
         """Perform health check."""
         total_processes = len(self._processes)
-        running_processes = sum(
-            1 for p in self._processes.values() 
-            if p.status == ProcessStatus.RUNNING
-        )
-        orphaned_processes = sum(
-            1 for p in self._processes.values()
-            if p.status == ProcessStatus.ORPHANED
-        )
+        running_processes = self._processes.count("status", ProcessStatus.RUNNING)
+        orphaned_processes = self._processes.count("status", ProcessStatus.ORPHANED)
         
         # Check system resource usage
         system_cpu = psutil.cpu_percent()
@@ -743,13 +901,18 @@ class ProcessManager(BaseManager[ProcessRecord]):
             "system_cpu_percent": system_cpu,
             "system_memory_percent": system_memory,
             "pid_files": len(list(self._pid_dir.glob("*.pid"))),
-            "monitoring_active": not self._stop_event.is_set(),
+            "monitoring_active": bool(self._scheduled_jobs),
             "pid_tracking_enabled": True,
-            "pid_audit_events": await self._count_pid_events()
+            "pid_audit_events": await self._count_pid_events(),
+            "pid_audit_partitions": self._audit_trail.get_stats(),
+            "validation_partitions": self._validation_results.get_stats()
         }
     
     async def _create_schema(self) -> None:
         """Create database schema."""
+        # Must precede the first table; existing databases convert on the next full VACUUM
+        await enable_incremental_vacuum(self.db)
+        
         await self.db.execute("""
             CREATE TABLE IF NOT EXISTS process_registry (
                 process_id TEXT PRIMARY KEY,
@@ -770,18 +933,6 @@ class ProcessManager(BaseManager[ProcessRecord]):
             )
         """)
         
-        # Create PID audit trail table
-        await self.db.execute("""
-            CREATE TABLE IF NOT EXISTS pid_audit_trail (
-                id TEXT PRIMARY KEY,
-                pid INTEGER NOT NULL,
-                event_type TEXT NOT NULL,
-                timestamp TEXT NOT NULL,
-                process_id TEXT,
-                details TEXT
-            )
-        """)
-        
         # Create indexes for performance
         await self.db.execute("""
             CREATE INDEX IF NOT EXISTS idx_process_registry_pid 
@@ -808,67 +959,9 @@ class ProcessManager(BaseManager[ProcessRecord]):
             ON process_registry(last_heartbeat)
         """)
         
-        # Create indexes for PID audit trail
-        await self.db.execute("""
-            CREATE INDEX IF NOT EXISTS idx_pid_audit_pid 
-            ON pid_audit_trail(pid)
-        """)
-        
-        await self.db.execute("""
-            CREATE INDEX IF NOT EXISTS idx_pid_audit_timestamp 
-            ON pid_audit_trail(timestamp)
-        """)
-        
-        await self.db.execute("""
-            CREATE INDEX IF NOT EXISTS idx_pid_audit_event_type 
-            ON pid_audit_trail(event_type)
-        """)
-        
-        await self.db.execute("""
-            CREATE INDEX IF NOT EXISTS idx_pid_audit_process_id 
-            ON pid_audit_trail(process_id)
-        """)
-        
-        # Create validation results table
-        await self.db.execute("""
-            CREATE TABLE IF NOT EXISTS validation_results (
-                id TEXT PRIMARY KEY,
-                process_id TEXT NOT NULL,
-                pid INTEGER NOT NULL,
-                is_valid BOOLEAN NOT NULL,
-                validation_time TEXT NOT NULL,
-                integrity_valid BOOLEAN NOT NULL,
-                resource_valid BOOLEAN NOT NULL,
-                security_valid BOOLEAN NOT NULL,
-                lifecycle_valid BOOLEAN NOT NULL,
-                warnings TEXT,
-                errors TEXT,
-                metrics TEXT,
-                created_at TEXT NOT NULL,
-                FOREIGN KEY (process_id) REFERENCES process_registry(process_id)
-            )
-        """)
-        
-        # Create indexes for validation results
-        await self.db.execute("""
-            CREATE INDEX IF NOT EXISTS idx_validation_results_process_id 
-            ON validation_results(process_id)
-        """)
-        
-        await self.db.execute("""
-            CREATE INDEX IF NOT EXISTS idx_validation_results_pid 
-            ON validation_results(pid)
-        """)
-        
-        await self.db.execute("""
-            CREATE INDEX IF NOT EXISTS idx_validation_results_validation_time 
-            ON validation_results(validation_time)
-        """)
-        
-        await self.db.execute("""
-            CREATE INDEX IF NOT EXISTS idx_validation_results_is_valid 
-            ON validation_results(is_valid)
-        """)
+        # PID audit trail and validation results (per-day partitions)
+        await self._audit_trail.create(self.db)
+        await self._validation_results.create(self.db)
     
     @track_request_lifetime
     async def register_process(
@@ -906,10 +999,10 @@ class ProcessManager(BaseManager[ProcessRecord]):
                 raise ValidationError("pid", pid, "Process not found or not accessible")
             
             # Enhanced PID collision detection
-            if pid in self._pid_to_process_id:
-                existing_process_id = self._pid_to_process_id[pid]
-                existing_record = self._processes.get(existing_process_id)
-                if existing_record and existing_record.is_alive():
+            existing_record = self._processes.lookup("pid", pid)
+            if existing_record:
+                existing_process_id = existing_record.process_id
+                if existing_record.is_alive():
                     # Check for PID reuse by comparing metadata
                     if await self._detect_pid_reuse(pid):
                         # PID has been reused, resolve collision
@@ -944,11 +1037,11 @@ class ProcessManager(BaseManager[ProcessRecord]):
                 psutil_proc = process_record.get_psutil_process()
                 if psutil_proc:
                     process_record.metrics.update_from_psutil(psutil_proc)
-                    process_record.status = ProcessStatus.RUNNING
+                    self._set_status(process_record, ProcessStatus.RUNNING)
                 
                 # Store in memory
-                self._processes[process_record.process_id] = process_record
-                self._pid_to_process_id[pid] = process_record.process_id
+                self._processes.put(process_record)
+                self._watch_exit(process_record)
                 
                 # Log PID event
                 await self._log_pid_event(
@@ -1005,12 +1098,12 @@ class ProcessManager(BaseManager[ProcessRecord]):
             
             with error_context("process_manager", "unregister_process", process_id=process_id):
                 # Update status to stopped
-                process_record.status = ProcessStatus.STOPPED
+                self._set_status(process_record, ProcessStatus.STOPPED)
                 process_record.updated_at = datetime.utcnow()
                 
                 # Remove from memory
                 self._processes.pop(process_id, None)
-                self._pid_to_process_id.pop(process_record.pid, None)
+                self._unwatch_exit(process_record)
                 
                 # Update database
                 await self._save_process(process_record)
@@ -1040,10 +1133,7 @@ class ProcessManager(BaseManager[ProcessRecord]):
     
     async def get_process_by_pid(self, pid: int) -> Optional[ProcessRecord]:
         """Get process by PID."""
-        process_id = self._pid_to_process_id.get(pid)
-        if process_id:
-            return self._processes.get(process_id)
-        return None
+        return self._processes.lookup("pid", pid)
     
     async def list_processes(
         self,
@@ -1062,16 +1152,11 @@ class ProcessManager(BaseManager[ProcessRecord]):
         Returns:
             List of process records
         """
-        processes = list(self._processes.values())
-        
-        if process_type:
-            processes = [p for p in processes if p.process_type == process_type]
-        
-        if status:
-            processes = [p for p in processes if p.status == status]
-        
-        if session_id:
-            processes = [p for p in processes if p.session_id == session_id]
+        processes = self._processes.find(
+            process_type=process_type,
+            status=status,
+            session_id=session_id
+        )
         
         # Sort by creation time, newest first
         processes.sort(key=lambda p: p.created_at, reverse=True)
@@ -1129,12 +1214,12 @@ class ProcessManager(BaseManager[ProcessRecord]):
                 process_id=process_id,
                 pid=process_record.pid
             )
-            process_record.status = ProcessStatus.STOPPED
+            self._set_status(process_record, ProcessStatus.STOPPED)
             await self._save_process(process_record)
             return
         
         with error_context("process_manager", "terminate_process", process_id=process_id):
-            process_record.status = ProcessStatus.STOPPING
+            self._set_status(process_record, ProcessStatus.STOPPING)
             await self._save_process(process_record)
             
             try:
@@ -1168,7 +1253,7 @@ class ProcessManager(BaseManager[ProcessRecord]):
                         else:
                             os.killpg(os.getpgid(process_record.pid), signal.SIGKILL)
                 
-                process_record.status = ProcessStatus.STOPPED
+                self._set_status(process_record, ProcessStatus.STOPPED)
                 await self._save_process(process_record)
                 
                 # Emit event
@@ -1266,8 +1351,7 @@ class ProcessManager(BaseManager[ProcessRecord]):
                     process_record = ProcessRecord.from_dict(process_data)
                     
                     # Store in memory
-                    self._processes[process_record.process_id] = process_record
-                    self._pid_to_process_id[process_record.pid] = process_record.process_id
+                    self._processes.put(process_record)
                     
                 except Exception as e:
                     logger.error(
@@ -1292,7 +1376,7 @@ class ProcessManager(BaseManager[ProcessRecord]):
                     process_id=process_record.process_id,
                     pid=process_record.pid
                 )
-                process_record.status = ProcessStatus.ORPHANED
+                self._set_status(process_record, ProcessStatus.ORPHANED)
                 await self._save_process(process_record)
                 orphaned_count += 1
         
@@ -1392,219 +1476,228 @@ class ProcessManager(BaseManager[ProcessRecord]):
     
     # Monitoring methods
     
-    async def _monitor_processes(self) -> None:
-        """Monitor process health and status."""
-        while not self._stop_event.is_set():
+    def _set_status(self, process_record: ProcessRecord, status: ProcessStatus) -> None:
+        """Change a process status and move it in the status index."""
+        process_record.status = status
+        self._processes.reindex(process_record)
+    
+    def _watch_exit(self, process_record: ProcessRecord) -> None:
+        """Have the exit watcher report when a live process exits."""
+        if not self._exit_watcher:
+            return
+        if process_record.status not in (
+            ProcessStatus.STARTING, ProcessStatus.RUNNING, ProcessStatus.STOPPING
+        ):
+            return
+        
+        create_time = None
+        if process_record.pid_info and process_record.pid_info.creation_time:
+            create_time = process_record.pid_info.creation_time.timestamp()
+        
+        try:
+            self._exit_watcher.watch(
+                process_record.pid, self._on_process_exit, create_time=create_time
+            )
+        except Exception as e:
+            logger.warning(
+                "process_exit_watch_failed",
+                process_id=process_record.process_id,
+                pid=process_record.pid,
+                error=str(e)
+            )
+    
+    def _unwatch_exit(self, process_record: ProcessRecord) -> None:
+        """Stop watching a process that left the registry."""
+        if self._exit_watcher:
+            self._exit_watcher.unwatch(process_record.pid, self._on_process_exit)
+    
+    async def _on_process_exit(self, pid: int) -> None:
+        """Handle an exit reported by the watcher."""
+        process_record = self._processes.lookup("pid", pid)
+        if process_record:
+            await self._handle_process_exit(process_record)
+    
+    async def _handle_process_exit(self, process_record: ProcessRecord) -> None:
+        """Move an exited process to its final status."""
+        if process_record.status in (ProcessStatus.RUNNING, ProcessStatus.STARTING):
+            # Process died unexpectedly
+            self._set_status(process_record, ProcessStatus.ORPHANED)
+            process_record.updated_at = datetime.utcnow()
+            
+            logger.warning(
+                "process_orphaned",
+                process_id=process_record.process_id,
+                pid=process_record.pid
+            )
+            await self._save_process(process_record)
+            
+            # Emit orphaned process event
+            await emit(
+                "process_orphaned",
+                EventCategory.SYSTEM,
+                {
+                    "process_id": process_record.process_id,
+                    "pid": process_record.pid,
+                    "process_type": process_record.process_type.value
+                },
+                priority=EventPriority.HIGH
+            )
+        elif process_record.status == ProcessStatus.STOPPING:
+            # Process completed shutdown
+            self._set_status(process_record, ProcessStatus.STOPPED)
+            process_record.updated_at = datetime.utcnow()
+            
+            logger.info(
+                "process_completed_shutdown",
+                process_id=process_record.process_id,
+                pid=process_record.pid
+            )
+            await self._save_process(process_record)
+    
+    async def _monitor_processes(self) -> Activity:
+        """Check process heartbeats and remove old stopped processes."""
+        now = datetime.utcnow()
+        
+        # Exits are handled by _on_process_exit; only time-based checks here
+        stale_processes = []
+        stale_heartbeats = 0
+        
+        for process_id, process_record in list(self._processes.items()):
+            # Check for stale heartbeat
+            if (process_record.last_heartbeat and 
+                (now - process_record.last_heartbeat).total_seconds() > self._heartbeat_timeout):
+                stale_heartbeats += 1
+                logger.warning(
+                    "process_heartbeat_stale",
+                    process_id=process_id,
+                    pid=process_record.pid,
+                    last_heartbeat=process_record.last_heartbeat.isoformat()
+                )
+            
+            # Check for old stopped processes
+            if (process_record.status in (ProcessStatus.STOPPED, ProcessStatus.FAILED) and
+                (now - process_record.updated_at).total_seconds() > self._cleanup_age):
+                stale_processes.append(process_record)
+        
+        # Clean up stale processes
+        for process_record in stale_processes:
+            logger.debug(
+                "cleaning_stale_process",
+                process_id=process_record.process_id,
+                pid=process_record.pid
+            )
+            self._processes.pop(process_record.process_id, None)
+            self._unwatch_exit(process_record)
+            await self._remove_pid_file(process_record)
+        
+        # Run comprehensive cleanup periodically
+        if (now - self._last_cleanup).total_seconds() >= self._cleanup_interval:
+            logger.info("running_scheduled_cleanup")
             try:
-                await asyncio.sleep(self._monitoring_interval)
-                
-                if self._stop_event.is_set():
-                    break
-                
-                now = datetime.utcnow()
-                
-                # Check for dead processes
-                dead_processes = []
-                orphaned_processes = []
-                stale_processes = []
-                
-                for process_id, process_record in list(self._processes.items()):
-                    # Check if process is still alive
-                    if not process_record.is_alive():
-                        if process_record.status in (ProcessStatus.RUNNING, ProcessStatus.STARTING):
-                            # Process died unexpectedly
-                            process_record.status = ProcessStatus.ORPHANED
-                            orphaned_processes.append(process_record)
-                        elif process_record.status == ProcessStatus.STOPPING:
-                            # Process completed shutdown
-                            process_record.status = ProcessStatus.STOPPED
-                            dead_processes.append(process_record)
-                    
-                    # Check for stale heartbeat
-                    if (process_record.last_heartbeat and 
-                        (now - process_record.last_heartbeat).total_seconds() > self._heartbeat_timeout):
-                        logger.warning(
-                            "process_heartbeat_stale",
-                            process_id=process_id,
-                            pid=process_record.pid,
-                            last_heartbeat=process_record.last_heartbeat.isoformat()
-                        )
-                    
-                    # Check for old stopped processes
-                    if (process_record.status in (ProcessStatus.STOPPED, ProcessStatus.FAILED) and
-                        (now - process_record.updated_at).total_seconds() > self._cleanup_age):
-                        stale_processes.append(process_record)
+                cleanup_stats = await self.run_comprehensive_cleanup()
+                self._last_cleanup = now
                 
-                # Handle dead processes
-                for process_record in dead_processes:
+                # Log cleanup summary
+                if any(cleanup_stats.values()):
                     logger.info(
-                        "process_completed_shutdown",
-                        process_id=process_record.process_id,
-                        pid=process_record.pid
-                    )
-                    await self._save_process(process_record)
-                
-                # Handle orphaned processes
-                for process_record in orphaned_processes:
-                    logger.warning(
-                        "process_orphaned",
-                        process_id=process_record.process_id,
-                        pid=process_record.pid
-                    )
-                    await self._save_process(process_record)
-                    
-                    # Emit orphaned process event
-                    await emit(
-                        "process_orphaned",
-                        EventCategory.SYSTEM,
-                        {
-                            "process_id": process_record.process_id,
-                            "pid": process_record.pid,
-                            "process_type": process_record.process_type.value
-                        },
-                        priority=EventPriority.HIGH
+                        "scheduled_cleanup_completed",
+                        **cleanup_stats
                     )
-                
-                # Clean up stale processes
-                for process_record in stale_processes:
-                    logger.debug(
-                        "cleaning_stale_process",
-                        process_id=process_record.process_id,
-                        pid=process_record.pid
-                    )
-                    self._processes.pop(process_record.process_id, None)
-                    self._pid_to_process_id.pop(process_record.pid, None)
-                    await self._remove_pid_file(process_record)
-                
-                # Run comprehensive cleanup periodically
-                if (now - self._last_cleanup).total_seconds() >= self._cleanup_interval:
-                    logger.info("running_scheduled_cleanup")
-                    try:
-                        cleanup_stats = await self.run_comprehensive_cleanup()
-                        self._last_cleanup = now
-                        
-                        # Log cleanup summary
-                        if any(cleanup_stats.values()):
-                            logger.info(
-                                "scheduled_cleanup_completed",
-                                **cleanup_stats
-                            )
-                    except Exception as cleanup_error:
-                        logger.error(
-                            "scheduled_cleanup_failed",
-                            error=str(cleanup_error)
-                        )
-                
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
+            except Exception as cleanup_error:
                 logger.error(
-                    "process_monitoring_error",
-                    error=str(e),
-                    exc_info=True
+                    "scheduled_cleanup_failed",
+                    error=str(cleanup_error)
                 )
+        
+        return Activity(changed=bool(stale_processes or stale_heartbeats))
     
-    async def _monitor_resources(self) -> None:
-        """Monitor resource usage of tracked processes with comprehensive validation."""
-        # Configurable monitoring intervals
-        config = get_config()
-        monitoring_interval = getattr(config, 'process_monitoring_interval', 60.0)  # Default 60 seconds
-        resource_validation_interval = getattr(config, 'resource_validation_interval', 300.0)  # Default 5 minutes
+    async def _monitor_resources(self) -> Activity:
+        """
+        Collect resource usage of tracked processes with periodic validation.
         
-        last_validation_time = datetime.utcnow()
+        Runs on the shared scheduler, which backs off while usage is steady
+        and samples faster as any process nears its alert thresholds.
+        """
+        now = datetime.utcnow()
         
-        logger.info(
-            "resource_monitoring_started",
-            monitoring_interval=monitoring_interval,
-            validation_interval=resource_validation_interval
-        )
+        # Comprehensive resource monitoring
+        activity = await self._collect_comprehensive_metrics()
         
-        while not self._stop_event.is_set():
-            try:
-                await asyncio.sleep(monitoring_interval)
-                
-                if self._stop_event.is_set():
-                    break
-                
-                now = datetime.utcnow()
-                
-                # Comprehensive resource monitoring
-                await self._collect_comprehensive_metrics()
-                
-                # Periodic resource validation and enforcement
-                if (now - last_validation_time).total_seconds() >= resource_validation_interval:
-                    await self._validate_and_enforce_resource_limits()
-                    last_validation_time = now
-                
-                # Log aggregate system statistics
-                await self._log_system_resource_summary()
-                
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(
-                    "resource_monitoring_error",
-                    error=str(e),
-                    exc_info=True
-                )
+        # Periodic resource validation and enforcement
+        if (now - self._last_resource_validation).total_seconds() >= self._resource_validation_interval:
+            await self._validate_and_enforce_resource_limits()
+            self._last_resource_validation = now
+        
+        # Log aggregate system statistics
+        await self._log_system_resource_summary()
+        
+        return activity
     
-    async def _collect_comprehensive_metrics(self) -> None:
-        """Collect comprehensive resource metrics for all tracked processes."""
+    async def _collect_comprehensive_metrics(self) -> Activity:
+        """
+        Collect comprehensive resource metrics for all tracked processes.
+        
+        Returns:
+            Whether any process changed state or alerted, and the highest
+            usage relative to an alert threshold
+        """
         collection_start = datetime.utcnow()
         successful_collections = 0
         failed_collections = 0
-        
-        # Process processes in batches for performance
-        batch_size = 50  # Process up to 50 processes at once
-        process_items = list(self._processes.items())
-        
-        for i in range(0, len(process_items), batch_size):
-            batch = process_items[i:i + batch_size]
+        orphaned = 0
+        alerting = 0
+        pressure = 0.0
+        
+        running = [
+            (process_record.process_id, process_record)
+            for process_record in self._processes.find(status=ProcessStatus.RUNNING)
+        ]
+        
+        # Sample every PID in one pass off the event loop
+        samples = await asyncio.to_thread(
+            self._metrics_collector.collect,
+            [process_record.pid for _, process_record in running]
+        )
             
-            # Collect metrics for batch
-            for process_id, process_record in batch:
-                try:
-                    if process_record.status == ProcessStatus.RUNNING:
-                        psutil_proc = process_record.get_psutil_process()
-                        if psutil_proc:
-                            # Update comprehensive metrics
-                            process_record.metrics.update_from_psutil(psutil_proc)
-                            successful_collections += 1
+        # Apply all results in one batch before any awaits
+        updated = []
+        for process_id, process_record in running:
+            sample = samples.get(process_record.pid)
+            if sample is None:
+                failed_collections += 1
+                if process_record.pid in samples.exited:
+                    # Process is gone, mark as orphaned
+                    self._set_status(process_record, ProcessStatus.ORPHANED)
+                    orphaned += 1
+                # Otherwise unreadable this pass; keep the last metrics
+                continue
                             
-                            # Check for immediate alerts (critical violations)
-                            violations = process_record.metrics.check_resource_limits()
-                            if violations:
-                                await self._handle_resource_violations(process_id, process_record, violations)
+            process_record.metrics.apply_sample(sample)
+            updated.append((process_id, process_record))
+            successful_collections += 1
+            pressure = max(pressure, process_record.metrics.alert_pressure())
                             
-                            # Check for alert thresholds
-                            alerts = process_record.metrics.should_trigger_alerts()
-                            if alerts:
-                                await self._handle_resource_alerts(process_id, process_record, alerts)
-                        else:
-                            # Process no longer accessible, mark as orphaned
-                            process_record.status = ProcessStatus.ORPHANED
-                            failed_collections += 1
+        for process_id, process_record in updated:
+            try:
+                # Check for immediate alerts (critical violations)
+                violations = process_record.metrics.check_resource_limits()
+                if violations:
+                    alerting += 1
+                    await self._handle_resource_violations(process_id, process_record, violations)
                     
-                except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
-                    failed_collections += 1
-                    logger.debug(
-                        "process_metrics_collection_failed",
-                        process_id=process_id,
-                        pid=process_record.pid,
-                        error=str(e)
-                    )
-                except Exception as e:
-                    failed_collections += 1
-                    logger.error(
-                        "process_metrics_collection_error",
-                        process_id=process_id,
-                        pid=process_record.pid,
-                        error=str(e)
-                    )
+                # Check for alert thresholds
+                alerts = process_record.metrics.should_trigger_alerts()
+                if alerts:
+                    alerting += 1
+                    await self._handle_resource_alerts(process_id, process_record, alerts)
             
-            # Yield control between batches to prevent blocking
-            if not self._stop_event.is_set():
-                await asyncio.sleep(0.1)
+            except Exception as e:
+                logger.error(
+                    "process_metrics_collection_error",
+                    process_id=process_id,
+                    pid=process_record.pid,
+                    error=str(e)
+                )
         
         collection_duration = (datetime.utcnow() - collection_start).total_seconds()
         
@@ -1613,8 +1706,11 @@ class ProcessManager(BaseManager[ProcessRecord]):
             successful_collections=successful_collections,
             failed_collections=failed_collections,
             total_processes=len(self._processes),
-            collection_duration_seconds=collection_duration
+            collection_duration_seconds=collection_duration,
+            sample_pass_ms=self._metrics_collector.last_pass_ms
         )
+        
+        return Activity(changed=bool(orphaned or alerting), pressure=pressure)
     
     async def _handle_resource_violations(
         self,
@@ -1763,7 +1859,7 @@ class ProcessManager(BaseManager[ProcessRecord]):
         validation_start = datetime.utcnow()
         
         # Collect system-wide resource statistics
-        total_processes = len([p for p in self._processes.values() if p.status == ProcessStatus.RUNNING])
+        total_processes = self._processes.count("status", ProcessStatus.RUNNING)
         system_metrics = await self._collect_system_wide_metrics()
         
         # Check system-wide resource usage
@@ -1771,15 +1867,16 @@ class ProcessManager(BaseManager[ProcessRecord]):
         
         # Run comprehensive validation for processes that haven't been validated recently
         validation_tasks = []
-        for process_id, process_record in self._processes.items():
-            if process_record.status == ProcessStatus.RUNNING:
-                # Check if process needs validation
-                last_validation = await self._get_last_validation_time(process_id, "resource_comprehensive")
-                
-                if not last_validation or (validation_start - last_validation).total_seconds() > 1800:  # 30 minutes
-                    validation_tasks.append(
-                        self._comprehensive_process_resource_validation(process_id, process_record)
-                    )
+        for process_record in self._processes.find(status=ProcessStatus.RUNNING):
+            process_id = process_record.process_id
+                
+            # Check if process needs validation
+            last_validation = await self._get_last_validation_time(process_id, "resource_comprehensive")
+            
+            if not last_validation or (validation_start - last_validation).total_seconds() > 1800:  # 30 minutes
+                validation_tasks.append(
+                    self._comprehensive_process_resource_validation(process_id, process_record)
+                )
         
         if validation_tasks:
             # Run validations in parallel, but limit concurrency
@@ -1823,7 +1920,7 @@ class ProcessManager(BaseManager[ProcessRecord]):
             network_io = psutil.net_io_counters()
             
             # Process counts
-            running_processes = len([p for p in self._processes.values() if p.status == ProcessStatus.RUNNING])
+            running_processes = self._processes.count("status", ProcessStatus.RUNNING)
             total_processes = len(self._processes)
             
             return {
@@ -1994,7 +2091,7 @@ class ProcessManager(BaseManager[ProcessRecord]):
         """Log comprehensive system resource usage summary."""
         try:
             # Collect process-level statistics
-            running_processes = [p for p in self._processes.values() if p.status == ProcessStatus.RUNNING]
+            running_processes = self._processes.find(status=ProcessStatus.RUNNING)
             
             if not running_processes:
                 return
@@ -2240,18 +2337,14 @@ class ProcessManager(BaseManager[ProcessRecord]):
             details=details or {}
         )
         
-        await self.db.execute("""
-            INSERT INTO pid_audit_trail 
-            (id, pid, event_type, timestamp, process_id, details)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            event.id,
-            event.pid,
-            event.event_type,
-            event.timestamp.isoformat(),
-            event.process_id,
-            json.dumps(event.details)
-        ))
+        await self._audit_trail.insert({
+            "id": event.id,
+            "pid": event.pid,
+            "event_type": event.event_type,
+            "timestamp": event.timestamp.isoformat(),
+            "process_id": event.process_id,
+            "details": json.dumps(event.details)
+        }, event.timestamp)
         await self.db.commit()
         
         logger.info(
@@ -2329,9 +2422,7 @@ class ProcessManager(BaseManager[ProcessRecord]):
     
     async def _count_pid_events(self) -> int:
         """Count total PID audit events."""
-        cursor = await self.db.execute("SELECT COUNT(*) FROM pid_audit_trail")
-        row = await cursor.fetchone()
-        return row[0] if row else 0
+        return await self._audit_trail.count()
     
     # Process Validation Methods
     
@@ -2402,7 +2493,7 @@ class ProcessManager(BaseManager[ProcessRecord]):
             except psutil.NoSuchProcess:
                 result.add_error("integrity", f"Process {process_record.pid} no longer exists")
                 # Mark as orphaned
-                process_record.status = ProcessStatus.ORPHANED
+                self._set_status(process_record, ProcessStatus.ORPHANED)
                 await self._log_pid_event(process_record.pid, "orphaned", process_id)
                 
         except Exception as e:
@@ -2674,7 +2765,7 @@ class ProcessManager(BaseManager[ProcessRecord]):
             except psutil.NoSuchProcess:
                 result.add_error("lifecycle", f"Process {process_record.pid} no longer exists")
                 # Update status to orphaned
-                process_record.status = ProcessStatus.ORPHANED
+                self._set_status(process_record, ProcessStatus.ORPHANED)
                 await self._log_pid_event(process_record.pid, "orphaned", process_id)
                 
         except Exception as e:
@@ -2755,25 +2846,21 @@ class ProcessManager(BaseManager[ProcessRecord]):
     async def _save_validation_result(self, result: ProcessValidationResult) -> None:
         """Save validation result to database."""
         try:
-            await self.db.execute("""
-                INSERT INTO validation_results 
-                (process_id, pid, is_valid, validation_time, integrity_valid, 
-                 resource_valid, security_valid, lifecycle_valid, 
-                 warnings, errors, metrics)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                result.process_id,
-                result.pid,
-                result.is_valid,
-                result.validation_time.isoformat(),
-                result.integrity_valid,
-                result.resource_valid,
-                result.security_valid,
-                result.lifecycle_valid,
-                json.dumps(result.warnings),
-                json.dumps(result.errors),
-                json.dumps(result.metrics)
-            ))
+            await self._validation_results.insert({
+                "id": f"validation_{uuid.uuid4().hex[:12]}",
+                "process_id": result.process_id,
+                "pid": result.pid,
+                "is_valid": result.is_valid,
+                "validation_time": result.validation_time.isoformat(),
+                "integrity_valid": result.integrity_valid,
+                "resource_valid": result.resource_valid,
+                "security_valid": result.security_valid,
+                "lifecycle_valid": result.lifecycle_valid,
+                "warnings": json.dumps(result.warnings),
+                "errors": json.dumps(result.errors),
+                "metrics": json.dumps(result.metrics),
+                "created_at": datetime.utcnow().isoformat()
+            }, result.validation_time)
             await self.db.commit()
         except Exception as e:
             logger.error("failed_to_save_validation_result", error=str(e))
@@ -2911,6 +2998,9 @@ class ProcessManager(BaseManager[ProcessRecord]):
         """
         Clean up old validation results based on retention policy.
         
+        Whole days past retention are rolled up into validation_summary and
+        their partitions dropped; no row-by-row DELETE is needed.
+        
         Args:
             retention_days: Number of days to retain validation results
             
@@ -2918,24 +3008,12 @@ class ProcessManager(BaseManager[ProcessRecord]):
             Number of validation results cleaned up
         """
         try:
-            cutoff_time = (datetime.utcnow() - timedelta(days=retention_days)).isoformat()
-            
-            # Count old validation results
-            cursor = await self.db.execute("""
-                SELECT COUNT(*) FROM validation_results WHERE validation_time < ?
-            """, (cutoff_time,))
-            
-            count_result = await cursor.fetchone()
-            old_count = count_result[0] if count_result else 0
+            old_count = await self._validation_results.compact(
+                retention_days,
+                summary_retention_days=self._summary_retention_days
+            )
             
             if old_count > 0:
-                # Delete old validation results
-                await self.db.execute("""
-                    DELETE FROM validation_results WHERE validation_time < ?
-                """, (cutoff_time,))
-                
-                await self.db.commit()
-                
                 logger.info(
                     "cleanup_old_validation_results_completed",
                     cleaned_up=old_count,
@@ -2952,6 +3030,9 @@ class ProcessManager(BaseManager[ProcessRecord]):
         """
         Clean up old audit trail entries.
         
+        Whole days past retention are rolled up into pid_audit_summary and
+        their partitions dropped; no row-by-row DELETE is needed.
+        
         Args:
             retention_days: Number of days to retain audit trail
             
@@ -2959,24 +3040,12 @@ class ProcessManager(BaseManager[ProcessRecord]):
             Number of audit trail entries cleaned up
         """
         try:
-            cutoff_time = (datetime.utcnow() - timedelta(days=retention_days)).isoformat()
-            
-            # Count old audit entries
-            cursor = await self.db.execute("""
-                SELECT COUNT(*) FROM pid_audit_trail WHERE timestamp < ?
-            """, (cutoff_time,))
-            
-            count_result = await cursor.fetchone()
-            old_count = count_result[0] if count_result else 0
+            old_count = await self._audit_trail.compact(
+                retention_days,
+                summary_retention_days=self._summary_retention_days
+            )
             
             if old_count > 0:
-                # Delete old audit entries
-                await self.db.execute("""
-                    DELETE FROM pid_audit_trail WHERE timestamp < ?
-                """, (cutoff_time,))
-                
-                await self.db.commit()
-                
                 logger.info(
                     "cleanup_old_audit_trail_completed",
                     cleaned_up=old_count,
@@ -2993,6 +3062,10 @@ class ProcessManager(BaseManager[ProcessRecord]):
         """
         Perform database maintenance operations.
         
+        Free pages are released with incremental vacuum slices of a few
+        milliseconds each. A database created before incremental
+        auto-vacuum was enabled gets one full VACUUM to convert it.
+        
         Returns:
             True if maintenance completed successfully
         """
@@ -3004,11 +3077,20 @@ class ProcessManager(BaseManager[ProcessRecord]):
             cursor = await self.db.execute("PRAGMA freelist_count")
             freelist_count_before = (await cursor.fetchone())[0]
             
-            # Vacuum database to reclaim space
-            await self.db.execute("VACUUM")
+            vacuum_stats: Dict[str, Any] = {}
+            if await enable_incremental_vacuum(self.db):
+                vacuum_stats = await incremental_vacuum(
+                    self.db,
+                    slice_ms=self._vacuum_slice_ms
+                )
+            else:
+                # One-time conversion; applies the pending auto_vacuum mode
+                await self.db.execute("VACUUM")
+                vacuum_stats = {"converted": True}
             
-            # Analyze tables to update statistics
-            await self.db.execute("ANALYZE")
+            # Refresh planner statistics only where they are stale
+            await self.db.execute("PRAGMA analysis_limit = 400")
+            await self.db.execute("PRAGMA optimize")
             
             # Get statistics after maintenance
             cursor = await self.db.execute("PRAGMA page_count")
@@ -3025,7 +3107,8 @@ class ProcessManager(BaseManager[ProcessRecord]):
                 pages_reclaimed=pages_reclaimed,
                 freelist_reduced=freelist_reduced,
                 page_count_before=page_count_before,
-                page_count_after=page_count_after
+                page_count_after=page_count_after,
+                **vacuum_stats
             )
             
             return True
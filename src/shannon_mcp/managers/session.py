@@ -34,6 +34,7 @@ from ..utils.errors import (
 from ..utils.notifications import emit, EventCategory, EventPriority, event_handler
 from ..utils.shutdown import track_request_lifetime, register_shutdown_handler, ShutdownPhase
 from ..utils.logging import get_logger
+from ..utils.scheduler import Activity
 from .cache import SessionCache
 
 
@@ -218,8 +219,12 @@ class SessionManager(BaseManager[Session]):
     async def _start(self) -> None:
         """Start session manager operations."""
         # Start session monitoring
-        self._tasks.append(
-            asyncio.create_task(self._monitor_sessions())
+        self._schedule_job(
+            "monitor_sessions",
+            self._monitor_sessions,
+            interval=10,
+            min_interval=1,
+            max_interval=60
         )
     
     async def _stop(self) -> None:
@@ -721,48 +726,50 @@ class SessionManager(BaseManager[Session]):
         # This could be implemented to restore running sessions
         pass
     
-    async def _monitor_sessions(self) -> None:
-        """Monitor sessions for timeouts and cleanup."""
-        while True:
-            try:
-                await asyncio.sleep(10)  # Check every 10 seconds
-                
-                now = datetime.utcnow()
-                sessions_to_clean = []
-                
-                for session_id, session in self._sessions.items():
-                    # Check for timeout
-                    if session.state == SessionState.RUNNING:
-                        duration = now - session.metrics.start_time
-                        if duration.total_seconds() > self.session_config.session_timeout:
-                            logger.warning(
-                                "session_timeout",
-                                session_id=session_id,
-                                duration_seconds=duration.total_seconds()
-                            )
-                            session.state = SessionState.TIMEOUT
-                            sessions_to_clean.append(session_id)
-                    
-                    # Clean up completed/failed sessions after a delay
-                    elif session.state in (
-                        SessionState.COMPLETED,
-                        SessionState.FAILED,
-                        SessionState.CANCELLED,
-                        SessionState.TIMEOUT
-                    ):
-                        if session.metrics.end_time:
-                            age = now - session.metrics.end_time
-                            if age.total_seconds() > 300:  # 5 minutes
-                                sessions_to_clean.append(session_id)
-                
-                # Clean up sessions
-                for session_id in sessions_to_clean:
-                    await self._cleanup_session(session_id)
-                    
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error("session_monitor_error", error=str(e))
+    async def _monitor_sessions(self) -> Activity:
+        """
+        Check sessions for timeouts and cleanup.
+        
+        Runs on the shared scheduler; checks tighten as running sessions
+        approach their timeout and back off while nothing is happening.
+        """
+        now = datetime.utcnow()
+        timeout = self.session_config.session_timeout
+        sessions_to_clean = []
+        pressure = 0.0
+        
+        for session_id, session in self._sessions.items():
+            # Check for timeout
+            if session.state == SessionState.RUNNING:
+                duration = now - session.metrics.start_time
+                if duration.total_seconds() > timeout:
+                    logger.warning(
+                        "session_timeout",
+                        session_id=session_id,
+                        duration_seconds=duration.total_seconds()
+                    )
+                    session.state = SessionState.TIMEOUT
+                    sessions_to_clean.append(session_id)
+                elif timeout:
+                    pressure = max(pressure, duration.total_seconds() / timeout)
+            
+            # Clean up completed/failed sessions after a delay
+            elif session.state in (
+                SessionState.COMPLETED,
+                SessionState.FAILED,
+                SessionState.CANCELLED,
+                SessionState.TIMEOUT
+            ):
+                if session.metrics.end_time:
+                    age = now - session.metrics.end_time
+                    if age.total_seconds() > 300:  # 5 minutes
+                        sessions_to_clean.append(session_id)
+        
+        # Clean up sessions
+        for session_id in sessions_to_clean:
+            await self._cleanup_session(session_id)
+        
+        return Activity(changed=bool(sessions_to_clean), pressure=pressure)
     
     async def _cleanup_session(self, session_id: str) -> None:
         """Clean up a session."""
@@ -8,17 +8,20 @@ This module provides system-wide process tracking and management:
 - Automatic cleanup of stale processes
 """
 
-from .storage import RegistryStorage, ProcessEntry, ProcessStatus
+from .storage import RegistryStorage, ProcessEntry, ProcessStatus, ProcessUpdate
 from .tracker import ProcessTracker, ProcessInfo
 from .validator import ProcessValidator, ValidationResult
 from .cleaner import RegistryCleaner, CleanupStats
 from .monitor import ResourceMonitor, ResourceStats, ResourceAlert
+from .sampler import SystemSampler, SystemSnapshot
+from .scanner import ClaudeProcessScanner, is_claude_command
 
 __all__ = [
     # Storage
     'RegistryStorage',
     'ProcessEntry',
     'ProcessStatus',
+    'ProcessUpdate',
     
     # Tracker
     'ProcessTracker',
@@ -35,5 +38,13 @@ __all__ = [
     # Monitor
     'ResourceMonitor',
     'ResourceStats',
-    'ResourceAlert'
+    'ResourceAlert',
+    
+    # Sampler
+    'SystemSampler',
+    'SystemSnapshot',
+    
+    # Scanner
+    'ClaudeProcessScanner',
+    'is_claude_command'
 ]
\ No newline at end of file
@@ -13,6 +13,7 @@ from enum import Enum
 
 from ..utils.logging import get_logger
 from ..utils.errors import ShannonError
+from ..utils.process_watcher import ProcessExitWatcher, get_exit_watcher
 from .storage import RegistryStorage, ProcessEntry, ProcessStatus
 from .validator import ProcessValidator, ValidationStatus
 
@@ -83,7 +84,8 @@ class RegistryCleaner:
     def __init__(
         self,
         storage: RegistryStorage,
-        validator: ProcessValidator
+        validator: ProcessValidator,
+        exit_watcher: Optional[ProcessExitWatcher] = None
     ):
         """
         Initialize cleaner.
@@ -91,6 +93,7 @@ class RegistryCleaner:
         Args:
             storage: Registry storage instance
             validator: Process validator instance
+            exit_watcher: Exit watcher (defaults to the shared one)
         """
         self.storage = storage
         self.validator = validator
@@ -105,6 +108,10 @@ class RegistryCleaner:
         self._cleanup_task: Optional[asyncio.Task] = None
         self._stop_event = asyncio.Event()
         
+        # Exited processes are removed when the watcher reports them
+        self._exit_watcher = exit_watcher
+        self.exits_cleaned = 0
+        
     async def start_periodic_cleanup(
         self,
         interval_hours: int = 1
@@ -120,6 +127,10 @@ class RegistryCleaner:
             return
         
         self._stop_event.clear()
+        if self._exit_watcher is None:
+            self._exit_watcher = get_exit_watcher()
+        self._exit_watcher.add_listener(self._on_process_exit)
+        
         self._cleanup_task = asyncio.create_task(
             self._cleanup_loop(interval_hours * 3600)
         )
@@ -131,6 +142,8 @@ class RegistryCleaner:
             return
         
         self._stop_event.set()
+        if self._exit_watcher:
+            self._exit_watcher.remove_listener(self._on_process_exit)
         
         try:
             await asyncio.wait_for(self._cleanup_task, timeout=5.0)
@@ -189,6 +202,16 @@ class RegistryCleaner:
         
         return stats
     
+    async def _on_process_exit(self, pid: int) -> None:
+        """Remove an exited process without waiting for the next pass."""
+        entry = await self.storage.get_process(pid, self.validator.hostname)
+        if entry is None:
+            return
+        
+        await self.storage.remove_process(pid, entry.host)
+        self.exits_cleaned += 1
+        logger.debug(f"Removed exited process {pid}")
+    
     async def _cleanup_processes(self, stats: CleanupStats) -> None:
         """Clean up invalid processes."""
         # Validate all processes
@@ -10,16 +10,20 @@ from datetime import datetime, timezone, timedelta
 from typing import Optional, List, Dict, Any, Callable
 from dataclasses import dataclass, field
 from enum import Enum
-from collections import deque
-import statistics
 
 from ..utils.logging import get_logger
+from ..utils.stats import RingBuffer
+from ..utils.scheduler import Activity, AdaptiveScheduler, get_scheduler
 from ..utils.errors import ShannonError
-from .storage import RegistryStorage, ProcessEntry, ProcessStatus
+from .storage import RegistryStorage, ProcessEntry, ProcessStatus, ProcessUpdate
 from .tracker import ProcessTracker
+from .sampler import SystemSampler
 
 logger = get_logger(__name__)
 
+# Windows reported as avg_1min / avg_5min / avg_15min
+HISTORY_WINDOWS = (60, 300, 900)
+
 
 class ResourceType(str, Enum):
     """Types of resources to monitor."""
@@ -120,7 +124,8 @@ class ResourceMonitor:
     def __init__(
         self,
         storage: RegistryStorage,
-        tracker: ProcessTracker
+        tracker: ProcessTracker,
+        system_sample_interval: float = 1.0
     ):
         """
         Initialize resource monitor.
@@ -128,6 +133,7 @@ class ResourceMonitor:
         Args:
             storage: Registry storage instance
             tracker: Process tracker instance
+            system_sample_interval: Seconds between background system samples
         """
         self.storage = storage
         self.tracker = tracker
@@ -136,6 +142,9 @@ class ResourceMonitor:
         self.sample_interval_seconds = 5
         self.history_size = 180  # 15 minutes at 5s intervals
         
+        # System-wide stats are sampled off the event loop
+        self.sampler = SystemSampler(interval=system_sample_interval)
+        
         # Resource thresholds
         self.thresholds = {
             ResourceType.CPU: {
@@ -161,43 +170,48 @@ class ResourceMonitor:
         }
         
         # Historical data
-        self._system_history: Dict[ResourceType, deque] = {
-            res_type: deque(maxlen=self.history_size)
-            for res_type in ResourceType
-        }
-        self._process_history: Dict[int, Dict[ResourceType, deque]] = {}
+        self._system_history: Dict[ResourceType, RingBuffer] = self._new_history()
+        self._process_history: Dict[int, Dict[ResourceType, RingBuffer]] = {}
         
         # Alert tracking
         self._active_alerts: Dict[str, ResourceAlert] = {}
         self._alert_callbacks: List[Callable[[ResourceAlert], None]] = []
         
-        # Monitoring task
-        self._monitoring_task: Optional[asyncio.Task] = None
-        self._stop_event = asyncio.Event()
+        # Monitoring passes run on the shared adaptive scheduler
+        self._scheduler: Optional[AdaptiveScheduler] = None
+        self._monitoring_job = f"resource_monitor.{id(self):x}"
         
     async def start_monitoring(self) -> None:
-        """Start resource monitoring."""
-        if self._monitoring_task and not self._monitoring_task.done():
+        """
+        Start resource monitoring.
+        
+        Passes back off while usage is steady and well below the warning
+        thresholds, and run faster as usage approaches them.
+        """
+        if self._scheduler and self._scheduler.has_job(self._monitoring_job):
             logger.warning("Resource monitoring already running")
             return
         
-        self._stop_event.clear()
-        self._monitoring_task = asyncio.create_task(self._monitoring_loop())
+        self.sampler.start()
+        self._scheduler = get_scheduler()
+        self._scheduler.add_job(
+            self._monitoring_job,
+            self._monitoring_pass,
+            interval=self.sample_interval_seconds,
+            min_interval=1.0,
+            max_interval=self.sample_interval_seconds * 12
+        )
         logger.info(f"Started resource monitoring with {self.sample_interval_seconds}s interval")
     
     async def stop_monitoring(self) -> None:
         """Stop resource monitoring."""
-        if not self._monitoring_task:
+        if not self._scheduler:
             return
         
-        self._stop_event.set()
-        
-        try:
-            await asyncio.wait_for(self._monitoring_task, timeout=5.0)
-        except asyncio.TimeoutError:
-            logger.warning("Monitoring task didn't stop gracefully, cancelling")
-            self._monitoring_task.cancel()
+        await self._scheduler.remove_job(self._monitoring_job)
+        self._scheduler = None
         
+        await asyncio.to_thread(self.sampler.stop)
         logger.info("Stopped resource monitoring")
     
     def add_alert_callback(
@@ -216,67 +230,59 @@ class ResourceMonitor:
         """
         Get current system resource statistics.
         
+        Returns the latest snapshot published by the background sampler
+        without waiting on any measurement.
+        
         Returns:
             Dict of resource stats by type
         """
         stats = {}
-        now = datetime.now(timezone.utc)
+        snapshot = self.sampler.latest()
+        now = snapshot.timestamp
         
         # CPU stats
-        cpu_percent = psutil.cpu_percent(interval=1)
         stats[ResourceType.CPU] = ResourceStats(
             timestamp=now,
             resource_type=ResourceType.CPU,
-            current_value=cpu_percent,
-            current_percent=cpu_percent,
+            current_value=snapshot.cpu_percent,
+            current_percent=snapshot.cpu_percent,
             metadata={
-                "cpu_count": psutil.cpu_count(),
-                "cpu_freq": psutil.cpu_freq()._asdict() if psutil.cpu_freq() else None
+                "cpu_count": snapshot.cpu_count,
+                "cpu_freq": dict(snapshot.cpu_freq) if snapshot.cpu_freq else None
             }
         )
         
         # Memory stats
-        memory = psutil.virtual_memory()
         stats[ResourceType.MEMORY] = ResourceStats(
             timestamp=now,
             resource_type=ResourceType.MEMORY,
-            current_value=memory.used / (1024 * 1024),  # MB
-            current_percent=memory.percent,
+            current_value=snapshot.memory_used_mb,
+            current_percent=snapshot.memory_percent,
             metadata={
-                "total_mb": memory.total / (1024 * 1024),
-                "available_mb": memory.available / (1024 * 1024),
-                "swap_percent": psutil.swap_memory().percent
+                "total_mb": snapshot.memory_total_mb,
+                "available_mb": snapshot.memory_available_mb,
+                "swap_percent": snapshot.swap_percent
             }
         )
         
         # Disk I/O stats
-        disk_io = psutil.disk_io_counters()
+        disk_io = snapshot.disk_io
         if disk_io:
             stats[ResourceType.DISK_IO] = ResourceStats(
                 timestamp=now,
                 resource_type=ResourceType.DISK_IO,
-                current_value=(disk_io.read_bytes + disk_io.write_bytes) / (1024 * 1024),
-                metadata={
-                    "read_mb": disk_io.read_bytes / (1024 * 1024),
-                    "write_mb": disk_io.write_bytes / (1024 * 1024),
-                    "read_count": disk_io.read_count,
-                    "write_count": disk_io.write_count
-                }
+                current_value=disk_io["read_mb"] + disk_io["write_mb"],
+                metadata=dict(disk_io)
             )
         
         # Network I/O stats
-        net_io = psutil.net_io_counters()
+        net_io = snapshot.net_io
         if net_io:
             stats[ResourceType.NETWORK_IO] = ResourceStats(
                 timestamp=now,
                 resource_type=ResourceType.NETWORK_IO,
-                current_value=(net_io.bytes_sent + net_io.bytes_recv) / (1024 * 1024),
-                metadata={
-                    "sent_mb": net_io.bytes_sent / (1024 * 1024),
-                    "recv_mb": net_io.bytes_recv / (1024 * 1024),
-                    "packets_sent": net_io.packets_sent,
-                    "packets_recv": net_io.packets_recv
-                }
+                current_value=net_io["sent_mb"] + net_io["recv_mb"],
+                metadata=dict(net_io)
             )
         
         # Add historical averages
@@ -542,119 +548,106 @@ class ResourceMonitor:
         self._active_alerts[alert_key] = alert
         return alert
     
+    def _new_history(self) -> Dict[ResourceType, RingBuffer]:
+        """Create one empty history buffer per resource type."""
+        return {
+            res_type: RingBuffer(self.history_size, windows=HISTORY_WINDOWS)
+            for res_type in ResourceType
+        }
+    
     def _add_historical_stats(
         self,
         stats: ResourceStats,
-        history: deque
+        history: RingBuffer
     ) -> None:
         """Add historical statistics to stats object."""
         if not history:
             return
         
-        now = datetime.now(timezone.utc)
+        now = datetime.now(timezone.utc).timestamp()
         
-        # Filter samples by time window
-        samples_1min = []
-        samples_5min = []
-        samples_15min = []
-        
-        for sample in history:
-            age = (now - sample['timestamp']).total_seconds()
-            
-            if age <= 60:
-                samples_1min.append(sample['value'])
-            if age <= 300:
-                samples_5min.append(sample['value'])
-            if age <= 900:
-                samples_15min.append(sample['value'])
-        
-        # Calculate averages
-        if samples_1min:
-            stats.avg_1min = statistics.mean(samples_1min)
-        if samples_5min:
-            stats.avg_5min = statistics.mean(samples_5min)
-        if samples_15min:
-            stats.avg_15min = statistics.mean(samples_15min)
+        # Window means come from prefix sums, no scan over samples
+        stats.avg_1min = history.window_mean(60, now)
+        stats.avg_5min = history.window_mean(300, now)
+        stats.avg_15min = history.window_mean(900, now)
         
         # Find peak
-        if history:
-            peak_sample = max(history, key=lambda x: x['value'])
-            stats.peak_value = peak_sample['value']
-            stats.peak_time = peak_sample['timestamp']
+        peak_value, peak_time = history.peak()
+        stats.peak_value = peak_value
+        stats.peak_time = datetime.fromtimestamp(peak_time, timezone.utc)
+    
+    def _alert_pressure(self, res_type: ResourceType, value: float) -> float:
+        """Usage as a fraction of the resource's warning threshold."""
+        warning = self.thresholds.get(res_type, {}).get(AlertSeverity.WARNING)
+        return value / warning if warning else 0.0
     
-    async def _monitoring_loop(self) -> None:
-        """Background monitoring loop."""
-        while not self._stop_event.is_set():
-            try:
-                # Collect system stats
-                system_stats = await self.get_system_stats()
+    async def _monitoring_pass(self) -> Activity:
+        """Sample system and process usage once and check alerts."""
+        # Collect system stats
+        system_stats = await self.get_system_stats()
+        
+        # Store history
+        pressure = 0.0
+        for res_type, stats in system_stats.items():
+            self._system_history[res_type].append(
+                stats.current_value, stats.timestamp.timestamp()
+            )
+            pressure = max(pressure, self._alert_pressure(res_type, stats.current_value))
+        
+        # Collect process stats
+        processes = await self.storage.get_all_processes(
+            status=ProcessStatus.RUNNING,
+            host=self.tracker.hostname
+        )
+        
+        updates: List[ProcessUpdate] = []
+        for entry in processes:
+            process_stats = await self.get_process_stats(entry.pid)
+            if process_stats:
+                # Initialize history if needed
+                if entry.pid not in self._process_history:
+                    self._process_history[entry.pid] = self._new_history()
                 
                 # Store history
-                for res_type, stats in system_stats.items():
-                    self._system_history[res_type].append({
-                        'timestamp': stats.timestamp,
-                        'value': stats.current_value
-                    })
-                
-                # Collect process stats
-                processes = await self.storage.get_all_processes(
-                    status=ProcessStatus.RUNNING,
-                    host=self.tracker.hostname
-                )
+                for res_type, stats in process_stats.items():
+                    self._process_history[entry.pid][res_type].append(
+                        stats.current_value, stats.timestamp.timestamp()
+                    )
+                    pressure = max(
+                        pressure, self._alert_pressure(res_type, stats.current_value)
+                    )
                 
-                for entry in processes:
-                    process_stats = await self.get_process_stats(entry.pid)
-                    if process_stats:
-                        # Initialize history if needed
-                        if entry.pid not in self._process_history:
-                            self._process_history[entry.pid] = {
-                                res_type: deque(maxlen=self.history_size)
-                                for res_type in ResourceType
-                            }
-                        
-                        # Store history
-                        for res_type, stats in process_stats.items():
-                            self._process_history[entry.pid][res_type].append({
-                                'timestamp': stats.timestamp,
-                                'value': stats.current_value
-                            })
-                        
-                        # Update storage with latest resource usage
-                        await self.storage.update_process_resources(
-                            pid=entry.pid,
-                            host=entry.host,
-                            cpu_percent=process_stats[ResourceType.CPU].current_value,
-                            memory_mb=process_stats[ResourceType.MEMORY].current_value,
-                            disk_read_mb=process_stats.get(
-                                ResourceType.DISK_IO, ResourceStats(
-                                    datetime.now(timezone.utc), ResourceType.DISK_IO, 0
-                                )
-                            ).metadata.get('read_mb'),
-                            disk_write_mb=process_stats.get(
-                                ResourceType.DISK_IO, ResourceStats(
-                                    datetime.now(timezone.utc), ResourceType.DISK_IO, 0
-                                )
-                            ).metadata.get('write_mb')
+                # Update storage with latest resource usage
+                updates.append(ProcessUpdate(
+                    pid=entry.pid,
+                    host=entry.host,
+                    cpu_percent=process_stats[ResourceType.CPU].current_value,
+                    memory_mb=process_stats[ResourceType.MEMORY].current_value,
+                    disk_read_mb=process_stats.get(
+                        ResourceType.DISK_IO, ResourceStats(
+                            datetime.now(timezone.utc), ResourceType.DISK_IO, 0
                         )
-                
-                # Clean up old process history
-                current_pids = {p.pid for p in processes}
-                dead_pids = set(self._process_history.keys()) - current_pids
-                for pid in dead_pids:
-                    del self._process_history[pid]
-                
-                # Check for alerts
-                await self.check_alerts()
-                
-                # Wait for next iteration
-                await asyncio.wait_for(
-                    self._stop_event.wait(),
-                    timeout=self.sample_interval_seconds
-                )
-                
-            except asyncio.TimeoutError:
-                # Expected timeout - continue loop
-                continue
-            except Exception as e:
-                logger.error(f"Error in monitoring loop: {e}")
-                await asyncio.sleep(5)
\ No newline at end of file
+                    ).metadata.get('read_mb'),
+                    disk_write_mb=process_stats.get(
+                        ResourceType.DISK_IO, ResourceStats(
+                            datetime.now(timezone.utc), ResourceType.DISK_IO, 0
+                        )
+                    ).metadata.get('write_mb')
+                ))
+        
+        # One group commit for all processes
+        await self.storage.apply_updates(updates)
+        
+        # Clean up old process history
+        current_pids = {p.pid for p in processes}
+        dead_pids = set(self._process_history.keys()) - current_pids
+        for pid in dead_pids:
+            del self._process_history[pid]
+        
+        # Check for alerts
+        new_alerts = await self.check_alerts()
+        
+        return Activity(
+            changed=bool(new_alerts or dead_pids or self._active_alerts),
+            pressure=pressure
+        )
\ No newline at end of file
@@ -0,0 +1,257 @@
+"""
+System Sampler for Process Registry.
+
+Samples system-wide resource usage off the event loop:
+- Runs in a dedicated background thread
+- Delta-based CPU utilization (never sleeps to measure)
+- Disk and network throughput from counter deltas
+- Publishes immutable snapshots readable without blocking
+"""
+
+import threading
+import time
+import psutil
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Optional, Mapping, Dict, Any, Tuple
+from dataclasses import dataclass
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+MB = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class SystemSnapshot:
+    """Immutable point-in-time view of system resource usage."""
+    timestamp: datetime
+    monotonic: float
+    
+    # CPU
+    cpu_percent: float
+    cpu_count: Optional[int]
+    cpu_freq: Optional[Mapping[str, float]]
+    
+    # Memory (MB)
+    memory_used_mb: float
+    memory_percent: float
+    memory_total_mb: float
+    memory_available_mb: float
+    swap_percent: float
+    
+    # Cumulative counters plus per-second rates since the previous sample
+    disk_io: Optional[Mapping[str, float]]
+    net_io: Optional[Mapping[str, float]]
+    
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since this snapshot was taken."""
+        return time.monotonic() - self.monotonic
+
+
+def _cpu_busy_total(times: Any) -> Tuple[float, float]:
+    """Split cumulative CPU times into (busy, total) seconds."""
+    total = sum(times)
+    idle = times.idle + getattr(times, 'iowait', 0.0)
+    return total - idle, total
+
+
+class SystemSampler:
+    """Background thread that keeps a fresh SystemSnapshot available."""
+    
+    def __init__(self, interval: float = 1.0):
+        """
+        Initialize system sampler.
+        
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        
+        # Static facts are read once
+        self._cpu_count = psutil.cpu_count()
+        
+        # Previous raw counters for deltas; only touched under _sample_lock
+        self._sample_lock = threading.Lock()
+        self._last_cpu: Optional[Tuple[float, float]] = None
+        self._last_disk = None
+        self._last_net = None
+        self._last_monotonic: Optional[float] = None
+        
+        # Latest published snapshot (reference swap is atomic)
+        self._latest: Optional[SystemSnapshot] = None
+        
+        # Worker thread
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        
+        # Statistics
+        self.samples_taken = 0
+        self.sample_errors = 0
+        self.last_sample_ms = 0.0
+    
+    @property
+    def running(self) -> bool:
+        """Whether the sampling thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self) -> None:
+        """Start the sampling thread if it is not running."""
+        if self.running:
+            return
+        
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="shannon-system-sampler",
+            daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Started system sampler with {self.interval}s interval")
+    
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the sampling thread.
+        
+        Args:
+            timeout: Seconds to wait for the thread to exit
+        """
+        if not self._thread:
+            return
+        
+        self._stop_event.set()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning("System sampler thread didn't stop in time")
+        self._thread = None
+        logger.info("Stopped system sampler")
+    
+    def latest(self) -> SystemSnapshot:
+        """
+        Get the most recent snapshot.
+        
+        When the thread is not running, a snapshot older than the interval
+        is refreshed inline. Sampling never sleeps, so this is safe to call
+        from the event loop.
+        
+        Returns:
+            Latest system snapshot
+        """
+        snapshot = self._latest
+        if snapshot is None or (not self.running and snapshot.age_seconds >= self.interval):
+            snapshot = self.sample()
+        return snapshot
+    
+    def sample(self) -> SystemSnapshot:
+        """
+        Take and publish a snapshot now.
+        
+        CPU utilization is the busy share of CPU time since the previous
+        sample, or since boot for the first one.
+        
+        Returns:
+            New system snapshot
+        """
+        start = time.perf_counter()
+        
+        with self._sample_lock:
+            now = time.monotonic()
+            elapsed = now - self._last_monotonic if self._last_monotonic is not None else None
+            
+            # CPU
+            busy, total = _cpu_busy_total(psutil.cpu_times())
+            if self._last_cpu is not None:
+                busy_delta = busy - self._last_cpu[0]
+                total_delta = total - self._last_cpu[1]
+            else:
+                busy_delta, total_delta = busy, total
+            cpu_percent = round(100.0 * busy_delta / total_delta, 1) if total_delta > 0 else 0.0
+            cpu_percent = min(max(cpu_percent, 0.0), 100.0)
+            self._last_cpu = (busy, total)
+            
+            try:
+                freq = psutil.cpu_freq()
+            except Exception:
+                freq = None
+            
+            # Memory
+            memory = psutil.virtual_memory()
+            swap = psutil.swap_memory()
+            
+            # Disk I/O
+            disk_io = None
+            disk = psutil.disk_io_counters()
+            if disk:
+                disk_io = {
+                    "read_mb": disk.read_bytes / MB,
+                    "write_mb": disk.write_bytes / MB,
+                    "read_count": disk.read_count,
+                    "write_count": disk.write_count
+                }
+                if self._last_disk is not None and elapsed:
+                    disk_io["read_mb_per_sec"] = (disk.read_bytes - self._last_disk.read_bytes) / MB / elapsed
+                    disk_io["write_mb_per_sec"] = (disk.write_bytes - self._last_disk.write_bytes) / MB / elapsed
+                self._last_disk = disk
+            
+            # Network I/O
+            net_io = None
+            net = psutil.net_io_counters()
+            if net:
+                net_io = {
+                    "sent_mb": net.bytes_sent / MB,
+                    "recv_mb": net.bytes_recv / MB,
+                    "packets_sent": net.packets_sent,
+                    "packets_recv": net.packets_recv
+                }
+                if self._last_net is not None and elapsed:
+                    net_io["sent_mb_per_sec"] = (net.bytes_sent - self._last_net.bytes_sent) / MB / elapsed
+                    net_io["recv_mb_per_sec"] = (net.bytes_recv - self._last_net.bytes_recv) / MB / elapsed
+                self._last_net = net
+            
+            self._last_monotonic = now
+            
+            snapshot = SystemSnapshot(
+                timestamp=datetime.now(timezone.utc),
+                monotonic=now,
+                cpu_percent=cpu_percent,
+                cpu_count=self._cpu_count,
+                cpu_freq=MappingProxyType(freq._asdict()) if freq else None,
+                memory_used_mb=memory.used / MB,
+                memory_percent=memory.percent,
+                memory_total_mb=memory.total / MB,
+                memory_available_mb=memory.available / MB,
+                swap_percent=swap.percent,
+                disk_io=MappingProxyType(disk_io) if disk_io else None,
+                net_io=MappingProxyType(net_io) if net_io else None
+            )
+            self._latest = snapshot
+        
+        self.samples_taken += 1
+        self.last_sample_ms = (time.perf_counter() - start) * 1000
+        return snapshot
+    
+    def _run(self) -> None:
+        """Sampling thread body."""
+        while not self._stop_event.is_set():
+            try:
+                self.sample()
+            except Exception as e:
+                self.sample_errors += 1
+                logger.error(f"System sampling failed: {e}")
+            
+            self._stop_event.wait(self.interval)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get sampler statistics."""
+        latest = self._latest
+        return {
+            "running": self.running,
+            "interval": self.interval,
+            "samples_taken": self.samples_taken,
+            "sample_errors": self.sample_errors,
+            "last_sample_ms": self.last_sample_ms,
+            "snapshot_age_seconds": latest.age_seconds if latest else None
+        }
@@ -0,0 +1,207 @@
+"""
+Process Scanner for Process Registry.
+
+Finds Claude processes incrementally instead of walking every PID each time:
+- Classification cached per (pid, create_time)
+- Only PIDs that are new since the last scan are inspected
+- PID reuse caught by comparing creation times
+- Scans run in a worker thread, off the event loop
+"""
+
+import asyncio
+import threading
+import time
+import psutil
+from typing import Optional, Dict, Any, List, FrozenSet, Tuple
+
+from ..utils.logging import get_logger
+from ..utils.process_watcher import CREATE_TIME_TOLERANCE
+
+logger = get_logger(__name__)
+
+
+def is_claude_command(name: Optional[str], cmdline: Optional[List[str]]) -> bool:
+    """
+    Check if a process name or command line belongs to Claude Code.
+    
+    Args:
+        name: Process name
+        cmdline: Process command line
+    
+    Returns:
+        True if the process is Claude Code
+    """
+    if name and 'claude' in name.lower():
+        return True
+    
+    if cmdline:
+        cmd_str = ' '.join(cmdline).lower()
+        if 'claude' in cmd_str:
+            return True
+    
+    return False
+
+
+class ClaudeProcessScanner:
+    """Keeps the set of Claude processes current with incremental scans."""
+    
+    def __init__(self, revalidate_interval: float = 300.0):
+        """
+        Initialize scanner.
+        
+        Args:
+            revalidate_interval: Seconds between creation-time checks of every
+                cached PID. Claude PIDs are checked on every scan; other PIDs
+                are only reused after the PID space wraps, so they are
+                checked on this slower cadence.
+        """
+        self.revalidate_interval = revalidate_interval
+        
+        # pid -> (create_time, is_claude); only touched under _lock
+        self._known: Dict[int, Tuple[float, bool]] = {}
+        self._lock = threading.Lock()
+        self._last_revalidate: Optional[float] = None
+        
+        # Published results, replaced whole after each scan
+        self._claude: Dict[int, float] = {}
+        self._last_scan: Optional[float] = None
+        
+        # Statistics
+        self.scans = 0
+        self.revalidations = 0
+        self.inspected = 0
+        self.reused_pids = 0
+        self.last_scan_ms = 0.0
+        self.last_inspected = 0
+    
+    @property
+    def claude_pids(self) -> FrozenSet[int]:
+        """Claude PIDs found by the last scan."""
+        return frozenset(self._claude)
+    
+    @property
+    def claude_processes(self) -> Dict[int, float]:
+        """Claude PIDs from the last scan mapped to their creation times."""
+        return dict(self._claude)
+    
+    def is_claude(self, pid: int) -> bool:
+        """Whether the last scan classified a PID as Claude."""
+        return pid in self._claude
+    
+    async def refresh(self, max_age: float = 0.0) -> Dict[int, float]:
+        """
+        Scan in a worker thread unless the last scan is recent enough.
+        
+        Args:
+            max_age: Reuse the previous result if it is at most this many
+                seconds old
+        
+        Returns:
+            Claude PIDs mapped to their creation times
+        """
+        if (
+            max_age > 0
+            and self._last_scan is not None
+            and time.monotonic() - self._last_scan <= max_age
+        ):
+            return dict(self._claude)
+        
+        return await asyncio.to_thread(self.scan)
+    
+    def scan(self) -> Dict[int, float]:
+        """
+        Bring the cached classification up to date.
+        
+        Blocking; call through refresh() from async code.
+        
+        Returns:
+            Claude PIDs mapped to their creation times
+        """
+        with self._lock:
+            start = time.perf_counter()
+            now = time.monotonic()
+            current = set(psutil.pids())
+            
+            # Forget processes that have gone
+            for pid in self._known.keys() - current:
+                del self._known[pid]
+            
+            # New PIDs, plus cached ones whose creation time moved
+            pending = current - self._known.keys()
+            
+            revalidate = (
+                self._last_revalidate is None
+                or now - self._last_revalidate >= self.revalidate_interval
+            )
+            if revalidate:
+                self._last_revalidate = now
+                self.revalidations += 1
+                checked = list(self._known)
+            else:
+                checked = [pid for pid, (_, claude) in self._known.items() if claude]
+            
+            for pid in checked:
+                if self._is_reused(pid):
+                    self.reused_pids += 1
+                    del self._known[pid]
+                    pending.add(pid)
+            
+            for pid in pending:
+                self._classify(pid)
+            
+            self._claude = {
+                pid: create_time
+                for pid, (create_time, claude) in self._known.items()
+                if claude
+            }
+            
+            self.scans += 1
+            self.inspected += len(pending)
+            self.last_inspected = len(pending)
+            self.last_scan_ms = (time.perf_counter() - start) * 1000
+            self._last_scan = time.monotonic()
+            return dict(self._claude)
+    
+    def _is_reused(self, pid: int) -> bool:
+        """Whether a cached PID now belongs to a different process."""
+        try:
+            create_time = psutil.Process(pid).create_time()
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            return True
+        except psutil.AccessDenied:
+            return False
+        
+        return abs(create_time - self._known[pid][0]) > CREATE_TIME_TOLERANCE
+    
+    def _classify(self, pid: int) -> None:
+        """Inspect one PID and cache whether it is Claude."""
+        try:
+            # Denied attributes come back as None rather than raising
+            info = psutil.Process(pid).as_dict(attrs=['create_time', 'name', 'cmdline'])
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            return
+        except Exception as e:
+            logger.debug(f"Failed to inspect process {pid}: {e}")
+            return
+        
+        if info.get('create_time') is None:
+            return
+        
+        self._known[pid] = (
+            info['create_time'],
+            is_claude_command(info.get('name'), info.get('cmdline'))
+        )
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scanner statistics."""
+        return {
+            "scans": self.scans,
+            "cached_pids": len(self._known),
+            "claude_pids": len(self._claude),
+            "last_scan_ms": self.last_scan_ms,
+            "last_inspected": self.last_inspected,
+            "inspected": self.inspected,
+            "revalidations": self.revalidations,
+            "reused_pids": self.reused_pids,
+            "revalidate_interval": self.revalidate_interval
+        }
@@ -1,21 +1,29 @@
 """
 Registry Storage for Process Registry.
 
-Provides persistent storage for process information using SQLite.
+Provides persistent storage for process information using SQLite:
+- A single writer connection that group-commits queued updates
+- A separate read-only connection so queries never wait on writes
+- An indexed in-memory process table serving lookups (read-through cache)
+- Cross-session messages pushed to in-process mailboxes, with SQLite as the
+  durable log and a timing wheel expiring them
 """
 
 import asyncio
+import time
 import aiosqlite
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass, asdict
+from typing import List, Optional, Dict, Any, Tuple, Iterable
+from dataclasses import dataclass, asdict, replace
 from enum import Enum
 import json
 import os
 
 from ..utils.logging import get_logger
 from ..utils.errors import ShannonError
+from ..utils.table import IndexedTable
+from ..utils.timer_wheel import TimingWheel
 
 logger = get_logger(__name__)
 
@@ -101,15 +109,57 @@ class ProcessEntry:
         )
 
 
+@dataclass
+class ProcessUpdate:
+    """A queued change to a registered process; None fields are left as-is."""
+    pid: int
+    host: str
+    status: Optional[ProcessStatus] = None
+    metadata: Optional[Dict[str, Any]] = None
+    cpu_percent: Optional[float] = None
+    memory_mb: Optional[float] = None
+    disk_read_mb: Optional[float] = None
+    disk_write_mb: Optional[float] = None
+
+
+class _Mailbox:
+    """Messages pushed to a session while someone waits for them."""
+    
+    __slots__ = ("messages", "event", "waiters")
+    
+    def __init__(self):
+        # id -> message, in send order
+        self.messages: Dict[int, Dict[str, Any]] = {}
+        self.event = asyncio.Event()
+        self.waiters = 0
+
+
+def _snapshot(entry: ProcessEntry) -> ProcessEntry:
+    """Copy a cached entry so callers cannot mutate the table."""
+    return replace(
+        entry,
+        args=list(entry.args),
+        env=dict(entry.env),
+        metadata=dict(entry.metadata)
+    )
+
+
 class RegistryStorage:
     """Storage backend for the process registry."""
     
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        batch_interval: float = 0.05,
+        max_batch_size: int = 1000
+    ):
         """
         Initialize registry storage.
         
         Args:
             db_path: Path to SQLite database (defaults to ~/.claude/registry.db)
+            batch_interval: Seconds to collect queued updates before committing
+            max_batch_size: Queued updates that trigger an immediate commit
         """
         if db_path is None:
             db_path = Path.home() / ".claude" / "registry.db"
@@ -117,9 +167,55 @@ class RegistryStorage:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
+        self.batch_interval = batch_interval
+        self.max_batch_size = max_batch_size
+        
+        # Writer connection; every write runs on it under _lock
         self._db: Optional[aiosqlite.Connection] = None
         self._lock = asyncio.Lock()
         
+        # Read-only connection (WAL readers never block on the writer)
+        self._read_db: Optional[aiosqlite.Connection] = None
+        
+        # Group-commit queue drained by the writer task
+        self._pending: List[ProcessUpdate] = []
+        self._pending_waiters: List[asyncio.Future] = []
+        self._pending_event = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        self._writer_task: Optional[asyncio.Task] = None
+        self._closing = False
+        
+        # Process table cache, current as of registry revision _table_revision
+        self._table: IndexedTable[ProcessEntry] = IndexedTable(
+            key=lambda entry: (entry.pid, entry.host),
+            indexes={
+                "pid": lambda entry: entry.pid,
+                "session_id": lambda entry: entry.session_id,
+                "status": lambda entry: entry.status,
+                "host": lambda entry: entry.host
+            }
+        )
+        self._table_revision: Optional[int] = None
+        self._reload_lock = asyncio.Lock()
+        
+        # Local message delivery; other processes are picked up via data_version
+        self._mailboxes: Dict[str, _Mailbox] = {}
+        self.message_poll_interval = 1.0
+        
+        # Message expiry by id, advanced by the expiry task
+        self._message_expiry: TimingWheel[int] = TimingWheel(tick=1.0)
+        self._expiry_event = asyncio.Event()
+        self._expiry_task: Optional[asyncio.Task] = None
+        
+        # Statistics
+        self.table_reloads = 0
+        self.batches_committed = 0
+        self.updates_committed = 0
+        self.last_batch_size = 0
+        self.last_commit_ms = 0.0
+        self.messages_pushed = 0
+        self.messages_expired = 0
+        
     async def initialize(self) -> None:
         """Initialize database and create tables."""
         async with self._lock:
@@ -210,8 +306,52 @@ class RegistryStorage:
                 )
             """)
             
+            # Unread lookups by recipient; broadcasts are to_session IS NULL
+            await self._db.execute("""
+                CREATE INDEX IF NOT EXISTS idx_messages_recipient 
+                ON messages(to_session, read_at, expires_at)
+            """)
+            
+            await self._db.execute("""
+                CREATE INDEX IF NOT EXISTS idx_messages_expires 
+                ON messages(expires_at)
+            """)
+            
+            # Bumped by every write to the processes table
+            await self._db.execute("""
+                CREATE TABLE IF NOT EXISTS registry_revision (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    revision INTEGER NOT NULL
+                )
+            """)
+            
+            await self._db.execute(
+                "INSERT OR IGNORE INTO registry_revision (id, revision) VALUES (0, 0)"
+            )
+            
             await self._db.commit()
             
+            # Pending expiries from earlier runs
+            self._message_expiry.clear()
+            cursor = await self._db.execute(
+                "SELECT id, expires_at FROM messages WHERE expires_at IS NOT NULL"
+            )
+            for message_id, expires_at in await cursor.fetchall():
+                self._message_expiry.schedule(
+                    message_id,
+                    datetime.fromisoformat(expires_at).timestamp()
+                )
+            
+            self._read_db = await aiosqlite.connect(
+                f"{self.db_path.resolve().as_uri()}?mode=ro",
+                uri=True,
+                timeout=30.0
+            )
+            
+            self._closing = False
+            self._writer_task = asyncio.create_task(self._writer_loop())
+            self._expiry_task = asyncio.create_task(self._expiry_loop())
+            
         logger.info(f"Initialized process registry database at {self.db_path}")
     
     async def register_process(self, entry: ProcessEntry) -> None:
@@ -261,8 +401,17 @@ class RegistryStorage:
                     f"Process registered: {entry.command}"
                 )
                 
+            revision = await self._bump_revision()
             await self._db.commit()
             
+            if self._table_revision is not None:
+                cached = self._table.get((entry.pid, entry.host))
+                if existing and cached:
+                    # Updates keep the original start time
+                    entry = replace(entry, started_at=cached.started_at)
+                self._table.put(_snapshot(entry))
+            self._advance_table(revision)
+            
             logger.debug(f"Registered process {entry.pid} on {entry.host}")
     
     async def get_process(self, pid: int, host: Optional[str] = None) -> Optional[ProcessEntry]:
@@ -272,35 +421,15 @@ class RegistryStorage:
         Args:
             pid: Process ID
             host: Optional host filter
-            
+        
         Returns:
             Process entry if found
         """
-        async with self._lock:
-            if not self._db:
-                raise ShannonError("Registry storage not initialized")
-            
-            if host:
-                cursor = await self._db.execute(
-                    "SELECT * FROM processes WHERE pid = ? AND host = ?",
-                    (pid, host)
-                )
-            else:
-                # Get from current host
-                cursor = await self._db.execute(
-                    "SELECT * FROM processes WHERE pid = ? AND host = ?",
-                    (pid, os.uname().nodename)
-                )
-            
-            row = await cursor.fetchone()
-            
-            if row:
-                # Convert row to dict
-                columns = [desc[0] for desc in cursor.description]
-                data = dict(zip(columns, row))
-                return ProcessEntry.from_dict(data)
-            
-            return None
+        await self._sync_table()
+        
+        # Default to current host
+        entry = self._table.get((pid, host or os.uname().nodename))
+        return _snapshot(entry) if entry else None
     
     async def get_session_processes(
         self,
@@ -313,34 +442,16 @@ class RegistryStorage:
         Args:
             session_id: Session ID
             status: Optional status filter
-            
+        
         Returns:
             List of process entries
         """
-        async with self._lock:
-            if not self._db:
-                raise ShannonError("Registry storage not initialized")
-            
-            if status:
-                cursor = await self._db.execute(
-                    "SELECT * FROM processes WHERE session_id = ? AND status = ?",
-                    (session_id, status.value)
-                )
-            else:
-                cursor = await self._db.execute(
-                    "SELECT * FROM processes WHERE session_id = ?",
-                    (session_id,)
-                )
-            
-            rows = await cursor.fetchall()
-            columns = [desc[0] for desc in cursor.description]
-            
-            processes = []
-            for row in rows:
-                data = dict(zip(columns, row))
-                processes.append(ProcessEntry.from_dict(data))
-            
-            return processes
+        await self._sync_table()
+        
+        return [
+            _snapshot(entry)
+            for entry in self._table.find(session_id=session_id, status=status)
+        ]
     
     async def get_all_processes(
         self,
@@ -353,35 +464,81 @@ class RegistryStorage:
         Args:
             status: Optional status filter
             host: Optional host filter
-            
+        
         Returns:
             List of process entries
         """
-        async with self._lock:
-            if not self._db:
-                raise ShannonError("Registry storage not initialized")
-            
-            query = "SELECT * FROM processes WHERE 1=1"
-            params = []
-            
-            if status:
-                query += " AND status = ?"
-                params.append(status.value)
-            
-            if host:
-                query += " AND host = ?"
-                params.append(host)
-            
-            cursor = await self._db.execute(query, params)
-            rows = await cursor.fetchall()
-            columns = [desc[0] for desc in cursor.description]
+        await self._sync_table()
+        
+        return [
+            _snapshot(entry)
+            for entry in self._table.find(status=status, host=host)
+        ]
+    
+    async def _sync_table(self) -> None:
+        """
+        Make sure the process table matches the database.
+        
+        Every write to the processes table bumps the registry revision.
+        Writes through this storage update the table directly and advance
+        its revision, so the table is reloaded only when some other
+        process has changed the registry. Checks and reloads use the
+        read-only connection and never wait for the writer.
+        """
+        if not self._read_db:
+            raise ShannonError("Registry storage not initialized")
+        
+        cursor = await self._read_db.execute("SELECT revision FROM registry_revision")
+        if (await cursor.fetchone())[0] == self._table_revision:
+            return
+        
+        async with self._reload_lock:
+            # Revision and rows from one snapshot
+            await self._read_db.execute("BEGIN")
+            try:
+                cursor = await self._read_db.execute("SELECT revision FROM registry_revision")
+                revision = (await cursor.fetchone())[0]
+                if revision == self._table_revision:
+                    return
+                
+                cursor = await self._read_db.execute("SELECT * FROM processes")
+                rows = await cursor.fetchall()
+                columns = [desc[0] for desc in cursor.description]
+            finally:
+                await self._read_db.execute("COMMIT")
             
-            processes = []
+            # Swapped without awaiting, so no write-through lands halfway
+            self._table.clear()
             for row in rows:
-                data = dict(zip(columns, row))
-                processes.append(ProcessEntry.from_dict(data))
+                self._table.put(ProcessEntry.from_dict(dict(zip(columns, row))))
             
-            return processes
+            self._table_revision = revision
+            self.table_reloads += 1
+    
+    async def _bump_revision(self) -> int:
+        """Advance the registry revision inside the current write transaction."""
+        await self._db.execute(
+            "UPDATE registry_revision SET revision = revision + 1 WHERE id = 0"
+        )
+        cursor = await self._db.execute("SELECT revision FROM registry_revision")
+        return (await cursor.fetchone())[0]
+    
+    def _advance_table(self, revision: int) -> None:
+        """
+        Mark the table current after a write-through.
+        
+        Only valid when the table held the revision just before this
+        write; otherwise another process wrote in between and the next
+        read reloads.
+        """
+        if self._table_revision == revision - 1:
+            self._table_revision = revision
+    
+    async def _data_version(self) -> int:
+        """Counter on the read connection that changes when another connection commits."""
+        cursor = await self._read_db.execute("PRAGMA data_version")
+        row = await cursor.fetchone()
+        return row[0]
     
     async def update_process_status(
         self,
@@ -399,59 +556,9 @@ class RegistryStorage:
             status: New status
             metadata: Optional metadata update
         """
-        async with self._lock:
-            if not self._db:
-                raise ShannonError("Registry storage not initialized")
-            
-            # Get current status
-            cursor = await self._db.execute(
-                "SELECT status, session_id FROM processes WHERE pid = ? AND host = ?",
-                (pid, host)
-            )
-            row = await cursor.fetchone()
-            
-            if not row:
-                logger.warning(f"Process {pid} on {host} not found")
-                return
-            
-            old_status, session_id = row
-            
-            # Update status and last_seen
-            if metadata:
-                await self._db.execute("""
-                    UPDATE processes 
-                    SET status = ?, last_seen = ?, metadata = ?
-                    WHERE pid = ? AND host = ?
-                """, (
-                    status.value,
-                    datetime.now(timezone.utc).isoformat(),
-                    json.dumps(metadata),
-                    pid,
-                    host
-                ))
-            else:
-                await self._db.execute("""
-                    UPDATE processes 
-                    SET status = ?, last_seen = ?
-                    WHERE pid = ? AND host = ?
-                """, (
-                    status.value,
-                    datetime.now(timezone.utc).isoformat(),
-                    pid,
-                    host
-                ))
-            
-            # Record in history
-            if old_status != status.value:
-                await self._record_history(
-                    pid, host, session_id,
-                    "status_changed", old_status, status.value,
-                    f"Status changed from {old_status} to {status.value}"
-                )
-            
-            await self._db.commit()
-            
-            logger.debug(f"Updated process {pid} on {host} to status {status}")
+        await self.apply_updates([
+            ProcessUpdate(pid=pid, host=host, status=status, metadata=metadata)
+        ])
     
     async def update_process_resources(
         self,
@@ -473,39 +580,157 @@ class RegistryStorage:
             disk_read_mb: Disk read in MB
             disk_write_mb: Disk write in MB
         """
+        await self.apply_updates([
+            ProcessUpdate(
+                pid=pid,
+                host=host,
+                cpu_percent=cpu_percent,
+                memory_mb=memory_mb,
+                disk_read_mb=disk_read_mb,
+                disk_write_mb=disk_write_mb
+            )
+        ])
+    
+    async def apply_updates(self, updates: Iterable[ProcessUpdate]) -> None:
+        """
+        Queue process updates and wait until they are committed.
+        
+        Updates from all callers are group-committed by the writer task in
+        a single transaction, in the order they were queued.
+        
+        Args:
+            updates: Status and resource updates to apply
+        """
+        updates = list(updates)
+        if not updates:
+            return
+        
+        if not self._writer_task or self._closing:
+            raise ShannonError("Registry storage not initialized")
+        
+        waiter = asyncio.get_running_loop().create_future()
+        self._pending.extend(updates)
+        self._pending_waiters.append(waiter)
+        self._pending_event.set()
+        if len(self._pending) >= self.max_batch_size:
+            self._batch_full.set()
+        
+        await waiter
+    
+    async def _writer_loop(self) -> None:
+        """Commit queued updates in batches until the storage is closed."""
+        while True:
+            await self._pending_event.wait()
+            
+            # Give other callers a moment to join this batch
+            if not self._closing and len(self._pending) < self.max_batch_size:
+                try:
+                    await asyncio.wait_for(
+                        self._batch_full.wait(),
+                        timeout=self.batch_interval
+                    )
+                except asyncio.TimeoutError:
+                    pass
+            
+            batch, self._pending = self._pending, []
+            waiters, self._pending_waiters = self._pending_waiters, []
+            self._pending_event.clear()
+            self._batch_full.clear()
+            
+            if batch:
+                try:
+                    await self._commit_updates(batch)
+                except Exception as e:
+                    logger.error(f"Failed to commit {len(batch)} process updates: {e}")
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_exception(e)
+                else:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_result(None)
+            
+            if self._closing and not self._pending:
+                return
+    
+    async def _commit_updates(self, batch: List[ProcessUpdate]) -> None:
+        """Apply a batch of updates in one transaction."""
+        start = time.perf_counter()
+        
         async with self._lock:
             if not self._db:
                 raise ShannonError("Registry storage not initialized")
             
-            # Build update query
-            updates = ["last_seen = ?"]
-            params = [datetime.now(timezone.utc).isoformat()]
-            
-            if cpu_percent is not None:
-                updates.append("cpu_percent = ?")
-                params.append(cpu_percent)
-            
-            if memory_mb is not None:
-                updates.append("memory_mb = ?")
-                params.append(memory_mb)
-            
-            if disk_read_mb is not None:
-                updates.append("disk_read_mb = ?")
-                params.append(disk_read_mb)
+            # Current status of every touched process, for history rows
+            current: Dict[Tuple[int, str], Tuple[str, str]] = {}
+            pids = sorted({update.pid for update in batch})
+            for offset in range(0, len(pids), 500):
+                chunk = pids[offset:offset + 500]
+                placeholders = ','.join('?' * len(chunk))
+                cursor = await self._db.execute(
+                    f"SELECT pid, host, status, session_id FROM processes WHERE pid IN ({placeholders})",
+                    chunk
+                )
+                for pid, host, status, session_id in await cursor.fetchall():
+                    current[(pid, host)] = (status, session_id)
             
-            if disk_write_mb is not None:
-                updates.append("disk_write_mb = ?")
-                params.append(disk_write_mb)
+            now = datetime.now(timezone.utc).isoformat()
+            rows = []
+            history = []
             
-            params.extend([pid, host])
+            for update in batch:
+                key = (update.pid, update.host)
+            
+                if update.status is not None:
+                    if key not in current:
+                        logger.warning(f"Process {update.pid} on {update.host} not found")
+                        continue
+            
+                    old_status, session_id = current[key]
+                    if old_status != update.status.value:
+                        history.append((
+                            update.pid, update.host, session_id,
+                            "status_changed", now, old_status, update.status.value,
+                            f"Status changed from {old_status} to {update.status.value}"
+                        ))
+                        current[key] = (update.status.value, session_id)
+            
+                rows.append((
+                    now,
+                    update.status.value if update.status is not None else None,
+                    json.dumps(update.metadata) if update.metadata else None,
+                    update.cpu_percent,
+                    update.memory_mb,
+                    update.disk_read_mb,
+                    update.disk_write_mb,
+                    update.pid,
+                    update.host
+                ))
             
-            await self._db.execute(f"""
-                UPDATE processes 
-                SET {', '.join(updates)}
+            await self._db.executemany("""
+                UPDATE processes
+                SET last_seen = ?,
+                    status = COALESCE(?, status),
+                    metadata = COALESCE(?, metadata),
+                    cpu_percent = COALESCE(?, cpu_percent),
+                    memory_mb = COALESCE(?, memory_mb),
+                    disk_read_mb = COALESCE(?, disk_read_mb),
+                    disk_write_mb = COALESCE(?, disk_write_mb)
                 WHERE pid = ? AND host = ?
-            """, params)
+            """, rows)
             
+            await self._record_history_many(history)
+            revision = await self._bump_revision()
             await self._db.commit()
+        
+            if self._table_revision is not None:
+                self._apply_to_table(batch, now)
+            self._advance_table(revision)
+        
+        self.batches_committed += 1
+        self.updates_committed += len(batch)
+        self.last_batch_size = len(batch)
+        self.last_commit_ms = (time.perf_counter() - start) * 1000
     
     async def remove_process(self, pid: int, host: str) -> None:
         """
@@ -542,7 +767,10 @@ class RegistryStorage:
                     "Process removed from registry"
                 )
                 
+                revision = await self._bump_revision()
                 await self._db.commit()
+                self._table.pop((pid, host), None)
+                self._advance_table(revision)
                 
                 logger.debug(f"Removed process {pid} on {host}")
     
@@ -571,20 +799,28 @@ class RegistryStorage:
             stale_processes = await cursor.fetchall()
             
             # Remove them
-            for pid, host, session_id, status in stale_processes:
-                await self._record_history(
-                    pid, host, session_id,
-                    "removed", status, None,
+            now = datetime.now(timezone.utc).isoformat()
+            await self._record_history_many([
+                (
+                    pid, host, session_id, "removed", now, status, None,
                     f"Stale process (not seen for {stale_threshold_seconds}s)"
                 )
+                for pid, host, session_id, status in stale_processes
+            ])
             
             await self._db.execute(
                 "DELETE FROM processes WHERE last_seen < ?",
                 (threshold_time,)
             )
             
+            revision = await self._bump_revision() if stale_processes else None
             await self._db.commit()
             
+            for pid, host, _, _ in stale_processes:
+                self._table.pop((pid, host), None)
+            if revision is not None:
+                self._advance_table(revision)
+            
             count = len(stale_processes)
             if count > 0:
                 logger.info(f"Cleaned up {count} stale processes")
@@ -602,6 +838,9 @@ class RegistryStorage:
         """
         Send a message between sessions.
         
+        The message is logged durably, then pushed straight to any local
+        session waiting in wait_for_messages().
+        
         Args:
             from_session: Sender session ID
             to_session: Recipient session ID (None for broadcast)
@@ -619,6 +858,16 @@ class RegistryStorage:
             now = datetime.now(timezone.utc)
             expires_at = now.timestamp() + ttl_seconds
             
+            message = {
+                "from_session": from_session,
+                "to_session": to_session,
+                "message_type": message_type,
+                "payload": payload,
+                "created_at": now.isoformat(),
+                "read_at": None,
+                "expires_at": datetime.fromtimestamp(expires_at, tz=timezone.utc).isoformat()
+            }
+            
             cursor = await self._db.execute("""
                 INSERT INTO messages (
                     from_session, to_session, message_type, payload,
@@ -629,13 +878,32 @@ class RegistryStorage:
                 to_session,
                 message_type,
                 json.dumps(payload),
-                now.isoformat(),
-                datetime.fromtimestamp(expires_at, tz=timezone.utc).isoformat()
+                message["created_at"],
+                message["expires_at"]
             ))
             
             await self._db.commit()
             
-            return cursor.lastrowid
+            message_id = cursor.lastrowid
+        
+        self._message_expiry.schedule(message_id, expires_at)
+        self._expiry_event.set()
+        
+        self._publish({"id": message_id, **message})
+        
+        return message_id
+    
+    def _publish(self, message: Dict[str, Any]) -> None:
+        """Push a message to the mailboxes of local waiting recipients."""
+        if message["to_session"] is None:
+            mailboxes = list(self._mailboxes.values())
+        else:
+            mailbox = self._mailboxes.get(message["to_session"])
+            mailboxes = [mailbox] if mailbox else []
+        
+        for mailbox in mailboxes:
+            mailbox.messages[message["id"]] = dict(message)
+            mailbox.event.set()
     
     async def get_messages(
         self,
@@ -647,58 +915,147 @@ class RegistryStorage:
         
         Args:
             session_id: Session ID
-            unread_only: Only return unread messages
+            unread_only: Only return unread messages (and mark them read)
+            
+        Returns:
+            List of messages
+        """
+        if not self._read_db:
+            raise ShannonError("Registry storage not initialized")
+        
+        now = datetime.now(timezone.utc).isoformat()
+        unread = "AND read_at IS NULL" if unread_only else ""
+        
+        # Direct and broadcast messages as two index range scans
+        cursor = await self._read_db.execute(f"""
+            SELECT * FROM messages 
+            WHERE to_session = ? {unread} AND expires_at > ?
+            UNION ALL
+            SELECT * FROM messages 
+            WHERE to_session IS NULL {unread} AND expires_at > ?
+            ORDER BY id
+        """, (session_id, now, now))
+        
+        rows = await cursor.fetchall()
+        columns = [desc[0] for desc in cursor.description]
+        
+        messages = []
+        for row in rows:
+            data = dict(zip(columns, row))
+            data["payload"] = json.loads(data["payload"])
+            messages.append(data)
+        
+        if unread_only and messages:
+            messages = await self._claim_messages(messages)
+        
+        return messages
+    
+    async def wait_for_messages(
+        self,
+        session_id: str,
+        timeout: float = 30.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Wait until unread messages arrive for a session.
+        
+        Messages already waiting are returned at once. Otherwise local
+        senders push into this session's mailbox, and messages written by
+        other processes are noticed within message_poll_interval. Returned
+        messages are marked read.
+        
+        Args:
+            session_id: Session ID
+            timeout: Seconds to wait before returning an empty list
             
         Returns:
             List of messages
         """
+        mailbox = self._mailboxes.get(session_id)
+        if mailbox is None:
+            mailbox = self._mailboxes[session_id] = _Mailbox()
+        mailbox.waiters += 1
+        
+        try:
+            messages = await self.get_messages(session_id)
+            if messages:
+                return messages
+            
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            version = await self._data_version()
+            
+            while not self._closing:
+                if mailbox.messages:
+                    pushed = list(mailbox.messages.values())
+                    mailbox.messages.clear()
+                    mailbox.event.clear()
+                    
+                    # Another waiter or reader may have claimed some first
+                    messages = await self._claim_messages(pushed)
+                    if messages:
+                        self.messages_pushed += len(messages)
+                        return messages
+                    continue
+                
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                
+                try:
+                    await asyncio.wait_for(
+                        mailbox.event.wait(),
+                        timeout=min(remaining, self.message_poll_interval)
+                    )
+                except asyncio.TimeoutError:
+                    # Commits by any other connection, this storage's writer included
+                    current = await self._data_version()
+                    if current != version:
+                        version = current
+                        messages = await self.get_messages(session_id)
+                        if messages:
+                            return messages
+            
+            return []
+            
+        finally:
+            mailbox.waiters -= 1
+            if not mailbox.waiters:
+                # Anything left is still unread in the database
+                self._mailboxes.pop(session_id, None)
+    
+    async def _claim_messages(
+        self,
+        messages: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Mark messages read, keeping only those no one else read first."""
         async with self._lock:
             if not self._db:
                 raise ShannonError("Registry storage not initialized")
             
             now = datetime.now(timezone.utc).isoformat()
+            ids = [message["id"] for message in messages]
+            claimed = set()
             
-            # Get messages for this session or broadcast messages
-            if unread_only:
-                cursor = await self._db.execute("""
-                    SELECT * FROM messages 
-                    WHERE (to_session = ? OR to_session IS NULL)
-                    AND read_at IS NULL
-                    AND expires_at > ?
-                    ORDER BY created_at
-                """, (session_id, now))
-            else:
-                cursor = await self._db.execute("""
-                    SELECT * FROM messages 
-                    WHERE (to_session = ? OR to_session IS NULL)
-                    AND expires_at > ?
-                    ORDER BY created_at
-                """, (session_id, now))
-            
-            rows = await cursor.fetchall()
-            columns = [desc[0] for desc in cursor.description]
-            
-            messages = []
-            message_ids = []
-            
-            for row in rows:
-                data = dict(zip(columns, row))
-                data["payload"] = json.loads(data["payload"])
-                messages.append(data)
-                message_ids.append(data["id"])
-            
-            # Mark messages as read
-            if unread_only and message_ids:
-                placeholders = ','.join('?' * len(message_ids))
-                await self._db.execute(f"""
+            for offset in range(0, len(ids), 500):
+                chunk = ids[offset:offset + 500]
+                placeholders = ','.join('?' * len(chunk))
+                cursor = await self._db.execute(f"""
                     UPDATE messages 
                     SET read_at = ?
-                    WHERE id IN ({placeholders})
-                """, [now] + message_ids)
+                    WHERE id IN ({placeholders}) AND read_at IS NULL
+                    RETURNING id
+                """, [now] + chunk)
+                claimed.update(row[0] for row in await cursor.fetchall())
                 
-                await self._db.commit()
+            await self._db.commit()
             
-            return messages
+        result = []
+        for message in messages:
+            if message["id"] in claimed:
+                message["read_at"] = now
+                result.append(message)
+        
+        return result
     
     async def cleanup_expired_messages(self) -> int:
         """
@@ -707,12 +1064,14 @@ class RegistryStorage:
         Returns:
             Number of messages removed
         """
+        removed = await self._expire_messages()
+        
         async with self._lock:
             if not self._db:
                 raise ShannonError("Registry storage not initialized")
             
+            # Messages sent by other processes never entered our wheel
             now = datetime.now(timezone.utc).isoformat()
-            
             cursor = await self._db.execute(
                 "DELETE FROM messages WHERE expires_at < ?",
                 (now,)
@@ -720,7 +1079,53 @@ class RegistryStorage:
             
             await self._db.commit()
             
-            return cursor.rowcount
+            removed += cursor.rowcount
+        
+        return removed
+    
+    async def _expire_messages(self) -> int:
+        """Delete the messages whose deadline has passed on the wheel."""
+        expired = self._message_expiry.advance()
+        if not expired:
+            return 0
+        
+        for mailbox in self._mailboxes.values():
+            for message_id in expired:
+                mailbox.messages.pop(message_id, None)
+        
+        removed = 0
+        async with self._lock:
+            if not self._db:
+                raise ShannonError("Registry storage not initialized")
+            
+            for offset in range(0, len(expired), 500):
+                chunk = expired[offset:offset + 500]
+                placeholders = ','.join('?' * len(chunk))
+                cursor = await self._db.execute(
+                    f"DELETE FROM messages WHERE id IN ({placeholders})",
+                    chunk
+                )
+                removed += cursor.rowcount
+            
+            await self._db.commit()
+        
+        self.messages_expired += removed
+        return removed
+    
+    async def _expiry_loop(self) -> None:
+        """Expire messages tick by tick while any are scheduled."""
+        while not self._closing:
+            if not self._message_expiry:
+                self._expiry_event.clear()
+                await self._expiry_event.wait()
+                continue
+            
+            await asyncio.sleep(self._message_expiry.tick)
+            
+            try:
+                await self._expire_messages()
+            except Exception as e:
+                logger.error(f"Failed to expire messages: {e}")
     
     async def get_process_history(
         self,
@@ -735,43 +1140,42 @@ class RegistryStorage:
             pid: Optional PID filter
             session_id: Optional session filter
             limit: Maximum entries to return
-            
+        
         Returns:
             List of history entries
         """
-        async with self._lock:
-            if not self._db:
-                raise ShannonError("Registry storage not initialized")
-            
-            query = "SELECT * FROM process_history WHERE 1=1"
-            params = []
-            
-            if pid:
-                query += " AND pid = ?"
-                params.append(pid)
-            
-            if session_id:
-                query += " AND session_id = ?"
-                params.append(session_id)
-            
-            query += " ORDER BY event_time DESC LIMIT ?"
-            params.append(limit)
-            
-            cursor = await self._db.execute(query, params)
-            rows = await cursor.fetchall()
-            columns = [desc[0] for desc in cursor.description]
-            
-            history = []
-            for row in rows:
-                data = dict(zip(columns, row))
-                if data.get("details"):
-                    try:
-                        data["details"] = json.loads(data["details"])
-                    except:
-                        pass
-                history.append(data)
-            
-            return history
+        if not self._read_db:
+            raise ShannonError("Registry storage not initialized")
+        
+        query = "SELECT * FROM process_history WHERE 1=1"
+        params = []
+        
+        if pid:
+            query += " AND pid = ?"
+            params.append(pid)
+        
+        if session_id:
+            query += " AND session_id = ?"
+            params.append(session_id)
+        
+        query += " ORDER BY event_time DESC LIMIT ?"
+        params.append(limit)
+        
+        cursor = await self._read_db.execute(query, params)
+        rows = await cursor.fetchall()
+        columns = [desc[0] for desc in cursor.description]
+        
+        history = []
+        for row in rows:
+            data = dict(zip(columns, row))
+            if data.get("details"):
+                try:
+                    data["details"] = json.loads(data["details"])
+                except:
+                    pass
+            history.append(data)
+        
+        return history
     
     async def _update_process(self, entry: ProcessEntry) -> None:
         """Update an existing process entry."""
@@ -822,9 +1226,91 @@ class RegistryStorage:
             old_status, new_status, details
         ))
     
+    def _apply_to_table(self, batch: List[ProcessUpdate], last_seen: str) -> None:
+        """Mirror a committed batch into the process table."""
+        seen = datetime.fromisoformat(last_seen)
+        
+        for update in batch:
+            entry = self._table.get((update.pid, update.host))
+            if entry is None:
+                continue
+            
+            entry.last_seen = seen
+            if update.status is not None:
+                entry.status = update.status
+            if update.metadata:
+                entry.metadata = dict(update.metadata)
+            if update.cpu_percent is not None:
+                entry.cpu_percent = update.cpu_percent
+            if update.memory_mb is not None:
+                entry.memory_mb = update.memory_mb
+            if update.disk_read_mb is not None:
+                entry.disk_read_mb = update.disk_read_mb
+            if update.disk_write_mb is not None:
+                entry.disk_write_mb = update.disk_write_mb
+            
+            self._table.reindex(entry)
+    
+    async def _record_history_many(self, rows: List[Tuple]) -> None:
+        """Record several history events with one statement."""
+        if not rows:
+            return
+        
+        await self._db.executemany("""
+            INSERT INTO process_history (
+                pid, host, session_id, event_type, event_time,
+                old_status, new_status, details
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get write batching, table and messaging statistics."""
+        return {
+            "pending_updates": len(self._pending),
+            "batches_committed": self.batches_committed,
+            "updates_committed": self.updates_committed,
+            "last_batch_size": self.last_batch_size,
+            "last_commit_ms": self.last_commit_ms,
+            "table_rows": len(self._table),
+            "table_reloads": self.table_reloads,
+            "mailboxes": len(self._mailboxes),
+            "messages_pushed": self.messages_pushed,
+            "messages_expired": self.messages_expired,
+            "messages_scheduled": len(self._message_expiry),
+            "avg_batch_size": (
+                self.updates_committed / self.batches_committed
+                if self.batches_committed else 0.0
+            )
+        }
+    
     async def close(self) -> None:
-        """Close database connection."""
+        """Flush queued updates and close database connections."""
+        if self._writer_task:
+            self._closing = True
+            self._pending_event.set()
+            self._batch_full.set()
+            await self._writer_task
+            self._writer_task = None
+        
+        if self._expiry_task:
+            self._expiry_task.cancel()
+            try:
+                await self._expiry_task
+            except asyncio.CancelledError:
+                pass
+            self._expiry_task = None
+        
+        # Release waiters; they see _closing and return
+        for mailbox in self._mailboxes.values():
+            mailbox.event.set()
+        
+        if self._read_db:
+            await self._read_db.close()
+            self._read_db = None
+        
         async with self._lock:
+            self._table.clear()
+            self._table_revision = None
             if self._db:
                 await self._db.close()
                 self._db = None
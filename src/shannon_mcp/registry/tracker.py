@@ -14,7 +14,10 @@ import json
 
 from ..utils.logging import get_logger
 from ..utils.errors import ShannonError
-from .storage import RegistryStorage, ProcessEntry, ProcessStatus
+from ..utils.process_watcher import ProcessExitWatcher, get_exit_watcher
+from ..utils.scheduler import Activity, AdaptiveScheduler, get_scheduler
+from .storage import RegistryStorage, ProcessEntry, ProcessStatus, ProcessUpdate
+from .scanner import ClaudeProcessScanner
 
 logger = get_logger(__name__)
 
@@ -122,50 +125,84 @@ class ProcessInfo:
 class ProcessTracker:
     """Tracks system processes and Claude sessions."""
     
-    def __init__(self, storage: RegistryStorage):
+    def __init__(
+        self,
+        storage: RegistryStorage,
+        exit_watcher: Optional[ProcessExitWatcher] = None,
+        scanner: Optional[ClaudeProcessScanner] = None
+    ):
         """
         Initialize process tracker.
         
         Args:
             storage: Registry storage instance
+            exit_watcher: Exit watcher (defaults to the shared one)
+            scanner: Claude process scanner, shared with the validator and
+                cleaner through this tracker
         """
         self.storage = storage
         self.hostname = os.uname().nodename
         
         # Track known PIDs
         self._tracked_pids: Set[int] = set()
-        self._tracking_task: Optional[asyncio.Task] = None
-        self._stop_event = asyncio.Event()
+        
+        # Tracking passes run on the shared adaptive scheduler
+        self._scheduler: Optional[AdaptiveScheduler] = None
+        self._tracking_job = f"process_tracker.{id(self):x}"
+        self._tracking_interval = 30
+        
+        # Exits are pushed by the watcher rather than found by polling
+        self._exit_watcher = exit_watcher
+        self.exits_detected = 0
+        
+        # Incremental Claude process discovery
+        self.scanner = scanner or ClaudeProcessScanner()
+        
+    @property
+    def exit_watcher(self) -> ProcessExitWatcher:
+        """Exit watcher used for tracked processes."""
+        if self._exit_watcher is None:
+            self._exit_watcher = get_exit_watcher()
+        return self._exit_watcher
         
     async def start_tracking(self, interval_seconds: int = 30) -> None:
         """
         Start background process tracking.
         
+        The interval backs off while tracked processes and the set of Claude
+        processes stay unchanged, and returns to `interval_seconds` when
+        either changes.
+        
         Args:
             interval_seconds: Tracking interval
         """
-        if self._tracking_task and not self._tracking_task.done():
+        if self._scheduler and self._scheduler.has_job(self._tracking_job):
             logger.warning("Process tracking already running")
             return
         
-        self._stop_event.clear()
-        self._tracking_task = asyncio.create_task(
-            self._tracking_loop(interval_seconds)
+        # Exits are pushed from here on; no per-pass liveness scan
+        try:
+            await self._watch_registered_processes()
+        except Exception as e:
+            logger.error(f"Failed to watch registered processes: {e}")
+        
+        self._tracking_interval = interval_seconds
+        self._scheduler = get_scheduler()
+        self._scheduler.add_job(
+            self._tracking_job,
+            self._tracking_pass,
+            interval=interval_seconds,
+            start_after=0
         )
         logger.info(f"Started process tracking with {interval_seconds}s interval")
     
     async def stop_tracking(self) -> None:
         """Stop background process tracking."""
-        if not self._tracking_task:
+        if not self._scheduler:
             return
         
-        self._stop_event.set()
-        
-        try:
-            await asyncio.wait_for(self._tracking_task, timeout=5.0)
-        except asyncio.TimeoutError:
-            logger.warning("Tracking task didn't stop gracefully, cancelling")
-            self._tracking_task.cancel()
+        await self._scheduler.remove_job(self._tracking_job)
+        self._scheduler = None
         
         logger.info("Stopped process tracking")
     
@@ -217,6 +254,10 @@ class ProcessTracker:
             
             # Add to tracked PIDs
             self._tracked_pids.add(pid)
+            self.exit_watcher.watch(
+                pid, self._on_process_exit,
+                create_time=info.create_time.timestamp()
+            )
             
             logger.info(f"Started tracking process {pid} for session {session_id}")
             return entry
@@ -233,10 +274,35 @@ class ProcessTracker:
         """
         if pid in self._tracked_pids:
             self._tracked_pids.remove(pid)
+            self.exit_watcher.unwatch(pid, self._on_process_exit)
             
         await self.storage.remove_process(pid, self.hostname)
         logger.info(f"Stopped tracking process {pid}")
     
+    async def _on_process_exit(self, pid: int) -> None:
+        """Mark a registered process stopped as soon as it exits."""
+        self._tracked_pids.discard(pid)
+        self.exits_detected += 1
+        
+        await self.storage.update_process_status(
+            pid, self.hostname, ProcessStatus.STOPPED
+        )
+        logger.info(f"Registered process {pid} exited")
+    
+    async def _watch_registered_processes(self) -> None:
+        """Watch every live process registered for this host."""
+        processes = await self.storage.get_all_processes(host=self.hostname)
+        
+        for entry in processes:
+            if entry.status in (ProcessStatus.STOPPED, ProcessStatus.CRASHED):
+                continue
+            
+            # Dead or reused PIDs are reported immediately
+            self.exit_watcher.watch(
+                entry.pid, self._on_process_exit,
+                create_time=entry.started_at.timestamp()
+            )
+    
     async def get_process_info(self, pid: int) -> Optional[ProcessInfo]:
         """
         Get detailed process information.
@@ -253,25 +319,40 @@ class ProcessTracker:
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             return None
     
-    async def find_claude_processes(self) -> List[ProcessInfo]:
+    async def find_claude_processes(
+        self,
+        exclude: Optional[Set[int]] = None,
+        max_age: float = 0.0
+    ) -> List[ProcessInfo]:
         """
         Find all Claude Code processes on the system.
         
+        Only PIDs new since the previous scan are classified; details are
+        gathered in a worker thread for the Claude processes alone.
+        
+        Args:
+            exclude: PIDs to leave out of the result
+            max_age: Reuse a scan at most this many seconds old
+        
         Returns:
             List of Claude process info
         """
-        claude_processes = []
+        claude = await self.scanner.refresh(max_age)
+        pids = [pid for pid in claude if not exclude or pid not in exclude]
         
-        for process in psutil.process_iter(['pid', 'name', 'cmdline']):
+        return await asyncio.to_thread(self._collect_process_info, pids)
+    
+    def _collect_process_info(self, pids: List[int]) -> List[ProcessInfo]:
+        """Build process info for PIDs, skipping ones that have exited."""
+        infos = []
+        
+        for pid in pids:
             try:
-                # Check if it's a Claude process
-                if self._is_claude_process(process):
-                    info = ProcessInfo.from_psutil(process)
-                    claude_processes.append(info)
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                infos.append(ProcessInfo.from_psutil(psutil.Process(pid)))
+            except (psutil.NoSuchProcess, psutil.AccessDenied, ShannonError):
                 continue
         
-        return claude_processes
+        return infos
     
     async def validate_tracked_processes(self) -> Dict[str, List[int]]:
         """
@@ -308,10 +389,10 @@ class ProcessTracker:
                 dead.append(entry.pid)
         
         # Update status for dead processes
-        for pid in dead:
-            await self.storage.update_process_status(
-                pid, self.hostname, ProcessStatus.STOPPED
-            )
+        await self.storage.apply_updates(
+            ProcessUpdate(pid=pid, host=self.hostname, status=ProcessStatus.STOPPED)
+            for pid in dead
+        )
         
         return {'alive': alive, 'dead': dead}
     
@@ -376,27 +457,6 @@ class ProcessTracker:
             }
         }
     
-    def _is_claude_process(self, process: psutil.Process) -> bool:
-        """Check if a process is Claude Code."""
-        try:
-            name = process.info.get('name', '').lower()
-            cmdline = process.info.get('cmdline', [])
-            
-            # Check process name
-            if 'claude' in name:
-                return True
-            
-            # Check command line
-            if cmdline:
-                cmd_str = ' '.join(cmdline).lower()
-                if 'claude' in cmd_str or 'claude-code' in cmd_str:
-                    return True
-            
-            return False
-            
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            return False
-    
     def _map_status(self, psutil_status: str) -> ProcessStatus:
         """Map psutil status to ProcessStatus."""
         mapping = {
@@ -423,38 +483,28 @@ class ProcessTracker:
                         pass
         return None
     
-    async def _tracking_loop(self, interval: int) -> None:
-        """Background tracking loop."""
-        while not self._stop_event.is_set():
-            try:
-                # Update tracked processes
-                await self._update_tracked_processes()
-                
-                # Validate processes
-                validation = await self.validate_tracked_processes()
-                if validation['dead']:
-                    logger.info(f"Found {len(validation['dead'])} dead processes")
-                
-                # Clean up stale entries
-                stale_count = await self.storage.cleanup_stale_processes(
-                    stale_threshold_seconds=interval * 10  # 10x interval
-                )
+    async def _tracking_pass(self) -> Activity:
+        """Run one tracking pass."""
+        # Update tracked processes
+        await self._update_tracked_processes()
+        
+        # Keep the Claude process cache warm so lookups stay incremental
+        previous = self.scanner.claude_pids
+        await self.scanner.refresh()
                 
-                # Wait for next iteration
-                await asyncio.wait_for(
-                    self._stop_event.wait(),
-                    timeout=interval
-                )
+        # Clean up stale entries
+        stale_count = await self.storage.cleanup_stale_processes(
+            stale_threshold_seconds=self._tracking_interval * 10  # 10x interval
+        )
                 
-            except asyncio.TimeoutError:
-                # Expected timeout - continue loop
-                continue
-            except Exception as e:
-                logger.error(f"Error in tracking loop: {e}")
-                await asyncio.sleep(5)  # Brief pause before retry
+        return Activity(
+            changed=bool(stale_count) or self.scanner.claude_pids != previous
+        )
     
     async def _update_tracked_processes(self) -> None:
         """Update resource usage for tracked processes."""
+        updates: List[ProcessUpdate] = []
+        
         for pid in list(self._tracked_pids):
             try:
                 process = psutil.Process(pid)
@@ -478,16 +528,6 @@ class ProcessTracker:
                     disk_read_mb = io_counters.read_bytes / (1024 * 1024)
                     disk_write_mb = io_counters.write_bytes / (1024 * 1024)
                 
-                # Update in storage
-                await self.storage.update_process_resources(
-                    pid=pid,
-                    host=self.hostname,
-                    cpu_percent=cpu_percent,
-                    memory_mb=memory_info.rss / (1024 * 1024),
-                    disk_read_mb=disk_read_mb,
-                    disk_write_mb=disk_write_mb
-                )
-                
                 # Update status based on CPU usage
                 if cpu_percent > 50:
                     status = ProcessStatus.BUSY
@@ -496,15 +536,24 @@ class ProcessTracker:
                 else:
                     status = ProcessStatus.IDLE
                 
-                await self.storage.update_process_status(
-                    pid, self.hostname, status
-                )
+                updates.append(ProcessUpdate(
+                    pid=pid,
+                    host=self.hostname,
+                    status=status,
+                    cpu_percent=cpu_percent,
+                    memory_mb=memory_info.rss / (1024 * 1024),
+                    disk_read_mb=disk_read_mb,
+                    disk_write_mb=disk_write_mb
+                ))
                 
             except psutil.NoSuchProcess:
                 # Process no longer exists
                 self._tracked_pids.remove(pid)
-                await self.storage.update_process_status(
-                    pid, self.hostname, ProcessStatus.STOPPED
-                )
+                updates.append(ProcessUpdate(
+                    pid=pid, host=self.hostname, status=ProcessStatus.STOPPED
+                ))
             except Exception as e:
-                logger.warning(f"Failed to update process {pid}: {e}")
\ No newline at end of file
+                logger.warning(f"Failed to update process {pid}: {e}")
+        
+        # One group commit for the whole pass
+        await self.storage.apply_updates(updates)
\ No newline at end of file
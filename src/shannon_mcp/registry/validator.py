@@ -384,18 +384,14 @@ class ProcessValidator:
         Returns:
             List of orphaned process info
         """
-        # Get all Claude processes
-        all_claude = await self.tracker.find_claude_processes()
-        
         # Get registered PIDs
         registered = await self.storage.get_all_processes(host=self.hostname)
         registered_pids = {p.pid for p in registered}
         
-        # Find orphans
-        orphans = [
-            p for p in all_claude
-            if p.pid not in registered_pids
-        ]
+        # Only unregistered Claude processes are looked at in detail
+        orphans = await self.tracker.find_claude_processes(
+            exclude=registered_pids
+        )
         
         if orphans:
             logger.warning(f"Found {len(orphans)} orphaned Claude processes")
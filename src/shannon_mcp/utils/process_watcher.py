@@ -0,0 +1,299 @@
+"""
+Process exit watching for Shannon MCP Server.
+
+This module pushes process-exit events instead of polling every record:
+- pidfd (Linux 5.3+) registered with the event loop as a readable fd
+- A single polling task where pidfd is unavailable
+- Per-PID callbacks plus listeners that see every exit
+"""
+
+import asyncio
+import inspect
+import os
+import weakref
+import psutil
+from typing import Optional, Dict, Any, List, Callable, Sequence, Set
+
+from .logging import get_logger
+
+
+logger = get_logger("shannon-mcp.process-watcher")
+
+# Called with the PID that exited; may be a coroutine function
+ExitCallback = Callable[[int], Any]
+
+BACKEND_PIDFD = "pidfd"
+BACKEND_POLL = "poll"
+DEFAULT_BACKENDS = (BACKEND_PIDFD, BACKEND_POLL)
+
+# Creation times closer than this are the same process
+CREATE_TIME_TOLERANCE = 1.0
+
+
+class _Watch:
+    """Watch state for one PID."""
+
+    __slots__ = ("pid", "backend", "callbacks", "fd", "proc")
+
+    def __init__(self, pid: int, backend: str):
+        self.pid = pid
+        self.backend = backend
+        self.callbacks: List[ExitCallback] = []
+        self.fd: Optional[int] = None
+        self.proc: Optional[psutil.Process] = None
+
+
+class ProcessExitWatcher:
+    """Delivers process-exit events for watched PIDs as soon as they happen."""
+
+    def __init__(
+        self,
+        poll_interval: float = 5.0,
+        backends: Sequence[str] = DEFAULT_BACKENDS
+    ):
+        """
+        Initialize watcher.
+
+        Args:
+            poll_interval: Seconds between checks for PIDs on the poll backend
+            backends: Backends to try for each PID, in order
+        """
+        self.poll_interval = poll_interval
+        self.backends = tuple(backends)
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._watches: Dict[int, _Watch] = {}
+        self._listeners: List[ExitCallback] = []
+
+        # Poll backend
+        self._poll_task: Optional[asyncio.Task] = None
+
+        # Dispatch tasks kept alive until they finish
+        self._dispatches: Set[asyncio.Task] = set()
+
+        # Statistics
+        self.exits_delivered = 0
+        self.poll_passes = 0
+
+    def add_listener(self, callback: ExitCallback) -> None:
+        """
+        Receive every exit of every watched PID.
+
+        Listeners run after the PID's own callbacks.
+
+        Args:
+            callback: Called with the exited PID
+        """
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback: ExitCallback) -> None:
+        """Stop delivering exits to a listener."""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def is_watching(self, pid: int) -> bool:
+        """Whether an exit callback is registered for a PID."""
+        return pid in self._watches
+
+    def backend_for(self, pid: int) -> Optional[str]:
+        """Backend used for a watched PID."""
+        watch = self._watches.get(pid)
+        return watch.backend if watch else None
+
+    def watch(
+        self,
+        pid: int,
+        callback: ExitCallback,
+        create_time: Optional[float] = None
+    ) -> None:
+        """
+        Call `callback(pid)` once when the process exits.
+
+        Must be called from the event loop. If the process is already gone,
+        or `create_time` shows the PID now belongs to a different process,
+        the callback is scheduled right away.
+
+        Args:
+            pid: Process ID to watch
+            callback: Called with the PID on exit
+            create_time: Expected creation time (epoch seconds) to detect reuse
+        """
+        self._loop = asyncio.get_running_loop()
+
+        watch = self._watches.get(pid)
+        if watch is not None:
+            if callback not in watch.callbacks:
+                watch.callbacks.append(callback)
+            return
+
+        try:
+            proc = psutil.Process(pid)
+            if create_time is not None and abs(proc.create_time() - create_time) > CREATE_TIME_TOLERANCE:
+                raise psutil.NoSuchProcess(pid)
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            watch = _Watch(pid, "exited")
+            watch.callbacks.append(callback)
+            self._watches[pid] = watch
+            self._loop.call_soon(self._exited, pid)
+            return
+        except psutil.AccessDenied:
+            proc = None
+
+        for backend in self.backends:
+            watch = _Watch(pid, backend)
+            watch.proc = proc
+            if self._start_backend(watch):
+                break
+        else:
+            raise ValueError(f"No usable exit-watch backend for PID {pid}")
+
+        watch.callbacks.append(callback)
+        self._watches[pid] = watch
+
+        logger.debug("process_exit_watch_started", pid=pid, backend=watch.backend)
+
+    def unwatch(self, pid: int, callback: Optional[ExitCallback] = None) -> None:
+        """
+        Stop watching a PID.
+
+        Args:
+            pid: Process ID
+            callback: Only remove this callback (default: all callbacks)
+        """
+        watch = self._watches.get(pid)
+        if watch is None:
+            return
+
+        if callback is not None:
+            if callback in watch.callbacks:
+                watch.callbacks.remove(callback)
+            if watch.callbacks:
+                return
+
+        self._release(watch)
+
+    def close(self) -> None:
+        """Stop watching everything."""
+        for watch in list(self._watches.values()):
+            self._release(watch)
+        if self._poll_task:
+            self._poll_task.cancel()
+            self._poll_task = None
+
+    def _start_backend(self, watch: _Watch) -> bool:
+        """Arm one backend for a PID; False if it is unavailable."""
+        if watch.backend == BACKEND_PIDFD:
+            if not hasattr(os, "pidfd_open"):
+                return False
+            try:
+                fd = os.pidfd_open(watch.pid)
+            except ProcessLookupError:
+                # Exited between the psutil check and pidfd_open
+                self._loop.call_soon(self._exited, watch.pid)
+                return True
+            except OSError:
+                return False
+
+            try:
+                self._loop.add_reader(fd, self._exited, watch.pid)
+            except (NotImplementedError, ValueError, OSError):
+                os.close(fd)
+                return False
+
+            watch.fd = fd
+            return True
+
+        if watch.backend == BACKEND_POLL:
+            if self._poll_task is None or self._poll_task.done():
+                self._poll_task = self._loop.create_task(self._poll_loop())
+            return True
+
+        return False
+
+    async def _poll_loop(self) -> None:
+        """Check PIDs on the poll backend until none remain."""
+        while any(w.backend == BACKEND_POLL for w in self._watches.values()):
+            await asyncio.sleep(self.poll_interval)
+            self.poll_passes += 1
+
+            for watch in list(self._watches.values()):
+                if watch.backend == BACKEND_POLL and not self._is_alive(watch):
+                    self._exited(watch.pid)
+
+    def _is_alive(self, watch: _Watch) -> bool:
+        """Whether a polled process is still running (and not a zombie)."""
+        try:
+            if watch.proc is None:
+                return psutil.pid_exists(watch.pid)
+            # is_running() compares creation times, catching PID reuse
+            return watch.proc.is_running() and watch.proc.status() != psutil.STATUS_ZOMBIE
+        except psutil.NoSuchProcess:
+            return False
+        except psutil.Error:
+            return True
+
+    def _release(self, watch: _Watch) -> None:
+        """Drop a watch and free its backend resources."""
+        self._watches.pop(watch.pid, None)
+        if watch.fd is not None:
+            try:
+                self._loop.remove_reader(watch.fd)
+            except Exception:
+                pass
+            os.close(watch.fd)
+            watch.fd = None
+
+    def _exited(self, pid: int) -> None:
+        """Backend notification that a PID exited."""
+        watch = self._watches.get(pid)
+        if watch is None:
+            # Unwatched while a notification was in flight
+            return
+
+        self._release(watch)
+        self.exits_delivered += 1
+
+        task = self._loop.create_task(self._dispatch(pid, watch.callbacks))
+        self._dispatches.add(task)
+        task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, pid: int, callbacks: List[ExitCallback]) -> None:
+        """Run PID callbacks, then listeners, in order."""
+        for callback in list(callbacks) + list(self._listeners):
+            try:
+                result = callback(pid)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error("process_exit_callback_failed", pid=pid, error=str(e))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get watcher statistics."""
+        by_backend: Dict[str, int] = {}
+        for watch in self._watches.values():
+            by_backend[watch.backend] = by_backend.get(watch.backend, 0) + 1
+
+        return {
+            "watched": len(self._watches),
+            "by_backend": by_backend,
+            "listeners": len(self._listeners),
+            "exits_delivered": self.exits_delivered,
+            "poll_passes": self.poll_passes
+        }
+
+
+# One shared watcher per event loop
+_watchers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ProcessExitWatcher]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_exit_watcher() -> ProcessExitWatcher:
+    """Get the shared exit watcher for the running event loop."""
+    loop = asyncio.get_running_loop()
+    watcher = _watchers.get(loop)
+    if watcher is None:
+        watcher = ProcessExitWatcher()
+        _watchers[loop] = watcher
+    return watcher
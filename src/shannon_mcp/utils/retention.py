@@ -0,0 +1,351 @@
+"""
+Tiered retention for SQLite audit data in Shannon MCP Server.
+
+This module keeps append-mostly history cheap to expire with:
+- One table per UTC day, so retention is a DROP TABLE instead of a DELETE
+- Expired days rolled up into compact summary rows before they are dropped
+- Free pages returned by PRAGMA incremental_vacuum in short, adaptive slices
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Optional, Dict, Any, List, Sequence, Tuple
+
+import aiosqlite
+
+from .logging import get_logger
+
+
+logger = get_logger("shannon-mcp.retention")
+
+# PRAGMA auto_vacuum value for INCREMENTAL
+AUTO_VACUUM_INCREMENTAL = 2
+
+
+@dataclass
+class PartitionSummary:
+    """
+    How a day partition is rolled up before it is dropped.
+    
+    Attributes:
+        table: Summary table name
+        columns: Column definitions for the summary table (must include
+            a `day TEXT NOT NULL` column)
+        rollup: INSERT ... SELECT statement; `{partition}` is replaced by
+            the partition table name and the single `?` is bound to the day
+    """
+    table: str
+    columns: str
+    rollup: str
+
+
+class DailyPartitionedTable:
+    """
+    A logical table stored as one SQLite table per UTC day.
+    
+    Partitions are named `<name>_pYYYYMMDD` and created on first write.
+    Rows are routed by the timestamp passed to insert(); reads that need the
+    whole history go through count() or a UNION over partitions().
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        columns: str,
+        indexes: Sequence[str] = (),
+        summary: Optional[PartitionSummary] = None,
+        time_column: Optional[str] = None
+    ):
+        """
+        Initialize partitioned table.
+        
+        Args:
+            name: Logical table name (also the name of any legacy table)
+            columns: Column definitions shared by every partition
+            indexes: Columns to index in each partition
+            summary: Rollup applied to partitions before they are dropped
+            time_column: Timestamp column used to split a legacy table
+        """
+        self.name = name
+        self.columns = columns
+        self.indexes = tuple(indexes)
+        self.summary = summary
+        self.time_column = time_column
+        
+        self._db: Optional[aiosqlite.Connection] = None
+        self._partitions: Dict[date, str] = {}
+        
+        # Statistics
+        self.partitions_dropped = 0
+        self.rows_compacted = 0
+    
+    def table_for(self, day: date) -> str:
+        """Partition table name for a day."""
+        return f"{self.name}_p{day:%Y%m%d}"
+    
+    def partitions(self) -> List[Tuple[date, str]]:
+        """Existing partitions, oldest first."""
+        return sorted(self._partitions.items())
+    
+    async def create(self, db: aiosqlite.Connection) -> None:
+        """
+        Attach to a connection and discover existing partitions.
+        
+        A legacy unpartitioned table with the logical name is split into
+        day partitions (one commit per day) and then dropped.
+        
+        Args:
+            db: Database connection
+        """
+        self._db = db
+        self._partitions.clear()
+        
+        if self.summary:
+            await db.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.summary.table} ({self.summary.columns})"
+            )
+            await db.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.summary.table}_day "
+                f"ON {self.summary.table}(day)"
+            )
+        
+        pattern = f"{self.name}_p" + "[0-9]" * 8
+        cursor = await db.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name GLOB ?",
+            (pattern,)
+        )
+        for (table,) in await cursor.fetchall():
+            day = datetime.strptime(table[-8:], "%Y%m%d").date()
+            self._partitions[day] = table
+        
+        await db.commit()
+        
+        await self._split_legacy_table()
+    
+    async def insert(self, values: Dict[str, Any], when: datetime) -> None:
+        """
+        Insert a row into the partition for its day (no commit).
+        
+        Args:
+            values: Column values
+            when: Row timestamp, selecting the partition
+        """
+        table = await self._ensure_partition(when.date())
+        columns = ", ".join(values)
+        placeholders = ", ".join("?" * len(values))
+        await self._db.execute(
+            f"INSERT INTO {table} ({columns}) VALUES ({placeholders})",
+            tuple(values.values())
+        )
+    
+    async def count(self) -> int:
+        """Total rows across all partitions."""
+        total = 0
+        for _, table in self.partitions():
+            cursor = await self._db.execute(f"SELECT COUNT(*) FROM {table}")
+            row = await cursor.fetchone()
+            total += row[0] if row else 0
+        return total
+    
+    async def compact(
+        self,
+        retention_days: int,
+        summary_retention_days: Optional[int] = None,
+        today: Optional[date] = None
+    ) -> int:
+        """
+        Roll up and drop partitions older than the retention period.
+        
+        Each partition is summarized and dropped in its own short
+        transaction, yielding to the event loop in between.
+        
+        Args:
+            retention_days: Days of raw rows to keep
+            summary_retention_days: Days of summary rows to keep (None keeps all)
+            today: Current UTC day (defaults to today)
+        
+        Returns:
+            Number of raw rows compacted
+        """
+        today = today or datetime.utcnow().date()
+        cutoff = today - timedelta(days=retention_days)
+        compacted = 0
+        
+        for day, table in self.partitions():
+            if day >= cutoff:
+                break
+            
+            cursor = await self._db.execute(f"SELECT COUNT(*) FROM {table}")
+            rows = (await cursor.fetchone())[0]
+            
+            if self.summary and rows:
+                await self._db.execute(
+                    self.summary.rollup.format(partition=table),
+                    (day.isoformat(),)
+                )
+            await self._db.execute(f"DROP TABLE {table}")
+            await self._db.commit()
+            
+            del self._partitions[day]
+            compacted += rows
+            self.partitions_dropped += 1
+            self.rows_compacted += rows
+            
+            await asyncio.sleep(0)
+        
+        if self.summary and summary_retention_days is not None:
+            summary_cutoff = today - timedelta(days=summary_retention_days)
+            await self._db.execute(
+                f"DELETE FROM {self.summary.table} WHERE day < ?",
+                (summary_cutoff.isoformat(),)
+            )
+            await self._db.commit()
+        
+        return compacted
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get partition statistics."""
+        days = sorted(self._partitions)
+        return {
+            "partitions": len(days),
+            "oldest_day": days[0].isoformat() if days else None,
+            "newest_day": days[-1].isoformat() if days else None,
+            "partitions_dropped": self.partitions_dropped,
+            "rows_compacted": self.rows_compacted
+        }
+    
+    async def _ensure_partition(self, day: date) -> str:
+        """Create the partition for a day if needed."""
+        table = self._partitions.get(day)
+        if table is not None:
+            return table
+        
+        table = self.table_for(day)
+        await self._db.execute(f"CREATE TABLE IF NOT EXISTS {table} ({self.columns})")
+        for column in self.indexes:
+            await self._db.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{table}_{column} ON {table}({column})"
+            )
+        
+        self._partitions[day] = table
+        return table
+    
+    async def _split_legacy_table(self) -> None:
+        """Move rows of an unpartitioned table into day partitions."""
+        cursor = await self._db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (self.name,)
+        )
+        if not await cursor.fetchone():
+            return
+        
+        if not self.time_column:
+            logger.warning("legacy_table_not_split", table=self.name)
+            return
+        
+        cursor = await self._db.execute(
+            f"SELECT DISTINCT substr({self.time_column}, 1, 10) FROM {self.name}"
+        )
+        days = [row[0] for row in await cursor.fetchall() if row[0]]
+        
+        for value in days:
+            day = date.fromisoformat(value)
+            table = await self._ensure_partition(day)
+            await self._db.execute(
+                f"INSERT OR IGNORE INTO {table} SELECT * FROM {self.name} "
+                f"WHERE substr({self.time_column}, 1, 10) = ?",
+                (value,)
+            )
+            await self._db.commit()
+            await asyncio.sleep(0)
+        
+        await self._db.execute(f"DROP TABLE {self.name}")
+        await self._db.commit()
+        
+        logger.info("legacy_table_split", table=self.name, days=len(days))
+
+
+async def enable_incremental_vacuum(db: aiosqlite.Connection) -> bool:
+    """
+    Switch a database to incremental auto-vacuum where possible.
+    
+    The mode can only change before the first table is created; an
+    existing database keeps its mode until the next full VACUUM.
+    
+    Args:
+        db: Database connection
+    
+    Returns:
+        True if incremental auto-vacuum is active
+    """
+    if await _auto_vacuum_mode(db) == AUTO_VACUUM_INCREMENTAL:
+        return True
+    
+    await db.execute("PRAGMA auto_vacuum = INCREMENTAL")
+    return await _auto_vacuum_mode(db) == AUTO_VACUUM_INCREMENTAL
+
+
+async def incremental_vacuum(
+    db: aiosqlite.Connection,
+    slice_ms: float = 5.0,
+    max_pages: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Return free pages to the filesystem in short slices.
+    
+    Pages per slice grow while slices finish well under `slice_ms` and
+    shrink when one runs over, so no slice holds the write lock for long.
+    Other tasks run between slices.
+    
+    Args:
+        db: Database connection (auto_vacuum must be INCREMENTAL)
+        slice_ms: Target duration of one slice in milliseconds
+        max_pages: Stop after freeing this many pages (None frees all)
+    
+    Returns:
+        Pages freed, slices run and the longest slice in milliseconds
+    """
+    pages = 16
+    freed = 0
+    slices = 0
+    longest_ms = 0.0
+    
+    while max_pages is None or freed < max_pages:
+        free = await _pragma_int(db, "freelist_count")
+        if free == 0:
+            break
+        
+        step = min(pages, free)
+        if max_pages is not None:
+            step = min(step, max_pages - freed)
+        
+        start = time.perf_counter()
+        cursor = await db.execute(f"PRAGMA incremental_vacuum({step})")
+        # The pragma frees one page per step; drain it to finish the slice
+        await cursor.fetchall()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        
+        freed += free - await _pragma_int(db, "freelist_count")
+        slices += 1
+        longest_ms = max(longest_ms, elapsed_ms)
+        
+        if elapsed_ms < slice_ms / 2:
+            pages *= 2
+        elif elapsed_ms > slice_ms:
+            pages = max(1, pages // 2)
+        
+        await asyncio.sleep(0)
+    
+    return {"pages_freed": freed, "slices": slices, "longest_slice_ms": longest_ms}
+
+
+async def _auto_vacuum_mode(db: aiosqlite.Connection) -> int:
+    return await _pragma_int(db, "auto_vacuum")
+
+
+async def _pragma_int(db: aiosqlite.Connection, name: str) -> int:
+    cursor = await db.execute(f"PRAGMA {name}")
+    row = await cursor.fetchone()
+    return row[0] if row else 0
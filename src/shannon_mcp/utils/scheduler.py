@@ -0,0 +1,337 @@
+"""
+Adaptive periodic scheduling for Shannon MCP Server.
+
+This module runs background monitoring passes from one shared driver with:
+- All periodic jobs on a single timing wheel, so nearby deadlines share a wakeup
+- Exponential back-off while a job reports no change
+- Tighter intervals as reported pressure approaches an alert threshold
+- Tighter intervals while a job's recent runs are failing
+"""
+
+import asyncio
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, Callable, Awaitable, Set
+
+from .logging import get_logger
+from .stats import SlidingWindow
+from .timer_wheel import TimingWheel
+
+
+logger = get_logger("shannon-mcp.scheduler")
+
+
+@dataclass
+class Activity:
+    """
+    What a periodic job saw on its last run.
+    
+    Attributes:
+        changed: Something worth watching closely happened (state changes,
+            cleanups, new alerts)
+        pressure: Closeness to an alert threshold; 1.0 means the threshold
+            is reached (for example usage / alert level)
+    """
+    changed: bool = False
+    pressure: float = 0.0
+
+
+# A job is one monitoring pass; returning None means "nothing changed"
+JobFunc = Callable[[], Awaitable[Optional[Activity]]]
+
+
+@dataclass
+class AdaptiveInterval:
+    """Interval policy that backs off when idle and tightens under pressure."""
+    base: float
+    minimum: float
+    maximum: float
+    backoff: float = 2.0
+    approach: float = 0.75  # Pressure at which tightening starts
+    current: float = field(init=False)
+    
+    def __post_init__(self):
+        """Start at the base interval."""
+        if not 0 < self.minimum <= self.base <= self.maximum:
+            raise ValueError("Intervals must satisfy 0 < minimum <= base <= maximum")
+        self.current = self.base
+    
+    def next(self, activity: Activity, error_rate: float = 0.0) -> float:
+        """
+        Pick the interval before the next run.
+        
+        Args:
+            activity: What the last run reported
+            error_rate: Share of recent runs that failed (counts as pressure)
+        
+        Returns:
+            Seconds until the next run
+        """
+        pressure = max(activity.pressure, error_rate)
+        
+        if pressure >= 1.0:
+            self.current = self.minimum
+            return self.current
+        
+        if activity.changed:
+            interval = self.base
+        else:
+            interval = min(self.maximum, self.current * self.backoff)
+        
+        if pressure > self.approach:
+            # Slide from base at `approach` down to minimum at the threshold
+            fraction = (1.0 - pressure) / (1.0 - self.approach)
+            interval = min(interval, self.minimum + (self.base - self.minimum) * fraction)
+        
+        self.current = max(self.minimum, interval)
+        return self.current
+
+
+class _Job:
+    """A registered periodic job."""
+    
+    __slots__ = (
+        "name", "func", "policy", "window", "task",
+        "runs", "errors", "last_run", "last_duration_ms"
+    )
+    
+    def __init__(self, name: str, func: JobFunc, policy: AdaptiveInterval):
+        self.name = name
+        self.func = func
+        self.policy = policy
+        self.window = SlidingWindow(span=policy.base * 10, slots=10)
+        self.task: Optional[asyncio.Task] = None
+        self.runs = 0
+        self.errors = 0
+        self.last_run: Optional[float] = None
+        self.last_duration_ms = 0.0
+
+
+class AdaptiveScheduler:
+    """Runs periodic jobs from a single driver task on a shared timing wheel."""
+    
+    def __init__(
+        self,
+        slack: float = 0.5,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize scheduler.
+        
+        Args:
+            slack: Jobs due within this many seconds of a wakeup run in it
+            clock: Monotonic time source
+        """
+        self.slack = slack
+        self.clock = clock
+        
+        self._jobs: Dict[str, _Job] = {}
+        self._wheel: TimingWheel[str] = TimingWheel(tick=slack, clock=clock)
+        self._wakeup = asyncio.Event()
+        self._driver: Optional[asyncio.Task] = None
+        self._running: Set[asyncio.Task] = set()
+        
+        # Statistics
+        self.wakeups = 0
+        self.runs = 0
+    
+    def add_job(
+        self,
+        name: str,
+        func: JobFunc,
+        interval: float,
+        min_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        backoff: float = 2.0,
+        approach: float = 0.75,
+        start_after: Optional[float] = None
+    ) -> None:
+        """
+        Register a periodic job.
+        
+        Must be called from the event loop.
+        
+        Args:
+            name: Unique job name
+            func: Coroutine function running one pass
+            interval: Interval while activity is normal
+            min_interval: Interval at an alert threshold (default interval / 4)
+            max_interval: Longest idle back-off (default interval * 8)
+            backoff: Growth factor per idle run
+            approach: Pressure at which the interval starts to shrink
+            start_after: Delay before the first run (default one interval)
+        """
+        if name in self._jobs:
+            raise ValueError(f"Job already scheduled: {name}")
+        
+        policy = AdaptiveInterval(
+            base=interval,
+            minimum=min_interval if min_interval is not None else interval / 4,
+            maximum=max_interval if max_interval is not None else interval * 8,
+            backoff=backoff,
+            approach=approach
+        )
+        self._jobs[name] = _Job(name, func, policy)
+        
+        delay = interval if start_after is None else start_after
+        self._wheel.schedule(name, self.clock() + delay)
+        self._ensure_driver()
+        
+        logger.debug("job_scheduled", job=name, interval=interval)
+    
+    async def remove_job(self, name: str, timeout: float = 5.0) -> None:
+        """
+        Unregister a job, letting a run in progress finish.
+        
+        Args:
+            name: Job name
+            timeout: Seconds to wait for a running pass before cancelling it
+        """
+        job = self._jobs.pop(name, None)
+        if job is None:
+            return
+        
+        self._wheel.cancel(name)
+        self._wakeup.set()
+        
+        if job.task and not job.task.done():
+            try:
+                await asyncio.wait_for(asyncio.shield(job.task), timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.warning("job_stop_timeout", job=name)
+                job.task.cancel()
+            except Exception:
+                pass
+    
+    def has_job(self, name: str) -> bool:
+        """Whether a job is registered."""
+        return name in self._jobs
+    
+    def interval(self, name: str) -> Optional[float]:
+        """Current interval of a job."""
+        job = self._jobs.get(name)
+        return job.policy.current if job else None
+    
+    def wake(self, name: str) -> None:
+        """
+        Run a job as soon as possible.
+        
+        The job's interval drops back to its base, as after a change.
+        """
+        job = self._jobs.get(name)
+        if job is None:
+            return
+        
+        job.policy.current = min(job.policy.current, job.policy.base)
+        if job.task is None:
+            self._wheel.schedule(name, self.clock())
+            self._wakeup.set()
+    
+    async def close(self) -> None:
+        """Cancel the driver and every job."""
+        for name in list(self._jobs):
+            await self.remove_job(name, timeout=0)
+        
+        if self._driver:
+            self._driver.cancel()
+            try:
+                await self._driver
+            except asyncio.CancelledError:
+                pass
+            self._driver = None
+    
+    def _ensure_driver(self) -> None:
+        """Start the driver task if it is not running."""
+        if self._driver is None or self._driver.done():
+            self._driver = asyncio.get_running_loop().create_task(self._drive())
+    
+    async def _drive(self) -> None:
+        """Sleep until the next deadline, then start every job due by then."""
+        while self._jobs:
+            due = self._wheel.advance(self.clock() + self.slack)
+            if due:
+                self.wakeups += 1
+            
+            for name in due:
+                job = self._jobs.get(name)
+                if job is not None:
+                    job.task = asyncio.create_task(self._execute(job))
+                    self._running.add(job.task)
+                    job.task.add_done_callback(self._running.discard)
+            
+            self._wakeup.clear()
+            deadline = self._wheel.next_deadline()
+            timeout = None if deadline is None else max(0.0, deadline - self.clock())
+            
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+    
+    async def _execute(self, job: _Job) -> None:
+        """Run one pass and schedule the next from what it reported."""
+        start = self.clock()
+        error = False
+        activity: Optional[Activity] = None
+        
+        try:
+            activity = await job.func()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = True
+            job.errors += 1
+            logger.error("scheduled_job_failed", job=job.name, error=str(e))
+        finally:
+            job.task = None
+        
+        now = self.clock()
+        job.runs += 1
+        job.last_run = now
+        job.last_duration_ms = (now - start) * 1000
+        self.runs += 1
+        
+        job.window.record(now, error=error, latency=job.last_duration_ms)
+        error_rate = job.window.errors / job.window.count if job.window.count else 0.0
+        
+        interval = job.policy.next(activity or Activity(), error_rate)
+        
+        # Removed while running
+        if self._jobs.get(job.name) is job:
+            self._wheel.schedule(job.name, now + interval)
+            self._wakeup.set()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler statistics."""
+        return {
+            "jobs": {
+                name: {
+                    "interval": job.policy.current,
+                    "runs": job.runs,
+                    "errors": job.errors,
+                    "running": job.task is not None,
+                    "last_duration_ms": job.last_duration_ms
+                }
+                for name, job in self._jobs.items()
+            },
+            "wakeups": self.wakeups,
+            "runs": self.runs,
+            "coalesced_runs": max(0, self.runs - self.wakeups)
+        }
+
+
+# One shared scheduler per event loop
+_schedulers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AdaptiveScheduler]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_scheduler() -> AdaptiveScheduler:
+    """Get the shared scheduler for the running event loop."""
+    loop = asyncio.get_running_loop()
+    scheduler = _schedulers.get(loop)
+    if scheduler is None:
+        scheduler = AdaptiveScheduler()
+        _schedulers[loop] = scheduler
+    return scheduler
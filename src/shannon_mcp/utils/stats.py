@@ -0,0 +1,452 @@
+"""
+Lightweight statistics primitives for Shannon MCP Server.
+
+This module provides in-process instrumentation helpers with:
+- Fixed-bucket histograms with O(log buckets) observation
+- Approximate quantiles without retaining samples
+- Time-slotted sliding windows with O(1) amortized updates
+- Array-backed ring buffers with O(1) windowed means and peaks
+- Dictionary snapshots suitable for get_stats() payloads
+"""
+
+from array import array
+from bisect import bisect_left
+from collections import deque
+from typing import Dict, Any, List, Optional, Sequence, Deque, Tuple
+
+
+# Default latency bounds in milliseconds (roughly x2.5 steps)
+DEFAULT_LATENCY_BUCKETS_MS: Sequence[float] = (
+    0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000
+)
+
+# Default bounds for counts such as queue depths
+DEFAULT_COUNT_BUCKETS: Sequence[float] = (
+    1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000
+)
+
+
+def _bucket_quantile(
+    bounds: Sequence[float],
+    counts: Sequence[int],
+    count: int,
+    q: float,
+    maximum: Optional[float]
+) -> Optional[float]:
+    """Estimate a quantile as the upper bound of the bucket containing it."""
+    if not count:
+        return None
+    
+    rank = q * count
+    seen = 0
+    for index, bucket_count in enumerate(counts):
+        seen += bucket_count
+        if seen >= rank and bucket_count:
+            if index < len(bounds):
+                return min(bounds[index], maximum) if maximum is not None else bounds[index]
+            return maximum
+    return maximum
+
+
+class Histogram:
+    """Fixed-bucket histogram with running count, sum, min and max."""
+    
+    __slots__ = ("bounds", "counts", "count", "total", "min", "max")
+    
+    def __init__(self, bounds: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS):
+        """
+        Initialize histogram.
+        
+        Args:
+            bounds: Sorted inclusive upper bounds; an overflow bucket is implied
+        """
+        self.bounds: List[float] = sorted(bounds)
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+    
+    def observe(self, value: float) -> None:
+        """Record a single observation."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+    
+    @property
+    def mean(self) -> float:
+        """Mean of all observations."""
+        return self.total / self.count if self.count else 0.0
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile from bucket counts.
+        
+        Args:
+            q: Quantile in [0, 1]
+        
+        Returns:
+            Upper bound of the bucket containing the quantile (clamped to
+            the observed max), or None if empty
+        """
+        return _bucket_quantile(self.bounds, self.counts, self.count, q, self.max)
+    
+    def reset(self) -> None:
+        """Clear all observations."""
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for stats reporting."""
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.mean,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": {
+                **{
+                    f"le_{bound:g}": bucket_count
+                    for bound, bucket_count in zip(self.bounds, self.counts)
+                },
+                "le_inf": self.counts[-1]
+            }
+        }
+
+
+class SlidingWindow:
+    """
+    Event counts, failures and latency distribution over a trailing span.
+    
+    The span is split into a ring of fixed-width slots. Recording an event
+    touches only its slot and the running window totals; slots are expired
+    lazily as time advances, so updates are O(1) amortized and no samples
+    are retained.
+    """
+    
+    __slots__ = (
+        "span", "slots", "slot_width", "bounds", "_head",
+        "_counts", "_errors", "_latency_counts", "_latency_sums", "_latency_max", "_bins",
+        "count", "errors", "latency_count", "latency_total", "bins"
+    )
+    
+    def __init__(
+        self,
+        span: float,
+        slots: int = 60,
+        bounds: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS
+    ):
+        """
+        Initialize sliding window.
+        
+        Args:
+            span: Window length in seconds
+            slots: Number of ring slots; resolution is span / slots
+            bounds: Latency histogram bucket bounds
+        """
+        self.span = span
+        self.slots = slots
+        self.slot_width = span / slots
+        self.bounds: List[float] = sorted(bounds)
+        self._head: Optional[int] = None
+        
+        # Per-slot values
+        self._counts: List[int] = [0] * slots
+        self._errors: List[int] = [0] * slots
+        self._latency_counts: List[int] = [0] * slots
+        self._latency_sums: List[float] = [0.0] * slots
+        self._latency_max: List[Optional[float]] = [None] * slots
+        self._bins: List[List[int]] = [[0] * (len(self.bounds) + 1) for _ in range(slots)]
+        
+        # Running totals across live slots
+        self.count = 0
+        self.errors = 0
+        self.latency_count = 0
+        self.latency_total = 0.0
+        self.bins: List[int] = [0] * (len(self.bounds) + 1)
+    
+    def _advance(self, now: float) -> int:
+        """Move the head to now, expiring slots that left the window."""
+        slot = int(now // self.slot_width)
+        if self._head is None:
+            self._head = slot
+        elif slot > self._head:
+            # Clear the ring positions the new slots will reuse; a gap
+            # longer than the window clears every slot exactly once
+            for absolute in range(max(self._head + 1, slot - self.slots + 1), slot + 1):
+                self._expire(absolute % self.slots)
+            self._head = slot
+        return slot
+    
+    def _expire(self, index: int) -> None:
+        """Remove a slot's values from the running totals."""
+        if not self._counts[index]:
+            return
+        
+        self.count -= self._counts[index]
+        self.errors -= self._errors[index]
+        self.latency_count -= self._latency_counts[index]
+        self.latency_total -= self._latency_sums[index]
+        
+        slot_bins = self._bins[index]
+        for bucket, bucket_count in enumerate(slot_bins):
+            if bucket_count:
+                self.bins[bucket] -= bucket_count
+                slot_bins[bucket] = 0
+        
+        self._counts[index] = 0
+        self._errors[index] = 0
+        self._latency_counts[index] = 0
+        self._latency_sums[index] = 0.0
+        self._latency_max[index] = None
+    
+    def record(self, now: float, error: bool = False, latency: Optional[float] = None) -> None:
+        """
+        Record a single event.
+        
+        Args:
+            now: Event time in seconds on a monotonic clock
+            error: Whether the event was a failure
+            latency: Optional latency observation
+        """
+        slot = self._advance(now)
+        if slot <= self._head - self.slots:
+            return  # Older than the window
+        
+        index = slot % self.slots
+        self._counts[index] += 1
+        self.count += 1
+        
+        if error:
+            self._errors[index] += 1
+            self.errors += 1
+        
+        if latency is not None:
+            bucket = bisect_left(self.bounds, latency)
+            self._bins[index][bucket] += 1
+            self.bins[bucket] += 1
+            self._latency_counts[index] += 1
+            self._latency_sums[index] += latency
+            self.latency_count += 1
+            self.latency_total += latency
+            if self._latency_max[index] is None or latency > self._latency_max[index]:
+                self._latency_max[index] = latency
+    
+    def snapshot(self, now: float) -> Dict[str, Any]:
+        """
+        Summarize the window as of now.
+        
+        Args:
+            now: Current time in seconds on the same clock as record()
+        
+        Returns:
+            Counts, per-second rates and approximate latency quantiles
+        """
+        self._advance(now)
+        
+        # Only the max needs a scan, and snapshots are infrequent
+        maximum = max((m for m in self._latency_max if m is not None), default=None)
+        
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "rate_per_sec": self.count / self.span,
+            "error_rate": self.errors / self.count if self.count else 0.0,
+            "latency_mean_ms": self.latency_total / self.latency_count if self.latency_count else None,
+            "latency_max_ms": maximum,
+            "latency_p50_ms": _bucket_quantile(self.bounds, self.bins, self.latency_count, 0.50, maximum),
+            "latency_p95_ms": _bucket_quantile(self.bounds, self.bins, self.latency_count, 0.95, maximum),
+            "latency_p99_ms": _bucket_quantile(self.bounds, self.bins, self.latency_count, 0.99, maximum)
+        }
+
+
+class RingBuffer:
+    """
+    Fixed-capacity ring of timestamped float samples.
+    
+    Values and timestamps live in preallocated array('d') storage, so
+    appends never allocate or shift. A parallel ring of running prefix sums
+    makes the mean of any suffix O(1), time windows registered up front
+    keep a start cursor that only moves forward (O(1) amortized), and a
+    monotonic deque tracks the peak of the retained samples in O(1).
+    
+    Timestamps are expected to be non-decreasing; earlier ones are clamped
+    to the latest seen.
+    """
+    
+    __slots__ = (
+        "capacity", "_values", "_times", "_prefix", "_count",
+        "_peaks", "_window_starts"
+    )
+    
+    def __init__(self, capacity: int, windows: Sequence[float] = ()):
+        """
+        Initialize ring buffer.
+        
+        Args:
+            capacity: Maximum number of retained samples
+            windows: Time spans (seconds) whose means should be O(1)
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        
+        self.capacity = capacity
+        self._values = array('d', bytes(8 * capacity))
+        self._times = array('d', bytes(8 * capacity))
+        
+        # _prefix[i % (capacity + 1)] is the sum of every value up to
+        # sequence i; the extra slot keeps the sum just before the oldest
+        # retained sample
+        self._prefix = array('d', bytes(8 * (capacity + 1)))
+        self._count = 0  # Total samples ever appended
+        
+        # (sequence, value) pairs with strictly decreasing values
+        self._peaks: Deque[Tuple[int, float]] = deque()
+        
+        # Span -> sequence number of the oldest sample inside the window
+        self._window_starts: Dict[float, int] = {span: 0 for span in windows}
+    
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+    
+    @property
+    def _first(self) -> int:
+        """Sequence number of the oldest retained sample."""
+        return max(0, self._count - self.capacity)
+    
+    def _prefix_at(self, seq: int) -> float:
+        """Sum of values up to and including seq (0.0 for seq < 0)."""
+        return self._prefix[seq % (self.capacity + 1)] if seq >= 0 else 0.0
+    
+    def _range_sum(self, start: int, end: int) -> float:
+        """Sum of values for retained sequences in [start, end)."""
+        if end <= start:
+            return 0.0
+        return self._prefix_at(end - 1) - self._prefix_at(start - 1)
+    
+    def append(self, value: float, timestamp: float) -> None:
+        """
+        Add a sample, evicting the oldest one when full.
+        
+        Args:
+            value: Sample value
+            timestamp: Sample time in seconds (e.g. epoch or monotonic)
+        """
+        seq = self._count
+        index = seq % self.capacity
+        
+        if seq and timestamp < self._times[(seq - 1) % self.capacity]:
+            timestamp = self._times[(seq - 1) % self.capacity]
+        
+        self._prefix[seq % (self.capacity + 1)] = self._prefix_at(seq - 1) + value
+        self._values[index] = value
+        self._times[index] = timestamp
+        self._count = seq + 1
+        
+        # Drop the evicted sample from the peak deque
+        evicted = seq - self.capacity
+        if self._peaks and self._peaks[0][0] <= evicted:
+            self._peaks.popleft()
+        
+        while self._peaks and self._peaks[-1][1] <= value:
+            self._peaks.pop()
+        self._peaks.append((seq, value))
+    
+    def last(self) -> Optional[float]:
+        """Most recent value, or None if empty."""
+        if not self._count:
+            return None
+        return self._values[(self._count - 1) % self.capacity]
+    
+    def mean(self) -> Optional[float]:
+        """Mean of all retained samples."""
+        if not self._count:
+            return None
+        return self._range_sum(self._first, self._count) / len(self)
+    
+    def mean_last(self, n: int, skip: int = 0) -> Optional[float]:
+        """
+        Mean of the n samples preceding the most recent `skip` samples.
+        
+        Args:
+            n: Number of samples to average
+            skip: Number of newest samples to exclude
+        
+        Returns:
+            Mean, or None if no samples fall in the range
+        """
+        end = self._count - skip
+        start = max(self._first, end - n)
+        if end <= start:
+            return None
+        return self._range_sum(start, end) / (end - start)
+    
+    def window_mean(self, span: float, now: float) -> Optional[float]:
+        """
+        Mean of samples with timestamp >= now - span.
+        
+        Registered spans are O(1) amortized; others fall back to a binary
+        search over the retained samples.
+        
+        Args:
+            span: Window length in seconds
+            now: Current time on the same clock as the timestamps
+        
+        Returns:
+            Mean, or None if no samples fall in the window
+        """
+        cutoff = now - span
+        start = self._window_starts.get(span)
+        
+        if start is None:
+            start = self._bisect_time(cutoff)
+        else:
+            start = max(start, self._first)
+            while start < self._count and self._times[start % self.capacity] < cutoff:
+                start += 1
+            self._window_starts[span] = start
+        
+        if start >= self._count:
+            return None
+        return self._range_sum(start, self._count) / (self._count - start)
+    
+    def _bisect_time(self, cutoff: float) -> int:
+        """First retained sequence whose timestamp is >= cutoff."""
+        low, high = self._first, self._count
+        while low < high:
+            mid = (low + high) // 2
+            if self._times[mid % self.capacity] < cutoff:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+    
+    def peak(self) -> Optional[Tuple[float, float]]:
+        """
+        Largest retained value and its timestamp.
+        
+        Returns:
+            (value, timestamp), or None if empty
+        """
+        if not self._peaks:
+            return None
+        seq, value = self._peaks[0]
+        return value, self._times[seq % self.capacity]
+    
+    def values(self) -> List[float]:
+        """Retained values, oldest first."""
+        return [self._values[seq % self.capacity] for seq in range(self._first, self._count)]
+    
+    def timestamps(self) -> List[float]:
+        """Retained timestamps, oldest first."""
+        return [self._times[seq % self.capacity] for seq in range(self._first, self._count)]
@@ -0,0 +1,238 @@
+"""
+Indexed in-memory tables for Shannon MCP Server.
+
+This module provides a keyed record table with:
+- O(1) lookup by primary key
+- Maintained secondary indexes (one bucket per distinct value)
+- Unique indexes that map a value straight to one row
+- Filtered listings that intersect index buckets instead of scanning
+"""
+
+from typing import (
+    Optional, Dict, Any, List, Callable, Hashable, Iterator, Tuple,
+    Sequence, TypeVar, Generic
+)
+
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class IndexedTable(Generic[V]):
+    """
+    Primary-keyed rows with secondary indexes kept in step on every change.
+
+    Rows are stored by reference. After changing an indexed attribute of a
+    stored row in place, call reindex() so its index entries move with it.
+    Supports the read-only dict protocol plus item assignment and pop().
+    """
+
+    def __init__(
+        self,
+        key: Callable[[V], Hashable],
+        indexes: Dict[str, Callable[[V], Hashable]],
+        unique: Sequence[str] = ()
+    ):
+        """
+        Initialize table.
+
+        Args:
+            key: Extracts the primary key from a row
+            indexes: Index name to value extractor
+            unique: Index names whose values identify at most one row
+                (the most recently written row wins)
+        """
+        self._key = key
+        self._extractors = dict(indexes)
+        self._unique = set(unique)
+
+        unknown = self._unique - set(self._extractors)
+        if unknown:
+            raise ValueError(f"Unique index without extractor: {sorted(unknown)}")
+
+        self._rows: Dict[Hashable, V] = {}
+
+        # Index values as of the last write, so stale entries can be removed
+        self._row_values: Dict[Hashable, Dict[str, Hashable]] = {}
+
+        # value -> ordered set of keys (dict used as an ordered set)
+        self._buckets: Dict[str, Dict[Hashable, Dict[Hashable, None]]] = {
+            name: {} for name in self._extractors if name not in self._unique
+        }
+        # value -> key
+        self._unique_maps: Dict[str, Dict[Hashable, Hashable]] = {
+            name: {} for name in self._unique
+        }
+
+    # Mapping protocol
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._rows)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._rows
+
+    def __getitem__(self, key: Hashable) -> V:
+        return self._rows[key]
+
+    def __setitem__(self, key: Hashable, row: V) -> None:
+        if self._key(row) != key:
+            raise KeyError(f"Row key {self._key(row)!r} does not match {key!r}")
+        self.put(row)
+
+    def get(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        """Get a row by primary key."""
+        return self._rows.get(key, default)
+
+    def keys(self):
+        """Primary keys in insertion order."""
+        return self._rows.keys()
+
+    def values(self):
+        """Rows in insertion order."""
+        return self._rows.values()
+
+    def items(self):
+        """(key, row) pairs in insertion order."""
+        return self._rows.items()
+
+    # Writes
+
+    def put(self, row: V) -> None:
+        """Insert a row, or replace the row with the same primary key."""
+        key = self._key(row)
+        if key in self._rows:
+            self._unindex(key)
+        self._rows[key] = row
+        self._index(key, row)
+
+    def pop(self, key: Hashable, default: Any = _MISSING) -> V:
+        """Remove and return a row by primary key."""
+        if key not in self._rows:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+
+        self._unindex(key)
+        return self._rows.pop(key)
+
+    def reindex(self, row: V) -> None:
+        """Move a stored row's index entries after it was changed in place."""
+        key = self._key(row)
+        if self._rows.get(key) is not row:
+            return
+
+        old = self._row_values[key]
+        for name, extract in self._extractors.items():
+            value = extract(row)
+            if old[name] != value:
+                self._remove_entry(name, old[name], key)
+                self._add_entry(name, value, key)
+                old[name] = value
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        self._rows.clear()
+        self._row_values.clear()
+        for buckets in self._buckets.values():
+            buckets.clear()
+        for mapping in self._unique_maps.values():
+            mapping.clear()
+
+    # Queries
+
+    def lookup(self, index: str, value: Hashable) -> Optional[V]:
+        """Get the row holding a value in a unique index."""
+        key = self._unique_maps[index].get(value)
+        return self._rows.get(key) if key is not None else None
+
+    def count(self, index: str, value: Hashable) -> int:
+        """Count rows with a value in an index."""
+        if index in self._unique:
+            return 1 if value in self._unique_maps[index] else 0
+        return len(self._buckets[index].get(value, ()))
+
+    def find(self, **criteria: Any) -> List[V]:
+        """
+        List rows matching every given index value.
+
+        Criteria set to None are ignored. The smallest matching bucket is
+        walked and checked against the others, so cost follows the most
+        selective criterion rather than the table size.
+
+        Args:
+            **criteria: Index name to required value
+
+        Returns:
+            Matching rows, in insertion order of the smallest bucket
+        """
+        filters = [(name, value) for name, value in criteria.items() if value is not None]
+        if not filters:
+            return list(self._rows.values())
+
+        candidates: List[Tuple[int, str, Any]] = []
+        for name, value in filters:
+            if name in self._unique:
+                key = self._unique_maps[name].get(value)
+                keys = {key: None} if key is not None else {}
+            else:
+                keys = self._buckets[name].get(value, {})
+            if not keys:
+                return []
+            candidates.append((len(keys), name, keys))
+
+        candidates.sort(key=lambda candidate: candidate[0])
+        _, _, smallest = candidates[0]
+        rest = [(name, keys) for _, name, keys in candidates[1:]]
+
+        return [
+            self._rows[key]
+            for key in smallest
+            if all(key in keys for _, keys in rest)
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get table statistics."""
+        return {
+            "rows": len(self._rows),
+            "indexes": {
+                name: len(self._unique_maps[name]) if name in self._unique
+                else len(self._buckets[name])
+                for name in self._extractors
+            }
+        }
+
+    # Index maintenance
+
+    def _index(self, key: Hashable, row: V) -> None:
+        values = {name: extract(row) for name, extract in self._extractors.items()}
+        self._row_values[key] = values
+        for name, value in values.items():
+            self._add_entry(name, value, key)
+
+    def _unindex(self, key: Hashable) -> None:
+        for name, value in self._row_values.pop(key).items():
+            self._remove_entry(name, value, key)
+
+    def _add_entry(self, name: str, value: Hashable, key: Hashable) -> None:
+        if name in self._unique:
+            self._unique_maps[name][value] = key
+        else:
+            self._buckets[name].setdefault(value, {})[key] = None
+
+    def _remove_entry(self, name: str, value: Hashable, key: Hashable) -> None:
+        if name in self._unique:
+            mapping = self._unique_maps[name]
+            # A newer row may have claimed the value since
+            if mapping.get(value) == key:
+                del mapping[value]
+        else:
+            bucket = self._buckets[name].get(value)
+            if bucket is not None:
+                bucket.pop(key, None)
+                if not bucket:
+                    del self._buckets[name][value]
@@ -0,0 +1,148 @@
+"""
+Timing wheel for Shannon MCP Server.
+
+This module provides deadline tracking for many keys with:
+- O(1) schedule and cancel
+- Expiry that only visits the slots for the elapsed ticks
+- Deadlines beyond one rotation kept in place until their round comes
+"""
+
+import time
+from typing import Optional, Dict, Hashable, List, Callable, Tuple, TypeVar, Generic
+
+
+K = TypeVar("K", bound=Hashable)
+
+
+class TimingWheel(Generic[K]):
+    """
+    Hashed timing wheel keyed by arbitrary hashable keys.
+    
+    Deadlines are absolute times on the wheel's clock. Keys are bucketed by
+    the tick their deadline falls in, so advancing the wheel touches only the
+    buckets for the ticks that passed rather than every scheduled key.
+    """
+    
+    def __init__(
+        self,
+        tick: float = 1.0,
+        slots: int = 512,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize wheel.
+        
+        Args:
+            tick: Seconds covered by one slot (expiry granularity)
+            slots: Number of slots in one rotation
+            clock: Time source the deadlines refer to
+        """
+        if tick <= 0 or slots <= 0:
+            raise ValueError("tick and slots must be positive")
+        
+        self.tick = tick
+        self.clock = clock
+        self._slots: List[Dict[K, float]] = [{} for _ in range(slots)]
+        
+        # key -> (deadline, slot index)
+        self._entries: Dict[K, Tuple[float, int]] = {}
+        
+        # Last tick whose slot holds nothing that is due
+        self._done = self._tick_of(clock()) - 1
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, key: K) -> bool:
+        return key in self._entries
+    
+    def deadline(self, key: K) -> Optional[float]:
+        """Deadline of a scheduled key."""
+        entry = self._entries.get(key)
+        return entry[0] if entry else None
+    
+    def next_deadline(self) -> Optional[float]:
+        """
+        Earliest scheduled deadline.
+        
+        Scans every key, so it suits wheels holding a handful of entries
+        (such as periodic jobs) rather than large expiry sets.
+        """
+        return min((deadline for deadline, _ in self._entries.values()), default=None)
+    
+    def schedule(self, key: K, deadline: float) -> None:
+        """
+        Schedule a key, replacing any earlier deadline for it.
+        
+        Args:
+            key: Key to expire
+            deadline: Absolute expiry time on the wheel's clock
+        """
+        self.cancel(key)
+        
+        # Deadlines already passed land in the next slot to be visited
+        tick = max(self._tick_of(deadline), self._done + 1)
+        index = tick % len(self._slots)
+        self._slots[index][key] = deadline
+        self._entries[key] = (deadline, index)
+    
+    def cancel(self, key: K) -> bool:
+        """
+        Remove a scheduled key.
+        
+        Returns:
+            True if the key was scheduled
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        
+        del self._slots[entry[1]][key]
+        return True
+    
+    def advance(self, now: Optional[float] = None) -> List[K]:
+        """
+        Pop every key whose deadline has passed.
+        
+        Args:
+            now: Current time (defaults to the wheel's clock)
+        
+        Returns:
+            Expired keys in deadline order
+        """
+        if now is None:
+            now = self.clock()
+        
+        target = self._tick_of(now)
+        if target <= self._done:
+            return []
+        
+        if target - self._done >= len(self._slots):
+            # A whole rotation or more passed; every slot is due
+            visit = range(len(self._slots))
+        else:
+            visit = (tick % len(self._slots) for tick in range(self._done + 1, target + 1))
+        
+        expired = []
+        for index in visit:
+            slot = self._slots[index]
+            for key, deadline in list(slot.items()):
+                if deadline <= now:
+                    del slot[key]
+                    del self._entries[key]
+                    expired.append((deadline, key))
+        
+        # The current tick may still hold deadlines later within it
+        self._done = target - 1
+        
+        expired.sort(key=lambda item: item[0])
+        return [key for _, key in expired]
+    
+    def clear(self) -> None:
+        """Remove all keys."""
+        for slot in self._slots:
+            slot.clear()
+        self._entries.clear()
+    
+    def _tick_of(self, when: float) -> int:
+        return int(when // self.tick)
@@ -12,7 +12,7 @@ from typing import List, Dict, Any
 import statistics
 import random
 
-from shannon_mcp.analytics.writer import MetricsWriter, MetricType
+from shannon_mcp.analytics.writer import MetricsWriter, MetricEntry, MetricType
 from shannon_mcp.analytics.parser import MetricsParser
 from shannon_mcp.analytics.aggregator import MetricsAggregator
 from shannon_mcp.analytics.reporter import ReportGenerator
@@ -457,4 +457,190 @@ class BenchmarkAnalyticsEndToEnd:
         # End-to-end should be performant
         assert results["throughput"] > 1000  # >1k metrics/second end-to-end
         
-        return results
\ No newline at end of file
+        return results
+
+
+class BenchmarkVectorizedAggregation:
+    """Benchmark the NumPy aggregation backend.
+    
+    The 10M-event run times the array kernels alone. The entry run
+    starts from MetricEntry lists, as the aggregator does, and reports
+    parsing and MetricArrays.from_metrics conversion as their own phases.
+    """
+    
+    EVENT_COUNT = 10_000_000
+    ENTRY_COUNT = 1_000_000
+    
+    STAGES = ("base_stats", "hourly", "daily", "by_session")
+    
+    @staticmethod
+    def _synthetic_arrays(count: int):
+        """Build metric arrays directly, skipping per-event object creation."""
+        np = pytest.importorskip("numpy")
+        from shannon_mcp.analytics.vectorized import MetricArrays
+        
+        rng = np.random.default_rng(42)
+        types = list(MetricType)
+        start_us = int(datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp() * 1_000_000)
+        week_us = 7 * 24 * 3600 * 1_000_000
+        
+        durations = rng.exponential(250.0, count)
+        durations[rng.random(count) < 0.3] = np.nan
+        
+        def codes(n_values: int, missing: float):
+            values = rng.integers(0, n_values, count)
+            values[rng.random(count) < missing] = -1
+            return values
+        
+        type_codes = rng.integers(0, len(types), count)
+        error_code = types.index(MetricType.ERROR_OCCURRED)
+        error_codes = np.where(type_codes == error_code, rng.integers(0, 5, count), -1)
+        
+        return MetricArrays(
+            timestamps_us=np.sort(rng.integers(start_us, start_us + week_us, count)),
+            type_codes=type_codes,
+            durations=durations,
+            duration_is_float=~np.isnan(durations),
+            tokens=np.where(rng.random(count) < 0.2, rng.integers(1, 5000, count), 0),
+            success=rng.choice(np.array([-1, 0, 1], dtype=np.int8), count),
+            session_codes=codes(10_000, 0.05),
+            user_codes=codes(100, 0.5),
+            tool_codes=codes(20, 0.6),
+            agent_codes=codes(10, 0.9),
+            error_codes=error_codes,
+            types=types,
+            sessions=[f"session_{i}" for i in range(10_000)],
+            users=[f"user_{i}" for i in range(100)],
+            tools=[f"tool_{i}" for i in range(20)],
+            agents=[f"agent_{i}" for i in range(10)],
+            error_types=[f"error_{i}" for i in range(5)]
+        )
+    
+    @staticmethod
+    def _metric_entries(count: int) -> List[MetricEntry]:
+        """Build MetricEntry objects shaped like tracked sessions."""
+        rng = random.Random(42)
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        week_seconds = 7 * 24 * 3600
+        
+        entries = []
+        for i in range(count):
+            roll = rng.random()
+            if roll < 0.5:
+                metric_type = MetricType.TOOL_USE
+                data = {
+                    "tool_name": f"tool_{rng.randrange(20)}",
+                    "duration_ms": rng.expovariate(1 / 250.0),
+                    "success": rng.random() < 0.95
+                }
+            elif roll < 0.8:
+                metric_type = MetricType.PERFORMANCE
+                data = {
+                    "operation": f"op_{rng.randrange(10)}",
+                    "duration_ms": rng.expovariate(1 / 50.0),
+                    "success": True
+                }
+            elif roll < 0.9:
+                metric_type = MetricType.ERROR_OCCURRED
+                data = {"error_type": f"error_{rng.randrange(5)}"}
+            else:
+                metric_type = MetricType.SESSION_END
+                data = {"duration_seconds": rng.randrange(1, 3600), "token_count": rng.randrange(1, 5000)}
+            
+            entries.append(MetricEntry(
+                id=str(i),
+                timestamp=start + timedelta(seconds=rng.randrange(week_seconds)),
+                type=metric_type,
+                session_id=f"session_{rng.randrange(10_000)}",
+                user_id=f"user_{rng.randrange(100)}" if rng.random() < 0.5 else None,
+                data=data,
+                metadata={}
+            ))
+        return entries
+    
+    def _run_stages(self, arrays, count: int) -> Dict[str, Any]:
+        """Time each vectorized aggregation stage over the same arrays."""
+        from shannon_mcp.analytics import vectorized
+        from shannon_mcp.analytics.aggregator import AggregationResult, AggregationType
+        
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = start + timedelta(days=7)
+        results = {}
+        
+        for name in self.STAGES:
+            aggregate = getattr(vectorized, f"aggregate_{name}")
+            result = AggregationResult(type=AggregationType.HOURLY, start_time=start, end_time=end)
+            
+            begin = time.perf_counter()
+            aggregate(arrays, result)
+            duration = time.perf_counter() - begin
+            
+            results[name] = {
+                "avg_time": duration,
+                "throughput": count / duration,
+                "result_size": len(result.time_series)
+            }
+        
+        return results
+    
+    @pytest.mark.benchmark
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_vectorized_aggregation_performance(self, benchmark=None):
+        """Benchmark the vectorized kernels over 10M prebuilt events."""
+        arrays = self._synthetic_arrays(self.EVENT_COUNT)
+        results = self._run_stages(arrays, self.EVENT_COUNT)
+        
+        # Every stage should sustain millions of events per second
+        for name, stats in results.items():
+            assert stats["throughput"] > 1_000_000, name
+        
+        # Arrays were built directly; see the entry benchmark for conversion
+        results["includes_conversion"] = False
+        return results
+    
+    @pytest.mark.benchmark
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_entry_aggregation_performance(self, benchmark=None):
+        """Benchmark aggregation from MetricEntry lists, conversion included."""
+        pytest.importorskip("numpy")
+        from shannon_mcp.analytics.parser import ParsedMetric
+        from shannon_mcp.analytics.vectorized import MetricArrays
+        
+        entries = self._metric_entries(self.ENTRY_COUNT)
+        
+        begin = time.perf_counter()
+        parsed = [ParsedMetric.from_entry(entry) for entry in entries]
+        parse_time = time.perf_counter() - begin
+        
+        # The per-event loop the aggregator runs before any kernel
+        begin = time.perf_counter()
+        arrays = MetricArrays.from_metrics(parsed)
+        conversion_time = time.perf_counter() - begin
+        assert arrays is not None
+        
+        results = self._run_stages(arrays, self.ENTRY_COUNT)
+        aggregation_time = sum(stats["avg_time"] for stats in results.values())
+        
+        results.update({
+            "events": self.ENTRY_COUNT,
+            "parse": {
+                "avg_time": parse_time,
+                "throughput": self.ENTRY_COUNT / parse_time
+            },
+            "conversion": {
+                "avg_time": conversion_time,
+                "throughput": self.ENTRY_COUNT / conversion_time
+            },
+            "end_to_end": {
+                "avg_time": conversion_time + aggregation_time,
+                "throughput": self.ENTRY_COUNT / (conversion_time + aggregation_time)
+            },
+            "conversion_share": conversion_time / (conversion_time + aggregation_time),
+            "includes_conversion": True
+        })
+        
+        assert results["end_to_end"]["throughput"] > 100_000
+        
+        return results
@@ -0,0 +1,256 @@
+"""
+End-to-end benchmarks for HookEngine.trigger.
+"""
+
+import pytest
+import asyncio
+import importlib.util
+import time
+import statistics
+from typing import List, Dict, Any, Optional
+
+from aiohttp import web
+
+from shannon_mcp.hooks.config import (
+    HookConfig, HookTrigger, HookAction, HookActionType, HookCondition
+)
+from shannon_mcp.hooks.engine import HookEngine
+from shannon_mcp.hooks.registry import HookRegistry
+
+
+PHASES = ("lookup", "conditions", "execution", "notification")
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of samples"""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _transform_type() -> Optional[str]:
+    """Transform backend available here, if any"""
+    if importlib.util.find_spec("jmespath"):
+        return "jmespath"
+    if importlib.util.find_spec("jsonpath_ng"):
+        return "json"
+    return None
+
+
+class _StandInWebhook:
+    """Local aiohttp server answering webhook calls"""
+    
+    def __init__(self):
+        self.requests = 0
+        self._runner = None
+        self.url = None
+    
+    async def start(self) -> None:
+        async def handle(request):
+            await request.read()
+            self.requests += 1
+            return web.json_response({"ok": True})
+        
+        app = web.Application()
+        app.router.add_post("/hook", handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        
+        port = self._runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}/hook"
+    
+    async def stop(self) -> None:
+        await self._runner.cleanup()
+
+
+class _TimedNotifications:
+    """Accumulate time spent in NotificationCenter.emit"""
+    
+    def __init__(self, engine: HookEngine):
+        self.elapsed = 0.0
+        emit = engine.notification_center.emit
+        
+        async def timed_emit(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await emit(*args, **kwargs)
+            finally:
+                self.elapsed += time.perf_counter() - start
+        
+        engine.notification_center.emit = timed_emit
+
+
+class BenchmarkHookTrigger:
+    """Benchmark trigger-to-completion latency of HookEngine.trigger.
+    
+    Every registered hook matches the trigger. Actions rotate through
+    command, function, webhook and transform (transform only when jmespath
+    or jsonpath_ng is installed). Lookup and condition time are measured
+    with the same registry calls trigger makes; notification time is the
+    time spent in NotificationCenter.emit, summed over hooks; execution is
+    the remainder.
+    """
+    
+    FANOUTS = (1, 10, 100)
+    TRIGGERS_PER_SCENARIO = 200  # Divided across the fan-out, at least 5
+    
+    @staticmethod
+    def _build_hooks(
+        count: int,
+        webhook_url: str,
+        conditions: bool,
+        sandbox: bool
+    ) -> List[HookConfig]:
+        """Create count hooks with a rotating mix of actions"""
+        transform = _transform_type()
+        kinds = ["command", "function", "webhook"] + (["transform"] if transform else [])
+        
+        hooks = []
+        for i in range(count):
+            kind = kinds[i % len(kinds)]
+            if kind == "command":
+                action = HookAction(type=HookActionType.COMMAND, config={}, command="echo $event")
+            elif kind == "function":
+                action = HookAction(type=HookActionType.FUNCTION, config={}, function_name="record")
+            elif kind == "webhook":
+                action = HookAction(type=HookActionType.WEBHOOK, config={}, url=webhook_url)
+            else:
+                expression = "file.path" if transform == "jmespath" else "$.file.path"
+                action = HookAction(
+                    type=HookActionType.TRANSFORM,
+                    config={"type": transform, "expression": expression}
+                )
+            
+            hooks.append(HookConfig(
+                name=f"{kind}-{i}",
+                description="",
+                triggers=[HookTrigger.FILE_MODIFY],
+                actions=[action],
+                async_execution=True,
+                timeout=10.0,
+                sandbox=sandbox,
+                # Conditions that always pass, so fan-out stays at count
+                conditions=[
+                    HookCondition(field="file.path", operator="regex", value=r".*\.py$"),
+                    HookCondition(field="file.size", operator="lt", value=10**6)
+                ] if conditions else []
+            ))
+        
+        return hooks
+    
+    async def _run_scenario(
+        self,
+        fanout: int,
+        conditions: bool,
+        sandbox: bool,
+        webhook: _StandInWebhook
+    ) -> Dict[str, Any]:
+        """Trigger one configuration repeatedly and summarize the samples"""
+        async def record(hook, action, context):
+            return {"path": context["file"]["path"]}
+        
+        registry = HookRegistry()
+        for hook in self._build_hooks(fanout, webhook.url, conditions, sandbox):
+            await registry.register(hook)
+        
+        engine = HookEngine(registry, custom_functions={"record": record})
+        await engine.initialize()
+        notifications = _TimedNotifications(engine)
+        
+        iterations = max(5, self.TRIGGERS_PER_SCENARIO // fanout)
+        totals = []
+        phases = {phase: [] for phase in PHASES}
+        failures = 0
+        
+        try:
+            # One untimed trigger warms pools, workspaces and compiled templates
+            await engine.trigger(
+                HookTrigger.FILE_MODIFY,
+                {"event": "warmup", "file": {"path": "warm.py", "size": 1}}
+            )
+            
+            for i in range(iterations):
+                context = {"event": f"edit-{i}", "file": {"path": f"src/m{i}.py", "size": i}}
+                
+                start = time.perf_counter()
+                await registry.get_hooks_for_trigger(HookTrigger.FILE_MODIFY)
+                lookup = time.perf_counter() - start
+                
+                start = time.perf_counter()
+                matched = await registry.get_hooks_for_trigger(HookTrigger.FILE_MODIFY, context)
+                conditions_time = max(0.0, time.perf_counter() - start - lookup)
+                assert len(matched) == fanout
+                
+                notifications.elapsed = 0.0
+                start = time.perf_counter()
+                results = await engine.trigger(HookTrigger.FILE_MODIFY, context)
+                total = time.perf_counter() - start
+                
+                failures += sum(1 for result in results if not result.success)
+                
+                totals.append(total)
+                phases["lookup"].append(lookup)
+                phases["conditions"].append(conditions_time)
+                phases["notification"].append(notifications.elapsed)
+                phases["execution"].append(
+                    max(0.0, total - lookup - conditions_time - notifications.elapsed)
+                )
+        finally:
+            await engine.cleanup()
+        
+        elapsed = sum(totals)
+        return {
+            "fanout": fanout,
+            "conditions": conditions,
+            "sandbox": sandbox,
+            "triggers": iterations,
+            "failures": failures,
+            "p50_ms": _percentile(totals, 50) * 1000,
+            "p99_ms": _percentile(totals, 99) * 1000,
+            "mean_ms": statistics.mean(totals) * 1000,
+            "triggers_per_second": iterations / elapsed,
+            "hooks_per_second": iterations * fanout / elapsed,
+            "phases_p50_ms": {
+                phase: _percentile(samples, 50) * 1000 for phase, samples in phases.items()
+            },
+            "phases_p99_ms": {
+                phase: _percentile(samples, 99) * 1000 for phase, samples in phases.items()
+            }
+        }
+    
+    @pytest.mark.benchmark
+    @pytest.mark.asyncio
+    async def test_trigger_latency_performance(self, benchmark=None, temp_dir=None):
+        """Benchmark trigger latency across fan-out, conditions and sandbox."""
+        webhook = _StandInWebhook()
+        await webhook.start()
+        
+        scenarios = {}
+        try:
+            for fanout in self.FANOUTS:
+                for conditions in (False, True):
+                    for sandbox in (False, True):
+                        # Stable keys so reports from different commits line up
+                        key = (
+                            f"fanout_{fanout}"
+                            f"/conditions_{'on' if conditions else 'off'}"
+                            f"/sandbox_{'on' if sandbox else 'off'}"
+                        )
+                        scenarios[key] = await self._run_scenario(
+                            fanout, conditions, sandbox, webhook
+                        )
+        finally:
+            await webhook.stop()
+        
+        results = {
+            "transform": _transform_type(),
+            "webhook_requests": webhook.requests,
+            "scenarios": scenarios
+        }
+        
+        # Every hook runs to completion on every trigger
+        assert all(s["failures"] == 0 for s in scenarios.values())
+        
+        return results
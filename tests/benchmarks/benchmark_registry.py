@@ -10,7 +10,7 @@ from typing import List, Dict, Any
 import statistics
 import random
 
-from shannon_mcp.registry.storage import RegistryStorage, ProcessStatus
+from shannon_mcp.registry.storage import RegistryStorage, ProcessEntry, ProcessStatus, ProcessUpdate
 from shannon_mcp.registry.tracker import ProcessTracker
 from shannon_mcp.registry.monitor import ResourceMonitor
 from tests.fixtures.registry_fixtures import RegistryFixtures
@@ -469,4 +469,96 @@ class BenchmarkCrossSessionMessaging:
         assert results["100_messages"]["send_rate"] > 1000
         assert results["1000_messages"]["send_rate"] > 5000
         
-        return results
\ No newline at end of file
+        return results
+
+class BenchmarkBatchedRegistryWrites:
+    """Benchmark group-committed registry updates for 1,000 tracked PIDs."""
+    
+    PROCESS_COUNT = 1000
+    
+    @staticmethod
+    async def _populated_storage(db_path, count: int) -> RegistryStorage:
+        """Create a storage with `count` registered processes on one host."""
+        storage = RegistryStorage(db_path, batch_interval=0.01)
+        await storage.initialize()
+        
+        for i in range(count):
+            entry = RegistryFixtures.create_process_entry(
+                pid=60000 + i,
+                session_id=f"batch-session-{i % 50}",
+                status=ProcessStatus.RUNNING
+            )
+            entry["host"] = "bench-host"
+            await storage.register_process(ProcessEntry.from_dict(entry))
+        
+        return storage
+    
+    @pytest.mark.benchmark
+    @pytest.mark.asyncio
+    async def test_batched_update_performance(self, benchmark=None, temp_dir=None):
+        """Benchmark one tracker pass over 1,000 PIDs and concurrent reads."""
+        import tempfile
+        from pathlib import Path
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = Path(temp_dir or tmp) / "batched.db"
+            storage = await self._populated_storage(db_path, self.PROCESS_COUNT)
+            pids = [60000 + i for i in range(self.PROCESS_COUNT)]
+            
+            def tracker_pass(run: int) -> List[ProcessUpdate]:
+                return [
+                    ProcessUpdate(
+                        pid=pid,
+                        host="bench-host",
+                        status=ProcessStatus.BUSY if (pid + run) % 7 == 0 else ProcessStatus.RUNNING,
+                        cpu_percent=random.uniform(0, 100),
+                        memory_mb=random.uniform(50, 500)
+                    )
+                    for pid in pids
+                ]
+            
+            try:
+                # Whole pass through the batched API
+                pass_times = []
+                for run in range(5):
+                    start = time.perf_counter()
+                    await storage.apply_updates(tracker_pass(run))
+                    pass_times.append(time.perf_counter() - start)
+                
+                # Independent callers coalesced by the writer task
+                batches_before = storage.batches_committed
+                start = time.perf_counter()
+                await asyncio.gather(*[
+                    storage.update_process_resources(pid, "bench-host", cpu_percent=1.0)
+                    for pid in pids
+                ])
+                concurrent_time = time.perf_counter() - start
+                concurrent_batches = storage.batches_committed - batches_before
+                
+                # Reads on the read-only connection while a pass is committing
+                read_times = []
+                writer = asyncio.create_task(storage.apply_updates(tracker_pass(99)))
+                while not writer.done():
+                    start = time.perf_counter()
+                    await storage.get_all_processes(host="bench-host")
+                    read_times.append(time.perf_counter() - start)
+                await writer
+            finally:
+                await storage.close()
+        
+        avg_pass = statistics.mean(pass_times)
+        results = {
+            "processes": self.PROCESS_COUNT,
+            "batched_pass_ms": avg_pass * 1000,
+            "updates_per_second": self.PROCESS_COUNT / avg_pass,
+            "concurrent_calls_ms": concurrent_time * 1000,
+            "concurrent_batches": concurrent_batches,
+            "reads_during_write": len(read_times),
+            "read_p50_ms": statistics.median(read_times) * 1000 if read_times else None
+        }
+        
+        # A full pass is a handful of statements, not 2,000 commits
+        assert results["updates_per_second"] > 5000
+        assert results["concurrent_batches"] <= 3
+        
+        return results
@@ -4,9 +4,10 @@ Run all performance benchmarks and generate report.
 
 import asyncio
 import json
+import subprocess
 import time
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import sys
 import argparse
 from datetime import datetime
@@ -33,14 +34,16 @@ from benchmark_analytics import (
     BenchmarkAggregation,
     BenchmarkReportGeneration,
     BenchmarkDataRetention,
-    BenchmarkRealTimeAnalytics
+    BenchmarkRealTimeAnalytics,
+    BenchmarkVectorizedAggregation
 )
 from benchmark_registry import (
     BenchmarkRegistryStorage,
     BenchmarkProcessTracking,
     BenchmarkResourceMonitoring,
     BenchmarkRegistryCleanup,
-    BenchmarkCrossSessionMessaging
+    BenchmarkCrossSessionMessaging,
+    BenchmarkBatchedRegistryWrites
 )
 from benchmark_session import (
     BenchmarkSessionLifecycle,
@@ -72,6 +75,7 @@ from benchmark_hooks import (
     BenchmarkHookErrorHandling,
     BenchmarkHookPersistence
 )
+from benchmark_hook_trigger import BenchmarkHookTrigger
 from benchmark_transport import (
     BenchmarkTransportConnection,
     BenchmarkTransportMessaging,
@@ -190,14 +194,16 @@ class BenchmarkRunner:
                 BenchmarkAggregation,
                 BenchmarkReportGeneration,
                 BenchmarkDataRetention,
-                BenchmarkRealTimeAnalytics
+                BenchmarkRealTimeAnalytics,
+                BenchmarkVectorizedAggregation
             ],
             "registry": [
                 BenchmarkRegistryStorage,
                 BenchmarkProcessTracking,
                 BenchmarkResourceMonitoring,
                 BenchmarkRegistryCleanup,
-                BenchmarkCrossSessionMessaging
+                BenchmarkCrossSessionMessaging,
+                BenchmarkBatchedRegistryWrites
             ],
             "session": [
                 BenchmarkSessionLifecycle,
@@ -227,7 +233,8 @@ class BenchmarkRunner:
                 BenchmarkHookFiltering,
                 BenchmarkHookChaining,
                 BenchmarkHookErrorHandling,
-                BenchmarkHookPersistence
+                BenchmarkHookPersistence,
+                BenchmarkHookTrigger
             ],
             "transport": [
                 BenchmarkTransportConnection,
@@ -271,7 +278,8 @@ class BenchmarkRunner:
                 "start_time": self.start_time.isoformat(),
                 "end_time": self.end_time.isoformat(),
                 "duration": (self.end_time - self.start_time).total_seconds(),
-                "categories": list(self.results.keys())
+                "categories": list(self.results.keys()),
+                "commit": _git_commit()
             },
             "results": self.results,
             "summary": self._generate_summary()
@@ -291,6 +299,8 @@ class BenchmarkRunner:
         print(f"\nReports saved to:")
         print(f"  - {report_file}")
         print(f"  - {readable_file}")
+        
+        return report
     
     def _generate_summary(self) -> Dict[str, Any]:
         """Generate summary statistics."""
@@ -381,6 +391,51 @@ class BenchmarkRunner:
         return ", ".join(parts)
 
 
+def _git_commit() -> Optional[str]:
+    """Current commit, so reports from different revisions can be told apart."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _numeric_metrics(node: Any, prefix: str = "") -> Dict[str, float]:
+    """Flatten a results tree to {"category/Class/method/...": value}."""
+    metrics = {}
+    if isinstance(node, dict):
+        for key, value in node.items():
+            metrics.update(_numeric_metrics(value, f"{prefix}/{key}" if prefix else str(key)))
+    elif isinstance(node, (int, float)) and not isinstance(node, bool):
+        metrics[prefix] = node
+    return metrics
+
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """Diff the numeric metrics two reports have in common."""
+    before = _numeric_metrics(baseline.get("results", {}))
+    after = _numeric_metrics(current.get("results", {}))
+    
+    changes = {}
+    for path in sorted(before.keys() & after.keys()):
+        old, new = before[path], after[path]
+        changes[path] = {
+            "baseline": old,
+            "current": new,
+            "change_pct": (new - old) / abs(old) * 100 if old else None
+        }
+    
+    return {
+        "baseline_commit": baseline.get("metadata", {}).get("commit"),
+        "current_commit": current.get("metadata", {}).get("commit"),
+        "metrics": changes,
+        "only_in_baseline": sorted(before.keys() - after.keys()),
+        "only_in_current": sorted(after.keys() - before.keys())
+    }
+
+
 async def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Run Shannon MCP performance benchmarks")
@@ -397,6 +452,11 @@ async def main():
         default=Path("./benchmark_results"),
         help="Output directory for results (default: ./benchmark_results)"
     )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        help="Earlier JSON report to diff this run's metrics against"
+    )
     
     args = parser.parse_args()
     
@@ -406,7 +466,21 @@ async def main():
     print(f"Output directory: {args.output}")
     
     await runner.run_all_benchmarks(args.categories)
-    runner.generate_report()
+    report = runner.generate_report()
+    
+    if args.compare:
+        with open(args.compare) as f:
+            comparison = compare_reports(json.load(f), report)
+        
+        comparison_file = args.output / f"benchmark_compare_{runner.start_time.strftime('%Y%m%d_%H%M%S')}.json"
+        with open(comparison_file, "w") as f:
+            json.dump(comparison, f, indent=2)
+        
+        print(f"\nCompared against {args.compare} ({comparison['baseline_commit']}):")
+        for path, change in comparison["metrics"].items():
+            if change["change_pct"] is not None and abs(change["change_pct"]) >= 10:
+                print(f"  {path}: {change['baseline']:.4g} -> {change['current']:.4g} ({change['change_pct']:+.1f}%)")
+        print(f"  - {comparison_file}")
     
     print("\nBenchmarks completed!")
 
@@ -24,6 +24,7 @@ from shannon_mcp.managers.session import SessionManager
 from shannon_mcp.managers.agent import AgentManager
 from shannon_mcp.registry.storage import RegistryStorage
 from shannon_mcp.analytics.writer import JSONLWriter
+from shannon_mcp.hooks.config import HookConfig, HookTrigger, HookAction, HookActionType
 from shannon_mcp.utils.logging import setup_logging
 
 
@@ -219,6 +220,46 @@ def mock_process_info():
     }
 
 
+@pytest.fixture
+def hook_defaults() -> Dict[str, Any]:
+    """HookConfig fields make_hook applies; override in a test module."""
+    return {}
+
+
+@pytest.fixture
+def make_hook(hook_defaults: Dict[str, Any]):
+    """Factory for minimal hooks.
+    
+    Hooks trigger on CUSTOM and run a LOG action, or a FUNCTION action
+    when function_name is given. hook_defaults and then the call's
+    arguments override any field.
+    """
+    def make_hook(name=None, triggers=None, **overrides) -> HookConfig:
+        fields = {
+            "name": "hook",
+            "description": "",
+            "triggers": [HookTrigger.CUSTOM],
+            **hook_defaults,
+            **overrides
+        }
+        if name is not None:
+            fields["name"] = name
+        if triggers is not None:
+            fields["triggers"] = triggers
+        
+        function_name = fields.pop("function_name", None)
+        if "actions" not in fields:
+            fields["actions"] = [
+                HookAction(type=HookActionType.FUNCTION, config={}, function_name=function_name)
+                if function_name else
+                HookAction(type=HookActionType.LOG, config={})
+            ]
+        
+        return HookConfig(**fields)
+    
+    return make_hook
+
+
 # Async test helpers
 async def wait_for_condition(condition_func, timeout=5.0, interval=0.1):
     """Wait for a condition to become true."""
@@ -0,0 +1,120 @@
+"""
+Functional tests for the streaming metrics exporters.
+"""
+
+import pytest
+import csv
+import gzip
+import json
+import zipfile
+from datetime import datetime, timedelta, timezone
+
+from shannon_mcp.analytics.aggregator import MetricsAggregator, AggregationType
+from shannon_mcp.analytics.reporter import ReportGenerator, ReportFormat
+from shannon_mcp.analytics.exporter import MetricsExporter, ExportOptions, ExportFormat
+
+from .test_analytics_vectorized import _ListParser, _generate_metrics
+
+
+START = datetime(2024, 3, 1, tzinfo=timezone.utc)
+END = START + timedelta(days=4)
+
+
+@pytest.fixture
+def metrics():
+    """Generate a batch of parsed metrics."""
+    return _generate_metrics(1500)
+
+
+@pytest.fixture
+def exporter(metrics):
+    """Create an exporter with small buffers to force many flushes."""
+    parser = _ListParser(metrics)
+    aggregator = MetricsAggregator(parser)
+    reporter = ReportGenerator(aggregator)
+    return MetricsExporter(parser, aggregator, reporter, buffer_bytes=512, row_group_size=100)
+
+
+class TestStreamingExporter:
+    """Test streaming exports against their in-memory equivalents."""
+    
+    @pytest.mark.asyncio
+    async def test_json_matches_json_dumps(self, exporter, metrics, tmp_path):
+        """Test that incremental JSON output is byte-identical to json.dumps."""
+        options = ExportOptions(
+            format=ExportFormat.JSON,
+            report_formats=[ReportFormat.MARKDOWN, ReportFormat.JSON]
+        )
+        output = await exporter.export(tmp_path / "export.json", START, END, options)
+        
+        text = output.read_text()
+        data = json.loads(text)
+        
+        assert text == json.dumps(data, indent=2)
+        assert data["metrics"] == [m.entry.to_dict() for m in metrics]
+        assert list(data["aggregations"]) == [t.value for t in options.aggregation_types]
+        assert list(data["reports"]) == ["markdown"]
+    
+    @pytest.mark.asyncio
+    async def test_empty_sections(self, exporter, tmp_path):
+        """Test JSON output when every optional section is empty."""
+        options = ExportOptions(
+            format=ExportFormat.JSON,
+            aggregation_types=[],
+            report_formats=[]
+        )
+        output = await exporter.export(tmp_path / "empty.json", START, END, options)
+        
+        text = output.read_text()
+        assert text == json.dumps(json.loads(text), indent=2)
+    
+    @pytest.mark.asyncio
+    async def test_jsonl_streams_every_metric(self, exporter, metrics, tmp_path):
+        """Test that JSONL export writes the metadata line plus one line per metric."""
+        options = ExportOptions(format=ExportFormat.JSONL, compress=True)
+        output = await exporter.export(tmp_path / "export.jsonl", START, END, options)
+        
+        with gzip.open(output, "rt") as f:
+            lines = f.read().splitlines()
+        
+        assert json.loads(lines[0])["_metadata"] is True
+        assert [json.loads(line) for line in lines[1:]] == [m.entry.to_dict() for m in metrics]
+    
+    @pytest.mark.asyncio
+    async def test_csv_headers_cover_all_metrics(self, exporter, metrics, tmp_path):
+        """Test that CSV headers are the union of all flattened metric keys."""
+        options = ExportOptions(
+            format=ExportFormat.CSV,
+            aggregation_types=[AggregationType.DAILY]
+        )
+        output = await exporter.export(tmp_path / "export.csv", START, END, options)
+        
+        with zipfile.ZipFile(output) as zf:
+            assert zf.namelist() == ["export_metrics.csv", "export_daily.csv"]
+            rows = list(csv.DictReader(zf.read("export_metrics.csv").decode().splitlines()))
+        
+        assert len(rows) == len(metrics)
+        assert "duration_ms" in rows[0]
+        assert "error_type" in rows[0]
+    
+    @pytest.mark.asyncio
+    async def test_zip_layout(self, exporter, tmp_path):
+        """Test that every ZIP member is written and readable."""
+        options = ExportOptions(
+            format=ExportFormat.ZIP,
+            aggregation_types=[AggregationType.BY_TOOL],
+            report_formats=[ReportFormat.TEXT]
+        )
+        output = await exporter.export(tmp_path / "export.zip", START, END, options)
+        
+        with zipfile.ZipFile(output) as zf:
+            assert zf.namelist() == [
+                "data.json",
+                "data.jsonl",
+                "data_metrics.csv",
+                "data_by_tool.csv",
+                "reports/report_text.txt"
+            ]
+            data = json.loads(zf.read("data.json"))
+        
+        assert "by_tool" in data["aggregations"]
@@ -0,0 +1,114 @@
+"""
+Functional tests for live sliding-window metrics.
+"""
+
+import pytest
+import asyncio
+
+from shannon_mcp.analytics.writer import JSONLWriter, MetricsWriter
+from shannon_mcp.analytics.live import LiveMetricsMonitor, LIVE_METRICS_EVENT
+from shannon_mcp.utils.notifications import EventBus
+from shannon_mcp.utils.stats import SlidingWindow
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+async def writer(tmp_path):
+    """Create an initialized writer."""
+    writer = JSONLWriter(tmp_path, flush_interval=60)
+    await writer.initialize()
+    yield writer
+    await writer.close()
+
+
+class TestSlidingWindow:
+    """Test the slotted sliding window."""
+    
+    def test_expires_old_slots(self):
+        """Test that events leave the window once it slides past them."""
+        window = SlidingWindow(60, slots=60)
+        for second in range(120):
+            window.record(second + 0.5, error=second % 10 == 0, latency=float(second))
+        
+        snapshot = window.snapshot(120)
+        assert snapshot["count"] == 59
+        assert snapshot["errors"] == 5
+        assert snapshot["latency_max_ms"] == 119
+        assert snapshot["latency_mean_ms"] == sum(range(61, 120)) / 59
+    
+    def test_long_gap_clears_everything(self):
+        """Test that an idle gap longer than the span empties the window."""
+        window = SlidingWindow(60, slots=6)
+        window.record(0, latency=5)
+        window.record(30, error=True)
+        
+        snapshot = window.snapshot(10_000)
+        assert snapshot["count"] == 0
+        assert snapshot["errors"] == 0
+        assert snapshot["latency_p50_ms"] is None
+        assert sum(window.bins) == 0
+
+
+class TestLiveMetricsMonitor:
+    """Test live aggregation and publishing."""
+    
+    @pytest.mark.asyncio
+    async def test_windows_track_writer_entries(self, writer):
+        """Test that queued entries update every window."""
+        clock = _Clock()
+        monitor = LiveMetricsMonitor(writer, event_bus=EventBus(), clock=clock)
+        await monitor.start()
+        metrics = MetricsWriter(writer)
+        
+        try:
+            await metrics.track_tool_use("s1", "Read", True, duration_ms=20)
+            clock.now += 120
+            await metrics.track_tool_use("s1", "Bash", False, duration_ms=400)
+            await metrics.track_error("s1", "Timeout", "took too long")
+            
+            snapshot = monitor.snapshot()
+        finally:
+            await monitor.stop()
+        
+        assert snapshot["windows"]["1m"]["count"] == 2
+        assert snapshot["windows"]["1m"]["errors"] == 2
+        assert snapshot["windows"]["5m"]["count"] == 3
+        assert snapshot["windows"]["15m"]["latency_max_ms"] == 400
+        assert snapshot["by_type"]["tool_use"]["5m"]["count"] == 2
+        assert snapshot["by_type"]["error_occurred"]["1m"]["errors"] == 1
+        
+        # Listener is detached after stop
+        await metrics.track_tool_use("s1", "Read", True)
+        assert monitor.events_observed == 3
+    
+    @pytest.mark.asyncio
+    async def test_updates_are_throttled(self, writer):
+        """Test that bursts of metrics produce at most one update per interval."""
+        bus = EventBus()
+        monitor = LiveMetricsMonitor(writer, event_bus=bus, update_interval=0.05)
+        received = []
+        monitor.subscribe(lambda event: received.append(event))
+        await monitor.start()
+        metrics = MetricsWriter(writer)
+        
+        try:
+            for _ in range(500):
+                await metrics.track_tool_use("s1", "Read", True, duration_ms=1)
+            await asyncio.sleep(0.2)
+        finally:
+            await monitor.stop()
+        await bus.shutdown()
+        
+        assert 1 <= monitor.updates_published <= 5
+        assert received
+        assert received[0].name == LIVE_METRICS_EVENT
+        assert received[-1].data["windows"]["1m"]["count"] == 500
@@ -0,0 +1,149 @@
+"""
+Functional tests for report result caching.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from shannon_mcp.analytics.writer import JSONLWriter, MetricEntry, MetricType
+from shannon_mcp.analytics.parser import ParsedMetric
+from shannon_mcp.analytics.aggregator import MetricsAggregator, AggregationType
+from shannon_mcp.analytics.reporter import ReportGenerator, ReportFormat, make_query_key
+
+
+def _entry(timestamp: datetime) -> MetricEntry:
+    """Create a tool-use entry at the given time."""
+    return MetricEntry(
+        id=f"m-{timestamp.timestamp()}",
+        timestamp=timestamp,
+        type=MetricType.TOOL_USE,
+        session_id="s1",
+        user_id=None,
+        data={"tool_name": "Read", "success": True, "duration_ms": 5},
+        metadata={}
+    )
+
+
+class _CountingParser:
+    """Parser stand-in that counts how often metrics are streamed."""
+    
+    def __init__(self, *timestamps):
+        self.metrics = [ParsedMetric.from_entry(_entry(ts)) for ts in timestamps]
+        self.reads = 0
+    
+    async def stream_metrics(self, start_time=None, end_time=None, batch_size=1000):
+        self.reads += 1
+        yield [
+            m for m in self.metrics
+            if start_time <= m.timestamp <= end_time
+        ]
+
+
+@pytest.fixture
+async def writer(tmp_path):
+    """Create an initialized writer."""
+    writer = JSONLWriter(tmp_path, flush_interval=60)
+    await writer.initialize()
+    yield writer
+    await writer.close()
+
+
+class TestReportCache:
+    """Test report caching and invalidation."""
+    
+    def test_query_key_normalization(self):
+        """Test that equivalent queries share a key."""
+        start = datetime(2024, 3, 1, tzinfo=timezone.utc)
+        end = start + timedelta(days=1)
+        shifted = timezone(timedelta(hours=2))
+        
+        assert make_query_key(AggregationType.DAILY, start, end, {"a": 1, "b": 2}) == make_query_key(
+            AggregationType.DAILY, start.astimezone(shifted), end.astimezone(shifted), {"b": 2, "a": 1}
+        )
+        assert make_query_key(AggregationType.DAILY, start, end, None) == make_query_key(
+            AggregationType.DAILY, start, end, {}
+        )
+    
+    @pytest.mark.asyncio
+    async def test_sealed_range_is_cached(self, writer):
+        """Test that ranges before the live file never expire."""
+        end = writer.sealed_before - timedelta(seconds=1)
+        start = end - timedelta(days=1)
+        parser = _CountingParser(start + timedelta(hours=1))
+        reporter = ReportGenerator(MetricsAggregator(parser), writer=writer)
+        
+        first = await reporter.generate_report(AggregationType.DAILY, start, end, ReportFormat.MARKDOWN)
+        
+        # Later flushes cannot touch this range
+        await writer.write(_entry(datetime.now(timezone.utc)))
+        await writer.flush()
+        
+        second = await reporter.generate_report(AggregationType.DAILY, start, end, ReportFormat.MARKDOWN)
+        
+        assert parser.reads == 1
+        assert second.content == first.content
+        assert reporter.get_cache_stats()["sealed_entries"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_live_range_invalidated_by_flush(self, writer):
+        """Test that ranges touching the live file are recomputed after a flush."""
+        parser = _CountingParser()
+        reporter = ReportGenerator(MetricsAggregator(parser), writer=writer)
+        start = datetime.now(timezone.utc) - timedelta(hours=1)
+        end = start + timedelta(days=1)
+        
+        first = await reporter.generate_report(AggregationType.HOURLY, start, end, ReportFormat.JSON)
+        await reporter.generate_report(AggregationType.HOURLY, start, end, ReportFormat.JSON)
+        assert parser.reads == 1
+        
+        entry = _entry(datetime.now(timezone.utc))
+        parser.metrics.append(ParsedMetric.from_entry(entry))
+        await writer.write(entry)
+        await writer.flush()
+        
+        second = await reporter.generate_report(AggregationType.HOURLY, start, end, ReportFormat.JSON)
+        
+        assert parser.reads == 2
+        assert second.content != first.content
+        assert reporter.get_cache_stats()["invalidations"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_buffered_entries_hold_back_seal(self, writer):
+        """Test that queued entries keep their range live until flushed."""
+        old = writer.sealed_before - timedelta(minutes=5)
+        await writer.write(_entry(old))
+        
+        assert writer.sealed_before == old
+        
+        await writer.flush()
+        assert writer.sealed_before == old
+    
+    @pytest.mark.asyncio
+    async def test_formatted_output_memoized(self, writer):
+        """Test that rendered reports are reused per format."""
+        end = writer.sealed_before - timedelta(seconds=1)
+        start = end - timedelta(days=1)
+        parser = _CountingParser(start + timedelta(hours=1))
+        reporter = ReportGenerator(MetricsAggregator(parser), writer=writer)
+        
+        first = await reporter.generate_report(AggregationType.DAILY, start, end, ReportFormat.TEXT)
+        second = await reporter.generate_report(AggregationType.DAILY, start, end, ReportFormat.TEXT)
+        html = await reporter.generate_report(AggregationType.DAILY, start, end, ReportFormat.HTML)
+        
+        assert second.content is first.content
+        assert second.generated_at == first.generated_at
+        assert html.content != first.content
+        assert parser.reads == 1
+    
+    @pytest.mark.asyncio
+    async def test_no_writer_disables_cache(self):
+        """Test that reports are always recomputed without a writer."""
+        start = datetime(2024, 3, 1, tzinfo=timezone.utc)
+        parser = _CountingParser(start + timedelta(hours=1))
+        reporter = ReportGenerator(MetricsAggregator(parser))
+        
+        for _ in range(2):
+            await reporter.generate_report(AggregationType.DAILY, start, start + timedelta(days=1))
+        
+        assert parser.reads == 2
+        assert reporter.get_cache_stats() == {"enabled": False}
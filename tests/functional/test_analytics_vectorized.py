@@ -0,0 +1,124 @@
+"""
+Functional tests for the vectorized aggregation backend.
+"""
+
+import pytest
+import json
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from shannon_mcp.analytics.writer import MetricEntry, MetricType
+from shannon_mcp.analytics.parser import ParsedMetric
+from shannon_mcp.analytics.aggregator import MetricsAggregator, AggregationType
+
+np = pytest.importorskip("numpy")
+
+
+class _ListParser:
+    """Parser stand-in that streams a fixed list of metrics."""
+    
+    def __init__(self, metrics):
+        self.metrics = metrics
+    
+    async def stream_metrics(self, start_time=None, end_time=None, batch_size=1000):
+        for i in range(0, len(self.metrics), batch_size):
+            yield self.metrics[i:i + batch_size]
+
+
+def _generate_metrics(count: int, seed: int = 7) -> list:
+    """Generate a mixed batch of parsed metrics."""
+    rng = random.Random(seed)
+    start = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    metrics = []
+    
+    for _ in range(count):
+        metric_type = rng.choice(list(MetricType))
+        data = {}
+        if metric_type == MetricType.TOOL_USE:
+            data = {
+                "tool_name": rng.choice(["Read", "Edit", "Bash", "Grep"]),
+                "success": rng.random() > 0.2,
+                "duration_ms": rng.choice([None, 0, rng.randint(1, 500), rng.random() * 900])
+            }
+        elif metric_type == MetricType.AGENT_EXECUTION:
+            data = {
+                "agent_id": rng.choice(["architect", "tester"]),
+                "success": rng.choice([True, False, None]),
+                "duration_ms": rng.random() * 5000
+            }
+        elif metric_type == MetricType.ERROR_OCCURRED:
+            data = {"error_type": rng.choice(["Timeout", "Crash", ""])}
+        elif metric_type == MetricType.PERFORMANCE:
+            data = {"operation": "op", "duration_ms": rng.randint(0, 50), "success": True}
+        elif metric_type in (MetricType.SESSION_START, MetricType.SESSION_END):
+            data = {
+                "duration_seconds": rng.choice([None, rng.random() * 60]),
+                "token_count": rng.choice([None, 0, rng.randint(1, 10000)])
+            }
+        
+        entry = MetricEntry(
+            id=str(uuid.uuid4()),
+            timestamp=start + timedelta(seconds=rng.randint(0, 3 * 86400), microseconds=rng.randint(0, 999999)),
+            type=metric_type,
+            session_id=rng.choice([None, "s1", "s2", "s3", "s4"]),
+            user_id=rng.choice([None, "alice", "bob"]),
+            data=data,
+            metadata={}
+        )
+        metrics.append(ParsedMetric.from_entry(entry))
+    
+    return metrics
+
+
+class TestVectorizedAggregation:
+    """Test that the vectorized backend matches the pure-Python path."""
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("aggregation_type", list(AggregationType))
+    async def test_matches_pure_python(self, aggregation_type):
+        """Test identical results for every aggregation type."""
+        parser = _ListParser(_generate_metrics(3000))
+        start = datetime(2024, 3, 1, tzinfo=timezone.utc)
+        end = start + timedelta(days=4)
+        
+        expected = await MetricsAggregator(parser, use_vectorized=False).aggregate(
+            aggregation_type, start, end
+        )
+        actual = await MetricsAggregator(parser, use_vectorized=True).aggregate(
+            aggregation_type, start, end
+        )
+        
+        assert json.dumps(actual.to_dict()) == json.dumps(expected.to_dict())
+    
+    @pytest.mark.asyncio
+    async def test_integer_durations_stay_integers(self):
+        """Test that integer-only durations produce integer statistics."""
+        metrics = [
+            m for m in _generate_metrics(500, seed=3)
+            if m.type == MetricType.PERFORMANCE
+        ]
+        parser = _ListParser(metrics)
+        start = datetime(2024, 3, 1, tzinfo=timezone.utc)
+        end = start + timedelta(days=4)
+        
+        expected = await MetricsAggregator(parser, use_vectorized=False).aggregate(
+            AggregationType.HOURLY, start, end
+        )
+        actual = await MetricsAggregator(parser, use_vectorized=True).aggregate(
+            AggregationType.HOURLY, start, end
+        )
+        
+        assert type(actual.total_duration_ms) is type(expected.total_duration_ms)
+        assert type(actual.avg_duration_ms) is type(expected.avg_duration_ms)
+        assert json.dumps(actual.to_dict()) == json.dumps(expected.to_dict())
+    
+    @pytest.mark.asyncio
+    async def test_naive_timestamps_fall_back(self):
+        """Test that batches the arrays cannot represent use the Python path."""
+        metrics = _generate_metrics(50)
+        for metric in metrics:
+            metric.timestamp = metric.timestamp.replace(tzinfo=None)
+        
+        from shannon_mcp.analytics.vectorized import MetricArrays
+        assert MetricArrays.from_metrics(metrics) is None
@@ -0,0 +1,157 @@
+"""
+Functional tests for the background-flushing JSONL metrics writer.
+"""
+
+import pytest
+import asyncio
+import gzip
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+from shannon_mcp.analytics.writer import JSONLWriter, MetricEntry, MetricType, MetricsWriter
+
+
+def _read_all_lines(metrics_dir: Path) -> list:
+    """Read every metric line from plain and compressed files."""
+    lines = []
+    for file_path in sorted(metrics_dir.iterdir()):
+        if file_path.name.endswith(".jsonl.gz"):
+            lines.extend(gzip.decompress(file_path.read_bytes()).decode().splitlines())
+        elif file_path.suffix == ".jsonl":
+            lines.extend(file_path.read_text().splitlines())
+    return lines
+
+
+class TestJSONLWriter:
+    """Test JSONL writer flushing, rotation and stats."""
+    
+    @pytest.mark.asyncio
+    async def test_writes_do_not_hit_disk_until_flush(self, tmp_path):
+        """Test that writes are queued and persisted by flush."""
+        writer = JSONLWriter(tmp_path, buffer_size=1000, flush_interval=60)
+        await writer.initialize()
+        metrics = MetricsWriter(writer)
+        
+        for i in range(10):
+            await metrics.track_tool_use(f"session-{i}", "Read", True, duration_ms=i)
+        
+        assert writer.get_stats()["queue_depth"] == 10
+        assert _read_all_lines(writer.metrics_dir) == []
+        
+        await writer.flush()
+        
+        lines = _read_all_lines(writer.metrics_dir)
+        assert len(lines) == 10
+        assert json.loads(lines[0])["data"]["tool_name"] == "Read"
+        assert writer.flush_generation == 1
+        
+        await writer.close()
+    
+    @pytest.mark.asyncio
+    async def test_background_flusher_size_trigger(self, tmp_path):
+        """Test that the flusher drains the queue once it reaches buffer_size."""
+        writer = JSONLWriter(tmp_path, buffer_size=5, flush_interval=60)
+        await writer.initialize()
+        metrics = MetricsWriter(writer)
+        
+        for i in range(5):
+            await metrics.track_performance("op", float(i), True)
+        
+        for _ in range(50):
+            if writer.flush_generation:
+                break
+            await asyncio.sleep(0.01)
+        
+        assert writer.flush_generation >= 1
+        assert len(_read_all_lines(writer.metrics_dir)) == 5
+        
+        stats = writer.get_stats()
+        assert stats["queue_depth"] == 0
+        assert stats["flush_latency_ms"]["count"] >= 1
+        assert stats["queue_depth_histogram"]["max"] == 5
+        
+        await writer.close()
+    
+    @pytest.mark.asyncio
+    async def test_close_waits_for_inflight_flush(self, tmp_path):
+        """Test that closing during a background write loses no entries."""
+        writer = JSONLWriter(tmp_path, buffer_size=5, flush_interval=60)
+        await writer.initialize()
+        metrics = MetricsWriter(writer)
+        
+        handle = await writer._get_file_handle()
+        write = handle.write
+        started = asyncio.Event()
+        
+        async def slow_write(data):
+            started.set()
+            await asyncio.sleep(0.05)
+            return await write(data)
+        
+        handle.write = slow_write
+        
+        for i in range(5):
+            await metrics.track_performance("op", float(i), True)
+        await asyncio.wait_for(started.wait(), timeout=1.0)
+        
+        await writer.close()
+        
+        assert len(_read_all_lines(writer.metrics_dir)) == 5
+        assert writer.get_stats()["entries_written"] == 5
+    
+    @pytest.mark.asyncio
+    async def test_unserializable_entry_is_dropped_alone(self, tmp_path):
+        """Test that one bad entry does not cost the rest of its batch."""
+        writer = JSONLWriter(tmp_path, buffer_size=1000, flush_interval=60)
+        await writer.initialize()
+        metrics = MetricsWriter(writer)
+        
+        await metrics.track_performance("op", 1.0, True)
+        await writer.write(MetricEntry(
+            id="bad",
+            timestamp=datetime.now(timezone.utc),
+            type=MetricType.PERFORMANCE,
+            session_id=None,
+            user_id=None,
+            data={"value": object()},
+            metadata={}
+        ))
+        await metrics.track_performance("op", 2.0, True)
+        
+        await writer.flush()
+        
+        lines = _read_all_lines(writer.metrics_dir)
+        assert len(lines) == 2
+        assert "bad" not in {json.loads(line)["id"] for line in lines}
+        
+        stats = writer.get_stats()
+        assert stats["entries_written"] == 2
+        assert stats["entries_dropped"] == 1
+        assert stats["queue_depth"] == 0
+        
+        await writer.close()
+    
+    @pytest.mark.asyncio
+    async def test_rotation_compresses_without_losing_entries(self, tmp_path):
+        """Test that rotated files are compressed and no entries are lost."""
+        writer = JSONLWriter(
+            tmp_path,
+            max_file_size=4096,
+            max_files=100,
+            buffer_size=20,
+            flush_interval=0.01
+        )
+        await writer.initialize()
+        metrics = MetricsWriter(writer)
+        
+        for i in range(500):
+            await metrics.track_tool_use(f"session-{i % 3}", "Edit", i % 2 == 0)
+            if i % 20 == 0:
+                await asyncio.sleep(0)
+        
+        await writer.close()
+        
+        assert writer.get_stats()["rotations"] > 0
+        assert list(writer.metrics_dir.glob("metrics_*.jsonl.gz"))
+        assert len(_read_all_lines(writer.metrics_dir)) == 500
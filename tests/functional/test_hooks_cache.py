@@ -0,0 +1,119 @@
+"""
+Functional tests for memoized hook results.
+"""
+
+import os
+
+import pytest
+
+from shannon_mcp.hooks.config import HookTrigger
+from shannon_mcp.hooks.engine import HookEngine
+from shannon_mcp.hooks.registry import HookRegistry
+
+
+@pytest.fixture
+def hook_defaults():
+    """Cacheable hooks calling the engine's lint function."""
+    return {
+        "name": "lint",
+        "triggers": [HookTrigger.FILE_MODIFY],
+        "function_name": "lint",
+        "cacheable": True
+    }
+
+
+@pytest.fixture
+async def engine():
+    """Engine with a counting custom function."""
+    calls = []
+    
+    async def lint(hook, action, context):
+        calls.append(context)
+        return {"run": len(calls)}
+    
+    engine = HookEngine(HookRegistry(), custom_functions={"lint": lint})
+    engine.calls = calls
+    yield engine
+    await engine.cleanup()
+
+
+class TestHookResultCache:
+    """Test memoization keys, expiry and stats."""
+    
+    @pytest.mark.asyncio
+    async def test_identical_context_hits(self, engine, make_hook):
+        """Test that repeated contexts reuse the first result."""
+        await engine.registry.register(make_hook())
+        
+        first = await engine.trigger(HookTrigger.FILE_MODIFY, {"path": "a.py"})
+        second = await engine.trigger(HookTrigger.FILE_MODIFY, {"path": "a.py"})
+        other = await engine.trigger(HookTrigger.FILE_MODIFY, {"path": "b.py"})
+        
+        assert len(engine.calls) == 2
+        assert second[0].cached and second[0].output == first[0].output
+        assert not other[0].cached
+        
+        stats = engine.get_stats()["result_cache"]
+        assert (stats["hits"], stats["misses"]) == (1, 2)
+    
+    @pytest.mark.asyncio
+    async def test_key_fields_ignore_other_context(self, engine, make_hook):
+        """Test that only declared fields affect the key."""
+        await engine.registry.register(make_hook(cache_key_fields=["file.path"]))
+        
+        await engine.trigger(HookTrigger.FILE_MODIFY, {"file": {"path": "a.py"}, "at": 1})
+        result = await engine.trigger(HookTrigger.FILE_MODIFY, {"file": {"path": "a.py"}, "at": 2})
+        
+        assert result[0].cached
+        assert len(engine.calls) == 1
+    
+    @pytest.mark.asyncio
+    async def test_file_content_change_misses(self, engine, tmp_path, make_hook):
+        """Test that keyed files are hashed by content."""
+        source = tmp_path / "a.py"
+        source.write_text("x = 1\n")
+        await engine.registry.register(
+            make_hook(cache_key_fields=["path"], cache_key_files=["path"])
+        )
+        context = {"path": str(source)}
+        
+        await engine.trigger(HookTrigger.FILE_MODIFY, context)
+        assert (await engine.trigger(HookTrigger.FILE_MODIFY, context))[0].cached
+        
+        source.write_text("x = 2\n")
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        
+        assert not (await engine.trigger(HookTrigger.FILE_MODIFY, context))[0].cached
+        assert len(engine.calls) == 2
+    
+    @pytest.mark.asyncio
+    async def test_hook_update_and_ttl_miss(self, engine, make_hook):
+        """Test that config changes and expiry both re-run the hook."""
+        await engine.registry.register(make_hook(cache_ttl=60))
+        context = {"path": "a.py"}
+        
+        await engine.trigger(HookTrigger.FILE_MODIFY, context)
+        await engine.registry.update_hook("lint", {"retry_count": 1})
+        await engine.trigger(HookTrigger.FILE_MODIFY, context)
+        assert len(engine.calls) == 2
+        
+        # Expire the entry stored by the last run
+        entries = engine.result_cache._entries
+        key = next(reversed(entries))
+        entries[key] = (0.0, entries[key][1])
+        
+        result = await engine.trigger(HookTrigger.FILE_MODIFY, context)
+        assert not result[0].cached
+        assert engine.get_stats()["result_cache"]["expired"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_non_cacheable_hooks_always_run(self, engine, make_hook):
+        """Test that hooks without the flag are not memoized."""
+        await engine.registry.register(make_hook(cacheable=False))
+        
+        for _ in range(3):
+            await engine.trigger(HookTrigger.FILE_MODIFY, {"path": "a.py"})
+        
+        assert len(engine.calls) == 3
+        assert engine.get_stats()["result_cache"]["misses"] == 0
@@ -0,0 +1,96 @@
+"""
+Functional tests for compiled action templates.
+"""
+
+import pytest
+
+from shannon_mcp.hooks.compiled import CompiledTemplate, compile_expression
+from shannon_mcp.hooks.config import HookConfig, HookTrigger, HookAction, HookActionType
+from shannon_mcp.hooks.engine import HookEngine
+from shannon_mcp.hooks.registry import HookRegistry
+from shannon_mcp.utils.errors import HookExecutionError
+
+
+class TestCompiledTemplate:
+    """Test template parsing and lazy lookups."""
+    
+    def test_identifiers_parsed_once(self):
+        """Test that referenced names are extracted up front."""
+        template = CompiledTemplate("$user edited ${file_path} ($user) for $$5")
+        
+        assert template.identifiers == ("user", "file_path")
+    
+    def test_flat_lookup_matches_flattened_context(self):
+        """Test nested keys joined with underscores."""
+        template = CompiledTemplate("$file_path:$file_meta_size:$user_name:$missing")
+        context = {
+            "file": {"path": "a.py", "meta": {"size": 3}},
+            "user_name": "ada",
+            "unused": {"deep": list(range(1000))}
+        }
+        
+        assert template.render(context, flat=True) == "a.py:3:ada:$missing"
+        assert template.render(context) == "$file_path:$file_meta_size:ada:$missing"
+    
+    def test_nested_dict_is_not_a_leaf(self):
+        """Test that a dict value does not resolve."""
+        assert CompiledTemplate("$file").render({"file": {"path": "a"}}, flat=True) == "$file"
+
+
+class TestCompiledActions:
+    """Test actions render without mutation."""
+    
+    def test_config_rendering_does_not_mutate(self):
+        """Test that each context gets its own substituted config."""
+        action = HookAction(
+            type=HookActionType.LOG,
+            config={"message": "saved $file_path", "level": "info", "count": 2},
+            template="$file_path"
+        )
+        compiled = action.compile()
+        
+        first = compiled.render_config(action.config, {"file": {"path": "a.py"}})
+        second = compiled.render_config(action.config, {"file": {"path": "b.py"}})
+        
+        assert first["message"] == "saved a.py"
+        assert second["message"] == "saved b.py"
+        assert action.config["message"] == "saved $file_path"
+        assert action.compile() is compiled
+    
+    def test_unknown_transform_type(self):
+        """Test that bad transform types fail when compiled."""
+        with pytest.raises(HookExecutionError):
+            compile_expression("xpath", "//a")
+    
+    def test_transform_expression_cached(self):
+        """Test that an expression is parsed once."""
+        pytest.importorskip("jmespath")
+        compile_expression.cache_clear()
+        
+        assert compile_expression("jmespath", "a.b") is compile_expression("jmespath", "a.b")
+        assert compile_expression.cache_info().hits == 1
+    
+    @pytest.mark.asyncio
+    async def test_engine_renders_per_trigger(self):
+        """Test that repeated triggers see their own context."""
+        registry = HookRegistry()
+        await registry.register(HookConfig(
+            name="log",
+            description="",
+            triggers=[HookTrigger.FILE_MODIFY],
+            actions=[HookAction(
+                type=HookActionType.LOG,
+                config={"message": "edited $file_path"},
+                template="edited $file"
+            )]
+        ))
+        engine = HookEngine(registry)
+        
+        try:
+            first = await engine.trigger(HookTrigger.FILE_MODIFY, {"file": "a.py"})
+            second = await engine.trigger(HookTrigger.FILE_MODIFY, {"file": "b.py"})
+            
+            assert first[0].output[0]["message"] == "edited a.py"
+            assert second[0].output[0]["message"] == "edited b.py"
+        finally:
+            await engine.cleanup()
@@ -0,0 +1,126 @@
+"""
+Functional tests for hook rate limiting and execution history.
+"""
+
+import pytest
+
+from shannon_mcp.hooks import registry as registry_module
+from shannon_mcp.hooks.config import HookTrigger
+from shannon_mcp.hooks.engine import HookEngine
+from shannon_mcp.hooks.registry import HookRegistry
+
+
+@pytest.fixture
+def hook_defaults():
+    """Function hooks calling "ok"."""
+    return {"name": "h", "function_name": "ok"}
+
+
+class FakeClock:
+    """Monotonic clock the test advances by hand."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the registry's monotonic clock."""
+    fake = FakeClock()
+    monkeypatch.setattr(registry_module.time, "monotonic", fake)
+    return fake
+
+
+class TestRateLimiting:
+    """Test token bucket rate limits and cooldowns."""
+    
+    def test_rate_limit_refills_over_time(self, clock, make_hook):
+        """Test that a burst is capped and capacity returns gradually."""
+        registry = HookRegistry()
+        hook = make_hook(rate_limit=3)
+        
+        for _ in range(3):
+            assert registry.check_rate_limit(hook)
+            registry.record_execution(hook)
+        assert not registry.check_rate_limit(hook)
+        
+        clock.now += 20  # one token per 20 seconds
+        assert registry.check_rate_limit(hook)
+        registry.record_execution(hook)
+        assert not registry.check_rate_limit(hook)
+        
+        clock.now += 600
+        for _ in range(3):
+            registry.record_execution(hook)
+        assert not registry.check_rate_limit(hook)
+    
+    def test_changed_limit_takes_effect(self, clock, make_hook):
+        """Test that updating rate_limit resizes the bucket."""
+        registry = HookRegistry()
+        hook = make_hook(rate_limit=1)
+        registry.record_execution(hook)
+        assert not registry.check_rate_limit(hook)
+        
+        hook.rate_limit = 5
+        assert registry.check_rate_limit(hook)
+    
+    def test_cooldown(self, clock, make_hook):
+        """Test the minimum gap between executions."""
+        registry = HookRegistry()
+        hook = make_hook(cooldown=5.0)
+        registry.record_execution(hook)
+        
+        clock.now += 4.9
+        assert not registry.check_rate_limit(hook)
+        clock.now += 0.2
+        assert registry.check_rate_limit(hook)
+
+
+class TestExecutionHistory:
+    """Test history rings and aggregated stats."""
+    
+    @pytest.mark.asyncio
+    async def test_history_is_bounded_per_hook_and_overall(self, make_hook):
+        """Test ring sizes and newest-last ordering."""
+        async def ok(hook, action, context):
+            return context["n"]
+        
+        async def fail(hook, action, context):
+            raise ValueError("nope")
+        
+        registry = HookRegistry()
+        engine = HookEngine(
+            registry,
+            custom_functions={"ok": ok, "fail": fail},
+            max_history=10,
+            max_hook_history=4
+        )
+        
+        try:
+            await registry.register(make_hook("good"))
+            await registry.register(make_hook("bad", function_name="fail"))
+            
+            for n in range(6):
+                await engine.trigger(HookTrigger.CUSTOM, {"n": n})
+            
+            history = engine.get_execution_history()
+            assert len(history) == 10
+            assert history[-1].hook_name in {"good", "bad"}
+            
+            good = engine.get_execution_history("good")
+            assert [r.output for r in good] == [[2], [3], [4], [5]]
+            assert [r.output for r in engine.get_execution_history("good", limit=2)] == [[4], [5]]
+            
+            stats = engine.get_stats()
+            assert stats["total_executions"] == 12
+            assert stats["failure_count"] == 6
+            assert stats["hooks"]["good"]["executions"] == 6
+            assert stats["hooks"]["bad"]["failures"] == 6
+            assert stats["hooks"]["bad"]["last_error"].endswith("nope")
+            assert stats["hooks"]["good"]["duration_ms"]["p99"] is not None
+            assert engine.get_hook_stats("missing") is None
+        finally:
+            await engine.cleanup()
@@ -0,0 +1,180 @@
+"""
+Functional tests for hook directory hot reload.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from shannon_mcp.hooks.config import HookConfig, HookTrigger, HookAction, HookActionType
+from shannon_mcp.hooks.registry import HookRegistry
+
+
+def write_hook(directory, filename, name, priority=0, trigger="file_modify"):
+    """Write a hook definition file."""
+    path = directory / filename
+    path.write_text(json.dumps({
+        "name": name,
+        "description": "",
+        "triggers": [trigger],
+        "actions": [{"type": "log", "config": {}}],
+        "priority": priority
+    }))
+    return path
+
+
+async def wait_for(predicate, timeout=5.0):
+    """Poll until predicate() is true."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        assert loop.time() < deadline, "timed out waiting for reload"
+        await asyncio.sleep(0.02)
+
+
+async def dispatched(registry):
+    """Names of hooks dispatched for FILE_MODIFY."""
+    return [h.name for h in await registry.get_hooks_for_trigger(HookTrigger.FILE_MODIFY)]
+
+
+class TestDirectoryScan:
+    """Test incremental directory scans."""
+    
+    @pytest.mark.asyncio
+    async def test_scan_applies_only_changed_files(self, tmp_path):
+        """Test that unchanged files are skipped and deletions unregister."""
+        write_hook(tmp_path, "a.json", "a")
+        b = write_hook(tmp_path, "b.json", "b")
+        registry = HookRegistry(tmp_path)
+        await registry.initialize()
+        
+        assert await registry.reload() == 0
+        
+        b.unlink()
+        write_hook(tmp_path, "c.json", "c")
+        assert await registry.reload() == 2
+        assert sorted(await dispatched(registry)) == ["a", "c"]
+    
+    @pytest.mark.asyncio
+    async def test_invalid_file_keeps_previous_hook(self, tmp_path):
+        """Test that a broken edit does not remove the loaded hook."""
+        path = write_hook(tmp_path, "a.json", "a")
+        registry = HookRegistry(tmp_path)
+        await registry.initialize()
+        
+        path.write_text("{not json")
+        await registry.reload()
+        
+        assert await dispatched(registry) == ["a"]
+    
+    @pytest.mark.asyncio
+    async def test_duplicate_name_in_second_file_is_rejected(self, tmp_path):
+        """Test that a name owned by one file cannot be taken by another."""
+        write_hook(tmp_path, "a.json", "x", priority=1)
+        registry = HookRegistry(tmp_path)
+        await registry.initialize()
+        
+        write_hook(tmp_path, "b.json", "x", priority=2)
+        await registry.reload()
+        assert (await registry.get_hook("x")).priority == 1
+        
+        # Deleting the rejected file leaves the owner's hook alone
+        (tmp_path / "b.json").unlink()
+        await registry.reload()
+        assert (await registry.get_hook("x")).priority == 1
+        
+        # Once the owner is gone the name is free again
+        write_hook(tmp_path, "b.json", "x", priority=2)
+        (tmp_path / "a.json").unlink()
+        await registry.reload()
+        assert (await registry.get_hook("x")).priority == 2
+    
+    @pytest.mark.asyncio
+    async def test_file_cannot_replace_registered_hook(self, tmp_path):
+        """Test that a file does not override a hook registered directly."""
+        registry = HookRegistry(tmp_path)
+        await registry.initialize()
+        await registry.register(HookConfig(
+            name="x",
+            description="",
+            triggers=[HookTrigger.FILE_MODIFY],
+            actions=[HookAction(type=HookActionType.LOG, config={})],
+            priority=5
+        ))
+        
+        write_hook(tmp_path, "a.json", "x")
+        await registry.reload()
+        (tmp_path / "a.json").unlink()
+        await registry.reload()
+        
+        assert (await registry.get_hook("x")).priority == 5
+
+
+class TestHotReload:
+    """Test watched reloads."""
+    
+    @pytest.mark.asyncio
+    async def test_watched_changes_are_debounced_and_applied(self, tmp_path):
+        """Test add, edit, rename and delete through the watcher."""
+        write_hook(tmp_path, "a.json", "a", priority=1)
+        registry = HookRegistry(tmp_path)
+        await registry.initialize(watch=True)
+        try:
+            original_a = await registry.get_hook("a")
+            
+            # A burst of writes lands as one reload
+            for priority in range(5):
+                write_hook(tmp_path, "b.json", "b", priority=priority)
+            await wait_for(lambda: registry.hot_reloads >= 1)
+            await asyncio.sleep(0.4)
+            
+            assert registry.hot_reloads == 1
+            assert await dispatched(registry) == ["b", "a"]
+            assert await registry.get_hook("a") is original_a
+            
+            write_hook(tmp_path, "b.json", "renamed", priority=0)
+            await wait_for(lambda: registry.hot_reloads >= 2)
+            assert await dispatched(registry) == ["a", "renamed"]
+            
+            (tmp_path / "a.json").unlink()
+            await wait_for(lambda: registry.hot_reloads >= 3)
+            assert await dispatched(registry) == ["renamed"]
+            
+            stats = registry.get_stats()
+            assert stats["watching"]
+            assert stats["total_hooks"] == 1
+        finally:
+            await registry.shutdown()
+        
+        assert not registry.get_stats()["watching"]
+    
+    @pytest.mark.asyncio
+    async def test_readers_never_see_partial_update(self, tmp_path):
+        """Test that a replaced hook is never missing from dispatch."""
+        for i in range(20):
+            write_hook(tmp_path, f"h{i}.json", f"h{i}")
+        registry = HookRegistry(tmp_path)
+        await registry.initialize(watch=True)
+        
+        seen = []
+        stop = asyncio.Event()
+        
+        async def reader():
+            while not stop.is_set():
+                seen.append(len(await dispatched(registry)))
+                await asyncio.sleep(0)
+        
+        task = asyncio.create_task(reader())
+        try:
+            for i in range(20):
+                write_hook(tmp_path, f"h{i}.json", f"h{i}", priority=i)
+            # h0 keeps priority 0, so its rewrite is not a change
+            await wait_for(lambda: registry.hot_reload_changes >= 19)
+        finally:
+            stop.set()
+            await task
+            await registry.shutdown()
+        
+        assert set(seen) == {20}
+        assert (await dispatched(registry))[0] == "h19"
@@ -0,0 +1,96 @@
+"""
+Functional tests for hook registry dispatch.
+"""
+
+import pytest
+
+from shannon_mcp.hooks.config import (
+    HookTrigger, HookCondition
+)
+from shannon_mcp.hooks.registry import HookRegistry
+from shannon_mcp.utils.errors import ValidationError
+
+
+class TestCompiledConditions:
+    """Test condition compilation."""
+    
+    def test_operators(self):
+        """Test each operator against nested fields."""
+        context = {"file": {"path": "src/app.py", "size": 120}, "user": "ada"}
+        
+        assert HookCondition("user", "eq", "ada").compile()(context)
+        assert HookCondition("user", "ne", "bob").compile()(context)
+        assert HookCondition("file.size", "gt", 100).compile()(context)
+        assert not HookCondition("file.size", "lt", 100).compile()(context)
+        assert HookCondition("file.path", "contains", "app").compile()(context)
+        assert HookCondition("file.path", "regex", r"src/.*\.py").compile()(context)
+        assert HookCondition("file.missing.deep", "eq", None).compile()(context)
+    
+    def test_invalid_condition_rejected_at_compile(self):
+        """Test that bad operators and patterns fail before evaluation."""
+        with pytest.raises(ValidationError):
+            HookCondition("user", "between", 1).compile()
+        
+        with pytest.raises(ValidationError):
+            HookCondition("user", "regex", "(").compile()
+
+
+class TestDispatchTable:
+    """Test trigger lookup."""
+    
+    @pytest.mark.asyncio
+    async def test_priority_order_with_custom_hooks(self, make_hook):
+        """Test that CUSTOM hooks join every trigger in priority order."""
+        registry = HookRegistry()
+        await registry.register(make_hook("low", [HookTrigger.FILE_MODIFY], priority=1))
+        await registry.register(make_hook("high", [HookTrigger.FILE_MODIFY], priority=9))
+        await registry.register(make_hook("any", [HookTrigger.CUSTOM], priority=5))
+        await registry.register(make_hook("other", [HookTrigger.SESSION_START]))
+        
+        hooks = await registry.get_hooks_for_trigger(HookTrigger.FILE_MODIFY)
+        assert [h.name for h in hooks] == ["high", "any", "low"]
+        
+        hooks = await registry.get_hooks_for_trigger("custom")
+        assert [h.name for h in hooks] == ["any"]
+    
+    @pytest.mark.asyncio
+    async def test_conditions_filter_hooks(self, make_hook):
+        """Test that compiled conditions filter only when context is given."""
+        registry = HookRegistry()
+        await registry.register(make_hook(
+            "python_only",
+            [HookTrigger.FILE_MODIFY],
+            conditions=[HookCondition("file.path", "regex", r".*\.py$")]
+        ))
+        
+        match = await registry.get_hooks_for_trigger(
+            HookTrigger.FILE_MODIFY, {"file": {"path": "a.py"}}
+        )
+        miss = await registry.get_hooks_for_trigger(
+            HookTrigger.FILE_MODIFY, {"file": {"path": "a.js"}}
+        )
+        unfiltered = await registry.get_hooks_for_trigger(HookTrigger.FILE_MODIFY)
+        
+        assert [h.name for h in match] == ["python_only"]
+        assert miss == []
+        assert [h.name for h in unfiltered] == ["python_only"]
+    
+    @pytest.mark.asyncio
+    async def test_changes_rebuild_dispatch(self, make_hook):
+        """Test that enable, disable, update and unregister take effect."""
+        registry = HookRegistry()
+        await registry.register(make_hook("a", [HookTrigger.SESSION_END], priority=1))
+        await registry.register(make_hook("b", [HookTrigger.SESSION_END], priority=2))
+        
+        await registry.disable_hook("b")
+        hooks = await registry.get_hooks_for_trigger(HookTrigger.SESSION_END)
+        assert [h.name for h in hooks] == ["a"]
+        
+        await registry.enable_hook("b")
+        await registry.update_hook("a", {"priority": 10})
+        hooks = await registry.get_hooks_for_trigger(HookTrigger.SESSION_END)
+        assert [h.name for h in hooks] == ["a", "b"]
+        
+        await registry.unregister("a")
+        hooks = await registry.get_hooks_for_trigger(HookTrigger.SESSION_END)
+        assert [h.name for h in hooks] == ["b"]
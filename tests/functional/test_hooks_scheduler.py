@@ -0,0 +1,102 @@
+"""
+Functional tests for bounded hook execution.
+"""
+
+import asyncio
+
+import pytest
+
+from shannon_mcp.hooks.scheduler import HookScheduler
+
+
+class Probe:
+    """Records how many invocations overlap."""
+    
+    def __init__(self):
+        self.current = 0
+        self.peak = 0
+        self.order = []
+    
+    def job(self, label, delay=0.01):
+        async def run():
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+            self.order.append(label)
+            await asyncio.sleep(delay)
+            self.current -= 1
+            return label
+        return run
+
+
+class TestHookScheduler:
+    """Test worker bounds, ordering and per-hook limits."""
+    
+    @pytest.mark.asyncio
+    async def test_worker_pool_is_bounded(self, make_hook):
+        """Test that no more than max_workers invocations overlap."""
+        scheduler = HookScheduler(max_workers=3)
+        probe = Probe()
+        
+        futures = [
+            scheduler.submit(make_hook(f"h{i}"), probe.job(i))
+            for i in range(10)
+        ]
+        assert scheduler.queued == 7
+        
+        assert await asyncio.gather(*futures) == list(range(10))
+        assert probe.peak == 3
+        
+        stats = scheduler.get_stats()
+        assert stats["completed"] == 10
+        assert stats["max_queue_depth"] == 7
+        assert stats["wait_ms"]["count"] == 10
+    
+    @pytest.mark.asyncio
+    async def test_higher_priority_starts_first(self, make_hook):
+        """Test priority order, FIFO within a priority."""
+        scheduler = HookScheduler(max_workers=1)
+        probe = Probe()
+        
+        scheduler.submit(make_hook("blocker"), probe.job("blocker"))
+        scheduler.submit(make_hook("low"), probe.job("low"))
+        scheduler.submit(make_hook("high_a", priority=5), probe.job("high_a"))
+        scheduler.submit(make_hook("mid", priority=1), probe.job("mid"))
+        scheduler.submit(make_hook("high_b", priority=5), probe.job("high_b"))
+        await scheduler.drain()
+        
+        assert probe.order == ["blocker", "high_a", "high_b", "mid", "low"]
+    
+    @pytest.mark.asyncio
+    async def test_busy_hook_queues_instead_of_failing(self, make_hook):
+        """Test per-hook limits while other hooks keep running."""
+        scheduler = HookScheduler(max_workers=4)
+        serial = Probe()
+        pair = Probe()
+        
+        hook = make_hook("serial")
+        paired = make_hook("paired", max_concurrency=2)
+        futures = [scheduler.submit(hook, serial.job(i)) for i in range(3)]
+        futures += [scheduler.submit(paired, pair.job(i)) for i in range(4)]
+        
+        results = await asyncio.gather(*futures)
+        
+        assert results == [0, 1, 2, 0, 1, 2, 3]
+        assert serial.peak == 1
+        assert pair.peak == 2
+        assert serial.order == [0, 1, 2]
+    
+    @pytest.mark.asyncio
+    async def test_detached_failure_is_contained(self, make_hook):
+        """Test that fire-and-forget failures are counted, not raised."""
+        scheduler = HookScheduler()
+        
+        async def boom():
+            raise RuntimeError("boom")
+        
+        scheduler.submit(make_hook("boom"), boom, detached=True)
+        await scheduler.drain()
+        
+        stats = scheduler.get_stats()
+        assert stats["failed"] == 1
+        assert stats["detached"] == 1
+        assert stats["running"] == 0
@@ -0,0 +1,122 @@
+"""
+Functional tests for the pooled webhook client.
+"""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from shannon_mcp.hooks.webhook import WebhookClient
+from shannon_mcp.utils.errors import HookExecutionError
+
+
+@pytest.fixture
+async def webhook_server():
+    """Local stand-in webhook receiver recording requests."""
+    received = []
+    
+    async def handle(request):
+        received.append({
+            "peer": request.transport.get_extra_info("peername"),
+            "body": await request.json() if request.can_read_body else None
+        })
+        return web.json_response({"ok": True})
+    
+    async def fail(request):
+        return web.Response(status=500, text="boom")
+    
+    app = web.Application()
+    app.router.add_route("*", "/hook", handle)
+    app.router.add_post("/fail", fail)
+    
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    
+    yield f"http://127.0.0.1:{port}", received
+    
+    await runner.cleanup()
+
+
+class TestWebhookClient:
+    """Test pooled delivery and batching."""
+    
+    @pytest.mark.asyncio
+    async def test_requests_reuse_pooled_connection(self, webhook_server):
+        """Test that sequential webhooks share one keep-alive connection."""
+        base_url, received = webhook_server
+        client = WebhookClient()
+        try:
+            for i in range(5):
+                result = await client.post(f"{base_url}/hook", {"n": i})
+                assert result["status_code"] == 200
+                assert result["json"] == {"ok": True}
+            
+            await client.get(f"{base_url}/hook")
+        finally:
+            await client.close()
+        
+        assert [r["body"] for r in received[:5]] == [{"n": i} for i in range(5)]
+        assert len({r["peer"] for r in received}) == 1
+        assert client.get_stats()["requests"] == 6
+    
+    @pytest.mark.asyncio
+    async def test_batches_payloads_to_same_url(self, webhook_server):
+        """Test that POSTs within the window are sent as one request."""
+        base_url, received = webhook_server
+        client = WebhookClient()
+        try:
+            results = await asyncio.gather(*[
+                client.post(f"{base_url}/hook", {"n": i}, batch_window=0.05)
+                for i in range(3)
+            ])
+        finally:
+            await client.close()
+        
+        assert len(received) == 1
+        assert received[0]["body"] == {"batch": [{"n": 0}, {"n": 1}, {"n": 2}]}
+        assert all(result["batched"] == 3 for result in results)
+        
+        stats = client.get_stats()
+        assert stats["batches_sent"] == 1
+        assert stats["batched_payloads"] == 3
+    
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_early(self, webhook_server):
+        """Test that reaching the batch size sends without waiting."""
+        base_url, received = webhook_server
+        client = WebhookClient(max_batch_size=2)
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*[
+                    client.post(f"{base_url}/hook", {"n": i}, batch_window=60)
+                    for i in range(2)
+                ]),
+                timeout=5
+            )
+        finally:
+            await client.close()
+        
+        assert len(received) == 1
+    
+    @pytest.mark.asyncio
+    async def test_error_status_fails_every_caller(self, webhook_server):
+        """Test that an error response is raised to batched callers."""
+        base_url, _ = webhook_server
+        client = WebhookClient()
+        try:
+            with pytest.raises(HookExecutionError):
+                await client.post(f"{base_url}/fail", {})
+            
+            results = await asyncio.gather(
+                client.post(f"{base_url}/fail", {"n": 1}, batch_window=0.01),
+                client.post(f"{base_url}/fail", {"n": 2}, batch_window=0.01),
+                return_exceptions=True
+            )
+        finally:
+            await client.close()
+        
+        assert all(isinstance(result, HookExecutionError) for result in results)
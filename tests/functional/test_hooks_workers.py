@@ -0,0 +1,153 @@
+"""
+Functional tests for persistent script hook workers.
+"""
+
+import asyncio
+import os
+import shutil
+
+import pytest
+
+from shannon_mcp.hooks.workers import ScriptWorkerPool
+from shannon_mcp.utils.errors import HookExecutionError
+
+
+COUNTER_SCRIPT = """
+import os
+calls = 0
+
+def handle(context):
+    global calls
+    calls += 1
+    print("called")
+    return {"calls": calls, "pid": os.getpid(), "value": context.get("value")}
+"""
+
+
+@pytest.fixture
+def script(tmp_path):
+    """Python hook script keeping a call counter."""
+    path = tmp_path / "counter.py"
+    path.write_text(COUNTER_SCRIPT)
+    return path
+
+
+@pytest.fixture
+async def pool():
+    """Worker pool closed after the test."""
+    pool = ScriptWorkerPool(max_calls=3)
+    yield pool
+    await pool.close()
+
+
+class TestScriptWorkerPool:
+    """Test worker reuse, recycling and failure handling."""
+    
+    @pytest.mark.asyncio
+    async def test_worker_serves_repeated_calls(self, pool, script):
+        """Test that one interpreter handles calls until recycled."""
+        env = dict(os.environ)
+        results = [await pool.call(script, {"value": i}, env=env) for i in range(4)]
+        
+        assert [r["result"]["calls"] for r in results] == [1, 2, 3, 1]
+        assert results[0]["stdout"] == "called\n"
+        assert results[1]["result"]["value"] == 1
+        assert len({r["worker_pid"] for r in results[:3]}) == 1
+        assert results[3]["worker_pid"] != results[0]["worker_pid"]
+        
+        stats = pool.get_stats()
+        assert stats["spawned"] == 2
+        assert stats["recycled"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_script_change_reloads_worker(self, pool, script):
+        """Test that a newer mtime starts a fresh worker."""
+        env = dict(os.environ)
+        await pool.call(script, {}, env=env)
+        
+        script.write_text("def handle(context):\n    return 'v2'\n")
+        stat = script.stat()
+        os.utime(script, (stat.st_atime, stat.st_mtime + 10))
+        
+        result = await pool.call(script, {}, env=env)
+        assert result["result"] == "v2"
+    
+    @pytest.mark.asyncio
+    async def test_recycling_waits_for_queued_callers(self, pool, tmp_path):
+        """Test that callers already holding a recycled worker finish on it."""
+        path = tmp_path / "slow.py"
+        path.write_text(
+            "import os, time\n"
+            "def handle(context):\n"
+            "    time.sleep(0.2)\n"
+            "    return os.getpid()\n"
+        )
+        env = dict(os.environ)
+        
+        queued = [asyncio.create_task(pool.call(path, {}, env=env)) for _ in range(3)]
+        await asyncio.sleep(0.1)
+        
+        stat = path.stat()
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+        fresh = await pool.call(path, {}, env=env)
+        
+        results = await asyncio.gather(*queued)
+        assert len({r["result"] for r in results}) == 1
+        assert fresh["result"] != results[0]["result"]
+        assert pool.get_stats()["recycled"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_handler_errors_and_crashes(self, pool, tmp_path):
+        """Test that failures raise and a crashed worker is replaced."""
+        path = tmp_path / "flaky.py"
+        path.write_text(
+            "import sys\n"
+            "def handle(context):\n"
+            "    if context['mode'] == 'raise':\n"
+            "        raise ValueError('bad input')\n"
+            "    if context['mode'] == 'exit':\n"
+            "        sys.exit(3)\n"
+            "    return 'ok'\n"
+        )
+        env = dict(os.environ)
+        
+        with pytest.raises(HookExecutionError, match="bad input"):
+            await pool.call(path, {"mode": "raise"}, env=env)
+        
+        with pytest.raises(HookExecutionError, match="exited"):
+            await pool.call(path, {"mode": "exit"}, env=env)
+        
+        result = await pool.call(path, {"mode": "ok"}, env=env)
+        assert result["result"] == "ok"
+    
+    @pytest.mark.asyncio
+    async def test_timeout_kills_worker(self, pool, tmp_path):
+        """Test that a hung handler times out."""
+        path = tmp_path / "slow.py"
+        path.write_text("import time\ndef handle(context):\n    time.sleep(5)\n")
+        
+        with pytest.raises(HookExecutionError, match="timed out"):
+            await pool.call(path, {}, env=dict(os.environ), timeout=0.5)
+    
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+    async def test_node_worker(self, pool, tmp_path):
+        """Test a Node script exporting an async handler."""
+        path = tmp_path / "hook.js"
+        path.write_text(
+            "let calls = 0;\n"
+            "module.exports = async (context) => { calls += 1; return calls * context.n; };\n"
+        )
+        env = dict(os.environ)
+        
+        first = await pool.call(path, {"n": 2}, env=env)
+        second = await pool.call(path, {"n": 2}, env=env)
+        
+        assert (first["result"], second["result"]) == (2, 4)
+        assert first["worker_pid"] == second["worker_pid"]
+    
+    def test_supported_scripts(self, tmp_path):
+        """Test which script types get workers."""
+        assert ScriptWorkerPool.supports(tmp_path / "a.py")
+        assert ScriptWorkerPool.supports(tmp_path / "a.js")
+        assert not ScriptWorkerPool.supports(tmp_path / "a.sh")
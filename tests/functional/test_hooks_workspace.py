@@ -0,0 +1,127 @@
+"""
+Functional tests for cached sandbox workspaces.
+"""
+
+import asyncio
+import os
+
+import pytest
+
+from shannon_mcp.hooks.sandbox import HookSandbox
+from shannon_mcp.hooks.workspace import WorkspaceCache
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Small source tree exposed to hooks."""
+    root = tmp_path / "project"
+    (root / "src").mkdir(parents=True)
+    (root / "src" / "main.py").write_text("print('hi')\n")
+    (root / "README.md").write_text("readme\n")
+    (root / "empty").mkdir()
+    return root
+
+
+@pytest.fixture
+async def cache(tmp_path):
+    """Workspace cache under a scratch directory."""
+    cache = WorkspaceCache(tmp_path / "sandbox")
+    yield cache
+    await cache.clear()
+
+
+def bump(path, text):
+    """Rewrite a file with a later mtime."""
+    path.write_text(text)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class TestWorkspaceCache:
+    """Test template reuse, verification and workspace isolation."""
+    
+    @pytest.mark.asyncio
+    async def test_workspaces_reuse_template(self, cache, project):
+        """Test that the tree is copied once and then cloned."""
+        first = await cache.create("cmd_", [project])
+        second = await cache.create("cmd_", [project])
+        
+        assert first != second
+        for workspace in (first, second):
+            assert (workspace / "project" / "src" / "main.py").read_text() == "print('hi')\n"
+            assert (workspace / "project" / "empty").is_dir()
+        
+        stats = cache.get_stats()
+        assert stats["template_builds"] == 1
+        assert stats["template_hits"] == 1
+        assert stats["files_populated"] == 4
+        assert cache.mode in ("reflink", "copy")
+    
+    @pytest.mark.asyncio
+    async def test_source_change_rebuilds_template(self, cache, project):
+        """Test that edited, added and removed sources are picked up."""
+        await cache.create("cmd_", [project])
+        
+        bump(project / "README.md", "changed\n")
+        (project / "new.txt").write_text("new\n")
+        (project / "src" / "main.py").unlink()
+        
+        workspace = await cache.create("cmd_", [project])
+        
+        assert (workspace / "project" / "README.md").read_text() == "changed\n"
+        assert (workspace / "project" / "new.txt").exists()
+        assert not (workspace / "project" / "src" / "main.py").exists()
+        assert cache.get_stats()["template_invalidations"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_in_place_writes_stay_private(self, cache, project):
+        """Test that editing a workspace file reaches no other workspace."""
+        first = await cache.create("cmd_", [project])
+        second = await cache.create("cmd_", [project])
+        
+        readme = first / "project" / "README.md"
+        with open(readme, "r+") as f:
+            f.write("HACKED")
+        
+        fresh = await cache.create("cmd_", [project])
+        
+        for workspace in (second, fresh):
+            path = workspace / "project" / "README.md"
+            assert path.read_text() == "readme\n"
+            assert path.stat().st_ino != readme.stat().st_ino
+        assert (project / "README.md").read_text() == "readme\n"
+        assert cache.get_stats()["template_builds"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_removing_workspace_keeps_template(self, cache, project):
+        """Test that cleanup of one workspace does not affect others."""
+        first = await cache.create("cmd_", [project])
+        second = await cache.create("cmd_", [project])
+        
+        await cache.remove(first)
+        
+        assert not first.exists()
+        assert (second / "project" / "README.md").read_text() == "readme\n"
+        assert cache.get_stats()["template_builds"] == 1
+
+
+class TestSandboxWorkspaces:
+    """Test sandboxed execution on cached workspaces."""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_commands_get_separate_workspaces(self, project):
+        """Test that parallel executions neither collide nor copy twice."""
+        sandbox = HookSandbox()
+        await sandbox.initialize()
+        try:
+            results = await asyncio.gather(*[
+                sandbox.execute_command("cat project/README.md", allowed_paths=[project])
+                for _ in range(5)
+            ])
+            
+            assert all(result["stdout"] == "readme\n" for result in results)
+            assert len({result["sandbox_dir"] for result in results}) == 5
+            assert not any(os.path.exists(result["sandbox_dir"]) for result in results)
+            assert sandbox.get_stats()["workspaces"]["template_builds"] == 1
+        finally:
+            await sandbox.cleanup()
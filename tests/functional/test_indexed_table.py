@@ -0,0 +1,146 @@
+"""
+Functional tests for the indexed process table.
+"""
+
+import asyncio
+import pytest
+import random
+from dataclasses import dataclass
+
+from shannon_mcp.utils.table import IndexedTable
+from shannon_mcp.registry.storage import RegistryStorage, ProcessStatus
+
+from .test_registry_storage import _entry
+
+
+@dataclass
+class _Row:
+    """Minimal process-like row."""
+    id: str
+    pid: int
+    session: str
+    status: str
+
+
+def _table() -> IndexedTable:
+    """Create a table indexed like the process manager's."""
+    return IndexedTable(
+        key=lambda row: row.id,
+        indexes={
+            "pid": lambda row: row.pid,
+            "session": lambda row: row.session,
+            "status": lambda row: row.status
+        },
+        unique=("pid",)
+    )
+
+
+class TestIndexedTable:
+    """Test index maintenance against a brute-force scan."""
+    
+    def test_find_matches_linear_scan(self):
+        """Test that indexed queries agree with filtering every row."""
+        rng = random.Random(7)
+        table = _table()
+        rows = {}
+        
+        for step in range(2000):
+            op = rng.random()
+            row_id = f"p{rng.randrange(200)}"
+            if op < 0.5:
+                row = _Row(row_id, rng.randrange(10_000), f"s{rng.randrange(10)}", rng.choice("abc"))
+                table.put(row)
+                rows[row_id] = row
+            elif op < 0.8 and row_id in rows:
+                rows[row_id].status = rng.choice("abc")
+                table.reindex(rows[row_id])
+            elif row_id in rows:
+                table.pop(row_id)
+                del rows[row_id]
+            
+            session, status = f"s{rng.randrange(10)}", rng.choice("abc")
+            expected = [r for r in rows.values() if r.session == session and r.status == status]
+            assert sorted(r.id for r in table.find(session=session, status=status)) == sorted(r.id for r in expected)
+            assert table.count("status", status) == sum(1 for r in rows.values() if r.status == status)
+        
+        assert len(table) == len(rows)
+    
+    def test_unique_index_follows_latest_row(self):
+        """Test that a reused PID maps to the newest row and survives old removals."""
+        table = _table()
+        table.put(_Row("old", 42, "s1", "running"))
+        table.put(_Row("new", 42, "s2", "running"))
+        
+        assert table.lookup("pid", 42).id == "new"
+        
+        table.pop("old")
+        assert table.lookup("pid", 42).id == "new"
+        assert table.find(pid=42, session="s1") == []
+    
+    def test_in_place_change_requires_reindex(self):
+        """Test that reindex moves a row between status buckets."""
+        table = _table()
+        row = _Row("p1", 1, "s1", "running")
+        table.put(row)
+        
+        row.status = "stopped"
+        table.reindex(row)
+        
+        assert table.find(status="running") == []
+        assert table.find(status="stopped") == [row]
+        assert table.get_stats()["indexes"]["status"] == 1
+
+
+class TestRegistryTableCache:
+    """Test the registry storage read-through cache."""
+    
+    @pytest.mark.asyncio
+    async def test_reloads_only_on_external_writes(self, tmp_path):
+        """Test that own writes update the table and other writers force a reload."""
+        storage = RegistryStorage(tmp_path / "registry.db", batch_interval=0.01)
+        other = RegistryStorage(tmp_path / "registry.db", batch_interval=0.01)
+        await storage.initialize()
+        await other.initialize()
+        
+        try:
+            await storage.register_process(_entry(1, "s1"))
+            assert len(await storage.get_all_processes()) == 1
+            reloads = storage.table_reloads
+            
+            await storage.update_process_status(1, "test-host", ProcessStatus.RUNNING)
+            running = await storage.get_session_processes("s1", ProcessStatus.RUNNING)
+            assert [p.pid for p in running] == [1]
+            assert storage.table_reloads == reloads
+            
+            await other.register_process(_entry(2, "s2"))
+            assert [p.pid for p in await storage.get_all_processes()] == [1, 2]
+            assert storage.table_reloads == reloads + 1
+            
+            # Returned entries are copies
+            entry = await storage.get_process(1, "test-host")
+            entry.metadata["mutated"] = True
+            assert "mutated" not in (await storage.get_process(1, "test-host")).metadata
+        finally:
+            await storage.close()
+            await other.close()
+    
+    @pytest.mark.asyncio
+    async def test_reads_do_not_wait_for_writer(self, tmp_path):
+        """Test that cache checks and reloads bypass the writer lock."""
+        storage = RegistryStorage(tmp_path / "registry.db", batch_interval=0.01)
+        other = RegistryStorage(tmp_path / "registry.db", batch_interval=0.01)
+        await storage.initialize()
+        await other.initialize()
+        
+        try:
+            await storage.register_process(_entry(1, "s1"))
+            await storage.get_all_processes()
+            await other.register_process(_entry(2, "s2"))
+            
+            async with storage._lock:
+                processes = await asyncio.wait_for(storage.get_all_processes(), timeout=1.0)
+                assert [p.pid for p in processes] == [1, 2]
+                assert await asyncio.wait_for(storage.get_process(1, "test-host"), timeout=1.0)
+        finally:
+            await storage.close()
+            await other.close()
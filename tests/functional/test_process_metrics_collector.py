@@ -0,0 +1,95 @@
+"""
+Functional tests for the batched process metrics collector.
+"""
+
+import pytest
+import asyncio
+import os
+import subprocess
+import sys
+
+import psutil
+
+from shannon_mcp.managers import metrics_collector
+from shannon_mcp.managers.metrics_collector import ProcessMetricsCollector
+from shannon_mcp.managers.process import ProcessMetrics
+
+
+@pytest.fixture
+def child():
+    """Start a short-lived child process."""
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    yield proc
+    proc.kill()
+    proc.wait()
+
+
+class TestProcessMetricsCollector:
+    """Test bulk process sampling."""
+    
+    @pytest.mark.asyncio
+    async def test_collects_all_pids_in_worker_thread(self, child):
+        """Test that one pass samples every live PID."""
+        collector = ProcessMetricsCollector()
+        
+        samples = await asyncio.to_thread(collector.collect, [os.getpid(), child.pid])
+        
+        assert set(samples) == {os.getpid(), child.pid}
+        assert samples[os.getpid()].memory_rss_mb > 0
+        assert samples[os.getpid()].num_threads >= 1
+        assert collector.get_stats()["last_pass_size"] == 2
+    
+    def test_expensive_probes_follow_slow_cadence(self):
+        """Test that smaps, connections and open files are not probed every pass."""
+        collector = ProcessMetricsCollector(expensive_interval=3600)
+        
+        first = collector.collect([os.getpid()])[os.getpid()]
+        second = collector.collect([os.getpid()])[os.getpid()]
+        
+        assert first.has_expensive
+        assert first.open_files is not None
+        assert not second.has_expensive
+        assert collector.expensive_probes == 1
+    
+    def test_exited_and_untracked_pids_are_dropped(self, child):
+        """Test that dead PIDs are omitted and stale handles are released."""
+        collector = ProcessMetricsCollector()
+        collector.collect([os.getpid(), child.pid])
+        
+        child.kill()
+        child.wait()
+        
+        samples = collector.collect([os.getpid(), child.pid])
+        assert child.pid not in samples
+        assert samples.exited == {child.pid}
+        
+        collector.collect([])
+        assert collector.get_stats()["cached_handles"] == 0
+    
+    def test_unreadable_pids_are_not_reported_exited(self, monkeypatch):
+        """Test that permission errors and failed samples leave exited empty."""
+        def failing_sample(proc, expensive=True):
+            if proc.pid == os.getpid():
+                raise psutil.AccessDenied(proc.pid)
+            raise RuntimeError("probe failed")
+        
+        monkeypatch.setattr(metrics_collector, "sample_process", failing_sample)
+        collector = ProcessMetricsCollector()
+        
+        samples = collector.collect([os.getpid(), os.getppid()])
+        
+        assert len(samples) == 0
+        assert samples.exited == set()
+    
+    def test_apply_sample_keeps_previous_expensive_values(self):
+        """Test that cheap-only samples do not reset slow-cadence metrics."""
+        collector = ProcessMetricsCollector(expensive_interval=3600)
+        metrics = ProcessMetrics()
+        
+        metrics.apply_sample(collector.collect([os.getpid()])[os.getpid()])
+        open_files = metrics.open_files
+        metrics.apply_sample(collector.collect([os.getpid()])[os.getpid()])
+        
+        assert metrics.open_files == open_files
+        assert metrics.memory_mb > 0
+        assert len(metrics.history.cpu_history) == 2
@@ -0,0 +1,183 @@
+"""
+Functional tests for event-driven process exit detection.
+"""
+
+import pytest
+import asyncio
+import psutil
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+
+from shannon_mcp.utils.process_watcher import (
+    ProcessExitWatcher, BACKEND_PIDFD, BACKEND_POLL
+)
+from shannon_mcp.registry.storage import RegistryStorage, ProcessEntry, ProcessStatus
+from shannon_mcp.registry.tracker import ProcessTracker
+from shannon_mcp.registry.validator import ProcessValidator
+from shannon_mcp.registry.cleaner import RegistryCleaner
+
+
+def _spawn() -> subprocess.Popen:
+    """Start a child that sleeps until killed."""
+    return subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+
+
+async def _watch_kill(watcher: ProcessExitWatcher, proc: subprocess.Popen) -> float:
+    """Kill a watched child and return seconds until the exit was delivered."""
+    exited = asyncio.Event()
+    watcher.watch(proc.pid, lambda pid: exited.set())
+    
+    start = time.monotonic()
+    proc.kill()
+    await asyncio.wait_for(exited.wait(), timeout=5)
+    return time.monotonic() - start
+
+
+class TestProcessExitWatcher:
+    """Test each watch backend."""
+    
+    @pytest.mark.asyncio
+    async def test_pidfd_backend_delivers_without_reaping(self):
+        """Test that exits arrive promptly and the exit status stays collectable."""
+        watcher = ProcessExitWatcher(poll_interval=60, backends=(BACKEND_PIDFD,))
+        proc = _spawn()
+        
+        try:
+            elapsed = await _watch_kill(watcher, proc)
+        except ValueError:
+            proc.kill()
+            proc.wait()
+            pytest.skip("pidfd backend unavailable")
+        
+        assert elapsed < 1.0
+        assert proc.wait(timeout=5) == -9
+        assert watcher.get_stats()["watched"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_poll_backend_fallback(self):
+        """Test that polling still detects exits when nothing else is available."""
+        watcher = ProcessExitWatcher(poll_interval=0.05, backends=(BACKEND_POLL,))
+        proc = _spawn()
+        
+        try:
+            await _watch_kill(watcher, proc)
+        finally:
+            proc.wait()
+        
+        assert watcher.poll_passes >= 1
+    
+    @pytest.mark.asyncio
+    async def test_watching_children_starts_no_threads(self):
+        """Test that unwatched children leave nothing behind on any backend."""
+        watcher = ProcessExitWatcher(poll_interval=60)
+        procs = [_spawn() for _ in range(5)]
+        threads = threading.active_count()
+        
+        try:
+            for proc in procs:
+                watcher.watch(proc.pid, lambda pid: None)
+            assert threading.active_count() == threads
+            
+            for proc in procs:
+                watcher.unwatch(proc.pid)
+            assert watcher.get_stats()["watched"] == 0
+        finally:
+            watcher.close()
+            for proc in procs:
+                proc.kill()
+                proc.wait()
+    
+    @pytest.mark.asyncio
+    async def test_reused_pid_reports_exit_immediately(self):
+        """Test that a creation-time mismatch is treated as an exit."""
+        watcher = ProcessExitWatcher()
+        proc = _spawn()
+        exited = []
+        
+        try:
+            watcher.watch(proc.pid, exited.append, create_time=time.time() - 3600)
+            await asyncio.sleep(0.05)
+        finally:
+            proc.kill()
+            proc.wait()
+        
+        assert exited == [proc.pid]
+    
+    @pytest.mark.asyncio
+    async def test_callbacks_run_before_listeners(self):
+        """Test that per-PID callbacks finish before listeners see the exit."""
+        watcher = ProcessExitWatcher()
+        proc = _spawn()
+        order = []
+        done = asyncio.Event()
+        
+        async def callback(pid):
+            await asyncio.sleep(0.01)
+            order.append("callback")
+        
+        def listener(pid):
+            order.append("listener")
+            done.set()
+        
+        watcher.add_listener(listener)
+        watcher.watch(proc.pid, callback)
+        proc.kill()
+        proc.wait()
+        await asyncio.wait_for(done.wait(), timeout=5)
+        
+        assert order == ["callback", "listener"]
+
+
+class TestRegistryExitEvents:
+    """Test that registry components react to pushed exits."""
+    
+    @pytest.mark.asyncio
+    async def test_tracker_and_cleaner_handle_exit(self, tmp_path):
+        """Test that an exit marks the process stopped and removes it."""
+        storage = RegistryStorage(tmp_path / "registry.db", batch_interval=0.01)
+        await storage.initialize()
+        watcher = ProcessExitWatcher(poll_interval=60)
+        tracker = ProcessTracker(storage, exit_watcher=watcher)
+        cleaner = RegistryCleaner(storage, ProcessValidator(storage, tracker), exit_watcher=watcher)
+        await cleaner.start_periodic_cleanup(interval_hours=24)
+        proc = _spawn()
+        
+        try:
+            await storage.register_process(ProcessEntry(
+                pid=proc.pid,
+                session_id="s1",
+                project_path=None,
+                command="python",
+                args=[],
+                env={},
+                status=ProcessStatus.RUNNING,
+                started_at=datetime.fromtimestamp(psutil.Process(proc.pid).create_time(), timezone.utc),
+                last_seen=datetime.now(timezone.utc),
+                host=tracker.hostname,
+                port=None,
+                user=None,
+                metadata={}
+            ))
+            await tracker._watch_registered_processes()
+            assert watcher.is_watching(proc.pid)
+            
+            proc.kill()
+            proc.wait()
+            
+            deadline = time.monotonic() + 5
+            while cleaner.exits_cleaned == 0 and time.monotonic() < deadline:
+                await asyncio.sleep(0.02)
+            
+            history = await storage.get_process_history(pid=proc.pid)
+        finally:
+            await cleaner.stop_periodic_cleanup()
+            await storage.close()
+        
+        assert tracker.exits_detected == 1
+        assert cleaner.exits_cleaned == 1
+        events = {(h["event_type"], h["new_status"]) for h in history}
+        assert ("status_changed", ProcessStatus.STOPPED.value) in events
+        assert ("removed", None) in events
@@ -0,0 +1,115 @@
+"""
+Functional tests for push-based cross-session messaging.
+"""
+
+import pytest
+import asyncio
+
+import aiosqlite
+
+from shannon_mcp.registry.storage import RegistryStorage
+
+
+@pytest.fixture
+async def storage(tmp_path):
+    """Create an initialized storage."""
+    storage = RegistryStorage(tmp_path / "registry.db")
+    await storage.initialize()
+    yield storage
+    await storage.close()
+
+
+class TestRegistryMessaging:
+    """Test mailboxes, long-polling and expiry."""
+    
+    @pytest.mark.asyncio
+    async def test_waiter_receives_pushed_message(self, storage):
+        """Test that a waiting session is woken by a local send."""
+        waiter = asyncio.create_task(storage.wait_for_messages("s2", timeout=5.0))
+        await asyncio.sleep(0.05)
+        
+        message_id = await storage.send_message("s1", "s2", "ping", {"n": 1})
+        messages = await asyncio.wait_for(waiter, timeout=1.0)
+        
+        assert [m["id"] for m in messages] == [message_id]
+        assert messages[0]["payload"] == {"n": 1}
+        assert messages[0]["read_at"] is not None
+        assert storage.get_stats()["messages_pushed"] == 1
+        
+        # Delivered messages are marked read in the durable log
+        assert await storage.get_messages("s2") == []
+    
+    @pytest.mark.asyncio
+    async def test_pending_messages_return_immediately(self, storage):
+        """Test that messages sent before waiting are not missed."""
+        await storage.send_message("s1", "s2", "ping", {})
+        await storage.send_message("s1", None, "broadcast", {})
+        
+        messages = await storage.wait_for_messages("s2", timeout=5.0)
+        
+        assert [m["message_type"] for m in messages] == ["ping", "broadcast"]
+    
+    @pytest.mark.asyncio
+    async def test_wait_times_out(self, storage):
+        """Test that an idle wait returns an empty list."""
+        assert await storage.wait_for_messages("s2", timeout=0.05) == []
+        assert storage.get_stats()["mailboxes"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_message_delivered_once(self, storage):
+        """Test that concurrent waiters on one session do not both get a message."""
+        waiters = [
+            asyncio.create_task(storage.wait_for_messages("s2", timeout=0.3))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0.05)
+        
+        await storage.send_message("s1", "s2", "ping", {})
+        results = await asyncio.gather(*waiters)
+        
+        assert sorted(len(messages) for messages in results) == [0, 1]
+    
+    @pytest.mark.asyncio
+    async def test_other_process_messages_are_noticed(self, storage):
+        """Test that messages committed by another connection wake a waiter."""
+        storage.message_poll_interval = 0.05
+        waiter = asyncio.create_task(storage.wait_for_messages("s2", timeout=5.0))
+        await asyncio.sleep(0.05)
+        
+        async with aiosqlite.connect(storage.db_path) as other:
+            await other.execute("""
+                INSERT INTO messages (
+                    from_session, to_session, message_type, payload,
+                    created_at, expires_at
+                ) VALUES ('s9', 's2', 'remote', '{}', '2000-01-01T00:00:00+00:00',
+                          '2999-01-01T00:00:00+00:00')
+            """)
+            await other.commit()
+        
+        messages = await asyncio.wait_for(waiter, timeout=2.0)
+        assert [m["message_type"] for m in messages] == ["remote"]
+    
+    @pytest.mark.asyncio
+    async def test_expiry_deletes_by_id(self, storage):
+        """Test that the timing wheel removes messages once their TTL passes."""
+        await storage.send_message("s1", "s2", "short", {}, ttl_seconds=0)
+        await storage.send_message("s1", "s2", "long", {}, ttl_seconds=3600)
+        
+        removed = await storage._expire_messages()
+        
+        assert removed == 1
+        assert storage.get_stats()["messages_scheduled"] == 1
+        messages = await storage.get_messages("s2", unread_only=False)
+        assert [m["message_type"] for m in messages] == ["long"]
+    
+    @pytest.mark.asyncio
+    async def test_recipient_query_uses_index(self, storage):
+        """Test that unread lookups are index range scans."""
+        cursor = await storage._read_db.execute("""
+            EXPLAIN QUERY PLAN
+            SELECT * FROM messages
+            WHERE to_session = ? AND read_at IS NULL AND expires_at > ?
+        """, ("s2", "2000-01-01"))
+        plan = " ".join(str(row[-1]) for row in await cursor.fetchall())
+        
+        assert "idx_messages_recipient" in plan
@@ -0,0 +1,71 @@
+"""
+Functional tests for the background system sampler.
+"""
+
+import pytest
+import asyncio
+import dataclasses
+import time
+
+from shannon_mcp.registry.sampler import SystemSampler
+from shannon_mcp.registry.monitor import ResourceMonitor, ResourceType
+
+
+class TestSystemSampler:
+    """Test non-blocking system sampling."""
+    
+    def test_sample_does_not_block(self):
+        """Test that samples are delta-based rather than sleeping."""
+        sampler = SystemSampler(interval=1.0)
+        
+        start = time.perf_counter()
+        first = sampler.sample()
+        second = sampler.sample()
+        elapsed = time.perf_counter() - start
+        
+        assert elapsed < 0.5
+        assert 0.0 <= first.cpu_percent <= 100.0
+        assert 0.0 <= second.cpu_percent <= 100.0
+        assert second.memory_total_mb > 0
+    
+    def test_snapshots_are_immutable(self):
+        """Test that published snapshots cannot be modified."""
+        snapshot = SystemSampler().sample()
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshot.cpu_percent = 0.0
+        if snapshot.net_io is not None:
+            with pytest.raises(TypeError):
+                snapshot.net_io["sent_mb"] = 0.0
+    
+    def test_thread_publishes_snapshots(self):
+        """Test that the background thread keeps the snapshot fresh."""
+        sampler = SystemSampler(interval=0.02)
+        sampler.start()
+        try:
+            deadline = time.monotonic() + 2.0
+            while sampler.samples_taken < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            sampler.stop()
+        
+        assert sampler.samples_taken >= 3
+        assert not sampler.running
+        assert sampler.get_stats()["sample_errors"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_get_system_stats_is_instant(self):
+        """Test that ResourceMonitor no longer stalls the event loop."""
+        monitor = ResourceMonitor(storage=None, tracker=None, system_sample_interval=0.05)
+        monitor.sampler.start()
+        try:
+            start = time.perf_counter()
+            stats = await monitor.get_system_stats()
+            elapsed = time.perf_counter() - start
+        finally:
+            await asyncio.to_thread(monitor.sampler.stop)
+        
+        assert elapsed < 0.1
+        assert ResourceType.CPU in stats
+        assert ResourceType.MEMORY in stats
+        assert "cpu_count" in stats[ResourceType.CPU].metadata
@@ -0,0 +1,78 @@
+"""
+Functional tests for incremental Claude process discovery.
+"""
+
+import pytest
+import subprocess
+import sys
+
+from shannon_mcp.registry.scanner import ClaudeProcessScanner, is_claude_command
+
+
+@pytest.fixture
+def claude_child():
+    """Start a child process whose command line mentions claude."""
+    proc = subprocess.Popen(
+        [sys.executable, "-c", "import time; time.sleep(30)", "claude-test"]
+    )
+    yield proc
+    proc.kill()
+    proc.wait()
+
+
+class TestClaudeProcessScanner:
+    """Test cached, incremental process classification."""
+    
+    def test_classification(self):
+        """Test name and command line matching."""
+        assert is_claude_command("claude", None)
+        assert is_claude_command("node", ["node", "/usr/lib/claude-code/cli.js"])
+        assert not is_claude_command("python", ["python", "-m", "http.server"])
+        assert not is_claude_command(None, None)
+    
+    @pytest.mark.asyncio
+    async def test_finds_new_process_incrementally(self, claude_child):
+        """Test that only PIDs new since the last scan are inspected."""
+        scanner = ClaudeProcessScanner()
+        
+        first = await scanner.refresh()
+        assert claude_child.pid in first
+        assert scanner.is_claude(claude_child.pid)
+        
+        await scanner.refresh()
+        stats = scanner.get_stats()
+        assert stats["last_inspected"] < stats["cached_pids"]
+        assert stats["scans"] == 2
+    
+    def test_exited_process_is_dropped(self, claude_child):
+        """Test that exited PIDs leave the cached set."""
+        scanner = ClaudeProcessScanner()
+        scanner.scan()
+        assert claude_child.pid in scanner.claude_pids
+        
+        claude_child.kill()
+        claude_child.wait()
+        
+        assert claude_child.pid not in scanner.scan()
+    
+    def test_pid_reuse_is_reclassified(self, claude_child):
+        """Test that a changed creation time triggers a fresh inspection."""
+        scanner = ClaudeProcessScanner(revalidate_interval=0)
+        scanner.scan()
+        
+        # Pretend the cached entry belonged to an earlier, non-Claude process
+        create_time, _ = scanner._known[claude_child.pid]
+        scanner._known[claude_child.pid] = (create_time - 60, False)
+        
+        assert claude_child.pid in scanner.scan()
+        assert scanner.reused_pids >= 1
+    
+    @pytest.mark.asyncio
+    async def test_refresh_reuses_recent_scan(self):
+        """Test that max_age serves the cached result without rescanning."""
+        scanner = ClaudeProcessScanner()
+        
+        await scanner.refresh()
+        await scanner.refresh(max_age=60)
+        
+        assert scanner.scans == 1
@@ -0,0 +1,122 @@
+"""
+Functional tests for batched registry storage writes.
+"""
+
+import pytest
+import asyncio
+from datetime import datetime, timezone
+
+from shannon_mcp.registry.storage import (
+    RegistryStorage, ProcessEntry, ProcessStatus, ProcessUpdate
+)
+from shannon_mcp.utils.errors import ShannonError
+
+
+def _entry(pid: int, session_id: str = "s1") -> ProcessEntry:
+    """Create a minimal process entry."""
+    now = datetime.now(timezone.utc)
+    return ProcessEntry(
+        pid=pid,
+        session_id=session_id,
+        project_path=None,
+        command="claude",
+        args=[],
+        env={},
+        status=ProcessStatus.STARTING,
+        started_at=now,
+        last_seen=now,
+        host="test-host",
+        port=None,
+        user=None,
+        metadata={}
+    )
+
+
+@pytest.fixture
+async def storage(tmp_path):
+    """Create an initialized storage."""
+    storage = RegistryStorage(tmp_path / "registry.db", batch_interval=0.02)
+    await storage.initialize()
+    yield storage
+    await storage.close()
+
+
+class TestBatchedRegistryWrites:
+    """Test group-committed updates and the read connection."""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_updates_share_one_commit(self, storage):
+        """Test that updates from many callers are committed together."""
+        for pid in range(100):
+            await storage.register_process(_entry(pid))
+        
+        await asyncio.gather(*[
+            storage.update_process_resources(pid, "test-host", cpu_percent=float(pid))
+            for pid in range(100)
+        ])
+        
+        stats = storage.get_stats()
+        assert stats["updates_committed"] == 100
+        assert stats["batches_committed"] == 1
+        
+        entry = await storage.get_process(42, "test-host")
+        assert entry.cpu_percent == 42.0
+        assert entry.status == ProcessStatus.STARTING
+    
+    @pytest.mark.asyncio
+    async def test_batch_records_status_history_in_order(self, storage):
+        """Test that each status change in a batch gets a history row."""
+        await storage.register_process(_entry(1))
+        
+        await storage.apply_updates([
+            ProcessUpdate(pid=1, host="test-host", status=ProcessStatus.RUNNING, memory_mb=10.0),
+            ProcessUpdate(pid=1, host="test-host", status=ProcessStatus.RUNNING),
+            ProcessUpdate(pid=1, host="test-host", status=ProcessStatus.BUSY, metadata={"k": "v"}),
+            ProcessUpdate(pid=999, host="test-host", status=ProcessStatus.STOPPED)
+        ])
+        
+        entry = await storage.get_process(1, "test-host")
+        assert entry.status == ProcessStatus.BUSY
+        assert entry.memory_mb == 10.0
+        assert entry.metadata == {"k": "v"}
+        
+        history = await storage.get_process_history(pid=1)
+        changes = [(h["old_status"], h["new_status"]) for h in history if h["event_type"] == "status_changed"]
+        assert sorted(changes) == [("running", "busy"), ("starting", "running")]
+        assert await storage.get_process(999, "test-host") is None
+    
+    @pytest.mark.asyncio
+    async def test_read_connection_is_read_only(self, storage):
+        """Test that readers use a separate read-only connection."""
+        await storage.register_process(_entry(7))
+        
+        processes = await storage.get_all_processes(host="test-host")
+        assert [p.pid for p in processes] == [7]
+        
+        with pytest.raises(Exception, match="readonly"):
+            await storage._read_db.execute("DELETE FROM processes")
+    
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending_updates(self, tmp_path):
+        """Test that queued updates are committed before closing."""
+        storage = RegistryStorage(tmp_path / "registry.db", batch_interval=60)
+        await storage.initialize()
+        await storage.register_process(_entry(3))
+        
+        update = asyncio.create_task(
+            storage.update_process_status(3, "test-host", ProcessStatus.STOPPED)
+        )
+        await asyncio.sleep(0.05)
+        await asyncio.wait_for(storage.close(), timeout=5)
+        await update
+        
+        with pytest.raises(ShannonError):
+            await storage.update_process_status(3, "test-host", ProcessStatus.RUNNING)
+        
+        reopened = RegistryStorage(tmp_path / "registry.db")
+        await reopened.initialize()
+        try:
+            entry = await reopened.get_process(3, "test-host")
+        finally:
+            await reopened.close()
+        assert entry.status == ProcessStatus.STOPPED
@@ -0,0 +1,160 @@
+"""
+Functional tests for partitioned retention and incremental vacuum.
+"""
+
+import pytest
+from datetime import date, datetime, timedelta
+
+import aiosqlite
+
+from shannon_mcp.utils.retention import (
+    DailyPartitionedTable, PartitionSummary,
+    enable_incremental_vacuum, incremental_vacuum
+)
+
+
+def _events_table() -> DailyPartitionedTable:
+    """Create a small partitioned event table with a per-type rollup."""
+    return DailyPartitionedTable(
+        "events",
+        columns="id INTEGER PRIMARY KEY, kind TEXT NOT NULL, ts TEXT NOT NULL, body TEXT",
+        indexes=("kind",),
+        summary=PartitionSummary(
+            table="events_summary",
+            columns="day TEXT NOT NULL, kind TEXT NOT NULL, events INTEGER NOT NULL",
+            rollup="""
+                INSERT INTO events_summary (day, kind, events)
+                SELECT ?, kind, COUNT(*) FROM {partition} GROUP BY kind
+            """
+        ),
+        time_column="ts"
+    )
+
+
+@pytest.fixture
+async def db(tmp_path):
+    """Open a database with incremental auto-vacuum enabled."""
+    async with aiosqlite.connect(tmp_path / "retention.db") as db:
+        assert await enable_incremental_vacuum(db)
+        yield db
+
+
+async def _insert_days(table: DailyPartitionedTable, db, today: date, days: int, per_day: int):
+    """Insert `per_day` rows for each of the last `days` days."""
+    for offset in range(days):
+        when = datetime.combine(today - timedelta(days=offset), datetime.min.time())
+        for i in range(per_day):
+            await table.insert(
+                {"kind": "a" if i % 2 else "b", "ts": when.isoformat(), "body": "x" * 200},
+                when
+            )
+    await db.commit()
+
+
+class TestDailyPartitionedTable:
+    """Test day partitions, rollups and legacy migration."""
+    
+    @pytest.mark.asyncio
+    async def test_rows_routed_by_day(self, db):
+        """Test that each day gets its own table."""
+        table = _events_table()
+        await table.create(db)
+        today = date(2026, 10, 18)
+        
+        await _insert_days(table, db, today, days=3, per_day=4)
+        
+        assert [day for day, _ in table.partitions()] == [
+            today - timedelta(days=2), today - timedelta(days=1), today
+        ]
+        assert await table.count() == 12
+    
+    @pytest.mark.asyncio
+    async def test_compact_rolls_up_and_drops(self, db):
+        """Test that expired days become summary rows and their tables go."""
+        table = _events_table()
+        await table.create(db)
+        today = date(2026, 10, 18)
+        await _insert_days(table, db, today, days=5, per_day=4)
+        
+        compacted = await table.compact(retention_days=2, today=today)
+        
+        assert compacted == 8
+        assert len(table.partitions()) == 3
+        cursor = await db.execute("SELECT day, kind, events FROM events_summary ORDER BY day, kind")
+        rows = await cursor.fetchall()
+        assert len(rows) == 4
+        assert all(events == 2 for _, _, events in rows)
+        
+        cursor = await db.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE name = ?",
+            (table.table_for(today - timedelta(days=4)),)
+        )
+        assert (await cursor.fetchone())[0] == 0
+    
+    @pytest.mark.asyncio
+    async def test_existing_partitions_are_discovered(self, db):
+        """Test that a fresh instance finds partitions from earlier runs."""
+        today = date(2026, 10, 18)
+        first = _events_table()
+        await first.create(db)
+        await _insert_days(first, db, today, days=2, per_day=1)
+        
+        second = _events_table()
+        await second.create(db)
+        
+        assert second.partitions() == first.partitions()
+    
+    @pytest.mark.asyncio
+    async def test_legacy_table_is_split(self, db):
+        """Test that an unpartitioned table is moved into day partitions."""
+        await db.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, kind TEXT NOT NULL, ts TEXT NOT NULL, body TEXT)")
+        await db.executemany(
+            "INSERT INTO events (kind, ts, body) VALUES (?, ?, ?)",
+            [("a", "2026-10-16T10:00:00", ""), ("a", "2026-10-17T10:00:00", ""), ("b", "2026-10-17T11:00:00", "")]
+        )
+        await db.commit()
+        
+        table = _events_table()
+        await table.create(db)
+        
+        assert [day.isoformat() for day, _ in table.partitions()] == ["2026-10-16", "2026-10-17"]
+        assert await table.count() == 3
+        cursor = await db.execute("SELECT COUNT(*) FROM sqlite_master WHERE name = 'events'")
+        assert (await cursor.fetchone())[0] == 0
+
+
+class TestIncrementalVacuum:
+    """Test sliced free-page reclamation."""
+    
+    @pytest.mark.asyncio
+    async def test_frees_pages_in_slices(self, db):
+        """Test that dropped partitions are returned without a full VACUUM."""
+        table = _events_table()
+        await table.create(db)
+        today = date(2026, 10, 18)
+        await _insert_days(table, db, today, days=4, per_day=500)
+        await table.compact(retention_days=1, today=today)
+        
+        cursor = await db.execute("PRAGMA freelist_count")
+        free_before = (await cursor.fetchone())[0]
+        assert free_before > 0
+        
+        stats = await incremental_vacuum(db, slice_ms=5.0)
+        
+        cursor = await db.execute("PRAGMA freelist_count")
+        assert (await cursor.fetchone())[0] == 0
+        assert stats["pages_freed"] == free_before
+        assert stats["slices"] >= 1
+    
+    @pytest.mark.asyncio
+    async def test_max_pages_bounds_the_run(self, db):
+        """Test that a run can be capped to leave work for later."""
+        table = _events_table()
+        await table.create(db)
+        today = date(2026, 10, 18)
+        await _insert_days(table, db, today, days=3, per_day=500)
+        await table.compact(retention_days=0, today=today + timedelta(days=1))
+        
+        stats = await incremental_vacuum(db, max_pages=5)
+        
+        assert stats["pages_freed"] == 5
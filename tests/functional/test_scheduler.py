@@ -0,0 +1,187 @@
+"""
+Functional tests for the adaptive scheduler.
+"""
+
+import asyncio
+
+import pytest
+
+from shannon_mcp.managers.base import BaseManager, ManagerConfig, ManagerError
+from shannon_mcp.utils.scheduler import (
+    Activity, AdaptiveInterval, AdaptiveScheduler, get_scheduler
+)
+
+
+class TestAdaptiveInterval:
+    """Test interval back-off and tightening."""
+    
+    def test_backs_off_while_idle(self):
+        """Test exponential growth up to the maximum."""
+        policy = AdaptiveInterval(base=10, minimum=2, maximum=60)
+        
+        assert policy.next(Activity()) == 20
+        assert policy.next(Activity()) == 40
+        assert policy.next(Activity()) == 60
+        assert policy.next(Activity()) == 60
+    
+    def test_change_returns_to_base(self):
+        """Test that a reported change resets the back-off."""
+        policy = AdaptiveInterval(base=10, minimum=2, maximum=60)
+        policy.next(Activity())
+        policy.next(Activity())
+        
+        assert policy.next(Activity(changed=True)) == 10
+    
+    def test_tightens_near_threshold(self):
+        """Test that pressure shrinks the interval toward the minimum."""
+        policy = AdaptiveInterval(base=10, minimum=2, maximum=60, approach=0.5)
+        
+        assert policy.next(Activity(changed=True, pressure=0.75)) == pytest.approx(6)
+        assert policy.next(Activity(pressure=1.2)) == 2
+    
+    def test_error_rate_counts_as_pressure(self):
+        """Test that failing runs tighten the interval."""
+        policy = AdaptiveInterval(base=10, minimum=2, maximum=60)
+        
+        assert policy.next(Activity(), error_rate=1.0) == 2
+    
+    def test_rejects_inconsistent_bounds(self):
+        """Test interval validation."""
+        with pytest.raises(ValueError):
+            AdaptiveInterval(base=1, minimum=2, maximum=60)
+
+
+class TestAdaptiveScheduler:
+    """Test the shared driver."""
+    
+    @pytest.mark.asyncio
+    async def test_coalesces_nearby_deadlines(self):
+        """Test that jobs due within the slack share one wakeup."""
+        scheduler = AdaptiveScheduler(slack=0.2)
+        runs = []
+        
+        async def job_a():
+            runs.append("a")
+        
+        async def job_b():
+            runs.append("b")
+        
+        scheduler.add_job("a", job_a, interval=10, start_after=0.05)
+        scheduler.add_job("b", job_b, interval=10, start_after=0.1)
+        try:
+            await asyncio.sleep(0.3)
+            
+            assert sorted(runs) == ["a", "b"]
+            stats = scheduler.get_stats()
+            assert stats["wakeups"] == 1
+            assert stats["coalesced_runs"] == 1
+        finally:
+            await scheduler.close()
+    
+    @pytest.mark.asyncio
+    async def test_reschedules_from_activity(self):
+        """Test that an idle job backs off and a failing one tightens."""
+        scheduler = AdaptiveScheduler(slack=0.01)
+        
+        async def idle():
+            return None
+        
+        async def failing():
+            raise RuntimeError("boom")
+        
+        scheduler.add_job("idle", idle, interval=10, start_after=0)
+        scheduler.add_job("failing", failing, interval=10, start_after=0)
+        try:
+            await asyncio.sleep(0.05)
+            
+            assert scheduler.interval("idle") == 20
+            assert scheduler.interval("failing") == 2.5
+            assert scheduler.get_stats()["jobs"]["failing"]["errors"] == 1
+        finally:
+            await scheduler.close()
+    
+    @pytest.mark.asyncio
+    async def test_wake_and_remove(self):
+        """Test running a job early and unregistering it."""
+        scheduler = AdaptiveScheduler(slack=0.01)
+        runs = []
+        
+        async def job():
+            runs.append(1)
+            return Activity()
+        
+        scheduler.add_job("job", job, interval=60)
+        try:
+            await asyncio.sleep(0.02)
+            assert runs == []
+            
+            scheduler.wake("job")
+            await asyncio.sleep(0.02)
+            assert runs == [1]
+            
+            await scheduler.remove_job("job")
+            assert not scheduler.has_job("job")
+            
+            with pytest.raises(ValueError):
+                scheduler.add_job("job", job, interval=60)
+                scheduler.add_job("job", job, interval=60)
+        finally:
+            await scheduler.close()
+
+
+class _Manager(BaseManager):
+    """Minimal manager with a health job and a configurable start."""
+    
+    def __init__(self, name: str, fail_start: bool = False):
+        super().__init__(ManagerConfig(name=name, health_check_interval=60))
+        self.fail_start = fail_start
+    
+    async def _initialize(self) -> None:
+        pass
+    
+    async def _start(self) -> None:
+        self._schedule_job("pass", self._pass, interval=60)
+        if self.fail_start:
+            raise RuntimeError("start failed")
+    
+    async def _stop(self) -> None:
+        pass
+    
+    async def _health_check(self):
+        return {}
+    
+    async def _create_schema(self) -> None:
+        pass
+    
+    async def _pass(self) -> Activity:
+        return Activity()
+
+
+class TestManagerJobs:
+    """Test managers' jobs on the shared scheduler."""
+    
+    @pytest.mark.asyncio
+    async def test_managers_with_same_name_both_start(self):
+        """Test that jobs are named per manager, not per config name."""
+        first, second = _Manager("x"), _Manager("x")
+        for manager in (first, second):
+            await manager.initialize()
+            await manager.start()
+        try:
+            assert first.is_running and second.is_running
+            assert not set(first._scheduled_jobs) & set(second._scheduled_jobs)
+        finally:
+            await first.stop()
+            await second.stop()
+    
+    @pytest.mark.asyncio
+    async def test_failed_start_removes_jobs(self):
+        """Test that a failed start leaves no jobs on the scheduler."""
+        manager = _Manager("x", fail_start=True)
+        await manager.initialize()
+        
+        with pytest.raises(ManagerError):
+            await manager.start()
+        
+        assert manager._scheduled_jobs == []
+        assert not get_scheduler().get_stats()["jobs"]
@@ -0,0 +1,86 @@
+"""
+Functional tests for the array-backed ring buffer and resource histories.
+"""
+
+import pytest
+import random
+from datetime import datetime, timezone
+
+from shannon_mcp.utils.stats import RingBuffer
+from shannon_mcp.managers.process import ProcessResourceHistory
+from shannon_mcp.registry.monitor import ResourceMonitor, ResourceStats, ResourceType
+
+
+class TestRingBuffer:
+    """Test ring buffer aggregates against a brute-force reference."""
+    
+    @pytest.mark.parametrize("capacity", [1, 2, 5, 50])
+    def test_matches_reference(self, capacity):
+        """Test that O(1) means and peaks agree with recomputing from scratch."""
+        rng = random.Random(capacity)
+        ring = RingBuffer(capacity, windows=(10,))
+        reference = []
+        
+        now = 0.0
+        for _ in range(300):
+            now += rng.uniform(0.0, 3.0)
+            value = rng.uniform(-50.0, 50.0)
+            ring.append(value, now)
+            reference = (reference + [(value, now)])[-capacity:]
+            
+            values = [v for v, _ in reference]
+            assert ring.values() == values
+            assert ring.mean() == pytest.approx(sum(values) / len(values))
+            assert ring.peak()[0] == max(values)
+            assert ring.mean_last(3) == pytest.approx(sum(values[-3:]) / len(values[-3:]))
+            
+            for span in (10, 25):
+                window = [v for v, ts in reference if ts >= now - span]
+                expected = sum(window) / len(window) if window else None
+                assert ring.window_mean(span, now) == pytest.approx(expected)
+    
+    def test_empty_buffer(self):
+        """Test that aggregates of an empty buffer are None."""
+        ring = RingBuffer(4)
+        
+        assert len(ring) == 0
+        assert ring.mean() is None
+        assert ring.peak() is None
+        assert ring.window_mean(60, 0.0) is None
+
+
+class TestResourceHistories:
+    """Test histories that are built on the ring buffer."""
+    
+    def test_process_history_trend_and_peak(self):
+        """Test trend detection and capacity bounds for process history."""
+        history = ProcessResourceHistory(max_history_size=6)
+        assert history.get_cpu_trend() == "insufficient_data"
+        
+        for cpu, memory in [(5, 500), (10, 100), (10, 300), (10, 120), (40, 90), (40, 80), (40, 70)]:
+            history.add_measurement(cpu, memory)
+        
+        assert history.get_cpu_trend() == "increasing"
+        assert history.cpu_history == [10, 10, 10, 40, 40, 40]
+        assert history.get_peak_memory() == 300
+        assert history.get_average_cpu(last_n=2) == 40
+        assert len(history.timestamp_history) == 6
+    
+    def test_monitor_historical_stats(self):
+        """Test that window averages and peaks are filled from history."""
+        monitor = ResourceMonitor(storage=None, tracker=None)
+        history = monitor._system_history[ResourceType.CPU]
+        now = datetime.now(timezone.utc).timestamp()
+        
+        history.append(90.0, now - 600)
+        history.append(30.0, now - 200)
+        history.append(10.0, now - 5)
+        
+        stats = ResourceStats(datetime.now(timezone.utc), ResourceType.CPU, 10.0)
+        monitor._add_historical_stats(stats, history)
+        
+        assert stats.avg_1min == 10.0
+        assert stats.avg_5min == 20.0
+        assert stats.avg_15min == pytest.approx(130.0 / 3)
+        assert stats.peak_value == 90.0
+        assert stats.peak_time.timestamp() == pytest.approx(now - 600)
@@ -0,0 +1,67 @@
+"""
+Functional tests for the timing wheel.
+"""
+
+from shannon_mcp.utils.timer_wheel import TimingWheel
+
+
+class FakeClock:
+    """Manually advanced clock."""
+    
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTimingWheel:
+    """Test scheduling and expiry."""
+    
+    def test_expires_in_deadline_order(self):
+        """Test that only due keys are popped, earliest first."""
+        clock = FakeClock()
+        wheel = TimingWheel(tick=1.0, slots=8, clock=clock)
+        wheel.schedule("b", 1003.5)
+        wheel.schedule("a", 1002.0)
+        wheel.schedule("c", 1010.0)
+        
+        assert wheel.advance(1001.0) == []
+        assert wheel.advance(1004.0) == ["a", "b"]
+        assert len(wheel) == 1
+    
+    def test_deadline_later_in_current_tick(self):
+        """Test that a partly elapsed tick is revisited on the next advance."""
+        wheel = TimingWheel(tick=1.0, slots=8, clock=FakeClock())
+        wheel.schedule("a", 1002.8)
+        
+        assert wheel.advance(1002.5) == []
+        assert wheel.advance(1002.9) == ["a"]
+    
+    def test_deadlines_beyond_one_rotation(self):
+        """Test that far deadlines wait for their round."""
+        wheel = TimingWheel(tick=1.0, slots=4, clock=FakeClock())
+        wheel.schedule("far", 1009.0)
+        
+        assert wheel.advance(1005.0) == []
+        assert wheel.advance(1009.0) == ["far"]
+    
+    def test_cancel_and_reschedule(self):
+        """Test that rescheduling replaces the old deadline."""
+        wheel = TimingWheel(tick=1.0, slots=8, clock=FakeClock())
+        wheel.schedule("a", 1002.0)
+        wheel.schedule("a", 1005.0)
+        wheel.schedule("b", 1002.0)
+        
+        assert wheel.cancel("b")
+        assert not wheel.cancel("b")
+        assert wheel.advance(1003.0) == []
+        assert wheel.deadline("a") == 1005.0
+    
+    def test_past_deadline_fires_on_next_advance(self):
+        """Test that keys scheduled in the past are not lost."""
+        wheel = TimingWheel(tick=1.0, slots=8, clock=FakeClock())
+        wheel.advance(1005.0)
+        wheel.schedule("late", 1001.0)
+        
+        assert wheel.advance(1005.0) == ["late"]